@@ -110,6 +110,23 @@ parser.add_argument("--merge",
                     action='store_true',
                     help="Create a merged file with all annotations")
 
+parser.add_argument("--pipeline",
+                    action='store_true',
+                    help="Annotate each file as soon as the annotations it "
+                         "depends on are done, sharing results in memory")
+
+parser.add_argument("--no_intermediates",
+                    action='store_true',
+                    help="With --pipeline, do not write the results that "
+                         "are used by another annotation")
+
+parser.add_argument("-j",
+                    metavar="N",
+                    type=int,
+                    default=1,
+                    help="Number of files to annotate in parallel; "
+                         "0 means the number of CPUs (default: 1)")
+
 if len(sys.argv) <= 1:
     sys.argv.append('-h')
 
@@ -183,6 +200,9 @@ p = ProcessProgressTerminal()
 manager = sppasAnnotationsManager()
 if args.merge:
     manager.set_do_merge(True)
+manager.set_nb_workers(args.j)
+if args.pipeline:
+    manager.set_pipeline(True, not args.no_intermediates)
 manager.annotate(parameters, p)
 
 try:
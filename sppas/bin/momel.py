@@ -92,6 +92,14 @@ if __name__ == "__main__":
         metavar="file",
         help="File name for a Procedure Outcome Report (default: None)")
 
+    parser.add_argument(
+        "-j",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Number of files to annotate in parallel with -I; "
+             "0 means the number of CPUs (default: 1)")
+
     # Add arguments for input/output files
     # ------------------------------------
 
@@ -100,7 +108,7 @@ if __name__ == "__main__":
     group_io.add_argument(
         "-i",
         metavar="file",
-        help='Input file name (extension: .hz or .PitchTier)')
+        help='Input file name (extension: .hz, .PitchTier or audio)')
 
     group_io.add_argument(
         "-o",
@@ -111,7 +119,7 @@ if __name__ == "__main__":
         "-I",
         metavar="file",
         action='append',
-        help='Input file name with pitch (append).')
+        help='Input file name with pitch or audio (append).')
 
     group_io.add_argument(
         "-e",
@@ -170,7 +178,7 @@ if __name__ == "__main__":
 
     arguments = vars(args)
     for a in arguments:
-        if a not in ('i', 'o', 'I', 'e', 'quiet', 'log'):
+        if a not in ('i', 'o', 'I', 'e', 'quiet', 'log', 'j'):
             parameters.set_option_value(ann_step_idx, a, arguments[a])
 
     if args.i:
@@ -204,6 +212,7 @@ if __name__ == "__main__":
 
         # Perform the annotation
         process = sppasAnnotationsManager()
+        process.set_nb_workers(args.j)
         process.annotate(parameters)
 
     else:
@@ -54,8 +54,10 @@ from sppas import sg, paths, annots
 from sppas.src.anndata.aio import extensions_out
 from sppas import sppasTextNorm
 from sppas.src.annotations.TextNorm.normalize import TextNormalizer
+from sppas.src.annotations.annserver import sppasAnnotationServer
 from sppas import sppasVocabulary
 from sppas import sppasDictRepl
+from sppas import sppasArpaIO
 from sppas import sppasParam
 from sppas import sppasAnnotationsManager
 from sppas import sppasLogSetup
@@ -94,6 +96,14 @@ if __name__ == "__main__":
         metavar="file",
         help="File name for a Procedure Outcome Report (default: None)")
 
+    parser.add_argument(
+        "-j",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Number of files to annotate in parallel with -I; "
+             "0 means the number of CPUs (default: 1)")
+
     # Add arguments for input/output files
     # ------------------------------------
 
@@ -135,6 +145,35 @@ if __name__ == "__main__":
         help='Output file extension. One of: {:s}'
              ''.format(" ".join(extensions_out)))
 
+    # Add arguments to keep the resources loaded for a lot of files
+    # -------------------------------------------------------------
+
+    group_batch = parser.add_argument_group('Batch and server modes')
+
+    group_batch.add_argument(
+        "-B",
+        metavar="entry",
+        action='append',
+        help='Input directory, glob pattern or @file with the list of '
+             'input files (append). Resources are loaded only once.')
+
+    group_batch.add_argument(
+        "--odir",
+        metavar="dir",
+        help='Output directory of the batch or server modes '
+             '(default: the directory of each input file).')
+
+    group_batch.add_argument(
+        "--server",
+        action='store_true',
+        help='Read job lines "input[<TAB>output]" from stdin and answer '
+             'each of them on stdout.')
+
+    group_batch.add_argument(
+        "--socket",
+        metavar="file",
+        help='Serve job lines sent to the given unix socket.')
+
     # Add arguments from the options of the annotation
     # ------------------------------------------------
 
@@ -165,6 +204,12 @@ if __name__ == "__main__":
               "".format(os.path.basename(PROGRAM)))
         sys.exit(1)
 
+    if (args.B or args.server or args.socket) and (args.i or args.I):
+        parser.print_usage()
+        print("{:s}: error: batch and server modes are not allowed with "
+              "arguments -i or -I".format(os.path.basename(PROGRAM)))
+        sys.exit(1)
+
     # -----------------------------------------------------------------------
     # The automatic annotation is here:
     # -----------------------------------------------------------------------
@@ -185,10 +230,50 @@ if __name__ == "__main__":
 
     arguments = vars(args)
     for a in arguments:
-        if a not in ('i', 'o', 'I', 'e', 'r', 'l', 'quiet', 'log'):
+        if a not in ('i', 'o', 'I', 'e', 'r', 'l', 'quiet', 'log', 'j',
+                     'B', 'odir', 'server', 'socket'):
             parameters.set_option_value(ann_step_idx, a, str(arguments[a]))
 
-    if args.i:
+    if args.B or args.server or args.socket:
+
+        # Perform the annotation on a stream of files
+        # -------------------------------------------
+
+        if not args.r:
+            print("argparse.py: error: option -r is required with the batch "
+                  "and server modes")
+            sys.exit(1)
+
+        if args.l:
+            lang = args.l
+        else:
+            lang = os.path.basename(args.r)[:3]
+
+        ann = sppasTextNorm(log=None)
+        ann.load_resources(args.r, lang=lang)
+        ann.fix_options(parameters.get_options(ann_step_idx))
+        server = sppasAnnotationServer(ann, args.e, args.odir)
+
+        nb_errors = 0
+        if args.B:
+            for in_name, out_name, msg in server.batch(
+                    args.B, ann.get_input_extensions()):
+                if out_name is None:
+                    nb_errors += 1
+                sys.stdout.write(
+                    server.format_answer(in_name, out_name, msg))
+                sys.stdout.flush()
+
+        if args.server:
+            server.serve(sys.stdin, sys.stdout)
+
+        if args.socket:
+            server.serve_socket(args.socket)
+
+        if nb_errors > 0:
+            sys.exit(1)
+
+    elif args.i:
 
         # Perform the annotation on a single file
         # ---------------------------------------
@@ -243,6 +328,7 @@ if __name__ == "__main__":
 
         # Perform the annotation
         manager = sppasAnnotationsManager()
+        manager.set_nb_workers(args.j)
         manager.annotate(parameters)
 
     else:
@@ -261,6 +347,9 @@ if __name__ == "__main__":
 
         vocab = sppasVocabulary(args.r)
         normalizer = TextNormalizer(vocab, lang)
+        normalizer.set_segmentation(args.segment)
+        if args.lm:
+            normalizer.set_ngrams(sppasArpaIO().load(args.lm))
 
         replace_file = os.path.join(paths.resources, "repl", lang + ".repl")
         if os.path.exists(replace_file):
@@ -95,6 +95,14 @@ if __name__ == "__main__":
         metavar="file",
         help="File name for a Procedure Outcome Report (default: None)")
 
+    parser.add_argument(
+        "-j",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Number of files to annotate in parallel with -I; "
+             "0 means the number of CPUs (default: 1)")
+
     # Add arguments for input/output files
     # ------------------------------------
 
@@ -194,7 +202,7 @@ if __name__ == "__main__":
 
     arguments = vars(args)
     for a in arguments:
-        if a not in ('i', 'o', 'r', 'l', 'm', 'I', 'e', 'quiet', 'log'):
+        if a not in ('i', 'o', 'r', 'l', 'm', 'I', 'e', 'quiet', 'log', 'j'):
             parameters.set_option_value(ann_step_idx, a, str(arguments[a]))
 
     if args.i:
@@ -246,6 +254,7 @@ if __name__ == "__main__":
 
         # Perform the annotation
         process = sppasAnnotationsManager()
+        process.set_nb_workers(args.j)
         process.annotate(parameters)
 
     else:
@@ -91,6 +91,14 @@ if __name__ == "__main__":
         metavar="file",
         help="File name for a Procedure Outcome Report (default: None)")
 
+    parser.add_argument(
+        "-j",
+        metavar="N",
+        type=int,
+        default=1,
+        help="Number of files to annotate in parallel with -I; "
+             "0 means the number of CPUs (default: 1)")
+
     # Add arguments for input/output files
     # ------------------------------------
 
@@ -107,6 +115,12 @@ if __name__ == "__main__":
         help='Annotated file with silences/units segmentation '
              '(default: None)')
 
+    group_io.add_argument(
+        "--stream",
+        action='store_true',
+        help='Print the IPUs of the input file (-i) as soon as they are '
+             'found, while reading the audio file.')
+
     group_io.add_argument(
         "-I",
         metavar="file",
@@ -171,7 +185,7 @@ if __name__ == "__main__":
 
     arguments = vars(args)
     for a in arguments:
-        if a not in ('i', 'o', 'I', 'e', 'quiet', 'log'):
+        if a not in ('i', 'o', 'I', 'e', 'quiet', 'log', 'j', 'stream'):
             parameters.set_option_value(ann_step_idx, a, arguments[a])
 
     if args.i:
@@ -181,7 +195,11 @@ if __name__ == "__main__":
 
         ann = sppasSearchIPUs(log=None)
         ann.fix_options(parameters.get_options(ann_step_idx))
-        if args.o:
+        if args.stream:
+            for i, (from_time, to_time) in enumerate(ann.stream_tracks(args.i)):
+                print("{} {} ipu_{:d}".format(from_time, to_time, i + 1))
+                sys.stdout.flush()
+        elif args.o:
             ann.run([args.i], output_file=args.o)
         else:
             trs = ann.run([args.i])
@@ -206,6 +224,7 @@ if __name__ == "__main__":
 
         # Perform the annotation
         process = sppasAnnotationsManager()
+        process.set_nb_workers(args.j)
         process.annotate(parameters)
 
     else:
@@ -60,7 +60,8 @@ def train(pron_dict,
           lang,
           working_dir,
           output_dir,
-          tree_script=None):
+          tree_script=None,
+          nb_workers=1):
 
     # ---------------------------------
     # 1. Create a Data Manager
@@ -91,7 +92,7 @@ def train(pron_dict,
     #   - codes the audio data.
 
     logging.info("Create a CorpusManager")
-    corpus = sppasTrainingCorpus(datatrainer, lang=lang)
+    corpus = sppasTrainingCorpus(datatrainer, lang=lang, nb_workers=nb_workers)
     corpus.fix_resources(dict_file=pron_dict, mapping_file=mapping_table)
 
     if corpus_dir_list:
@@ -175,6 +176,13 @@ parser.add_argument("-T",
                     default=None,
                     help="Tree LED script to train a triphone model (NOT IMPLEMENTED YET).")
 
+parser.add_argument("-j",
+                    metavar="N",
+                    type=int,
+                    default=1,
+                    help="Number of audio files to convert into MFCC in "
+                         "parallel; 0 means the number of CPUs (default: 1)")
+
 parser.add_argument("--quiet", action='store_true', help="Disable the verbosity.")
 
 if len(sys.argv) <= 1:
@@ -215,7 +223,8 @@ acm = train(pron_dict=args.r,
             lang=args.l,
             working_dir=args.t,
             output_dir=args.o,
-            tree_script=args.T)
+            tree_script=args.T,
+            nb_workers=args.j)
 
 # --------------------------------
 
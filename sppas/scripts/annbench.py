@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+
+    scripts.annbench.py
+    ~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the creation of annotations.
+
+    A given number of annotations is created, like the readers do, then
+    their 'id' is requested, like the writers of XRA or EAF files do.
+    The time of both steps is reported.
+
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import time
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas.src.anndata import sppasAnnotation
+from sppas.src.anndata import sppasLocation, sppasInterval, sppasPoint
+from sppas.src.anndata import sppasLabel, sppasTag
+
+# ----------------------------------------------------------------------------
+# Parse command-line
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "creation of annotations.")
+
+parser.add_argument("-n",
+                    metavar="value",
+                    default=1000000,
+                    type=int,
+                    help='Number of annotations (default: 1000000)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+start = time.time()
+annotations = list()
+for i in range(args.n):
+    loc = sppasInterval(sppasPoint(i * 0.01), sppasPoint((i+1) * 0.01))
+    annotations.append(sppasAnnotation(sppasLocation(loc),
+                                       sppasLabel(sppasTag("a"))))
+create_time = time.time() - start
+
+start = time.time()
+for ann in annotations:
+    ann.get_meta("id")
+id_time = time.time() - start
+
+print("Annotations: {:d}".format(args.n))
+print("{:>12s} {:>9.2f}s".format("create", create_time))
+print("{:>12s} {:>9.2f}s".format("get 'id'", id_time))
@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+    scripts.audiobench.py
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the extraction of the channels of audio files.
+
+    Multi-channel WAV files of random samples are created for each sample
+    width (16, 24 and 32 bits), then the channels are de-interleaved and
+    the times are compared to the previous sample-by-sample loop, which
+    is evaluated on a short excerpt only (its time is quadratic).
+
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import time
+import wave
+import shutil
+try:  # python 3
+    import tracemalloc
+except ImportError:  # python 2
+    tracemalloc = None
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+import sppas.src.audiodata.aio
+from sppas.src.audiodata.audioframes import sppasAudioFrames
+from sppas.src.files.fileutils import sppasFileUtils
+
+# ----------------------------------------------------------------------------
+# Parse command-line
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "extraction of the channels of audio "
+                                    "files.")
+
+parser.add_argument("-d",
+                    metavar="value",
+                    default=600.,
+                    type=float,
+                    help='Duration of the audio files, in seconds '
+                         '(default: 600)')
+
+parser.add_argument("-c",
+                    metavar="value",
+                    default=4,
+                    type=int,
+                    help='Number of channels of the audio files (default: 4)')
+
+parser.add_argument("-r",
+                    metavar="value",
+                    default=16000,
+                    type=int,
+                    help='Frame rate of the audio files (default: 16000)')
+
+parser.add_argument("-e",
+                    metavar="value",
+                    default=10.,
+                    type=float,
+                    help='Duration of the excerpt to evaluate the '
+                         'sample-by-sample loop, in seconds (default: 10)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def create_audio(filename, nchannels, sampwidth, framerate, duration):
+    """Create a WAV file of random samples."""
+    w = wave.open(filename, "wb")
+    w.setnchannels(nchannels)
+    w.setsampwidth(sampwidth)
+    w.setframerate(framerate)
+    block = framerate * nchannels * sampwidth
+    for _ in range(int(duration)):
+        w.writeframes(os.urandom(block))
+    w.close()
+
+# ----------------------------------------------------------------------------
+
+
+def loop_deinterleave(data, sampwidth, nchannels):
+    """The sample-by-sample de-interleaving of the previous versions."""
+    channels = list()
+    for index in range(nchannels):
+        frames = b""
+        for i in range(index*sampwidth, len(data), nchannels*sampwidth):
+            frames += data[i:i+sampwidth]
+        channels.append(frames)
+    return channels
+
+# ----------------------------------------------------------------------------
+
+
+def extract(filename, sampwidth, nchannels):
+    """Extract all the channels of a file.
+
+    sppasChannel() does not support 24 bits samples: then the frames are
+    read with the wave module and de-interleaved.
+
+    """
+    if sampwidth == 3:
+        w = wave.open(filename, "rb")
+        data = w.readframes(w.getnframes())
+        w.close()
+        return sppasAudioFrames.deinterleave(data, sampwidth, nchannels)
+
+    audio = sppas.src.audiodata.aio.open(filename)
+    audio.extract_channels()
+    audio.close()
+    return audio.get_channels()
+
+# ----------------------------------------------------------------------------
+
+
+def measure(function, *fargs):
+    """Return the time and the memory peak to execute a function."""
+    if tracemalloc is not None:
+        tracemalloc.start()
+    start = time.time()
+    function(*fargs)
+    duration = time.time() - start
+    peak = 0
+    if tracemalloc is not None:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return duration, peak
+
+# ----------------------------------------------------------------------------
+
+
+tmp_dir = sppasFileUtils().set_random()
+os.mkdir(tmp_dir)
+mb = float(1024 * 1024)
+
+print("{:>5s} {:>9s} {:>10s} {:>10s} {:>12s} {:>12s}"
+      "".format("bits", "file", "extract", "peak", "loop excerpt",
+                "loop (est.)"))
+try:
+    for sampwidth in (2, 3, 4):
+        filename = os.path.join(tmp_dir, "bench{:d}.wav".format(sampwidth))
+        create_audio(filename, args.c, sampwidth, args.r, args.d)
+        size = os.path.getsize(filename)
+
+        t_extract, peak = measure(extract, filename, sampwidth, args.c)
+
+        w = wave.open(filename, "rb")
+        excerpt = w.readframes(int(args.e * args.r))
+        w.close()
+        t_loop, _ = measure(loop_deinterleave, excerpt, sampwidth, args.c)
+        # lower bound: the loop is at least linear with the duration
+        t_estimated = t_loop * args.d / args.e
+
+        print("{:>5d} {:>7.1f}MB {:>9.3f}s {:>8.1f}MB {:>11.3f}s {:>11.1f}s"
+              "".format(sampwidth * 8, size / mb, t_extract, peak / mb,
+                        t_loop, t_estimated))
+finally:
+    shutil.rmtree(tmp_dir)
@@ -70,6 +70,18 @@ parser.add_argument("-c",
                     required=False,
                     help='Number of the channel to extract (default: 1=first=left)')
 
+parser.add_argument("-bs",
+                    default=0,
+                    metavar="value",
+                    type=float,
+                    help='The position (in seconds) when begins the extract (default: 0)')
+
+parser.add_argument("-es",
+                    default=0,
+                    metavar="value",
+                    type=float,
+                    help='The position (in seconds) when ends the extract (default: end of the file)')
+
 if len(sys.argv) <= 1:
     sys.argv.append('-h')
 
@@ -78,9 +90,16 @@ args = parser.parse_args()
 # ----------------------------------------------------------------------------
 
 audio = sppas.src.audiodata.aio.open(args.w)
-idx = audio.extract_channel(args.c-1)
+begin = int(args.bs*audio.get_framerate())
+end = None
+if args.es:
+    end = int(args.es*audio.get_framerate())
+
+# Only the frames of the extract are read from the input file
+channel = audio.read_fragment(args.c-1, begin, end)
 
 # Save the converted channel
 audio_out = sppasAudioPCM()
-audio_out.append_channel(audio.get_channel(idx))
+audio_out.append_channel(channel)
 sppas.src.audiodata.aio.save(args.o, audio_out)
+audio.close()
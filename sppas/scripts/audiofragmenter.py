@@ -115,13 +115,11 @@ if args.ef:
 elif args.es:
     end = args.es*audio.get_framerate()
 else:
-    end = 0
+    end = None
 
+# only the frames of the fragment are read from the input file
 for i in range(audio.get_nchannels()):
-    idx = audio.extract_channel(i)
-    audio.rewind()
-    channel = audio.get_channel(idx)
-    extracter = channel.extract_fragment(begin, end)
-    audio_out.append_channel(extracter)
+    audio_out.append_channel(audio.read_fragment(i, begin, end))
 
 sppas.src.audiodata.aio.save(args.o, audio_out)
+audio.close()
@@ -79,6 +79,7 @@ for inputFile in args.w:
         idx = audio.extract_channel(i)
         audio.rewind()
         mixer.append_channel(audio.get_channel(idx))
+    audio.close()
 
 new_channel = mixer.mix()
 
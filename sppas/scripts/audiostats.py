@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+    scripts.audiostats.py
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to get the statistics of the audio files of a corpus.
+
+    The duration, the volumes and the clipping rates of the audio files
+    are estimated once and saved in a cache (see sppasAudioStatsCache).
+    The next runs read the cache only, so that the threshold of the search
+    for IPUs can be tuned on a large corpus in a few seconds.
+
+    The files are grouped by speaker, either with the name of their
+    directory, or with a regular expression on their name.
+
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import re
+import logging
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+import sppas.src.audiodata.aio
+from sppas.src.audiodata.audiostats import sppasAudioStats
+from sppas.src.audiodata.audiostats import sppasAudioStatsCache
+from sppas.src.annotations.SearchIPUs.silences import sppasSilences
+import sppas.src.calculus.stats.central as central
+
+# ----------------------------------------------------------------------------
+# Parse command-line
+
+parser = ArgumentParser(usage="%s -i file|dir [options]" % os.path.basename(PROGRAM),
+                        description="... a script to get the statistics of "
+                                    "the audio files of a corpus.")
+
+parser.add_argument("-i",
+                    metavar="file",
+                    action='append',
+                    required=True,
+                    help='Input audio file or directory of audio files '
+                         '(append)')
+
+parser.add_argument("--cache",
+                    metavar="dir",
+                    help='Directory of the statistics (default: next to '
+                         'the audio files)')
+
+parser.add_argument("-j",
+                    metavar="N",
+                    default=1,
+                    type=int,
+                    help='Number of processes; 0 means the number of CPUs '
+                         '(default: 1)')
+
+parser.add_argument("--speaker",
+                    metavar="regexp",
+                    help='Regular expression on the file names: its first '
+                         'group is the speaker (default: the name of the '
+                         'directory)')
+
+parser.add_argument("--clipping",
+                    metavar="factor",
+                    default=0.6,
+                    type=float,
+                    choices=sppasAudioStats.CLIPPING_FACTORS,
+                    help='Factor of the clipping rate (default: 0.6)')
+
+parser.add_argument("--max_clipping",
+                    metavar="value",
+                    default=0.1,
+                    type=float,
+                    help='Report the files with a clipping rate higher than '
+                         'this percentage (default: 0.1)')
+
+parser.add_argument("--threshold",
+                    metavar="value",
+                    default=0,
+                    type=int,
+                    help='Volume threshold of the search for IPUs to get '
+                         'the rate of silences; 0 means the one estimated '
+                         'for each file (default: 0)')
+
+parser.add_argument("--quiet",
+                    action='store_true',
+                    help="Print only the statistics of the speakers")
+
+if len(sys.argv) <= 1:
+    sys.argv.append('-h')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def summarize(stats):
+    """Return the summary of the first channel of an audio file.
+
+    It is executed by the workers: the volumes are not sent back.
+
+    """
+    volumes = stats.get_volumes(0)
+    threshold = sppasSilences.estimate_threshold(stats.get_volumes(0))
+    if args.threshold > 0:
+        silence_rate = stats.get_silence_rate(args.threshold)
+    else:
+        silence_rate = stats.get_silence_rate(threshold)
+
+    return dict(duration=stats.get_duration(),
+                nchannels=stats.get_nchannels(),
+                rms=stats.get_rms(0),
+                median=volumes.median(),
+                clipping=stats.get_clipping_rate(args.clipping) * 100.,
+                threshold=threshold,
+                silences=silence_rate * 100.)
+
+# ----------------------------------------------------------------------------
+
+
+def get_speaker(filename):
+    """Return the speaker of an audio file."""
+    if args.speaker is None:
+        return os.path.basename(os.path.dirname(os.path.abspath(filename)))
+    m = re.search(args.speaker, os.path.basename(filename))
+    if m is None:
+        return "-"
+    if m.groups():
+        return m.group(1)
+    return m.group(0)
+
+# ----------------------------------------------------------------------------
+# Get the audio files
+
+logging.getLogger().setLevel(logging.WARNING)
+
+files = list()
+for entry in args.i:
+    if os.path.isdir(entry):
+        for root, dirs, names in os.walk(entry):
+            dirs.sort()
+            for name in sorted(names):
+                ext = os.path.splitext(name)[1].lower()
+                if ext in sppas.src.audiodata.aio.extensions:
+                    files.append(os.path.join(root, name))
+    else:
+        files.append(entry)
+
+# ----------------------------------------------------------------------------
+# Statistics of the files
+
+cache = sppasAudioStatsCache(args.cache)
+speakers = dict()
+clipped = list()
+
+if not args.quiet:
+    print("{:s}\t{:s}\t{:s}\t{:s}\t{:s}\t{:s}\t{:s}\t{:s}".format(
+        "file", "duration", "channels", "rms", "median",
+        "clipping(%)", "threshold", "silences(%)"))
+
+for filename, summary, error in cache.get_files(files, args.j, summarize):
+    if error is not None:
+        print("{:s}\terror: {:s}".format(filename, error))
+        continue
+
+    speakers.setdefault(get_speaker(filename), list()).append(summary)
+    if summary["clipping"] > args.max_clipping:
+        clipped.append((filename, summary["clipping"]))
+
+    if not args.quiet:
+        print("{:s}\t{:.3f}\t{:d}\t{:d}\t{:.2f}\t{:.3f}\t{:d}\t{:.2f}".format(
+            filename, summary["duration"], summary["nchannels"],
+            summary["rms"], summary["median"], summary["clipping"],
+            summary["threshold"], summary["silences"]))
+
+# ----------------------------------------------------------------------------
+# Statistics of the speakers
+
+print("")
+print("{:s}\t{:s}\t{:s}\t{:s}\t{:s}".format(
+    "speaker", "files", "duration", "threshold", "silences(%)"))
+
+for speaker in sorted(speakers):
+    summaries = speakers[speaker]
+    duration = sum(s["duration"] for s in summaries)
+    silences = 0.
+    if duration > 0.:
+        silences = sum(s["silences"] * s["duration"]
+                       for s in summaries) / duration
+
+    # the threshold suggested for the speaker is the median of the
+    # thresholds estimated on the files
+    threshold = central.fmedian(sorted(s["threshold"] for s in summaries))
+    print("{:s}\t{:d}\t{:.3f}\t{:d}\t{:.2f}".format(
+        speaker, len(summaries), duration, int(threshold), silences))
+
+if len(clipped) > 0:
+    print("")
+    print("Files with a clipping rate higher than {:.3f}% (factor={:.1f}):"
+          "".format(args.max_clipping, args.clipping))
+    for filename, rate in clipped:
+        print("  - {:s}: {:.3f}".format(filename, rate))
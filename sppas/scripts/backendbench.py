@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+    scripts.backendbench.py
+    ~~~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the backends processing the audio samples.
+
+    Random frames are created in memory for the given duration, then each
+    operation is timed with each available backend. The pure-python
+    backend is evaluated on a short excerpt only and its time is
+    extrapolated to the whole duration: all its operations are linear.
+
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import time
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas.src.audiodata.backend import get_backends
+from sppas.src.audiodata.backend import _backends
+
+# ----------------------------------------------------------------------------
+# Parse command-line
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "backends processing the audio "
+                                    "samples.")
+
+parser.add_argument("-d",
+                    metavar="value",
+                    default=3600.,
+                    type=float,
+                    help='Duration of the audio, in seconds (default: 3600)')
+
+parser.add_argument("-w",
+                    metavar="value",
+                    default=[1, 2, 3, 4],
+                    type=int,
+                    nargs="+",
+                    choices=[1, 2, 3, 4],
+                    help='Sample widths, in bytes (default: 1 2 3 4)')
+
+parser.add_argument("-r",
+                    metavar="value",
+                    default=16000,
+                    type=int,
+                    help='Frame rate of the audio (default: 16000)')
+
+parser.add_argument("-e",
+                    metavar="value",
+                    default=30.,
+                    type=float,
+                    help='Duration of the excerpt to evaluate the python '
+                         'backend, in seconds (default: 30)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+OPERATIONS = (
+    ("samples", lambda b, f, w: b.samples(f, w)),
+    ("rms", lambda b, f, w: b.rms(f, w)),
+    ("minmax", lambda b, f, w: b.minmax(f, w)),
+    ("avg", lambda b, f, w: b.avg(f, w)),
+    ("cross", lambda b, f, w: b.cross(f, w)),
+    ("mul", lambda b, f, w: b.mul(f, w, 0.8)),
+    ("bias", lambda b, f, w: b.bias(f, w, 10)),
+    ("lin2lin", lambda b, f, w: b.lin2lin(f, w, 2 if w != 2 else 4)),
+    ("ratecv", lambda b, f, w: b.ratecv(f, w, 1, args.r, args.r // 2)),
+)
+
+# ----------------------------------------------------------------------------
+
+
+def measure(function, *fargs):
+    """Return the time to execute a function."""
+    start = time.time()
+    function(*fargs)
+    return time.time() - start
+
+# ----------------------------------------------------------------------------
+
+
+names = get_backends()
+print("Backends: {:s}".format(", ".join(names)))
+print("Duration: {:.0f}s at {:d}Hz; python estimated from {:.0f}s"
+      "".format(args.d, args.r, args.e))
+print()
+print("{:>5s} {:>8s} ".format("bits", "op") +
+      " ".join("{:>10s}".format(n) for n in names) +
+      " " + " ".join("{:>9s}".format("x " + n)
+                     for n in names if n != "python"))
+
+for sampwidth in args.w:
+    frames = os.urandom(int(args.d * args.r) * sampwidth)
+    excerpt = frames[:int(args.e * args.r) * sampwidth]
+
+    for op, function in OPERATIONS:
+        times = list()
+        for name in names:
+            backend = _backends[name]()
+            if name == "python":
+                t = measure(function, backend, excerpt, sampwidth)
+                t = t * args.d / args.e
+            else:
+                t = measure(function, backend, frames, sampwidth)
+            times.append(t)
+
+        ref = times[names.index("python")]
+        speedups = [ref / t if t > 0. else float("inf")
+                    for n, t in zip(names, times) if n != "python"]
+        print("{:>5d} {:>8s} ".format(sampwidth * 8, op) +
+              " ".join("{:>9.3f}s".format(t) for t in times) + " " +
+              " ".join("{:>8.1f}x".format(s) for s in speedups))
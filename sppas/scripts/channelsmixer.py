@@ -77,6 +77,7 @@ for inputFile in args.w:
     audio = sppas.src.audiodata.aio.open(inputFile)
     idx = audio.extract_channel(0)
     mixer.append_channel(audio.get_channel(idx))
+    audio.close()
 
 new_channel = mixer.mix()
 
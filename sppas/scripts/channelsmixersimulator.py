@@ -72,5 +72,6 @@ for inputFile in args.w:
     audio = sppas.src.audiodata.aio.open(inputFile)
     idx = audio.extract_channel(0)
     mixer.append_channel(audio.get_channel(idx))
+    audio.close()
 
 print(mixer.get_minmax())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+    scripts.mfccbench.py
+    ~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the extraction of the MFCC of audio files.
+
+    Copies of an audio file are converted into MFCC files of the HTK
+    format, with an increasing number of processes. The number of files
+    converted per second, and per second and process, are reported.
+
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import time
+import shutil
+import multiprocessing
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+from sppas.src.models.acm.features import sppasAcFeatures
+from sppas.src.audiodata.mfcc import sppasMFCC, IMPORT_NUMPY
+
+# ----------------------------------------------------------------------------
+# Parse command-line
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "extraction of the MFCC of audio files.")
+
+parser.add_argument("-i",
+                    metavar="file",
+                    default=os.path.join(paths.samples, "samples-eng",
+                                         "oriana1.wav"),
+                    help='Input audio file (default: oriana1.wav)')
+
+parser.add_argument("-c",
+                    metavar="file",
+                    help='Configuration file of HTK (default: the one of '
+                         'the acoustic model training)')
+
+parser.add_argument("-n",
+                    metavar="value",
+                    default=8,
+                    type=int,
+                    help='Number of files to convert (default: 8)')
+
+parser.add_argument("-w",
+                    metavar="value",
+                    type=int,
+                    nargs="+",
+                    help='Numbers of processes (default: 1 to the number '
+                         'of CPUs, by powers of 2)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+temp = sppasFileUtils().set_random()
+os.mkdir(temp)
+try:
+    config = args.c
+    if config is None:
+        features = sppasAcFeatures()
+        features.write_all(temp)
+        config = features.mfcconfigfile
+    mfcc = sppasMFCC(config)
+
+    workers = args.w
+    if workers is None:
+        try:
+            ncpu = multiprocessing.cpu_count()
+        except NotImplementedError:
+            ncpu = 1
+        workers = [1]
+        while workers[-1] * 2 <= ncpu:
+            workers.append(workers[-1] * 2)
+        if workers[-1] != ncpu:
+            workers.append(ncpu)
+
+    print("Input: {:s}".format(args.i))
+    print("Target: {:s}, numpy: {:s}".format(mfcc.get_config("TARGETKIND"),
+                                             str(IMPORT_NUMPY)))
+    print("Files: {:d}".format(args.n))
+    print()
+    print("{:>8s} {:>9s} {:>9s} {:>12s}".format("workers", "time",
+                                                 "files/s", "files/s/core"))
+
+    for nb_workers in workers:
+        files = [(args.i, os.path.join(temp, "%d.mfc" % i))
+                 for i in range(args.n)]
+        start = time.time()
+        errors = [e for f, e in mfcc.convert_files(files, nb_workers)
+                  if e is not None]
+        t = time.time() - start
+        if len(errors) > 0:
+            print("Error: {:s}".format(errors[0]))
+            break
+        nb = min(nb_workers, args.n)
+        print("{:>8d} {:>8.2f}s {:>9.2f} {:>12.2f}"
+              "".format(nb, t, args.n / t, args.n / t / nb))
+finally:
+    shutil.rmtree(temp)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+
+    scripts.rescompile.py
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to compile the linguistic resources.
+
+    A compiled resource is a memory-mapped image of a list of words or of
+    a dictionary: it is opened in nearly no time, instead of parsing the
+    ASCII file or unpickling the dump file.
+
+"""
+import sys
+import os
+import glob
+import time
+import shutil
+import tempfile
+from argparse import ArgumentParser
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas.src.config import paths
+from sppas.src.resources import sppasVocabulary
+from sppas.src.resources import sppasDictPron
+from sppas.src.resources import sppasDictRepl
+from sppas.src.resources import sppasDumpFile
+from sppas.src.resources import sppasCompiledFile
+
+# ----------------------------------------------------------------------------
+# Verify and extract args:
+# ----------------------------------------------------------------------------
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to compile the linguistic "
+                                    "resources (vocab, dict, repl).")
+
+parser.add_argument("-i",
+                    metavar="file",
+                    action='append',
+                    help='Input resource file name (as many as wanted). '
+                         'Default is all the resources of the package.')
+
+parser.add_argument("--bench",
+                    action='store_true',
+                    help="Compare the loading times of the ASCII, dump "
+                         "and compiled files")
+
+parser.add_argument("--quiet",
+                    action='store_true',
+                    help="Disable the verbosity")
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def resource_class(filename):
+    """Return the class to load a resource file, or None."""
+    name = os.path.basename(filename)
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".vocab" or name == "Punctuations.txt":
+        return sppasVocabulary
+    if ext == ".dict":
+        return sppasDictPron
+    if ext == ".repl":
+        return sppasDictRepl
+    return None
+
+# ----------------------------------------------------------------------------
+
+
+def elapsed(function, *args, **kwargs):
+    """Return the time to execute a function, in seconds."""
+    start = time.time()
+    function(*args, **kwargs)
+    return time.time() - start
+
+# ----------------------------------------------------------------------------
+
+
+if args.i:
+    files = args.i
+else:
+    files = sorted(glob.glob(os.path.join(paths.resources, "vocab", "*.vocab")))
+    files.append(os.path.join(paths.resources, "vocab", "Punctuations.txt"))
+    files.extend(sorted(glob.glob(os.path.join(paths.resources, "dict", "*.dict"))))
+    files.extend(sorted(glob.glob(os.path.join(paths.resources, "repl", "*.repl"))))
+    files.extend(sorted(glob.glob(os.path.join(paths.resources, "num", "*.repl"))))
+
+# The dump files of the benchmark are created in a temporary directory,
+# so that the resources directories are left unchanged.
+bench_dir = None
+if args.bench:
+    bench_dir = tempfile.mkdtemp()
+
+if args.bench and not args.quiet:
+    print("{:<24s} {:>8s} {:>10s} {:>10s} {:>10s}"
+          "".format("resource", "entries", "ascii", "dump", "compiled"))
+
+try:
+    for filename in files:
+        rsc_class = resource_class(filename)
+        if rsc_class is None:
+            print("{:s}: unknown resource type. Ignored.".format(filename))
+            continue
+
+        rsc = rsc_class(filename, nodump=True)
+        if rsc.save_as_compiled() is False:
+            print("{:s}: compilation failed.".format(filename))
+            continue
+
+        if args.bench:
+            # Loading times of the ASCII file, then of the dump file (created
+            # from a copy of the ASCII file) and of the compiled file.
+            empty = rsc_class()
+            if rsc_class is sppasDictPron:
+                t_ascii = elapsed(empty.load, filename)
+            else:
+                t_ascii = elapsed(empty.load_from_ascii, filename)
+            copied = os.path.join(bench_dir, os.path.basename(filename))
+            shutil.copy2(filename, copied)
+            dp = sppasDumpFile(copied)
+            if rsc_class is sppasVocabulary:
+                dp.save_as_dump(dict((k, None) for k in rsc))
+            else:
+                dp.save_as_dump(dict((k, rsc.get(k)) for k in rsc))
+            t_dump = elapsed(dp.load_from_dump)
+            os.remove(dp.get_dump_filename())
+            os.remove(copied)
+            t_compiled = elapsed(
+                sppasCompiledFile(filename).load_from_compiled)
+            if not args.quiet:
+                print("{:<24s} {:>8d} {:>9.4f}s {:>9.4f}s {:>9.4f}s"
+                      "".format(os.path.basename(filename), len(rsc),
+                                t_ascii, t_dump, t_compiled))
+
+        elif not args.quiet:
+            compiled = sppasCompiledFile(filename).get_compiled_filename()
+            print("{:s}: {:d} entries compiled into {:s}"
+                  "".format(filename, len(rsc), compiled))
+
+finally:
+    if bench_dir is not None:
+        shutil.rmtree(bench_dir)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+    scripts.tierbench.py
+    ~~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the searches into the annotations of tiers.
+
+    A tier of tokens and a tier of their phonemes are created, like the
+    ones of the alignment. The time to find the relations between both
+    tiers, to find the phonemes of each token, to check if the tokens
+    are a subset of the phonemes and to fill the gaps is reported.
+
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import time
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasLocation, sppasInterval, sppasPoint
+from sppas.src.anndata.aio.aioutils import fill_gaps
+from sppas.src.analysis import sppasTierFilters
+
+# ----------------------------------------------------------------------------
+# Parse command-line
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "searches into tiers.")
+
+parser.add_argument("-n",
+                    metavar="value",
+                    default=5000,
+                    type=int,
+                    help='Number of tokens (default: 5000)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+tokens = sppasTier("TokensAlign")
+phones = sppasTier("PhonAlign")
+for i in range(args.n):
+    # a token of 3 phonemes, followed by a silence every 10 tokens
+    begin = i * 0.4
+    end = begin + (0.3 if i % 10 == 9 else 0.4)
+    tokens.create_annotation(sppasLocation(
+        sppasInterval(sppasPoint(begin, 0.005), sppasPoint(end, 0.005))))
+    duration = (end - begin) / 3.
+    for j in range(3):
+        phones.create_annotation(sppasLocation(
+            sppasInterval(sppasPoint(begin + j * duration, 0.005),
+                          sppasPoint(begin + (j+1) * duration, 0.005))))
+
+times = list()
+
+start = time.time()
+sppasTierFilters(phones).rel(tokens, "starts", "during", "finishes")
+times.append(("rel", time.time() - start))
+
+start = time.time()
+for token in tokens:
+    phones.find(token.get_lowest_localization(),
+                token.get_highest_localization())
+times.append(("find", time.time() - start))
+
+start = time.time()
+phones.is_superset(tokens)
+times.append(("is_superset", time.time() - start))
+
+start = time.time()
+fill_gaps(tokens)
+times.append(("fill_gaps", time.time() - start))
+
+print("Tokens: {:d}, Phonemes: {:d}".format(len(tokens), len(phones)))
+for name, duration in times:
+    print("{:>12s} {:>9.2f}s".format(name, duration))
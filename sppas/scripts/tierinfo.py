@@ -79,7 +79,7 @@ args = parser.parse_args()
 # ----------------------------------------------------------------------------
 
 parser = sppasRW(args.i)
-trs_input = parser.read()
+trs_input = parser.read(lazy=True)
 
 if args.t <= 0 or args.t > len(trs_input):
     print('Error: Bad tier number.\n')
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+    scripts.trsbench.py
+    ~~~~~~~~~~~~~~~~~~~
+
+    ... a script to benchmark the readers and writers of XML annotated files.
+
+    A transcription with large tiers is written then read in the XRA and
+    EAF formats. The time and the peak of memory allocated by python are
+    reported, with the peak of memory of the ElementTree of the whole
+    file for comparison.
+
+"""
+from argparse import ArgumentParser
+import os
+import sys
+import time
+import shutil
+import tracemalloc
+import xml.etree.cElementTree as ET
+
+PROGRAM = os.path.abspath(__file__)
+SPPAS = os.path.dirname(os.path.dirname(os.path.dirname(PROGRAM)))
+sys.path.append(SPPAS)
+
+from sppas.src.files.fileutils import sppasFileUtils
+from sppas.src.anndata import sppasTranscription
+from sppas.src.anndata import sppasLocation, sppasInterval, sppasPoint
+from sppas.src.anndata import sppasLabel, sppasTag
+from sppas.src.anndata.aio.xra import sppasXRA
+from sppas.src.anndata.aio.elan import sppasEAF
+
+# ----------------------------------------------------------------------------
+# Parse command-line
+
+parser = ArgumentParser(usage="%s [options]" % os.path.basename(PROGRAM),
+                        description="... a script to benchmark the "
+                                    "readers and writers of XML "
+                                    "annotated files.")
+
+parser.add_argument("-n",
+                    metavar="value",
+                    default=50000,
+                    type=int,
+                    help='Number of annotations of a tier (default: 50000)')
+
+parser.add_argument("-t",
+                    metavar="value",
+                    default=4,
+                    type=int,
+                    help='Number of tiers (default: 4)')
+
+args = parser.parse_args()
+
+# ----------------------------------------------------------------------------
+
+
+def create_transcription(nb_tiers, nb_anns):
+    """Return a transcription with tiers of consecutive intervals."""
+    trs = sppasTranscription("bench")
+    for t in range(nb_tiers):
+        tier = trs.create_tier("tier%d" % t)
+        for i in range(nb_anns):
+            loc = sppasInterval(sppasPoint(i * 0.1), sppasPoint((i+1) * 0.1))
+            tier.create_annotation(sppasLocation(loc),
+                                   sppasLabel(sppasTag("w%d_%d" % (t, i))))
+    return trs
+
+# ----------------------------------------------------------------------------
+
+
+def measure(function, *arguments):
+    """Return the time and the peak of memory (MB) of a function."""
+    tracemalloc.start()
+    start = time.time()
+    function(*arguments)
+    t = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return t, peak / 1024. / 1024.
+
+# ----------------------------------------------------------------------------
+
+
+temp = sppasFileUtils().set_random()
+os.mkdir(temp)
+try:
+    trs = create_transcription(args.t, args.n)
+    print("Tiers: {:d}, annotations per tier: {:d}".format(args.t, args.n))
+    print()
+    print("{:>6s} {:>9s} {:>9s} {:>11s} {:>9s} {:>11s} {:>11s}"
+          "".format("format", "size", "write", "write peak",
+                    "read", "read peak", "tree peak"))
+
+    for trs_class, ext in ((sppasXRA, ".xra"), (sppasEAF, ".eaf")):
+        filename = os.path.join(temp, "bench" + ext)
+        writer = trs_class()
+        writer.set(trs)
+        write_time, write_peak = measure(writer.write, filename)
+        reader = trs_class()
+        read_time, read_peak = measure(reader.read, filename)
+        # the memory of the tree of the whole file, without the transcription
+        tree_peak = measure(ET.parse, filename)[1]
+        size = os.path.getsize(filename) / 1024. / 1024.
+        print("{:>6s} {:>7.1f}MB {:>8.2f}s {:>9.1f}MB {:>8.2f}s {:>9.1f}MB "
+              "{:>9.1f}MB".format(ext[1:], size, write_time, write_peak,
+                                  read_time, read_peak, tree_peak))
+finally:
+    shutil.rmtree(temp)
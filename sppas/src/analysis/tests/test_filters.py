@@ -44,6 +44,7 @@
 import unittest
 import os.path
 import time
+import random
 
 from sppas.src.utils.makeunicode import u
 from sppas.src.anndata.aio.readwrite import sppasRW
@@ -51,6 +52,7 @@ from sppas.src.anndata.tier import sppasTier
 from sppas.src.anndata.ann.annlocation import sppasLocation
 from sppas.src.anndata.ann.annlocation import sppasInterval
 from sppas.src.anndata.ann.annlocation import sppasPoint
+from sppas.src.anndata.ann.annlocation import sppasIntervalCompare
 from sppas.src.anndata.ann.annlabel import sppasTag
 from sppas.src.anndata.ann.annlabel import sppasLabel
 from sppas.src.anndata.ann.annotation import sppasAnnotation
@@ -596,3 +598,43 @@ class TestFilterRelationTier(unittest.TestCase):
         res2 = f.rel(self.rtier, "overlaps") | f.rel(self.rtier, "overlappedby")
         self.assertEqual(res1, res2)
 
+    # -----------------------------------------------------------------------
+
+    def test_relations_of_all_annotations(self):
+        """Compare the relations to the ones of all pairs of annotations."""
+        random.seed(9)
+        tokens = sppasTier("Tokens")
+        phones = sppasTier("Phones")
+        begin = 0.
+        for i in range(50):
+            # some tokens are ending after the phones
+            end = round(begin + random.uniform(0.2, 1.), 3)
+            tokens.create_annotation(sppasLocation(
+                sppasInterval(sppasPoint(begin, 0.005),
+                              sppasPoint(end + random.choice((0., 0.1)), 0.005))))
+            times = sorted(round(random.uniform(begin, end), 3)
+                           for j in range(random.randint(0, 3)))
+            for b, e in zip([begin] + times, times + [end]):
+                if e - b > 0.01:
+                    phones.create_annotation(sppasLocation(
+                        sppasInterval(sppasPoint(b, 0.002),
+                                      sppasPoint(e, 0.002))))
+            begin = end
+
+        comparator = sppasIntervalCompare()
+        names = [name for name in comparator.get_function_names()
+                 if name.startswith(("before", "after")) is False]
+        for t1, t2 in ((tokens, phones), (phones, tokens)):
+            res = sppasTierFilters(t1).rel(t2, *names)
+            for ann in t1:
+                expected = set()
+                for other in t2:
+                    for name in names:
+                        if comparator.get(name)(ann.get_location().get_best(),
+                                                other.get_location().get_best()):
+                            expected.add(name)
+                if len(expected) > 0:
+                    self.assertEqual(expected, set(res.get_value(ann)))
+                else:
+                    self.assertFalse(ann in res)
+
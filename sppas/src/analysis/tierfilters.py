@@ -243,15 +243,22 @@ class sppasTierFilters(sppasBaseFilters):
         # extract the information from the arguments
         rel_functions = sppasTierFilters.__fix_relation_functions(comparator, *args)
 
+        # only 'before' and 'after' relations are possible between
+        # annotations without contact.
+        distant = False
+        for func_name, complement in rel_functions:
+            if func_name.__name__.startswith(("before", "after")):
+                distant = True
+
         data = sppasAnnSet()
 
         # search for the annotations to be returned:
         for annotation in self.obj:
 
-            location = annotation.get_location()
-            match_values = sppasTierFilters.__connect(location,
+            match_values = sppasTierFilters.__connect(annotation,
                                                       other_tier,
                                                       rel_functions,
+                                                      distant,
                                                       **kwargs)
             if len(match_values) > 0:
                 data.append(annotation, list(set(match_values)))
@@ -318,10 +325,23 @@ class sppasTierFilters(sppasBaseFilters):
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def __connect(location, other_tier, rel_functions, **kwargs):
-        """Find connections between location and the other tier."""
+    def __connect(annotation, other_tier, rel_functions, distant, **kwargs):
+        """Find connections between annotation and the other tier.
+
+        Unless distant is True, only the annotations of the other tier in
+        contact with the annotation are compared.
+
+        """
+        if distant is True:
+            lo, hi = 0, len(other_tier)
+        else:
+            lo, hi = other_tier.find_range(annotation.get_lowest_localization(),
+                                           annotation.get_highest_localization())
+
+        location = annotation.get_location()
         values = list()
-        for other_ann in other_tier:
+        for i in range(lo, hi):
+            other_ann = other_tier[i]
             for localization, score in location:
                 for other_loc, other_score in other_ann.get_location():
                     for func_name, complement in rel_functions:
@@ -57,6 +57,7 @@ from .aio.readwrite import sppasRW
 from .metadata import sppasMetaData
 from .transcription import sppasTranscription
 from .tier import sppasTier
+from .columntier import sppasColumnTier
 from .ctrlvocab import sppasCtrlVocab
 from .media import sppasMedia
 from .hierarchy import sppasHierarchy
@@ -75,6 +76,7 @@ __all__ = (
     'sppasRW',
     'sppasTranscription',
     'sppasTier',
+    'sppasColumnTier',
     'sppasAnnotation',
     'sppasCtrlVocab',
     'sppasMedia',
@@ -46,6 +46,8 @@
 
 """
 import codecs
+import io
+import xml.etree.cElementTree as ET
 
 from sppas.src.config import sg
 from sppas.src.config import symbols
@@ -581,3 +583,90 @@ def unalign(aligned_tier, ipus_separators=(SIL_ORTHO, SIL_PHONO, 'dummy')):
         new_tier.create_annotation(loc, sppasLabel(sppasTag(l)))
 
     return new_tier
+
+# ---------------------------------------------------------------------------
+
+
+class sppasXMLStreamWriter(object):
+    """Write an XML document element after element.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The start tag of the root is written when the writer is created, then
+    each child of the root is indented and serialized as soon as it is
+    given, so that it can be forgotten by the caller. The file is the same
+    as the one of the indented ElementTree of the whole document.
+
+    >>> with open(filename, "wb") as fp:
+    >>>     xml = sppasXMLStreamWriter(fp, ET.Element("Document"), indent)
+    >>>     for tier in trs:
+    >>>         xml.write(create_tier_element(tier))
+    >>>     xml.close()
+
+    """
+
+    def __init__(self, fp, root, indent, xml_declaration=False):
+        """Create a sppasXMLStreamWriter and write the start of the document.
+
+        :param fp: (file) A file opened in binary mode
+        :param root: (ET) Root element. Only its tag and attributes are used.
+        :param indent: (function) Pretty indent of an element at a level
+        :param xml_declaration: (bool) Write the XML declaration
+
+        """
+        self.__fp = fp
+        self.__indent = indent
+        self.__tail = None
+        self.__end = u("</{:s}>").format(root.tag)
+
+        if xml_declaration is True:
+            declaration = u("<?xml version='1.0' encoding='{:s}'?>\n")
+            self.__write(declaration.format(sg.__encoding__))
+
+        # the start tag is the serialized root without its end tag
+        start = ET.Element(root.tag, root.attrib)
+        start.text = "\n\t"
+        content = io.BytesIO()
+        ET.ElementTree(start).write(content,
+                                    encoding=sg.__encoding__,
+                                    xml_declaration=False,
+                                    method="xml")
+        end = (start.text + self.__end).encode(sg.__encoding__)
+        self.__fp.write(content.getvalue()[:-len(end)])
+
+    # -----------------------------------------------------------------------
+
+    def write(self, element):
+        """Indent and write a child of the root.
+
+        :param element: (ET) Element to write
+
+        """
+        # the tail of the previous element is not the same if it's the last
+        if self.__tail is None:
+            self.__write(u("\n\t"))
+        else:
+            self.__write(self.__tail)
+
+        self.__indent(element, 1)
+        self.__tail = element.tail
+        element.tail = None
+        ET.ElementTree(element).write(self.__fp,
+                                      encoding=sg.__encoding__,
+                                      xml_declaration=False,
+                                      method="xml")
+
+    # -----------------------------------------------------------------------
+
+    def close(self):
+        """Write the end of the document. The file is not closed."""
+        self.__write(u("\n") + self.__end + u("\n\n"))
+
+    # -----------------------------------------------------------------------
+
+    def __write(self, text):
+        self.__fp.write(text.encode(sg.__encoding__))
@@ -107,6 +107,7 @@ class sppasBaseIO(sppasTranscription):
         self._accept_radius = True
         self._accept_gaps = False
         self._accept_overlaps = False
+        self._accept_lazy = False
 
     # -----------------------------------------------------------------------
     # Getters
@@ -254,6 +255,16 @@ class sppasBaseIO(sppasTranscription):
         """
         return self._accept_overlaps
 
+    # -----------------------------------------------------------------------
+
+    def lazy_support(self):
+        """Return True if the annotations of tiers can be loaded on demand.
+
+        :returns: boolean
+
+        """
+        return self._accept_lazy
+
     # -----------------------------------------------------------------------
     # Setters
     # -----------------------------------------------------------------------
@@ -287,6 +298,74 @@ class sppasBaseIO(sppasTranscription):
 
     # -----------------------------------------------------------------------
 
+    def open(self, filename, tiers=None):
+        """Read a file and fill the transcription without annotations.
+
+        The tiers are created but their annotations are loaded only the
+        first time they are accessed.
+
+        :param filename: (str)
+        :param tiers: (list of str) Names of the tiers to read or None to
+        read all the tiers of the file.
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def load(self, tiers=None):
+        """Load the annotations of the tiers of an opened file.
+
+        :param tiers: (list of sppasTier) Tiers to load or None to load
+        all of them.
+
+        """
+        if tiers is None:
+            tiers = self.get_tier_list()
+        tiers = [tier for tier in tiers if tier.is_loaded() is False]
+        if len(tiers) > 0:
+            # the tiers are marked as loaded before they are filled
+            for tier in tiers:
+                tier.set_loader(None)
+            self.__load_tiers(tiers)
+
+    # -----------------------------------------------------------------------
+
+    def _load_tier(self, tier):
+        """The loader of a tier of an opened file."""
+        self.__load_tiers([tier])
+
+    # -----------------------------------------------------------------------
+
+    def __load_tiers(self, tiers):
+        """Fill the tiers like if they were read with the file.
+
+        The controlled vocabularies are assigned to the tiers when the file
+        is opened. They are unset while loading, like if they were assigned
+        after the annotations were read.
+
+        """
+        ctrl_vocabs = [tier.get_ctrl_vocab() for tier in tiers]
+        for tier in tiers:
+            tier.set_ctrl_vocab(None)
+        try:
+            self._load_tiers(tiers)
+        finally:
+            for tier, ctrl_vocab in zip(tiers, ctrl_vocabs):
+                tier.set_ctrl_vocab(ctrl_vocab)
+
+    # -----------------------------------------------------------------------
+
+    def _load_tiers(self, tiers):
+        """Fill the given tiers with their annotations of the opened file.
+
+        :param tiers: (list of sppasTier)
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
     def write(self, filename):
         """Write the transcription into a file.
 
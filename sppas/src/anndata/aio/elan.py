@@ -68,6 +68,7 @@ from ..ctrlvocab import sppasCtrlVocab
 
 from .basetrs import sppasBaseIO
 from .aioutils import format_labels
+from .aioutils import sppasXMLStreamWriter
 from .aioutils import point2interval
 from .aioutils import merge_overlapping_annotations
 
@@ -159,6 +160,7 @@ class sppasEAF(sppasBaseIO):
         self._accept_radius = False
         self._accept_gaps = True
         self._accept_overlaps = False  # to be verified
+        self._accept_lazy = True
 
         # Information that are both used by ELAN and another software tool
         self._map_meta = bidict()
@@ -168,6 +170,12 @@ class sppasEAF(sppasBaseIO):
         # ELAN only supports (and assumes) milliseconds.
         self.unit = 0.001
 
+        # the opened file, to load the annotations of the tiers on demand
+        self.__filename = None
+        self.__time_slots = dict()
+        self.__removed_annotations = dict()
+        self.__tier_ids = dict()
+
     # -----------------------------------------------------------------------
 
     def make_point(self, midpoint):
@@ -208,50 +216,237 @@ class sppasEAF(sppasBaseIO):
     def read(self, filename):
         """Read a ELAN EAF file.
 
+        The file is parsed incrementally: the element of a tier is cleared
+        as soon as its annotations are created, so that the tree of the
+        whole document is never in memory. Only the tiers referring to a
+        parent tier which is not already parsed are delayed.
+
         :param filename: (str) input filename.
 
         """
-        tree = ET.parse(filename)
-        root = tree.getroot()
+        tree_path = list()
+        elements = dict()
+        time_slots = None
+        tiers = list()
+        delayed = list()
+        removed_annotations = dict()
 
-        # 1. Document
-        self._parse_document(root)
+        for event, elem in ET.iterparse(filename, events=("start", "end")):
+
+            if event == "start":
+                tree_path.append(elem)
+                # 1. Document
+                if len(tree_path) == 1:
+                    self._parse_document(elem)
+                continue
+
+            tree_path.pop()
+            if len(tree_path) != 1:
+                continue
+            tree_path[0].remove(elem)
+
+            if elem.tag == 'TIER':
+                tiers.append(elem.attrib['TIER_ID'])
+                if time_slots is not None and \
+                        self.__is_parsable_tier(elem) is True:
+                    self._parse_tier(elem, time_slots, removed_annotations)
+                else:
+                    delayed.append(elem)
+
+            elif elem.tag == 'TIME_ORDER' and time_slots is None:
+                time_slots = sppasEAF._parse_time_order(elem)
+
+            else:
+                # small elements, parsed when the tiers are read
+                elements.setdefault(elem.tag, list()).append(elem)
+
+        # 2. License, 3. Header, 5. Controlled vocabularies
+        self.__parse_header_elements(elements)
+
+        # 4. Time order (1..1)
+        if time_slots is None:
+            raise AioFormatError('TIME_ORDER')
+
+        # 6. Tiers (0..*)
+        for tier_root in sppasEAF.__sort_tiers(delayed):
+            self._parse_tier(tier_root, time_slots, removed_annotations)
+        # we restore the original rank of each tier
+        for i, tier_name in enumerate(tiers):
+            self.set_tier_index(tier_name, i)
+
+        # 7. Linguistic type, 8. Locale, 9. Language
+        self.__parse_type_elements(elements)
+
+    # -----------------------------------------------------------------------
+
+    def open(self, filename, tiers=None):
+        """Read a ELAN EAF file without the annotations of the tiers.
+
+        The annotations of a tier are parsed the first time they are
+        accessed. The parent tiers of the given ones are also read because
+        they are required to load the reference tiers. The hierarchy links
+        of a tier are established when its annotations are loaded.
+
+        :param filename: (str) input filename.
+        :param tiers: (list of str) Names of the tiers to read or None to
+        read all the tiers of the file.
+
+        """
+        tree_path = list()
+        elements = dict()
+        time_slots = None
+        tier_roots = list()
+
+        for event, elem in ET.iterparse(filename, events=("start", "end")):
+
+            if event == "start":
+                tree_path.append(elem)
+                if len(tree_path) == 1:
+                    self._parse_document(elem)
+                continue
+
+            tree_path.pop()
+            if len(tree_path) == 2 and tree_path[1].tag == 'TIER':
+                # annotations are parsed when the tier is loaded
+                tree_path[1].remove(elem)
+            if len(tree_path) != 1:
+                continue
+            tree_path[0].remove(elem)
+
+            if elem.tag == 'TIER':
+                tier_roots.append(elem)
+            elif elem.tag == 'TIME_ORDER' and time_slots is None:
+                time_slots = sppasEAF._parse_time_order(elem)
+            else:
+                elements.setdefault(elem.tag, list()).append(elem)
+
+        self.__parse_header_elements(elements)
+        if time_slots is None:
+            raise AioFormatError('TIME_ORDER')
+
+        # the selected tiers and their ancestors
+        if tiers is not None:
+            parents = dict((tier_root.attrib['TIER_ID'],
+                            tier_root.attrib.get('PARENT_REF', None))
+                           for tier_root in tier_roots)
+            selected = set()
+            for name in tiers:
+                while name in parents and name not in selected:
+                    selected.add(name)
+                    name = parents[name]
+            tier_roots = [tier_root for tier_root in tier_roots
+                          if tier_root.attrib['TIER_ID'] in selected]
+
+        self.__filename = filename
+        self.__time_slots = time_slots
+        self.__removed_annotations = dict()
+        for tier_root in tier_roots:
+            tier = self._create_tier(tier_root)
+            self.__tier_ids[tier] = tier_root.attrib['TIER_ID']
+            tier.set_loader(self._load_tier)
+
+        self.__parse_type_elements(elements)
+
+    # -----------------------------------------------------------------------
+
+    def _load_tiers(self, tiers):
+        """Parse the annotations of the given tiers of the opened file.
+
+        The file is parsed until all the tiers are found.
+
+        :param tiers: (list of sppasTier)
+
+        """
+        pending = dict((self.__tier_ids[tier], tier) for tier in tiers)
+        delayed = list()
+        tree_path = list()
+
+        with open(self.__filename, "rb") as fp:
+            for event, elem in ET.iterparse(fp, events=("start", "end")):
+
+                if event == "start":
+                    tree_path.append(elem)
+                    continue
+
+                tree_path.pop()
+                if len(tree_path) != 1:
+                    continue
+                tree_path[0].remove(elem)
+
+                if elem.tag == 'TIER' and elem.attrib['TIER_ID'] in pending:
+                    if self.__is_parsable_tier(elem, pending) is True:
+                        tier = pending.pop(elem.attrib['TIER_ID'])
+                        self.__load_tier_annotations(elem, tier)
+                    else:
+                        delayed.append(elem)
+                    if len(pending) == len(delayed):
+                        break
+
+        for tier_root in sppasEAF.__sort_tiers(delayed):
+            tier = pending.pop(tier_root.attrib['TIER_ID'])
+            self.__load_tier_annotations(tier_root, tier)
+
+    # -----------------------------------------------------------------------
+
+    def __load_tier_annotations(self, tier_root, tier):
+        """Fill a tier of the opened file with its annotations.
+
+        :param tier_root: (ET) Tier root.
+        :param tier: (sppasTier) The tier to add the annotations
+
+        """
+        # the alignable annotations removed from the parent must be known
+        if 'PARENT_REF' in tier_root.attrib:
+            parent_tier = self.find(tier_root.attrib['PARENT_REF'])
+            if parent_tier is not None:
+                parent_tier.load()
 
+        self._parse_tier_annotations(tier_root,
+                                     tier,
+                                     self.__time_slots,
+                                     self.__removed_annotations)
+
+    # -----------------------------------------------------------------------
+
+    def __parse_header_elements(self, elements):
+        """Parse the license, header and controlled vocabularies.
+
+        :param elements: (dict) The elements of the document, by tag.
+
+        """
         # 2. License (0..*)
-        for i, license_root in enumerate(root.findall('LICENSE')):
+        for i, license_root in enumerate(elements.get('LICENSE', [])):
             self._parse_license(license_root, i)
 
         # 3. Header (1..1)
-        header_root = root.find('HEADER')
-        if header_root is None:
+        if 'HEADER' not in elements:
             raise AioFormatError('HEADER')
-        self._parse_header(root.find('HEADER'))
-
-        # 4. Time order (1..1)
-        time_order_root = root.find('TIME_ORDER')
-        if time_order_root is None:
-            raise AioFormatError('TIME_ORDER')
-        time_slots = sppasEAF._parse_time_order(time_order_root)
+        self._parse_header(elements['HEADER'][0])
 
         # 5. Controlled vocabularies (0..*)
-        for vocabulary_root in root.findall('CONTROLLED_VOCABULARY'):
+        for vocabulary_root in elements.get('CONTROLLED_VOCABULARY', []):
             ctrl_vocab = sppasEAF._parse_ctrl_vocab(vocabulary_root)
             if len(ctrl_vocab) > 0:
                 self.add_ctrl_vocab(ctrl_vocab)
 
-        # 6. Tiers (0..*)
-        self._parse_tiers(root, time_slots)
+    # -----------------------------------------------------------------------
+
+    def __parse_type_elements(self, elements):
+        """Parse the elements to be assigned to the tiers.
+
+        :param elements: (dict) The elements of the document, by tag.
 
+        """
         # 7. Linguistic type
-        for linguistic_root in root.findall('LINGUISTIC_TYPE'):
+        for linguistic_root in elements.get('LINGUISTIC_TYPE', []):
             self._parse_linguistic_type(linguistic_root)
 
         # 8. Locale (0..*)
-        for i, locale_root in enumerate(root.findall('LOCALE')):
+        for i, locale_root in enumerate(elements.get('LOCALE', [])):
             self._parse_locale(locale_root, i)
 
         # 9. Language
-        for i, language_root in enumerate(root.findall('LANGUAGE')):
+        for i, language_root in enumerate(elements.get('LANGUAGE', [])):
             self._parse_language(language_root, i)
 
         # 10. Constraint
@@ -262,6 +457,45 @@ class sppasEAF(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
+    def __is_parsable_tier(self, tier_root, pending=()):
+        """Return True if a tier can be parsed before the next ones.
+
+        Alignable tiers without parent can always be parsed, the other ones
+        only if their parent tier was already parsed.
+
+        :param tier_root: (ET) Tier root.
+        :param pending: Names of the tiers not parsed yet
+
+        """
+        if sppasEAF.__is_alignable_tier(tier_root) == 2:
+            return True
+        if 'PARENT_REF' in tier_root.attrib:
+            parent_tier_name = tier_root.attrib['PARENT_REF']
+            return self.find(parent_tier_name) is not None and \
+                parent_tier_name not in pending
+        return False
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __sort_tiers(tier_roots):
+        """Return the tiers in the order they can be parsed.
+
+        Like in _parse_tiers(), alignable tiers are parsed first, then
+        alignable-ref tiers and finally ref tiers.
+
+        :param tier_roots: (list of ET) Tier roots.
+
+        """
+        sorted_roots = list()
+        for alignable in ([2], [1], [0, -1]):
+            for tier_root in tier_roots:
+                if sppasEAF.__is_alignable_tier(tier_root) in alignable:
+                    sorted_roots.append(tier_root)
+        return sorted_roots
+
+    # -----------------------------------------------------------------------
+
     def _parse_document(self, document_root):
         """Get the main element root.
 
@@ -625,6 +859,21 @@ class sppasEAF(sppasBaseIO):
         :param tier_root: (ET) Tier root.
         :param time_slots: (dict)
 
+        """
+        tier = self._create_tier(tier_root)
+        self._parse_tier_annotations(tier_root,
+                                     tier,
+                                     time_slots,
+                                     removed_annotations)
+
+    # -----------------------------------------------------------------------
+
+    def _create_tier(self, tier_root):
+        """Create a sppasTier() from the attributes of a 'TIER' element.
+
+        :param tier_root: (ET) Tier root.
+        :returns: (sppasTier)
+
         """
         # The name is used as identifier.
         tier = self.create_tier(tier_root.attrib['TIER_ID'])
@@ -636,6 +885,19 @@ class sppasEAF(sppasBaseIO):
                 tier.set_meta(self._map_meta.get(key, key),
                               tier_root.attrib[key])
 
+        return tier
+
+    # -----------------------------------------------------------------------
+
+    def _parse_tier_annotations(self, tier_root, tier, time_slots,
+                                removed_annotations=dict()):
+        """Get the annotations of a 'TIER' element and fix the hierarchy.
+
+        :param tier_root: (ET) Tier root.
+        :param tier: (sppasTier) The tier to add the annotations
+        :param time_slots: (dict)
+
+        """
         # get annotations
         if sppasEAF.__is_alignable_tier(tier_root) > 0:
             self._parse_alignable_tier(tier_root,
@@ -871,6 +1133,11 @@ class sppasEAF(sppasBaseIO):
     def write(self, filename):
         """Write an ELAN EAF file.
 
+        The time slots are fixed first, then the elements of the document
+        are written one after the other: the element of a tier is created,
+        indented and serialized, then it's forgotten before the next one
+        is created.
+
         :param filename: output filename.
 
         """
@@ -884,46 +1151,67 @@ class sppasEAF(sppasBaseIO):
         # 3. Header: media, linked media, property
         self._format_header(root)
 
-        # 4. Time Order: we only create the main element
-        time_order_root = ET.SubElement(root, 'TIME_ORDER')
-
-        # 5. Tiers
-
-        # 5.1 Create the root of each tier
-        self._format_tier_root(root)
-        # 5.2 Fill alignable tiers with their annotations
+        # 4. Time Order: the time slots of all the alignable tiers
         alignable_tiers = self._fix_alignable_tiers()
-        time_slots = self._format_alignable_tiers(root, alignable_tiers)
-        # 5.3 Fill reference tiers with their annotations
-        self._format_reference_tiers(root, alignable_tiers)
-
-        # 5.4 Now that tiers are filled in the tree,
-        # we can generate properly the list of time slots
+        new_alignable_tiers = self._merge_alignable_tiers(alignable_tiers)
+        time_slots = sppasEAF._fix_alignable_time_slots(new_alignable_tiers)
+        time_order_root = ET.SubElement(root, 'TIME_ORDER')
         self._format_time_slots(time_order_root, time_slots)
 
-        # 6. Linguistic Types
-        self._format_linguistic_types(root)
+        # the other elements are created while writing the tiers
+        end_root = sppasEAF._format_document()
+        self._format_default_linguistic_type(end_root)
+
+        with open(filename, "wb") as fp:
+            xml = sppasXMLStreamWriter(fp, root, sppasEAF.indent)
+            for element in list(root):
+                root.remove(element)
+                xml.write(element)
+
+            # 5. Tiers
+            new_tiers = dict((t.get_name(), t) for t in new_alignable_tiers)
+            reference_tiers = self._fix_reference_tiers(alignable_tiers)
+            for tier in self:
+                if tier.is_disjoint() is True:
+                    continue
+                tier_root = sppasEAF._create_tier_root(tier)
+                # Fill alignable tiers with their annotations
+                if tier.get_name() in new_tiers:
+                    new_tier = new_tiers[tier.get_name()]
+                    sppasEAF._format_alignable_annotations(tier_root,
+                                                           new_tier,
+                                                           list())
+                    sppasEAF._re_format_alignable_annotations(tier_root,
+                                                              new_tier,
+                                                              time_slots)
+                # Fill reference tiers with their annotations
+                elif tier in reference_tiers:
+                    self._format_reference_tier(tier_root, tier)
 
-        # 7. Locale
-        self._format_locales(root)
+                # 6. Linguistic Type of the tier
+                self._format_linguistic_type(end_root, tier_root, tier)
+                xml.write(tier_root)
 
-        # 8. Language
-        self._format_languages(root)
+            # 7. Locale
+            self._format_locales(end_root)
 
-        # 9. Constraint
-        sppasEAF._format_constraints(root)
+            # 8. Language
+            self._format_languages(end_root)
 
-        # 10. Controlled vocabulary
-        for ctrl_vocab in self.get_ctrl_vocab_list():
-            self._format_ctrl_vocab(root, ctrl_vocab)
+            # 9. Constraint
+            sppasEAF._format_constraints(end_root)
 
-        # 11. Lexicon ref
+            # 10. Controlled vocabulary
+            for ctrl_vocab in self.get_ctrl_vocab_list():
+                self._format_ctrl_vocab(end_root, ctrl_vocab)
 
-        # 12. External ref
+            # 11. Lexicon ref
+
+            # 12. External ref
 
-        sppasEAF.indent(root)
-        tree = ET.ElementTree(root)
-        tree.write(filename, sg.__encoding__, method="xml")
+            for element in end_root:
+                xml.write(element)
+            xml.close()
 
     # -----------------------------------------------------------------------
 
@@ -1116,65 +1404,83 @@ class sppasEAF(sppasBaseIO):
 
         :param root: (ElementTree)
 
+        """
+        self._format_default_linguistic_type(root)
+
+        # fix the linguistic type of each tier
+        for tier_root in root.findall('TIER'):
+            tier = self.find(tier_root.attrib['TIER_ID'])
+            if tier is not None:
+                self._format_linguistic_type(root, tier_root, tier)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _format_default_linguistic_type(root):
+        """Add the default element 'LINGUISTIC_TYPE' into the ElementTree.
+
+        :param root: (ElementTree)
+
         """
         default_root = ET.SubElement(root, 'LINGUISTIC_TYPE')
         default_root.set('LINGUISTIC_TYPE_ID', 'default')
         default_root.set('TIME_ALIGNABLE', 'true')
         default_root.set('GRAPHIC_REFERENCES', 'false')
 
-        # fix the linguistic type of each tier
-        # we always have to search for a controlled vocabulary
-        for tier_root in root.findall('TIER'):
+    # -----------------------------------------------------------------------
 
-            tier = self.find(tier_root.attrib['TIER_ID'])
-            if tier is None:
-                continue
+    def _format_linguistic_type(self, root, tier_root, tier):
+        """Fix the linguistic type of a filled tier.
 
-            ctrl_vocab = tier.get_ctrl_vocab()
-
-            is_alignable = sppasEAF.__is_alignable_tier(tier_root)
-            # alignable tiers without parent (= default linguistic type)
-            if is_alignable == 2:
-                if ctrl_vocab is not None:
-                    linguistic_type_id = "a_"+ctrl_vocab.get_name()
-                    tier_root.set('LINGUISTIC_TYPE_REF', linguistic_type_id)
-
-                    exists = False
-                    # already existing?
-                    for ling_root in root.findall('LINGUISTIC_TYPE'):
-                        if linguistic_type_id == ling_root.attrib['LINGUISTIC_TYPE_ID']:
-                            exists = True
-                            break
-                    if not exists:
-                        # create it:
-                        default_root = ET.SubElement(root, 'LINGUISTIC_TYPE')
-                        default_root.set('LINGUISTIC_TYPE_ID',
-                                         linguistic_type_id)
-                        default_root.set('TIME_ALIGNABLE',
-                                         'true')
-                        default_root.set('GRAPHIC_REFERENCES',
-                                         'false')
-                        default_root.set('CONTROLLED_VOCABULARY_REF',
-                                         ctrl_vocab.get_name())
-
-            # alignable tiers with a parent
-            elif is_alignable == 1:
-                continue
+        The element 'LINGUISTIC_TYPE' is added into the ElementTree if
+        required. We always have to search for a controlled vocabulary.
+
+        :param root: (ElementTree)
+        :param tier_root: (ET) Tier root, filled with its annotations
+        :param tier: (sppasTier)
+
+        """
+        ctrl_vocab = tier.get_ctrl_vocab()
 
-            # ref tiers
-            elif is_alignable == 0:
-                linguistic_type_id = "r_" + tier.get_name()
+        is_alignable = sppasEAF.__is_alignable_tier(tier_root)
+        # alignable tiers without parent (= default linguistic type)
+        if is_alignable == 2:
+            if ctrl_vocab is not None:
+                linguistic_type_id = "a_"+ctrl_vocab.get_name()
                 tier_root.set('LINGUISTIC_TYPE_REF', linguistic_type_id)
 
-                default_root = ET.SubElement(root, 'LINGUISTIC_TYPE')
-                default_root.set('LINGUISTIC_TYPE_ID', linguistic_type_id)
-                default_root.set('CONSTRAINTS', "Symbolic_Association")
-                default_root.set('TIME_ALIGNABLE', 'false')
-                default_root.set('GRAPHIC_REFERENCES', 'false')
-                if ctrl_vocab is not None:
+                exists = False
+                # already existing?
+                for ling_root in root.findall('LINGUISTIC_TYPE'):
+                    if linguistic_type_id == ling_root.attrib['LINGUISTIC_TYPE_ID']:
+                        exists = True
+                        break
+                if not exists:
+                    # create it:
+                    default_root = ET.SubElement(root, 'LINGUISTIC_TYPE')
+                    default_root.set('LINGUISTIC_TYPE_ID',
+                                     linguistic_type_id)
+                    default_root.set('TIME_ALIGNABLE',
+                                     'true')
+                    default_root.set('GRAPHIC_REFERENCES',
+                                     'false')
                     default_root.set('CONTROLLED_VOCABULARY_REF',
                                      ctrl_vocab.get_name())
 
+        # ref tiers (alignable tiers with a parent are unchanged)
+        elif is_alignable == 0:
+            linguistic_type_id = "r_" + tier.get_name()
+            tier_root.set('LINGUISTIC_TYPE_REF', linguistic_type_id)
+
+            default_root = ET.SubElement(root, 'LINGUISTIC_TYPE')
+            default_root.set('LINGUISTIC_TYPE_ID', linguistic_type_id)
+            default_root.set('CONSTRAINTS', "Symbolic_Association")
+            default_root.set('TIME_ALIGNABLE', 'false')
+            default_root.set('GRAPHIC_REFERENCES', 'false')
+            if ctrl_vocab is not None:
+                default_root.set('CONTROLLED_VOCABULARY_REF',
+                                 ctrl_vocab.get_name())
+
     # -----------------------------------------------------------------------
 
     def _format_locales(self, root):
@@ -1285,9 +1591,23 @@ class sppasEAF(sppasBaseIO):
 
         for tier in self:
             if tier.is_disjoint() is False:
-                tier_root = ET.SubElement(root, 'TIER')
-                tier_root.set('TIER_ID', tier.get_name())
-                tier_root.set('LINGUISTIC_TYPE_REF', 'default')
+                root.append(sppasEAF._create_tier_root(tier))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _create_tier_root(tier):
+        """Create the element 'TIER' of a tier. Do not fill at all.
+
+        :param tier: (sppasTier)
+        :returns: (ET)
+
+        """
+        tier_root = ET.Element('TIER')
+        tier_root.set('TIER_ID', tier.get_name())
+        tier_root.set('LINGUISTIC_TYPE_REF', 'default')
+
+        return tier_root
 
     # -----------------------------------------------------------------------
 
@@ -1300,16 +1620,41 @@ class sppasEAF(sppasBaseIO):
         :param alignable_tiers: (list)
         :returns: (dict) Time slots
 
+        """
+        new_alignable_tiers = self._merge_alignable_tiers(alignable_tiers)
+        time_slots = sppasEAF._fix_alignable_time_slots(new_alignable_tiers)
+
+        # create the annotations, with the time slots instead of time values
+        for tier in new_alignable_tiers:
+            for tier_root in root.findall('TIER'):
+                if tier_root.attrib['TIER_ID'] == tier.get_name():
+                    sppasEAF._format_alignable_annotations(tier_root,
+                                                           tier,
+                                                           list())
+                    sppasEAF._re_format_alignable_annotations(tier_root,
+                                                              tier,
+                                                              time_slots)
+
+        return time_slots
+
+    # -----------------------------------------------------------------------
+
+    def _merge_alignable_tiers(self, alignable_tiers):
+        """Return the alignable tiers without overlaps, points or disjoint.
+
+        :param alignable_tiers: (list)
+        :returns: (list of sppasTier) New tiers, in the order of self
+
         """
         # no tier, nothing to do!
         if self.is_empty():
-            return {}
+            return []
 
         min_time_point = self.get_min_loc()
         max_time_point = self.get_max_loc()
         if min_time_point is None or max_time_point is None:
             # only empty tiers in the transcription: nothing to add in the tree
-            return {}
+            return []
 
         # we have to remove the hierarchy because instead we can't merge
         # overlapping annotations
@@ -1332,31 +1677,33 @@ class sppasEAF(sppasBaseIO):
             new_tier.set_meta('id', tier.get_meta('id'))
             new_alignable_tiers.append(new_tier)
 
-        # create the annotations
-        time_values = list()
-        for tier in new_alignable_tiers:
-            for tier_root in root.findall('TIER'):
-                if tier_root.attrib['TIER_ID'] == tier.get_name():
-                    sppasEAF._format_alignable_annotations(tier_root,
-                                                           tier,
-                                                           time_values)
+        # restore the hierarchy...
+        self._hierarchy = hierarchy_backup
 
-        # assign time slots to annotations
-        time_slots = sppasEAF._fix_time_slots(time_values)
+        return new_alignable_tiers
 
-        # then, we can assign the time slots to annotations,
-        # instead of time values
-        for tier in new_alignable_tiers:
-            for tier_root in root.findall('TIER'):
-                if tier_root.attrib['TIER_ID'] == tier.get_name():
-                    sppasEAF._re_format_alignable_annotations(tier_root,
-                                                              tier,
-                                                              time_slots)
+    # -----------------------------------------------------------------------
 
-        # restore the hierarchy...
-        self._hierarchy = hierarchy_backup
+    @staticmethod
+    def _fix_alignable_time_slots(alignable_tiers):
+        """Return the time slots of the annotations of alignable tiers.
 
-        return time_slots
+        The annotations of a tier are created in a temporary element to
+        get their time values, so that only one tier is in memory.
+
+        :param alignable_tiers: (list) Tiers without overlaps, points or
+        disjoint.
+        :returns: (dict) The link between (time values/tier) and time slots.
+
+        """
+        time_values = list()
+        for tier in alignable_tiers:
+            sppasEAF._format_alignable_annotations(ET.Element('TIER'),
+                                                   tier,
+                                                   time_values)
+
+        # assign time slots to annotations
+        return sppasEAF._fix_time_slots(time_values)
 
     # -----------------------------------------------------------------------
 
@@ -1375,6 +1722,7 @@ class sppasEAF(sppasBaseIO):
         of the tiers. Is completed in this method.
 
         """
+        known = set(time_values)
         for ann in tier:
 
             # create an ANNOTATION for each label.
@@ -1404,10 +1752,10 @@ class sppasEAF(sppasBaseIO):
 
                 # we save only once a couple (time_value, rank, tier).
                 # it allows to link consecutive annotations.
-                if (b, b_rank, tier) not in time_values:
-                    time_values.append((b, b_rank, tier))
-                if (e, e_rank, tier) not in time_values:
-                    time_values.append((e, e_rank, tier))
+                for key in ((b, b_rank, tier), (e, e_rank, tier)):
+                    if key not in known:
+                        known.add(key)
+                        time_values.append(key)
 
     # -----------------------------------------------------------------------
 
@@ -1545,54 +1893,78 @@ class sppasEAF(sppasBaseIO):
         Only for reference tiers (annotations are not aligned but reference).
 
         :param root: (ElementTree)
-        :returns: (dict) Time slots
 
         """
+        for tier in self._fix_reference_tiers(alignable_tiers):
+            for tier_root in root.findall('TIER'):
+                if tier_root.attrib['TIER_ID'] == tier.get_name():
+                    self._format_reference_tier(tier_root, tier)
+                    break
+
+    # -----------------------------------------------------------------------
+
+    def _fix_reference_tiers(self, alignable_tiers):
+        """Return the list of tiers to be filled with annotation refs.
+
+        :param alignable_tiers: (list)
+        :returns: (list)
+
+        """
+        reference_tiers = list()
+
         # no tier, nothing to do!
         if self.is_empty():
-            return
+            return reference_tiers
 
         # all tiers are aligned, nothing to do!
         if len(alignable_tiers) == len(self):
-            return
+            return reference_tiers
 
         for tier in self:
             if tier in alignable_tiers:
                 continue
-            tier_root = None
-            for t_root in root.findall('TIER'):
-                if t_root.attrib['TIER_ID'] == tier.get_name():
-                    tier_root = t_root
-                    break
-            if tier_root is None:
+            # there's no element for this tier
+            if tier.is_disjoint() is True:
                 break
+            reference_tiers.append(tier)
 
-            # necessarily, this tier has a parent in the hierarchy.
-            parent_tier = self.get_hierarchy().get_parent(tier)
-            tier_root.set('PARENT_REF', parent_tier.get_name())
+        return reference_tiers
 
-            for ann in tier:
-                begin_value = ann.get_lowest_localization()
-                end_value = ann.get_highest_localization()
-                parent_ann = parent_tier.find(begin_value, end_value)
-
-                if len(parent_ann) != 1:
-                    logging.info("Failed to find one annotation reference "
-                                 "for {:s}. "
-                                 "Found: {:s}."
-                                 "".format(ann, parent_ann))
-                    raise AioFormatError(ann)
-                parent_id = parent_ann[0].get_meta('id')
-
-                ann_root = ET.SubElement(tier_root, "ANNOTATION")
-                ref_ann_root = ET.SubElement(ann_root, "REF_ANNOTATION")
-                ref_ann_root.set('ANNOTATION_ID', ann.get_meta('id'))
-                ref_ann_root.set('ANNOTATION_REF', parent_id)
-
-                # Assign the label
-                label_ann_root = ET.SubElement(ref_ann_root,
-                                               'ANNOTATION_VALUE')
-                label_ann_root.text = ann.serialize_labels(separator="\n")
+    # -----------------------------------------------------------------------
+
+    def _format_reference_tier(self, tier_root, tier):
+        """Fill the element 'TIER' of a reference tier.
+
+        :param tier_root: (ET) Tier root
+        :param tier: (sppasTier) A tier with a parent in the hierarchy
+
+        """
+        # necessarily, this tier has a parent in the hierarchy.
+        parent_tier = self.get_hierarchy().get_parent(tier)
+        tier_root.set('PARENT_REF', parent_tier.get_name())
+
+        for ann in tier:
+            begin_value = ann.get_lowest_localization()
+            end_value = ann.get_highest_localization()
+            parent_ann = parent_tier.find(begin_value, end_value)
+
+            if len(parent_ann) != 1:
+                logging.info("Failed to find one annotation reference "
+                             "for {:s}. "
+                             "Found: {:s}."
+                             "".format(ann, parent_ann))
+                raise AioFormatError(ann)
+            parent_id = parent_ann[0].get_meta('id')
+
+            ann_root = ET.SubElement(tier_root, "ANNOTATION")
+            ref_ann_root = ET.SubElement(ann_root, "REF_ANNOTATION")
+            ref_ann_root.set('ANNOTATION_ID', ann.get_meta('id'))
+            ref_ann_root.set('ANNOTATION_REF', parent_id)
+
+            # Assign the label
+            label_ann_root = ET.SubElement(ref_ann_root,
+                                           'ANNOTATION_VALUE')
+            label_ann_root.text = ann.serialize_labels(separator="\n")
 
     # -----------------------------------------------------------------------
     # PRIVATE
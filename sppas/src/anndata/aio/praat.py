@@ -65,6 +65,7 @@ from ..ann.annlocation import sppasInterval
 from ..ann.annlabel import sppasLabel
 from ..ann.annlabel import sppasTag
 from ..ann.annotation import sppasAnnotation
+from ..columntier import sppasColumnTier
 
 from .aioutils import fill_gaps
 from .aioutils import merge_overlapping_annotations
@@ -351,6 +352,11 @@ class sppasTextGrid(sppasBasePraat):
 
         self._accept_point = True
         self._accept_interval = True
+        self._accept_lazy = True
+
+        # the opened file, to load the annotations of the tiers on demand
+        self.__filename = None
+        self.__tier_lines = dict()
 
     # -----------------------------------------------------------------------
 
@@ -359,21 +365,113 @@ class sppasTextGrid(sppasBasePraat):
 
         :param filename: is the input file name, ending by ".TextGrid"
 
+        """
+        lines = self.__load_lines(filename)
+        self.__parse_lines(lines)
+
+    # -----------------------------------------------------------------------
+
+    def open(self, filename, tiers=None):
+        """Read a TextGrid file without the annotations of the tiers.
+
+        The annotations of a tier are parsed the first time they are
+        accessed.
+
+        :param filename: is the input file name, ending by ".TextGrid"
+        :param tiers: (list of str) Names of the tiers to read or None to
+        read all the tiers of the file.
+
+        """
+        lines = self.__load_lines(filename)
+        self.__filename = filename
+        self.__tier_lines = dict()
+        self.__parse_lines(lines, tiers, lazy=True)
+
+    # -----------------------------------------------------------------------
+
+    def _load_tiers(self, tiers):
+        """Parse the annotations of the given tiers of the opened file.
+
+        :param tiers: (list of sppasTier)
+
+        """
+        lines = self.__load_lines(self.__filename)
+        is_long = not lines[6].strip().isdigit()
+        for tier in tiers:
+            self._parse_annotations(tier,
+                                    lines,
+                                    self.__tier_lines[tier],
+                                    is_long)
+
+    # -----------------------------------------------------------------------
+
+    def read_columns(self, filename, tiers=None):
+        """Read the tiers of a TextGrid file into columnar tiers.
+
+        No annotation is created: the time values and the texts are stored
+        into the columns of the tiers.
+
+        :param filename: is the input file name, ending by ".TextGrid"
+        :param tiers: (list of str) Names of the tiers to read or None to
+        read all the tiers of the file.
+        :returns: (list of sppasColumnTier)
+
+        """
+        lines = self.__load_lines(filename)
+        is_long = not lines[6].strip().isdigit()
+
+        last_line = len(lines) - 1
+        cur_line = 7
+        if is_long is True:
+            # Ignore the line 'item []:'
+            cur_line += 1
+
+        columns = list()
+        while cur_line < last_line:
+            # Ignore the line: 'item [1]:'
+            if is_long is True:
+                cur_line += 1
+            tier_name = sppasBasePraat._parse_string(lines[cur_line+1])
+            if tiers is None or tier_name in tiers:
+                tier = sppasColumnTier(tier_name)
+                sppasTextGrid._parse_columns(tier, lines, cur_line, is_long)
+                columns.append(tier)
+            cur_line = sppasTextGrid._skip_tier(lines, cur_line, is_long)
+
+        return columns
+
+    # -----------------------------------------------------------------------
+
+    def __load_lines(self, filename):
+        """Return the content of a TextGrid file.
+
+        :param filename: is the input file name, ending by ".TextGrid"
+        :returns: (list of str) the lines of the file
+
         """
         if not self.detect(filename):
             raise IOError('{:s} is not of the expected {:s} format.'
                           ''.format(filename, self.default_extension))
 
-        # get the content of the file
-
         try:
-            lines = load(filename, sg.__encoding__)
+            return load(filename, sg.__encoding__)
         except AioEncodingError:
             try:
-                lines = load(filename, "UTF-16")
+                return load(filename, "UTF-16")
             except AioEncodingError:
                 raise AioEncodingError(filename, "", sg.__encoding__+"/UTF-16")
 
+    # -----------------------------------------------------------------------
+
+    def __parse_lines(self, lines, tiers=None, lazy=False):
+        """Parse the content of a TextGrid file.
+
+        :param lines: the contents of the file.
+        :param tiers: (list of str) Names of the tiers to read or None
+        :param lazy: (bool) Set a loader to the tiers instead of parsing
+        their annotations
+
+        """
         # parse the header of the file
 
         # if the size isn't named, it is a short TextGrid file
@@ -392,7 +490,16 @@ class sppasTextGrid(sppasBasePraat):
             # with the tier number between the brackets
             if is_long is True:
                 cur_line += 1
-            cur_line = self._parse_tier(lines, cur_line, is_long)
+            if lazy is False:
+                cur_line = self._parse_tier(lines, cur_line, is_long)
+                continue
+
+            tier_name = sppasBasePraat._parse_string(lines[cur_line+1])
+            if tiers is None or tier_name in tiers:
+                tier = self._create_tier(lines, cur_line)
+                self.__tier_lines[tier] = cur_line
+                tier.set_loader(self._load_tier)
+            cur_line = sppasTextGrid._skip_tier(lines, cur_line, is_long)
 
     # -----------------------------------------------------------------------
 
@@ -405,19 +512,39 @@ class sppasTextGrid(sppasBasePraat):
         :returns: (int) Number of lines of this tier
 
         """
-        # Parse the header of the tier
+        tier = self._create_tier(lines, start_line)
+        return self._parse_annotations(tier, lines, start_line, is_long)
 
-        tier_type = sppasBasePraat._parse_string(lines[start_line])
+    # -----------------------------------------------------------------------
+
+    def _create_tier(self, lines, start_line):
+        """Create a tier from the header of a tier of a TextGrid file.
+
+        :param lines: the contents of the file.
+        :param start_line: index in lines when the tier content starts.
+        :returns: (sppasTier)
+
+        """
         tier_name = sppasBasePraat._parse_string(lines[start_line+1])
-        tier_size = sppasBasePraat._parse_int(lines[start_line+4])
         tier = self.create_tier(tier_name)
+        sppasTextGrid.__is_interval_tier(lines, start_line)
 
-        if tier_type == "IntervalTier":
-            is_interval = True
-        elif tier_type == "TextTier":
-            is_interval = False
-        else:
-            raise AioLineFormatError(start_line+1, lines[start_line])
+        return tier
+
+    # -----------------------------------------------------------------------
+
+    def _parse_annotations(self, tier, lines, start_line, is_long):
+        """Parse the annotations of a tier from the content of a TextGrid.
+
+        :param tier: (sppasTier) The tier to add the annotations
+        :param lines: the contents of the file.
+        :param start_line: index in lines when the tier content starts.
+        :param is_long: (bool) False if the TextGrid is in short form.
+        :returns: (int) Number of lines of this tier
+
+        """
+        is_interval = sppasTextGrid.__is_interval_tier(lines, start_line)
+        tier_size = sppasBasePraat._parse_int(lines[start_line+4])
 
         # Parse the content of the tier
         start_line += 5
@@ -437,6 +564,110 @@ class sppasTextGrid(sppasBasePraat):
 
     # -----------------------------------------------------------------------
 
+    @staticmethod
+    def _parse_columns(tier, lines, start_line, is_long):
+        """Parse the annotations of a tier into a columnar tier.
+
+        :param tier: (sppasColumnTier) The tier to append the annotations
+        :param lines: the contents of the file.
+        :param start_line: index in lines when the tier content starts.
+        :param is_long: (bool) False if the TextGrid is in short form.
+        :returns: (int) Number of lines of this tier
+
+        """
+        is_interval = sppasTextGrid.__is_interval_tier(lines, start_line)
+        tier_size = sppasBasePraat._parse_int(lines[start_line+4])
+
+        start_line += 5
+        end = len(lines) - 1
+
+        while start_line < end and len(tier) < tier_size:
+            if is_long is True:
+                start_line += 1
+            first_line = start_line
+            midpoint = sppasBasePraat._parse_float(lines[start_line],
+                                                   start_line+1)
+            start_line += 1
+            if is_interval is True:
+                if start_line >= len(lines):
+                    raise AioLineFormatError(start_line-1, lines[-1])
+                end_point = sppasBasePraat._parse_float(lines[start_line],
+                                                        start_line+1)
+                start_line += 1
+            if start_line >= len(lines):
+                raise AioLineFormatError(start_line - 1, lines[-1])
+
+            text, next_line = sppasTextGrid._read_text(lines, start_line)
+            text = text.strip()
+            if "\n" in text or \
+                    (text.startswith("{") and text.endswith("}") and "|" in text):
+                # several labels or alternative tags
+                ann, start_line = sppasTextGrid._parse_annotation(
+                    lines, first_line, is_interval)
+                tier.append(ann)
+                continue
+
+            start_line = next_line
+            if len(text) == 0:
+                text = None
+            if is_interval is True:
+                tier.append_interval(midpoint, end_point, text, radius=0.0005)
+            else:
+                tier.append_point(midpoint, text, radius=0.0005)
+
+        return start_line
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _skip_tier(lines, start_line, is_long):
+        """Skip a tier in the content of a TextGrid file.
+
+        :param lines: the contents of the file.
+        :param start_line: index in lines when the tier content starts.
+        :param is_long: (bool) False if the TextGrid is in short form.
+        :returns: (int) Number of lines of this tier
+
+        """
+        is_interval = sppasTextGrid.__is_interval_tier(lines, start_line)
+        tier_size = sppasBasePraat._parse_int(lines[start_line+4])
+
+        start_line += 5
+        end = len(lines) - 1
+        nb_annotations = 0
+
+        while start_line < end and nb_annotations < tier_size:
+            if is_long is True:
+                start_line += 1
+            # the localization, then the text
+            start_line += 1
+            if is_interval is True:
+                start_line += 1
+            if start_line >= len(lines):
+                raise AioLineFormatError(start_line - 1, lines[-1])
+            start_line = sppasTextGrid._skip_text(lines, start_line)
+            nb_annotations += 1
+
+        return start_line
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __is_interval_tier(lines, start_line):
+        """Return True if the tier is an IntervalTier, False if a TextTier.
+
+        :raises: AioLineFormatError
+
+        """
+        tier_type = sppasBasePraat._parse_string(lines[start_line])
+        if tier_type == "IntervalTier":
+            return True
+        elif tier_type == "TextTier":
+            return False
+        raise AioLineFormatError(start_line+1, lines[start_line])
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def _parse_annotation(lines, start_line, is_interval):
         """Read an annotation from an IntervalTier in the content of lines.
@@ -490,6 +721,30 @@ class sppasTextGrid(sppasBasePraat):
         text can be on several lines.
         we save each line in an individual label.
 
+        """
+        text, end_line = sppasTextGrid._read_text(lines, start_line)
+
+        return format_labels(text, separator="\n"), end_line
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _read_text(lines, start_line):
+        """Return the text entry and the index of the next line."""
+        end_line = sppasTextGrid._skip_text(lines, start_line)
+        text = "\n".join(sppasBasePraat._parse_string(line.strip())
+                         for line in lines[start_line:end_line])
+
+        return text, end_line
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _skip_text(lines, start_line):
+        """Return the index of the line following a text entry.
+
+        text can be on several lines.
+
         """
         # read one line
         line = lines[start_line].strip()
@@ -498,9 +753,6 @@ class sppasTextGrid(sppasBasePraat):
         # text = "
         first = line.find('"')
         last = line.rfind('"')
-
-        # parse this line
-        text = sppasBasePraat._parse_string(line)
         start_line += 1
 
         # if the text continue on the following lines
@@ -509,14 +761,13 @@ class sppasTextGrid(sppasBasePraat):
             first = line.find('"')
             last = line.rfind('"')
 
-            text += "\n" + sppasBasePraat._parse_string(line)
             start_line += 1
             if line.endswith('"'):
                 break
             if start_line >= len(lines):
                 raise AioLineFormatError(start_line-1, lines[-1])
 
-        return format_labels(text, separator="\n"), start_line
+        return start_line
 
     # -----------------------------------------------------------------------
     # Writer
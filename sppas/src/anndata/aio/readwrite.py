@@ -165,11 +165,19 @@ class sppasRW(object):
         
     # -----------------------------------------------------------------------
 
-    def read(self, heuristic=True):
+    def read(self, heuristic=True, tiers=None, lazy=False):
         """Read a transcription from a file.
 
+        With the readers supporting it (TextGrid, XRA, EAF), only the
+        given tiers are read and their annotations can be loaded on demand,
+        the first time they are accessed. The other readers read the whole
+        file then the tiers not selected are removed.
+
         :param heuristic: (bool) if the extension of the file is unknown, use
         an heuristic to detect the format, then to choose the reader-writer.
+        :param tiers: (list of str) Names of the tiers to read or None to
+        read all the tiers.
+        :param lazy: (bool) Load the annotations of the tiers on demand.
         :returns: sppasTranscription reader-writer
 
         """
@@ -194,7 +202,17 @@ class sppasRW(object):
             trs.set_meta('file_read_date', sppasTime().now)
 
             # Read the file content dans store into a Transcription()
-            trs.read(self.__filename)
+            if trs.lazy_support() is True and \
+                    (lazy is True or tiers is not None):
+                trs.open(self.__filename, tiers)
+                if lazy is False:
+                    trs.load()
+            else:
+                trs.read(self.__filename)
+                if tiers is not None:
+                    for i in reversed(range(len(trs))):
+                        if trs[i].get_name() not in tiers:
+                            trs.pop(i)
 
         except UnicodeError as e:
             raise AioEncodingError(filename=self.__filename, error_msg=str(e))
@@ -253,6 +271,9 @@ class sppasRW(object):
 
         """
         trs_rw = sppasRW.create_trs_from_extension(self.__filename)
+        # the hierarchy links of a tier are known when it is loaded
+        for tier in transcription:
+            tier.load()
         trs_rw.set(transcription)
 
         # Add metadata about the file
@@ -581,7 +581,9 @@ class sppasTRS(sppasBaseIO):
                 # Update the end of the previous annotation
                 # to the current value
                 if prev_ann is not None:
-                    prev_ann.get_location().get_best().set_end(begin)
+                    localization = prev_ann.get_location().get_best()
+                    localization.set_end(begin)
+                    prev_ann.set_best_localization(localization)
 
                 # create new annotation covering the rest of the turn.
                 # will eventually be reduced by the rest of the turn content.
@@ -52,6 +52,7 @@ from ..ann.annlabel import sppasLabel
 from ..ann.annlabel import sppasTag
 
 from .basetrs import sppasBaseIO
+from .aioutils import sppasXMLStreamWriter
 
 # ---------------------------------------------------------------------------
 
@@ -118,54 +119,219 @@ class sppasXRA(sppasBaseIO):
         self._accept_radius = True
         self._accept_gaps = True
         self._accept_overlaps = True
+        self._accept_lazy = True
 
         self.__format = "1.4"
 
+        # the opened file, to load the annotations of the tiers on demand
+        self.__filename = None
+        self.__tier_ranks = dict()
+        self.__links = dict()
+
     # -----------------------------------------------------------------------
 
     def read(self, filename):
         """Read an XRA file and fill the Transcription.
 
+        The file is parsed incrementally: each annotation is created and
+        its element is cleared as soon as it is parsed, so that the tree of
+        the whole document is never in memory.
+
         :param filename: (str)
 
         """
-        tree = ET.parse(filename)
-        root = tree.getroot()
+        self.__parse(filename)
 
-        if "name" in root.attrib:
-            self.set_name(root.attrib['name'])
+    # -----------------------------------------------------------------------
 
-        if "version" in root.attrib:
-            self.set_meta('file_created_format_version',
-                          root.attrib['version'])
+    def open(self, filename, tiers=None):
+        """Read an XRA file without the annotations of the tiers.
 
-        if "date" in root.attrib:
-            self.set_meta('file_created_date',
-                          root.attrib['date'])
+        The annotations of a tier are parsed the first time they are
+        accessed. The hierarchy links of a tier are established when its
+        annotations are loaded.
 
-        if "author" in root.attrib:
-            self.set_meta('file_created_author',
-                          root.attrib['author'])
+        :param filename: (str)
+        :param tiers: (list of str) Names of the tiers to read or None to
+        read all the tiers of the file.
 
-        metadata_root = root.find('Metadata')
-        if metadata_root is not None:
-            sppasXRA._parse_metadata(self, metadata_root)
+        """
+        self.__filename = filename
+        self.__tier_ranks = dict()
+        self.__links = dict()
+        self.__parse(filename, tiers, lazy=True)
 
-        for tier_root in root.findall('Tier'):
-            self._parse_tier(tier_root)
+    # -----------------------------------------------------------------------
 
-        for media_root in root.findall('Media'):
+    def __parse(self, filename, tiers=None, lazy=False):
+        """Parse an XRA file.
+
+        :param filename: (str)
+        :param tiers: (list of str) Names of the tiers to read or None
+        :param lazy: (bool) Set a loader to the tiers instead of parsing
+        their annotations
+
+        """
+        tree_path = list()
+        rank = -1
+        tier_root = None
+        tier = None
+        tier_metadata = False
+        metadata_root = None
+        media = list()
+        hierarchy_root = None
+        vocabulary = list()
+
+        for event, elem in ET.iterparse(filename, events=("start", "end")):
+
+            if event == "start":
+                tree_path.append(elem)
+                if len(tree_path) == 1:
+                    self._parse_document(elem)
+                elif len(tree_path) == 2 and elem.tag == "Tier":
+                    rank += 1
+                    tier_root = elem
+                    tier = None
+                    if tiers is None or \
+                            sppasXRA.__get_tier_name(elem) in tiers:
+                        tier = self._create_tier(tier_root)
+                    tier_metadata = False
+                continue
+
+            tree_path.pop()
+            depth = len(tree_path)
+
+            # the children of a Tier: Metadata and Annotation elements
+            if depth == 2 and tier_root is not None:
+                if tier is None:
+                    pass
+                elif elem.tag == "Annotation":
+                    if lazy is False:
+                        sppasXRA._parse_annotation(tier, elem)
+                elif elem.tag == "Metadata" and tier_metadata is False:
+                    tier_metadata = True
+                    tier_id = tier.get_meta("id")
+                    sppasXRA._parse_metadata(tier, elem)
+                    tier.set_meta("id", tier_id)
+                tier_root.remove(elem)
+
+            # the children of the Document
+            elif depth == 1:
+                if elem.tag == "Tier":
+                    if tier is not None and lazy is True:
+                        self.__tier_ranks[tier] = rank
+                        tier.set_loader(self._load_tier)
+                    tier_root = None
+                    tier = None
+                elif elem.tag == "Metadata" and metadata_root is None:
+                    metadata_root = elem
+                    sppasXRA._parse_metadata(self, metadata_root)
+                elif elem.tag == "Media":
+                    media.append(elem)
+                elif elem.tag == "Hierarchy" and hierarchy_root is None:
+                    hierarchy_root = elem
+                elif elem.tag == "Vocabulary":
+                    vocabulary.append(elem)
+                tree_path[0].remove(elem)
+
+        # the elements referring to tiers are parsed when all tiers are read
+        for media_root in media:
             self._parse_media(media_root)
 
-        hierarchy_root = root.find('Hierarchy')
         if hierarchy_root is not None:
-            self._parse_hierarchy(hierarchy_root)
+            if lazy is True:
+                # a link is added when the annotations of its child are loaded
+                for link_type, parent_tier, child_tier in \
+                        self.__get_hierarchy_links(hierarchy_root):
+                    if parent_tier is not None and child_tier is not None:
+                        self.__links.setdefault(child_tier, list()).append(
+                            (link_type, parent_tier))
+            else:
+                self._parse_hierarchy(hierarchy_root)
 
-        for vocabulary_root in root.findall('Vocabulary'):
+        for vocabulary_root in vocabulary:
             self._parse_vocabulary(vocabulary_root)
 
     # -----------------------------------------------------------------------
 
+    def _load_tiers(self, tiers):
+        """Parse the annotations of the given tiers of the opened file.
+
+        The file is parsed until the last of the tiers.
+
+        :param tiers: (list of sppasTier)
+
+        """
+        ranked_tiers = dict((self.__tier_ranks[tier], tier) for tier in tiers)
+        last_rank = max(ranked_tiers)
+        tree_path = list()
+        rank = -1
+        tier = None
+
+        with open(self.__filename, "rb") as fp:
+            for event, elem in ET.iterparse(fp, events=("start", "end")):
+
+                if event == "start":
+                    tree_path.append(elem)
+                    if len(tree_path) == 2 and elem.tag == "Tier":
+                        rank += 1
+                        tier = ranked_tiers.get(rank, None)
+                    continue
+
+                tree_path.pop()
+                depth = len(tree_path)
+
+                if depth == 2:
+                    if tier is not None and elem.tag == "Annotation":
+                        sppasXRA._parse_annotation(tier, elem)
+                    tree_path[1].remove(elem)
+
+                elif depth == 1:
+                    tree_path[0].remove(elem)
+                    if elem.tag == "Tier" and rank == last_rank:
+                        break
+
+        for tier in tiers:
+            for link_type, parent_tier in self.__links.pop(tier, list()):
+                self.__add_hierarchy_link(link_type, parent_tier, tier)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __get_tier_name(tier_root):
+        """Return the name of the tier of a 'Tier' element."""
+        if "tiername" in tier_root.attrib:
+            return tier_root.attrib['tiername']
+        if "id" in tier_root.attrib:
+            return tier_root.attrib['id']
+        # XRA < 1.2
+        return tier_root.attrib.get('ID', None)
+
+    # -----------------------------------------------------------------------
+
+    def _parse_document(self, document_root):
+        """Parse the attributes of the 'Document' element.
+
+        :param document_root: (ET) XML Element tree root.
+
+        """
+        if "name" in document_root.attrib:
+            self.set_name(document_root.attrib['name'])
+
+        if "version" in document_root.attrib:
+            self.set_meta('file_created_format_version',
+                          document_root.attrib['version'])
+
+        if "date" in document_root.attrib:
+            self.set_meta('file_created_date',
+                          document_root.attrib['date'])
+
+        if "author" in document_root.attrib:
+            self.set_meta('file_created_author',
+                          document_root.attrib['author'])
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def _parse_metadata(meta_object, metadata_root):
         """Read any kind of metadata.
@@ -187,10 +353,11 @@ class sppasXRA(sppasBaseIO):
 
     # -----------------------------------------------------------------------
 
-    def _parse_tier(self, tier_root):
-        """Parse a 'Tier' element to create a sppasTier().
+    def _create_tier(self, tier_root):
+        """Create a sppasTier() from the attributes of a 'Tier' element.
 
         :param tier_root: (ET) XML Element tree root.
+        :returns: (sppasTier)
 
         """
         name = None
@@ -206,6 +373,20 @@ class sppasXRA(sppasBaseIO):
             tier = self.create_tier(name)
         else:
             tier = self.create_tier(tid)
+        tier.set_meta("id", tid)
+
+        return tier
+
+    # -----------------------------------------------------------------------
+
+    def _parse_tier(self, tier_root):
+        """Parse a 'Tier' element to create a sppasTier().
+
+        :param tier_root: (ET) XML Element tree root.
+
+        """
+        tier = self._create_tier(tier_root)
+        tid = tier.get_meta("id")
 
         # Set metadata
         sppasXRA._parse_metadata(tier, tier_root.find('Metadata'))
@@ -488,6 +669,20 @@ class sppasXRA(sppasBaseIO):
         :param hierarchy_root: (ET) XML Element tree root.
 
         """
+        for link_type, parent_tier, child_tier in \
+                self.__get_hierarchy_links(hierarchy_root):
+            self.__add_hierarchy_link(link_type, parent_tier, child_tier)
+
+    # -----------------------------------------------------------------------
+
+    def __get_hierarchy_links(self, hierarchy_root):
+        """Return the list of links of a 'Hierarchy' element.
+
+        :param hierarchy_root: (ET) XML Element tree root.
+        :returns: list of (type, parent tier or None, child tier or None)
+
+        """
+        links = list()
         for link_node in hierarchy_root.findall('Link'):
             try:
                 hierarchy_type = link_node.attrib['type']
@@ -506,15 +701,22 @@ class sppasXRA(sppasBaseIO):
                     parent_tier = tier
                 if tier.get_meta("id") == child_tier_id:
                     child_tier = tier
+            links.append((hierarchy_type, parent_tier, child_tier))
 
-            try:
-                self.add_hierarchy_link(hierarchy_type,
-                                        parent_tier,
-                                        child_tier)
-            except Exception as e:
-                # print(e)
-                logging.error("Corrupted hierarchy link: {:s}".format(str(e)))
-                pass
+        return links
+
+    # -----------------------------------------------------------------------
+
+    def __add_hierarchy_link(self, hierarchy_type, parent_tier, child_tier):
+        """Add a link into the hierarchy, log an error if invalid."""
+        try:
+            self.add_hierarchy_link(hierarchy_type,
+                                    parent_tier,
+                                    child_tier)
+        except Exception as e:
+            # print(e)
+            logging.error("Corrupted hierarchy link: {:s}".format(str(e)))
+            pass
 
     # -----------------------------------------------------------------------
 
@@ -569,6 +771,10 @@ class sppasXRA(sppasBaseIO):
     def write(self, filename):
         """Write an XRA file.
 
+        The elements of the document are written one after the other: the
+        element of a tier is created, indented and serialized, then it's
+        forgotten before the next one is created.
+
         :param filename: (str)
 
         """
@@ -579,32 +785,35 @@ class sppasXRA(sppasBaseIO):
         root.set('format', self.__format)
         root.set('name', self.get_name())
 
-        metadata_root = ET.SubElement(root, 'Metadata')
-        sppasXRA.format_metadata(metadata_root, self)
-        if len(metadata_root.findall('Entry')) == 0:
-            root.remove(metadata_root)
+        with open(filename, "wb") as fp:
+            xml = sppasXMLStreamWriter(fp, root, sppasXRA.indent,
+                                       xml_declaration=True)
 
-        for tier in self:
-            tier_root = ET.SubElement(root, 'Tier')
-            sppasXRA.format_tier(tier_root, tier)
-
-        for media in self.get_media_list():
-            media_root = ET.SubElement(root, 'Media')
-            self._format_media(media_root, media)
-
-        hierarchy_root = ET.SubElement(root, 'Hierarchy')
-        self._format_hierarchy(hierarchy_root)
-
-        for vocabulary in self.get_ctrl_vocab_list():
-            vocabulary_root = ET.SubElement(root, 'Vocabulary')
-            self._format_vocabulary(vocabulary_root, vocabulary)
-
-        sppasXRA.indent(root)
-        tree = ET.ElementTree(root)
-        tree.write(filename,
-                   encoding=sg.__encoding__,
-                   method="xml",
-                   xml_declaration=True)
+            metadata_root = ET.Element('Metadata')
+            sppasXRA.format_metadata(metadata_root, self)
+            if len(metadata_root.findall('Entry')) > 0:
+                xml.write(metadata_root)
+
+            for tier in self:
+                tier_root = ET.Element('Tier')
+                sppasXRA.format_tier(tier_root, tier)
+                xml.write(tier_root)
+
+            for media in self.get_media_list():
+                media_root = ET.Element('Media')
+                self._format_media(media_root, media)
+                xml.write(media_root)
+
+            hierarchy_root = ET.Element('Hierarchy')
+            self._format_hierarchy(hierarchy_root)
+            xml.write(hierarchy_root)
+
+            for vocabulary in self.get_ctrl_vocab_list():
+                vocabulary_root = ET.Element('Vocabulary')
+                self._format_vocabulary(vocabulary_root, vocabulary)
+                xml.write(vocabulary_root)
+
+            xml.close()
 
     # -----------------------------------------------------------------------
 
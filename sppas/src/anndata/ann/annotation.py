@@ -505,6 +505,8 @@ class sppasAnnotation(sppasMetaData):
             except Exception:
                 self.__location.get_best().set(old_loc)
                 raise
+            finally:
+                self.__parent.invalidate_index()
 
     # -----------------------------------------------------------------------
 
@@ -586,6 +588,7 @@ class sppasAnnotation(sppasMetaData):
 
         """
         if self.__parent is not None:
+            self.__parent.invalidate_index()
             self.__parent.validate_annotation_location(self.__location)
 
     # -----------------------------------------------------------------------
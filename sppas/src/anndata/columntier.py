@@ -0,0 +1,1101 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    anndata.columntier.py
+    ~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from collections import OrderedDict
+
+from sppas.src.utils import sppasUnicode
+
+from .anndataexc import AnnDataTypeError
+from .anndataexc import AnnDataIndexError
+from .anndataexc import IntervalBoundsError
+from .anndataexc import TierAppendError
+
+from .ann.annlabel import sppasLabel
+from .ann.annlabel import sppasTag
+from .ann.annlocation import sppasPoint
+from .ann.annlocation import sppasInterval
+from .ann.annlocation import sppasLocation
+from .ann.annotation import sppasAnnotation
+from .metadata import sppasMetaData
+from .ctrlvocab import sppasCtrlVocab
+from .media import sppasMedia
+from .tier import sppasTier
+
+# ----------------------------------------------------------------------------
+
+NO_LABEL = -1
+OTHER_LABELS = -2
+
+# ----------------------------------------------------------------------------
+
+
+class sppasColumnTier(sppasMetaData):
+    """Compact representation of a tier, column by column.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      contact@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    A sppasTier() stores a sppasAnnotation() object for each annotation,
+    with its location, points, labels, tags and metadata. A
+    sppasColumnTier() stores the annotations of a tier in columns instead:
+
+        - the midpoints and the radius of the begin and end points in
+          arrays of floats,
+        - the text of the labels in a table of strings: a text is stored
+          only once and the annotations refer to it by its index,
+        - the score of the tags in an array of floats,
+        - the metadata of an annotation, only if any was set.
+
+    Only the annotations with a single label made of a single string tag
+    are stored in the columns. The labels of the others are stored as
+    objects. Locations are either points or intervals: disjoint and
+    alternative localizations are not supported.
+
+    The annotations are appended in the order of their begin value. They
+    are created on demand, when accessed, so the read API is the one of
+    sppasTier(). Modifying a returned annotation does not modify the tier.
+
+    >>> tier = sppasColumnTier("PhonAlign")
+    >>> tier.append_interval(0., 0.12, "#", radius=0.005)
+    >>> tier.append_interval(0.12, 0.18, "a", radius=0.005)
+    >>> tier.find(sppasPoint(0.), sppasPoint(0.15))
+    >>> tier.to_tier()
+
+    """
+
+    def __init__(self, name=None, ctrl_vocab=None, media=None):
+        """Create a new sppasColumnTier instance.
+
+        :param name: (str) Name of the tier. It is used as identifier.
+        :param ctrl_vocab: (sppasCtrlVocab)
+        :param media: (sppasMedia)
+
+        """
+        super(sppasColumnTier, self).__init__()
+
+        self.__name = None
+        self.__ctrl_vocab = None
+        self.__media = None
+
+        # Localizations: type of the midpoints then the columns
+        self.__point = None
+        self.__time_type = None
+        self.__begins = array('d')
+        self.__ends = array('d')
+        self.__begin_radius = array('d')
+        self.__end_radius = array('d')
+        self.__max_radius = 0.
+        self.__sorted_ends = True
+
+        # Labels: index of the texts in the table, scores of the tags
+        self.__texts = list()
+        self.__text_indexes = dict()
+        self.__labels = array('l')
+        self.__scores = array('d')
+
+        # Data of some annotations only: {index: value}
+        self.__other_labels = dict()
+        self.__ann_scores = dict()
+        self.__ann_metadata = dict()
+
+        self.set_name(name)
+        self.set_ctrl_vocab(ctrl_vocab)
+        self.set_media(media)
+
+    # -----------------------------------------------------------------------
+    # Getters
+    # -----------------------------------------------------------------------
+
+    def get_name(self):
+        """Return the identifier name of the tier."""
+        return self.__name
+
+    # -----------------------------------------------------------------------
+
+    def get_ctrl_vocab(self):
+        """Return the controlled vocabulary of the tier."""
+        return self.__ctrl_vocab
+
+    # -----------------------------------------------------------------------
+
+    def get_media(self):
+        """Return the media of the tier."""
+        return self.__media
+
+    # -----------------------------------------------------------------------
+
+    def get_parent(self):
+        """Return the parent of the tier: always None."""
+        return None
+
+    # -----------------------------------------------------------------------
+    # Setters
+    # -----------------------------------------------------------------------
+
+    def set_name(self, name=None):
+        """Set the name of the tier.
+
+        If no name is given, the GUID of the tier is assigned.
+
+        :param name: (str) The identifier name or None.
+        :returns: the formatted name
+
+        """
+        if name is None:
+            name = self.get_meta("id")
+        su = sppasUnicode(name)
+        self.__name = su.to_strip()
+
+        return self.__name
+
+    # -----------------------------------------------------------------------
+
+    def set_ctrl_vocab(self, ctrl_vocab=None):
+        """Set a controlled vocabulary to this tier.
+
+        The labels are not validated: they will be when the tier is
+        converted into a sppasTier().
+
+        :param ctrl_vocab: (sppasCtrlVocab or None)
+        :raises: AnnDataTypeError
+
+        """
+        if ctrl_vocab is not None:
+            if isinstance(ctrl_vocab, sppasCtrlVocab) is False:
+                raise AnnDataTypeError(ctrl_vocab, "sppasCtrlVocab")
+
+        self.__ctrl_vocab = ctrl_vocab
+
+    # -----------------------------------------------------------------------
+
+    def set_media(self, media):
+        """Set a media to the tier.
+
+        :param media: (sppasMedia)
+        :raises: AnnDataTypeError
+
+        """
+        if media is not None:
+            if isinstance(media, sppasMedia) is False:
+                raise AnnDataTypeError(media, "sppasMedia")
+
+        self.__media = media
+
+    # -----------------------------------------------------------------------
+    # Bulk constructors and conversions
+    # -----------------------------------------------------------------------
+
+    def append_interval(self, begin, end, text=None, score=None, radius=None):
+        """Append an interval at the end of the tier.
+
+        :param begin: (float, int) Midpoint value of the begin point
+        :param end: (float, int) Midpoint value of the end point
+        :param text: (str) Content of the tag of the label or None
+        :param score: (float) Score of the tag
+        :param radius: (float, int) Radius of both points
+        :raises: AnnDataTypeError, IntervalBoundsError, TierAppendError
+
+        """
+        if self.__point is True:
+            raise AnnDataTypeError("sppasInterval", "sppasPoint")
+        if begin >= end:
+            raise IntervalBoundsError(str(begin), str(end))
+        if text is None:
+            code = NO_LABEL
+        else:
+            code = self.__intern(text)
+
+        self.__append(False, begin, end, radius, radius, code, score)
+
+    # -----------------------------------------------------------------------
+
+    def append_point(self, midpoint, text=None, score=None, radius=None):
+        """Append a point at the end of the tier.
+
+        :param midpoint: (float, int) Midpoint value of the point
+        :param text: (str) Content of the tag of the label or None
+        :param score: (float) Score of the tag
+        :param radius: (float, int) Radius of the point
+        :raises: AnnDataTypeError, TierAppendError
+
+        """
+        if self.__point is False:
+            raise AnnDataTypeError("sppasPoint", "sppasInterval")
+        if text is None:
+            code = NO_LABEL
+        else:
+            code = self.__intern(text)
+
+        self.__append(True, midpoint, midpoint, radius, radius, code, score)
+
+    # -----------------------------------------------------------------------
+
+    def extend_intervals(self, begins, ends, texts=None, scores=None,
+                         radius=None):
+        """Append a list of intervals at the end of the tier.
+
+        :param begins: (list) Midpoint values of the begin points
+        :param ends: (list) Midpoint values of the end points
+        :param texts: (list) Content of the tags or None
+        :param scores: (list) Score of the tags or None
+        :param radius: (float, int) Radius of all the points
+
+        """
+        if len(begins) != len(ends):
+            raise AnnDataTypeError(ends, "list of {:d} values"
+                                         "".format(len(begins)))
+        if texts is None:
+            texts = [None] * len(begins)
+        if scores is None:
+            scores = [None] * len(begins)
+
+        for b, e, text, score in zip(begins, ends, texts, scores):
+            self.append_interval(b, e, text, score, radius)
+
+    # -----------------------------------------------------------------------
+
+    def append(self, annotation):
+        """Append a copy of the given annotation at the end of the tier.
+
+        :param annotation: (sppasAnnotation)
+        :raises: AnnDataTypeError, TierAppendError
+
+        """
+        if isinstance(annotation, sppasAnnotation) is False:
+            raise AnnDataTypeError(annotation, "sppasAnnotation")
+        location = annotation.get_location()
+        if len(location) != 1 or location.is_disjoint() is True:
+            raise AnnDataTypeError(location, "sppasPoint, sppasInterval")
+
+        is_point = location.is_point()
+        if self.__point is not None and self.__point is not is_point:
+            raise AnnDataTypeError(location, self.__get_location_type())
+
+        begin = annotation.get_lowest_localization()
+        end = annotation.get_highest_localization()
+
+        labels = annotation.get_labels()
+        score = None
+        if len(labels) == 0:
+            code = NO_LABEL
+        elif len(labels) == 1 and len(labels[0]) == 1 and \
+                labels[0].get_type() == "str":
+            tag, score = labels[0][0]
+            code = self.__intern(tag.get_content())
+        else:
+            code = OTHER_LABELS
+
+        self.__append(is_point,
+                      begin.get_midpoint(), end.get_midpoint(),
+                      begin.get_radius(), end.get_radius(),
+                      code, score)
+
+        index = len(self.__begins) - 1
+        if code == OTHER_LABELS:
+            self.__other_labels[index] = [l.copy() for l in labels]
+        if annotation.get_score() is not None:
+            self.__ann_scores[index] = annotation.get_score()
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def from_tier(tier, metadata=False):
+        """Create a sppasColumnTier() from a sppasTier().
+
+        :param tier: (sppasTier)
+        :param metadata: (bool) Copy also the metadata of the annotations,
+        including their 'id'.
+        :returns: (sppasColumnTier)
+        :raises: AnnDataTypeError, TierAppendError
+
+        """
+        if isinstance(tier, sppasTier) is False:
+            raise AnnDataTypeError(tier, "sppasTier")
+
+        columns = sppasColumnTier(tier.get_name(),
+                                  tier.get_ctrl_vocab(),
+                                  tier.get_media())
+        for key in tier.get_meta_keys():
+            columns.set_meta(key, tier.get_meta(key))
+
+        for i, ann in enumerate(tier):
+            columns.append(ann)
+            if metadata is True:
+                for key in ann.get_meta_keys():
+                    columns.set_annotation_meta(i, key, ann.get_meta(key))
+
+        return columns
+
+    # -----------------------------------------------------------------------
+
+    def to_tier(self):
+        """Return the sppasTier() with the annotations of this tier.
+
+        :returns: (sppasTier)
+
+        """
+        tier = sppasTier(self.__name, self.__ctrl_vocab, self.__media)
+        for key in self.get_meta_keys():
+            tier.set_meta(key, self.get_meta(key))
+        for ann in self:
+            tier.add(ann)
+
+        return tier
+
+    # -----------------------------------------------------------------------
+    # Labels and metadata of the annotations
+    # -----------------------------------------------------------------------
+
+    def get_texts(self):
+        """Return the list of the texts of the labels, each one once."""
+        return list(self.__texts)
+
+    # -----------------------------------------------------------------------
+
+    def get_label_text(self, index):
+        """Return the content of the label of an annotation.
+
+        :param index: (int) Index of the annotation
+        :returns: (str) the text of the stored label, the serialized labels
+        or None if the annotation is not labelled
+
+        """
+        code = self.__labels[self.__check_index(index)]
+        if code == NO_LABEL:
+            return None
+        if code == OTHER_LABELS:
+            return self[index].serialize_labels()
+
+        return self.__texts[code]
+
+    # -----------------------------------------------------------------------
+
+    def map_tags(self, function):
+        """Replace the content of all the string tags of the tier.
+
+        The function is invoked only once for each text of the table.
+
+        :param function: (function) Returns the new content of a tag
+
+        """
+        texts = list()
+        indexes = dict()
+        new_codes = list()
+        for text in self.__texts:
+            new_text = function(text)
+            if new_text not in indexes:
+                indexes[new_text] = len(texts)
+                texts.append(new_text)
+            new_codes.append(indexes[new_text])
+
+        self.__texts = texts
+        self.__text_indexes = indexes
+        self.__labels = array('l', (c if c < 0 else new_codes[c]
+                                    for c in self.__labels))
+
+        for index, labels in self.__other_labels.items():
+            new_labels = list()
+            for label in labels:
+                if label.get_type() != "str":
+                    new_labels.append(label)
+                    continue
+                tags = list()
+                scores = list()
+                for tag, score in label:
+                    tags.append(sppasTag(function(tag.get_content())))
+                    scores.append(score)
+                new_labels.append(sppasLabel(tags, scores))
+            self.__other_labels[index] = new_labels
+
+    # -----------------------------------------------------------------------
+
+    def get_annotation_meta(self, index, key, default=""):
+        """Return a metadata of an annotation.
+
+        :param index: (int) Index of the annotation
+        :param key: (str) Key of the metadata
+        :param default: (str) Value to return if the key is not set
+
+        """
+        metadata = self.__ann_metadata.get(self.__check_index(index), dict())
+        return metadata.get(key, default)
+
+    # -----------------------------------------------------------------------
+
+    def set_annotation_meta(self, index, key, value):
+        """Set a metadata to an annotation.
+
+        The metadata of an annotation are stored only when set. The
+        annotations without 'id' get a new one when it is requested.
+
+        :param index: (int) Index of the annotation
+        :param key: (str) Key of the metadata
+        :param value: (str) Value of the metadata
+
+        """
+        index = self.__check_index(index)
+        if index not in self.__ann_metadata:
+            self.__ann_metadata[index] = OrderedDict()
+        key = sppasUnicode(key).to_strip()
+        self.__ann_metadata[index][key] = sppasUnicode(value).to_strip()
+
+    # -----------------------------------------------------------------------
+    # Read API of sppasTier()
+    # -----------------------------------------------------------------------
+
+    def is_empty(self):
+        """Return True if the tier does not contain annotations."""
+        return len(self.__begins) == 0
+
+    # -----------------------------------------------------------------------
+
+    def is_disjoint(self):
+        """Return False: disjoint localizations are not supported."""
+        return False
+
+    # -----------------------------------------------------------------------
+
+    def is_interval(self):
+        """Return True if the tier is made of interval localizations."""
+        return self.__point is False and len(self.__begins) > 0
+
+    # -----------------------------------------------------------------------
+
+    def is_point(self):
+        """Return True if the tier is made of point localizations."""
+        return self.__point is True and len(self.__begins) > 0
+
+    # -----------------------------------------------------------------------
+
+    def get_midpoint_intervals(self):
+        """Return midpoint values of all the intervals."""
+        if self.is_interval() is False:
+            return list()
+
+        return [(self.__time_type(b), self.__time_type(e))
+                for b, e in zip(self.__begins, self.__ends)]
+
+    # -----------------------------------------------------------------------
+
+    def get_midpoint_points(self):
+        """Return midpoint values of all the points."""
+        if self.is_point() is False:
+            return list()
+
+        return [self.__time_type(m) for m in self.__begins]
+
+    # -----------------------------------------------------------------------
+
+    def get_all_points(self):
+        """Return the list of all points of the tier."""
+        points = list()
+        for i in range(len(self.__begins)):
+            points.append(self.__get_begin(i))
+            if self.__point is False:
+                points.append(self.__get_end(i))
+
+        return points
+
+    # -----------------------------------------------------------------------
+
+    def get_first_point(self):
+        """Return the first point of the first annotation."""
+        if len(self.__begins) == 0:
+            return None
+
+        return self.__get_begin(0)
+
+    # -----------------------------------------------------------------------
+
+    def get_last_point(self):
+        """Return the last point of the last annotation."""
+        if len(self.__begins) == 0:
+            return None
+
+        return self.__get_end(len(self.__ends) - 1)
+
+    # -----------------------------------------------------------------------
+
+    def has_point(self, point):
+        """Return True if the tier contains a given point.
+
+        :param point: (sppasPoint) The point to find in the tier.
+        :returns: Boolean
+
+        """
+        if isinstance(point, sppasPoint) is False:
+            raise AnnDataTypeError(point, "sppasPoint")
+
+        lo, hi = self.__window(self.__begins, point, point)
+        for i in range(lo, hi):
+            if self.__get_begin(i) == point:
+                return True
+
+        if self.__point is False:
+            lo, hi = self.__window(self.__ends, point, point)
+            for i in range(lo, hi):
+                if self.__get_end(i) == point:
+                    return True
+
+        return False
+
+    # -----------------------------------------------------------------------
+
+    def is_superset(self, other):
+        """Return True if this tier contains all points of the other tier.
+
+        :param other: (sppasTier, sppasColumnTier)
+        :returns: Boolean
+
+        """
+        if len(other) == 0:
+            return True
+
+        # sorted midpoints and radius of all the points of this tier
+        points = list()
+        for i in range(len(self.__begins)):
+            points.append((self.__begins[i], self.__begin_radius[i]))
+            if self.__point is False:
+                points.append((self.__ends[i], self.__end_radius[i]))
+        points.sort()
+        midpoints = array('d', (p[0] for p in points))
+
+        for op in other.get_all_points():
+            lo, hi = self.__window(midpoints, op, op)
+            found = False
+            for i in range(lo, hi):
+                if self.__make_point(points[i][0], points[i][1]) == op:
+                    found = True
+                    break
+            if found is False:
+                return False
+
+        return True
+
+    # -----------------------------------------------------------------------
+
+    def find(self, begin, end, overlaps=True):
+        """Return a list of annotations between begin and end.
+
+        :param begin: sppasPoint or None to start from the beginning of the tier
+        :param end: sppasPoint or None to end at the end of the tier
+        :param overlaps: (bool) Return also overlapped annotations. \
+        Not relevant for tiers with points.
+        :returns: List of sppasAnnotation
+
+        """
+        if len(self.__begins) == 0:
+            return []
+
+        if begin is None:
+            begin = self.get_first_point()
+
+        if end is None:
+            end = self.get_last_point()
+
+        # Out of interval!
+        if begin > self.get_last_point() or end < self.get_first_point():
+            return []
+
+        lo, hi = self.__window(self.__begins, begin, end)
+        if self.__point is True:
+            selection = [i for i in range(lo, hi)
+                         if begin <= self.__get_begin(i) <= end]
+
+        elif overlaps is True:
+            if self.__sorted_ends is True:
+                lo = self.__window(self.__ends, begin, end)[0]
+            else:
+                lo = 0
+            selection = [i for i in range(lo, hi)
+                         if end > self.__get_begin(i) and
+                         begin < self.__get_end(i)]
+
+        else:
+            selection = [i for i in range(lo, hi)
+                         if self.__get_begin(i) >= begin and
+                         self.__get_end(i) <= end]
+
+        return [self.__get_annotation(i) for i in selection]
+
+    # -----------------------------------------------------------------------
+
+    def index(self, moment):
+        """Return the index of the moment (int), or -1.
+
+        Only for tier with points.
+
+        :param moment: (sppasPoint)
+
+        """
+        if self.is_point() is False:
+            return -1
+
+        lo, hi = self.__window(self.__begins, moment, moment)
+        for i in range(lo, hi):
+            if self.__get_begin(i) == moment:
+                return i
+
+        return -1
+
+    # -----------------------------------------------------------------------
+
+    def lindex(self, moment):
+        """Return the index of the interval starting at a given moment, or -1.
+
+        Only for tier with intervals.
+        If the tier contains more than one annotation starting at the same
+        moment, the method returns the first one.
+
+        :param moment: (sppasPoint)
+
+        """
+        if self.is_interval() is False:
+            return -1
+
+        lo, hi = self.__window(self.__begins, moment, moment)
+        for i in range(lo, hi):
+            if self.__get_begin(i) == moment:
+                return i
+
+        return -1
+
+    # -----------------------------------------------------------------------
+
+    def mindex(self, moment, bound=0):
+        """Return the index of the interval containing the given moment, or -1.
+
+        Only for tier with intervals.
+        If the tier contains more than one annotation at the same moment,
+        the method returns the first one (i.e. the one which started at first).
+
+        :param moment: (sppasPoint)
+        :param bound: (int)
+            - 0 to exclude bounds of the interval.
+            - -1 to include begin bound.
+            - +1 to include end bound.
+            - others: the midpoint of moment is strictly inside
+        :returns: (int) Index of the annotation containing a moment
+
+        """
+        if self.is_interval() is False:
+            return -1
+
+        lo = 0
+        hi = self.__window(self.__begins, moment, moment)[1]
+        if self.__sorted_ends is True:
+            lo = self.__window(self.__ends, moment, moment)[0]
+
+        for i in range(lo, hi):
+            b = self.__get_begin(i)
+            e = self.__get_end(i)
+            if bound == -1:
+                if b <= moment < e:
+                    return i
+            elif bound == 1:
+                if b < moment <= e:
+                    return i
+            elif bound == 0:
+                if b < moment < e:
+                    return i
+            else:
+                if b < moment.get_midpoint() < e:
+                    return i
+
+        return -1
+
+    # -----------------------------------------------------------------------
+
+    def rindex(self, moment):
+        """Return the index of the interval ending at the given moment.
+
+        Only for tier with intervals.
+        If the tier contains more than one annotation ending at the same
+        moment, the method returns the last one.
+
+        :param moment: (sppasPoint)
+
+        """
+        if self.is_interval() is False:
+            return -1
+
+        lo, hi = 0, len(self.__ends)
+        if self.__sorted_ends is True:
+            lo, hi = self.__window(self.__ends, moment, moment)
+        for i in reversed(range(lo, hi)):
+            if self.__get_end(i) == moment:
+                return i
+
+        return -1
+
+    # ------------------------------------------------------------------------
+
+    def near(self, moment, direction=1):
+        """Search for the annotation whose localization is closest.
+
+        Search for the nearest localization to the given moment into a
+        given direction.
+
+        :param moment: (sppasPoint)
+        :param direction: (int)
+                - nearest 0
+                - nereast forward 1
+                - nereast backward -1
+
+        """
+        if len(self.__begins) == 0:
+            return -1
+        if len(self.__begins) == 1:
+            return 0
+
+        index = self.__find(moment)
+        b = self.__get_begin(index)
+        e = self.__get_end(index)
+
+        # forward
+        if direction == 1:
+            if moment <= b:
+                return index
+            if index + 1 < len(self.__begins):
+                return index + 1
+            return -1
+
+        # backward
+        elif direction == -1:
+            if moment >= e:
+                return index
+            if index-1 >= 0:
+                return index-1
+            return -1
+
+        # direction == 0 (select the nearest)
+
+        # if time is during an annotation
+        if b <= moment <= e:
+            return index
+
+        # then, the nearest is either the current or the next annotation
+        _next = index + 1
+        if _next >= len(self.__begins):
+            # no next
+            return index
+
+        time = moment.get_midpoint()
+        if abs(time - self.__ends[index]) > abs(self.__begins[_next] - time):
+            return _next
+
+        return index
+
+    # -----------------------------------------------------------------------
+
+    def is_string(self):
+        """All label tags are string or unicode or None."""
+        ann = self.__get_labelled_annotation()
+        if ann is None:
+            return False
+        return ann.label_is_string()
+
+    # -----------------------------------------------------------------------
+
+    def is_float(self):
+        """All label tags are float values or None."""
+        ann = self.__get_labelled_annotation()
+        if ann is None:
+            return False
+        return ann.label_is_float()
+
+    # -----------------------------------------------------------------------
+
+    def is_int(self):
+        """All label tags are integer values or None."""
+        ann = self.__get_labelled_annotation()
+        if ann is None:
+            return False
+        return ann.label_is_int()
+
+    # -----------------------------------------------------------------------
+
+    def is_bool(self):
+        """All label tags are boolean values or None."""
+        ann = self.__get_labelled_annotation()
+        if ann is None:
+            return False
+        return ann.label_is_bool()
+
+    # -----------------------------------------------------------------------
+
+    def get_labels_type(self):
+        """Return the current type of labels, or an empty string."""
+        ann = self.__get_labelled_annotation()
+        if ann is None:
+            return ""
+        return ann.get_label_type()
+
+    # -----------------------------------------------------------------------
+
+    def get_annotation(self, identifier):
+        """Find an annotation from its metadata 'id'.
+
+        Only the annotations with stored metadata can be found.
+
+        :param identifier: (str) Metadata 'id' of an annotation.
+        :returns: sppasAnnotation or None
+
+        """
+        for index in sorted(self.__ann_metadata):
+            if self.__ann_metadata[index].get('id') == identifier:
+                return self.__get_annotation(index)
+        return None
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __append(self, is_point, begin, end, begin_radius, end_radius,
+                 code, score):
+        """Append the values of an annotation into the columns."""
+        time_type = float
+        if isinstance(begin, int) and isinstance(end, int):
+            time_type = int
+        if self.__time_type is not None and time_type is not self.__time_type:
+            raise AnnDataTypeError(begin, self.__time_type.__name__)
+
+        if len(self.__begins) > 0:
+            if is_point is True and begin <= self.__begins[-1]:
+                raise TierAppendError(self.__begins[-1], begin)
+            if is_point is False and begin < self.__begins[-1]:
+                raise TierAppendError(self.__begins[-1], begin)
+            if end < self.__ends[-1]:
+                self.__sorted_ends = False
+
+        self.__point = is_point
+        self.__time_type = time_type
+        self.__begins.append(begin)
+        self.__ends.append(end)
+        self.__begin_radius.append(sppasColumnTier.__to_float(begin_radius))
+        self.__end_radius.append(sppasColumnTier.__to_float(end_radius))
+        for radius in (begin_radius, end_radius):
+            if radius is not None and radius > self.__max_radius:
+                self.__max_radius = radius
+        self.__labels.append(code)
+        self.__scores.append(sppasColumnTier.__to_float(score))
+
+    # -----------------------------------------------------------------------
+
+    def __intern(self, text):
+        """Return the index of a text in the table, add it if missing."""
+        index = self.__text_indexes.get(text, None)
+        if index is None:
+            index = len(self.__texts)
+            self.__text_indexes[text] = index
+            self.__texts.append(text)
+
+        return index
+
+    # -----------------------------------------------------------------------
+
+    def __check_index(self, index):
+        """Return the positive value of an index or raise an error."""
+        if index < 0:
+            index += len(self.__begins)
+        if index < 0 or index >= len(self.__begins):
+            raise AnnDataIndexError(index)
+
+        return index
+
+    # -----------------------------------------------------------------------
+
+    def __get_location_type(self):
+        if self.__point is True:
+            return "sppasPoint"
+        return "sppasInterval"
+
+    # -----------------------------------------------------------------------
+
+    def __make_point(self, midpoint, radius):
+        """Create a sppasPoint from the values stored in the columns."""
+        if math.isnan(radius):
+            radius = None
+        else:
+            radius = self.__time_type(radius)
+
+        return sppasPoint(self.__time_type(midpoint), radius)
+
+    # -----------------------------------------------------------------------
+
+    def __get_begin(self, index):
+        return self.__make_point(self.__begins[index],
+                                 self.__begin_radius[index])
+
+    def __get_end(self, index):
+        return self.__make_point(self.__ends[index],
+                                 self.__end_radius[index])
+
+    # -----------------------------------------------------------------------
+
+    def __get_annotation(self, index):
+        """Create the sppasAnnotation() of the index-th annotation."""
+        if self.__point is True:
+            location = sppasLocation(self.__get_begin(index))
+        else:
+            location = sppasLocation(sppasInterval(self.__get_begin(index),
+                                                   self.__get_end(index)))
+
+        code = self.__labels[index]
+        if code == NO_LABEL:
+            labels = list()
+        elif code == OTHER_LABELS:
+            labels = [l.copy() for l in self.__other_labels[index]]
+        else:
+            score = self.__scores[index]
+            if math.isnan(score):
+                score = None
+            labels = [sppasLabel(sppasTag(self.__texts[code]), score)]
+
+        ann = sppasAnnotation(location, labels)
+        if index in self.__ann_scores:
+            ann.set_score(self.__ann_scores[index])
+        for key, value in self.__ann_metadata.get(index, dict()).items():
+            ann.set_meta(key, value)
+
+        return ann
+
+    # -----------------------------------------------------------------------
+
+    def __get_labelled_annotation(self):
+        """Return the first annotation with a label, or None."""
+        for index, code in enumerate(self.__labels):
+            if code != NO_LABEL:
+                ann = self.__get_annotation(index)
+                if ann.is_labelled() is True:
+                    return ann
+
+        return None
+
+    # -----------------------------------------------------------------------
+
+    def __window(self, values, begin, end):
+        """Return the range of sorted values that can be between 2 points.
+
+        The radius of the points are taken into account: the values of the
+        range have to be compared to the points.
+
+        """
+        delta = self.__max_radius
+        lo_delta = delta
+        if begin.get_radius() is not None:
+            lo_delta += begin.get_radius()
+        hi_delta = delta
+        if end.get_radius() is not None:
+            hi_delta += end.get_radius()
+
+        lo = bisect_left(values, begin.get_midpoint() - lo_delta)
+        hi = bisect_right(values, end.get_midpoint() + hi_delta)
+
+        return lo, hi
+
+    # -----------------------------------------------------------------------
+
+    def __find(self, x):
+        """Return the index of the annotation whose moment value contains x.
+
+        :param x: (sppasPoint)
+
+        """
+        if len(self.__begins) == 1:
+            return 0
+        if x > self.get_last_point():
+            return len(self.__begins) - 1
+
+        lo = 0
+        hi = len(self.__begins)
+        mid = (lo + hi) // 2
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+            b = self.__get_begin(mid)
+            if self.__point is True:
+                if b == x:
+                    return mid
+                if x < b:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            else:
+                e = self.__get_end(mid)
+                if b <= x < e:
+                    return mid
+                if x < e:
+                    hi = mid
+                else:
+                    lo = mid + 1
+
+        return mid
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __to_float(value):
+        if value is None:
+            return float('nan')
+        return float(value)
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def __iter__(self):
+        for i in range(len(self.__begins)):
+            yield self.__get_annotation(i)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.__get_annotation(index)
+                    for index in range(*i.indices(len(self.__begins)))]
+        try:
+            return self.__get_annotation(self.__check_index(i))
+        except AnnDataIndexError:
+            raise IndexError(i)
+
+    def __len__(self):
+        return len(self.__begins)
@@ -54,22 +54,31 @@ class sppasMetaData(object):
 
     Meta data keys and values are unicode strings.
 
+    The dictionary and the 'id' are created the first time they are
+    needed: most of the objects created by the readers never use them.
+
     """
 
     def __init__(self):
         """Create a sppasMetaData instance.
 
-        Add a GUID in the dictionary of metadata, with key "id".
+        The dictionary of metadata will contain a GUID, with key "id".
 
         """
-        self.__metadata = OrderedDict()
-        self.__metadata['id'] = sppasGUID().get()
+        self.__metadata = None
+
+    # -----------------------------------------------------------------------
+
+    def __getstate__(self):
+        """Generate the 'id' before the object is copied or pickled."""
+        self.get_meta('id')
+        return self.__dict__
 
     # -----------------------------------------------------------------------
 
     def gen_id(self):
         """Re-generate an 'id'."""
-        self.__metadata['id'] = sppasGUID().get()
+        self.__get_metadata()['id'] = sppasGUID().get()
 
     # -----------------------------------------------------------------------
 
@@ -80,6 +89,8 @@ class sppasMetaData(object):
         :returns: (Boolean)
 
         """
+        if self.__metadata is None:
+            return entry == 'id'
         return entry in self.__metadata
 
     # -----------------------------------------------------------------------
@@ -92,13 +103,21 @@ class sppasMetaData(object):
         :returns: (str) meta data value or default value
 
         """
-        return self.__metadata.get(entry, default)
+        if self.__metadata is None and entry != 'id':
+            return default
+
+        metadata = self.__get_metadata()
+        if entry == 'id' and metadata.get(entry, "") is None:
+            # the 'id' was not generated yet
+            metadata[entry] = sppasGUID().get()
+
+        return metadata.get(entry, default)
 
     # -----------------------------------------------------------------------
 
     def get_meta_keys(self):
         """Return the list of metadata keys."""
-        return self.__metadata.keys()
+        return self.__get_metadata().keys()
 
     # -----------------------------------------------------------------------
 
@@ -117,7 +136,7 @@ class sppasMetaData(object):
         su = sppasUnicode(value)
         value = su.to_strip()
 
-        self.__metadata[key] = value
+        self.__get_metadata()[key] = value
 
     # -----------------------------------------------------------------------
 
@@ -127,8 +146,23 @@ class sppasMetaData(object):
         :param key: (str)
 
         """
-        if key in self.__metadata:
-            del self.__metadata[key]
+        metadata = self.__get_metadata()
+        if key in metadata:
+            del metadata[key]
+
+    # -----------------------------------------------------------------------
+
+    def __get_metadata(self):
+        """Return the dictionary of metadata, create it if needed.
+
+        The value of the 'id' is None until it is requested.
+
+        """
+        if self.__metadata is None:
+            self.__metadata = OrderedDict()
+            self.__metadata['id'] = None
+
+        return self.__metadata
 
     # -----------------------------------------------------------------------
     # Add default metadata
@@ -42,6 +42,7 @@
 """
 import unittest
 import os.path
+import shutil
 import xml.etree.cElementTree as ET
 
 from sppas.src.config import sg
@@ -58,9 +59,11 @@ from ..ann.annotation import sppasAnnotation
 from ..media import sppasMedia
 from ..ctrlvocab import sppasCtrlVocab
 from ..aio.aioutils import format_labels
+from sppas.src.files.fileutils import sppasFileUtils
 
 # ---------------------------------------------------------------------------
 
+TEMP = sppasFileUtils().set_random()
 DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
 # ---------------------------------------------------------------------------
@@ -99,6 +102,7 @@ class TestEAF(unittest.TestCase):
         self.assertFalse(txt.radius_support())
         self.assertTrue(txt.gaps_support())
         self.assertFalse(txt.overlaps_support())
+        self.assertTrue(txt.lazy_support())
 
     # -----------------------------------------------------------------------
 
@@ -782,3 +786,124 @@ class TestEAF(unittest.TestCase):
         self.assertEqual(("a1", "a1"), created["a4"])
         self.assertEqual(("a2", "a2"), created["a5"])
         self.assertEqual(("a3", "a3"), created["a6"])
+
+    # -----------------------------------------------------------------------
+
+    def test_read_delayed_tiers(self):
+        """A ref tier can be declared before its parent tier."""
+        eaf_xml = '<ANNOTATION_DOCUMENT AUTHOR="" DATE="" FORMAT="3.0" VERSION="3.0">\n'\
+                  '  <HEADER TIME_UNITS="milliseconds"/>\n'\
+                  '  <TIME_ORDER>\n'\
+                  '    <TIME_SLOT TIME_SLOT_ID="ts1" TIME_VALUE="0"/>\n'\
+                  '    <TIME_SLOT TIME_SLOT_ID="ts2" TIME_VALUE="1000"/>\n'\
+                  '    <TIME_SLOT TIME_SLOT_ID="ts3" TIME_VALUE="2500"/>\n'\
+                  '  </TIME_ORDER>\n'\
+                  '  <TIER LINGUISTIC_TYPE_REF="ref" PARENT_REF="speech" TIER_ID="words">\n'\
+                  '    <ANNOTATION>\n'\
+                  '      <REF_ANNOTATION ANNOTATION_ID="a3" ANNOTATION_REF="a1">\n'\
+                  '        <ANNOTATION_VALUE>w1</ANNOTATION_VALUE>\n'\
+                  '      </REF_ANNOTATION>\n'\
+                  '    </ANNOTATION>\n'\
+                  '  </TIER>\n'\
+                  '  <TIER LINGUISTIC_TYPE_REF="default" TIER_ID="speech">\n'\
+                  '    <ANNOTATION>\n'\
+                  '      <ALIGNABLE_ANNOTATION ANNOTATION_ID="a1" TIME_SLOT_REF1="ts1" TIME_SLOT_REF2="ts2">\n'\
+                  '        <ANNOTATION_VALUE>utterance 1</ANNOTATION_VALUE>\n'\
+                  '      </ALIGNABLE_ANNOTATION>\n'\
+                  '    </ANNOTATION>\n'\
+                  '    <ANNOTATION>\n'\
+                  '      <ALIGNABLE_ANNOTATION ANNOTATION_ID="a2" TIME_SLOT_REF1="ts2" TIME_SLOT_REF2="ts3">\n'\
+                  '        <ANNOTATION_VALUE>utterance 2</ANNOTATION_VALUE>\n'\
+                  '      </ALIGNABLE_ANNOTATION>\n'\
+                  '    </ANNOTATION>\n'\
+                  '  </TIER>\n'\
+                  '  <LINGUISTIC_TYPE LINGUISTIC_TYPE_ID="default" TIME_ALIGNABLE="true"/>\n'\
+                  '</ANNOTATION_DOCUMENT>\n'
+        os.mkdir(TEMP)
+        try:
+            filename = os.path.join(TEMP, "delayed.eaf")
+            with open(filename, "w") as fp:
+                fp.write(eaf_xml)
+            eaf = sppasEAF()
+            eaf.read(filename)
+        finally:
+            shutil.rmtree(TEMP)
+
+        # the tiers are in their original order
+        self.assertEqual(2, len(eaf))
+        self.assertEqual("words", eaf[0].get_name())
+        self.assertEqual("speech", eaf[1].get_name())
+        self.assertEqual(2, len(eaf[1]))
+        self.assertEqual(sppasPoint(2.5), eaf[1][1].get_highest_localization())
+        self.assertEqual(1, len(eaf[0]))
+        self.assertEqual("w1", eaf[0][0].serialize_labels())
+        self.assertEqual(sppasPoint(1.), eaf[0][0].get_highest_localization())
+        self.assertEqual("a1", eaf[0][0].get_meta('ann_parent_ref'))
+        self.assertEqual(eaf[1], eaf.get_hierarchy().get_parent(eaf[0]))
+
+    # -----------------------------------------------------------------------
+
+    def test_read_write(self):
+        """Read, write then read again an EAF file."""
+        eaf = sppasEAF()
+        eaf.read(os.path.join(DATA, "sample.eaf"))
+        os.mkdir(TEMP)
+        try:
+            filename = os.path.join(TEMP, "sample.eaf")
+            eaf.write(filename)
+            eaf2 = sppasEAF()
+            eaf2.read(filename)
+        finally:
+            shutil.rmtree(TEMP)
+
+        self.assertEqual(len(eaf), len(eaf2))
+        for tier, tier2 in zip(eaf, eaf2):
+            self.assertEqual(tier.get_name(), tier2.get_name())
+            self.assertEqual(len(tier), len(tier2))
+            for ann, ann2 in zip(tier, tier2):
+                self.assertEqual(ann.get_location(), ann2.get_location())
+                self.assertEqual(ann.get_labels(), ann2.get_labels())
+        self.assertEqual(len(eaf.get_ctrl_vocab_list()),
+                         len(eaf2.get_ctrl_vocab_list()))
+
+    # -----------------------------------------------------------------------
+
+    def test_open(self):
+        """Open an EAF file and load the tiers on demand."""
+        eaf = sppasEAF()
+        eaf.read(os.path.join(DATA, "sample.eaf"))
+        eaf2 = sppasEAF()
+        eaf2.open(os.path.join(DATA, "sample.eaf"))
+        self.assertEqual(len(eaf), len(eaf2))
+        for tier, tier2 in zip(eaf, eaf2):
+            self.assertFalse(tier2.is_loaded())
+            self.assertEqual(tier.get_name(), tier2.get_name())
+            if tier.get_ctrl_vocab() is None:
+                self.assertIsNone(tier2.get_ctrl_vocab())
+            else:
+                self.assertEqual(tier.get_ctrl_vocab().get_name(),
+                                 tier2.get_ctrl_vocab().get_name())
+            for key in tier.get_meta_keys():
+                if key != "id":
+                    self.assertEqual(tier.get_meta(key), tier2.get_meta(key))
+
+        # a reference tier: its parent is loaded first
+        self.assertEqual(list(eaf.find("W-POS")), list(eaf2.find("W-POS")))
+        self.assertTrue(eaf2.find("W-Words").is_loaded())
+        self.assertFalse(eaf2.find("K-Spch").is_loaded())
+
+        eaf2.load()
+        for tier, tier2 in zip(eaf, eaf2):
+            self.assertEqual(list(tier), list(tier2))
+
+        # the selected tiers and their parents only
+        eaf2 = sppasEAF()
+        eaf2.open(os.path.join(DATA, "sample.eaf"), ["W-POS", "K-RGU"])
+        self.assertEqual(["W-Spch", "W-Words", "W-POS", "K-RGU"],
+                         [tier.get_name() for tier in eaf2])
+        self.assertEqual(list(eaf.find("W-POS")), list(eaf2.find("W-POS")))
+        parent = eaf2.get_hierarchy().get_parent(eaf2.find("W-Words"))
+        self.assertEqual(
+            eaf.get_hierarchy().get_parent(eaf.find("W-Words")).get_name(),
+            parent.get_name())
+        self.assertFalse(eaf2.find("K-RGU").is_loaded())
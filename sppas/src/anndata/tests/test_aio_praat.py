@@ -275,6 +275,7 @@ class TestTextGrid(unittest.TestCase):
         self.assertFalse(tg.radius_support())
         self.assertFalse(tg.gaps_support())
         self.assertFalse(tg.overlaps_support())
+        self.assertTrue(tg.lazy_support())
 
     # -----------------------------------------------------------------------
 
@@ -603,6 +604,46 @@ class TestTextGrid(unittest.TestCase):
         self.assertEqual(txt[0].get_name(), "Tokens")
         self.assertEqual(len(txt[0]), 1)
 
+    # -----------------------------------------------------------------------
+
+    def test_open(self):
+        for filename in ("sample.TextGrid", "sample-utf16.TextGrid"):
+            txt = sppasTextGrid()
+            txt.read(os.path.join(DATA, filename))
+            txt2 = sppasTextGrid()
+            txt2.open(os.path.join(DATA, filename))
+            self.assertEqual(len(txt), len(txt2))
+            for tier, tier2 in zip(txt, txt2):
+                self.assertFalse(tier2.is_loaded())
+                self.assertEqual(tier.get_name(), tier2.get_name())
+            self.assertEqual(list(txt[1]), list(txt2[1]))
+            self.assertFalse(txt2[0].is_loaded())
+            txt2.load()
+            self.assertEqual(list(txt[0]), list(txt2[0]))
+
+        txt = sppasTextGrid()
+        txt.open(os.path.join(DATA, "sample.TextGrid"), ["P-Tones"])
+        self.assertEqual(1, len(txt))
+        self.assertEqual(2, len(txt[0]))
+        self.assertTrue(txt[0].is_point())
+
+    # -----------------------------------------------------------------------
+
+    def test_read_columns(self):
+        for filename in ("sample.TextGrid", "sample-utf16.TextGrid"):
+            txt = sppasTextGrid()
+            txt.read(os.path.join(DATA, filename))
+            columns = sppasTextGrid().read_columns(os.path.join(DATA, filename))
+            self.assertEqual(len(txt), len(columns))
+            for tier, tier2 in zip(txt, columns):
+                self.assertEqual(tier.get_name(), tier2.get_name())
+                self.assertEqual(list(tier), list(tier2))
+
+        columns = sppasTextGrid().read_columns(
+            os.path.join(DATA, "sample.TextGrid"), ["P-Tones"])
+        self.assertEqual(1, len(columns))
+        self.assertTrue(columns[0].is_point())
+
     # -----------------------------------------------------------------------
     # Writer
     # -----------------------------------------------------------------------
@@ -184,6 +184,39 @@ class TestAIO(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_read_tiers(self):
+        """Read only some tiers, with or without loading them."""
+
+        parser = sppasRW(os.path.join(DATA, "sample.eaf"))
+        trs1 = parser.read()
+        trs2 = parser.read(lazy=True)
+        self.assertEqual(len(trs1), len(trs2))
+        self.assertFalse(any(tier.is_loaded() for tier in trs2))
+
+        # the annotations are loaded before writing
+        parser.set_filename(os.path.join(TEMP, "sample-lazy.xra"))
+        parser.write(trs2)
+        trs3 = parser.read(heuristic=True)
+        self.assertTrue(compare_tiers_trs(trs1, trs3, meta=False))
+
+        # only the selected tiers are loaded
+        trs3 = parser.read(tiers=["W-Words", "K-Spch"])
+        self.assertEqual(["K-Spch", "W-Words"], [t.get_name() for t in trs3])
+        self.assertTrue(all(tier.is_loaded() for tier in trs3))
+        self.assertEqual(list(trs1.find("W-Words")),
+                         list(trs3.find("W-Words")))
+        trs3 = parser.read(tiers=["K-Spch"], lazy=True)
+        self.assertEqual(1, len(trs3))
+        self.assertFalse(trs3[0].is_loaded())
+
+        # the other tiers are removed by the readers without lazy support
+        parser = sppasRW(os.path.join(DATA, "sample-TGA.antx"))
+        trs1 = parser.read(tiers=["Layer4", "Layer1"], lazy=True)
+        self.assertEqual(["Layer1", "Layer4"], [t.get_name() for t in trs1])
+        self.assertTrue(all(tier.is_loaded() for tier in trs1))
+
+    # -----------------------------------------------------------------------
+
     def test_IO_ANTX(self):
         """Read/Write/Read then compare ANTX files."""
 
@@ -41,7 +41,11 @@
 
 """
 import os.path
+import io
 import unittest
+import xml.etree.cElementTree as ET
+
+from sppas.src.config import sg
 
 from ..tier import sppasTier
 from ..ann.annotation import sppasAnnotation
@@ -55,6 +59,8 @@ from ..aio.aioutils import fill_gaps, check_gaps, unfill_gaps
 from ..aio.aioutils import merge_overlapping_annotations
 from ..aio.aioutils import load
 from ..aio.aioutils import format_labels
+from ..aio.aioutils import sppasXMLStreamWriter
+from ..aio.xra import sppasXRA
 
 # ---------------------------------------------------------------------------
 
@@ -261,3 +267,38 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(len(expected_tier), len(new_tier))
         for new_ann, expected_ann in zip(new_tier, expected_tier):
             self.assertEqual(new_ann, expected_ann)
+
+    # -----------------------------------------------------------------------
+
+    def test_xml_stream_writer(self):
+        """Write element after element like the indented whole tree."""
+        root = ET.Element('Document')
+        root.set('name', "stream")
+        root.set('xmlns:xsi', 'http://www.w3.org/2001/XMLSchema-instance')
+        elements = list()
+        for i in range(3):
+            tier_root = ET.SubElement(root, 'Tier')
+            tier_root.set('id', "t" + str(i))
+            for j in range(i):
+                ann_root = ET.SubElement(tier_root, 'Annotation')
+                label_root = ET.SubElement(ann_root, 'Label')
+                label_root.text = u"é & <{:d}>".format(j)
+            elements.append(tier_root)
+        elements.append(ET.SubElement(root, 'Hierarchy'))
+
+        expected = io.BytesIO()
+        sppasXRA.indent(root)
+        ET.ElementTree(root).write(expected,
+                                   encoding=sg.__encoding__,
+                                   method="xml",
+                                   xml_declaration=True)
+
+        # indent() is also fixing the tails: the elements are re-created
+        stream = io.BytesIO()
+        xml = sppasXMLStreamWriter(stream, root, sppasXRA.indent,
+                                   xml_declaration=True)
+        for element in elements:
+            xml.write(ET.fromstring(ET.tostring(element)))
+        xml.close()
+
+        self.assertEqual(expected.getvalue(), stream.getvalue())
@@ -87,6 +87,7 @@ class TestXRA(unittest.TestCase):
         self.assertTrue(xra.radius_support())
         self.assertTrue(xra.gaps_support())
         self.assertTrue(xra.overlaps_support())
+        self.assertTrue(xra.lazy_support())
 
     # -----------------------------------------------------------------------
 
@@ -221,3 +222,46 @@ class TestXRA(unittest.TestCase):
             self.assertEqual(len(ctrl1), len(ctrl2))
             for entry in ctrl1:
                 self.assertTrue(ctrl2.contains(entry))
+
+    # -----------------------------------------------------------------------
+
+    def test_open(self):
+        xra = sppasXRA()
+        xra.read(os.path.join(DATA, "sample-1.4.xra"))
+        xra2 = sppasXRA()
+        xra2.open(os.path.join(DATA, "sample-1.4.xra"))
+        self.assertEqual(len(xra), len(xra2))
+        for t1, t2 in zip(xra, xra2):
+            self.assertFalse(t2.is_loaded())
+            self.assertEqual(t1.get_name(), t2.get_name())
+            self.assertEqual(t1.get_meta("id"), t2.get_meta("id"))
+            self.assertEqual(t1.get_media(), t2.get_media())
+            if t1.get_ctrl_vocab() is None:
+                self.assertIsNone(t2.get_ctrl_vocab())
+            else:
+                self.assertEqual(t1.get_ctrl_vocab().get_name(),
+                                 t2.get_ctrl_vocab().get_name())
+
+        # a tier is loaded when its annotations are accessed
+        self.assertEqual(len(xra[3]), len(xra2[3]))
+        self.assertTrue(xra2[3].is_loaded())
+        self.assertFalse(xra2[4].is_loaded())
+        self.assertIsNone(xra2.get_hierarchy().get_parent(xra2[4]))
+
+        # the hierarchy link is added when the child tier is loaded
+        xra2.load()
+        for t1, t2 in zip(xra, xra2):
+            self.assertTrue(t2.is_loaded())
+            self.assertEqual(list(t1), list(t2))
+        self.assertEqual(xra2[3], xra2.get_hierarchy().get_parent(xra2[4]))
+
+    # -----------------------------------------------------------------------
+
+    def test_open_tiers(self):
+        xra = sppasXRA()
+        xra.open(os.path.join(DATA, "sample-1.4.xra"), ["Phones", "IPU"])
+        self.assertEqual(["IPU", "Phones"], [t.get_name() for t in xra])
+        self.assertEqual(1, len(xra.find("Phones")))
+        self.assertTrue(xra.find("Phones").is_loaded())
+        self.assertFalse(xra.find("IPU").is_loaded())
+        self.assertEqual(0, len(xra.get_hierarchy()))
@@ -42,6 +42,8 @@
 """
 
 import unittest
+import copy
+import pickle
 
 from sppas.src.config import symbols
 from ..ann.annlocation import sppasLocation
@@ -87,6 +89,35 @@ class TestAnnotation(unittest.TestCase):
         self.assertEqual(len(ann.get_meta_keys()), 1)
         self.assertTrue(ann.is_meta_key("id"))
 
+        # the 'id' is generated once, when requested
+        ann = sppasAnnotation(sppasLocation(self.it))
+        self.assertTrue(ann.is_meta_key("id"))
+        self.assertFalse(ann.is_meta_key("key"))
+        self.assertEqual("", ann.get_meta("key"))
+        identifier = ann.get_meta("id")
+        self.assertEqual(36, len(identifier))
+        self.assertEqual(identifier, ann.get_meta("id"))
+        self.assertEqual(identifier, ann.copy().get_meta("id"))
+        self.assertNotEqual(identifier,
+                            sppasAnnotation(sppasLocation(self.it)).get_meta("id"))
+
+        # the 'id' is kept by copy.deepcopy and pickle
+        ann = sppasAnnotation(sppasLocation(self.it))
+        copied = copy.deepcopy(ann)
+        self.assertEqual(ann.get_meta("id"), copied.get_meta("id"))
+        ann = sppasAnnotation(sppasLocation(self.it))
+        copied = pickle.loads(pickle.dumps(ann))
+        self.assertEqual(ann.get_meta("id"), copied.get_meta("id"))
+
+        # the 'id' given by a reader is kept
+        ann = sppasAnnotation(sppasLocation(self.it))
+        ann.set_meta("id", "a1")
+        self.assertEqual(["id"], list(ann.get_meta_keys()))
+        self.assertEqual("a1", ann.get_meta("id"))
+        ann.pop_meta("id")
+        self.assertFalse(ann.is_meta_key("id"))
+        self.assertIsNone(ann.get_meta("id", None))
+
     # -----------------------------------------------------------------------
 
     def test_get_labels(self):
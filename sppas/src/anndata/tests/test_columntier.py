@@ -0,0 +1,218 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+
+    src.anndata.tests.test_columntier
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+    :summary:      Test the class sppasColumnTier().
+
+"""
+import unittest
+
+from ..anndataexc import AnnDataTypeError
+from ..anndataexc import IntervalBoundsError
+from ..anndataexc import TierAppendError
+from ..ann.annlocation import sppasLocation
+from ..ann.annlocation import sppasDisjoint
+from ..ann.annlocation import sppasInterval
+from ..ann.annlocation import sppasPoint
+from ..ann.annlabel import sppasTag
+from ..ann.annlabel import sppasLabel
+from ..ann.annotation import sppasAnnotation
+from ..tier import sppasTier
+from ..columntier import sppasColumnTier
+
+# ---------------------------------------------------------------------------
+
+
+class TestColumnTier(unittest.TestCase):
+
+    def setUp(self):
+        # a tier with all the kinds of supported labels
+        self.tier = sppasTier("phones")
+        self.tier.set_meta("key", "value")
+        for i in range(20):
+            b = sppasPoint(i * 0.1, 0.005)
+            e = sppasPoint((i+1) * 0.1, 0.005)
+            if i % 5 == 0:
+                labels = list()
+            elif i % 7 == 0:
+                labels = sppasLabel([sppasTag("a"), sppasTag("b")], [0.4, 0.6])
+            else:
+                labels = sppasLabel(sppasTag("p%d" % (i % 3)), 0.5)
+            ann = self.tier.create_annotation(
+                sppasLocation(sppasInterval(b, e)), labels)
+            ann.set_meta("index", str(i))
+        self.tier[3].set_score(0.8)
+
+    # -----------------------------------------------------------------------
+
+    def test_append(self):
+        tier = sppasColumnTier("phones")
+        self.assertTrue(tier.is_empty())
+        self.assertFalse(tier.is_interval())
+        tier.append_interval(0., 0.5, "a", radius=0.005)
+        tier.append_interval(0.5, 1., "b", 0.7, radius=0.005)
+        tier.append_interval(1., 1.5)
+        tier.extend_intervals([1.5, 2.], [2., 3.], ["a", "b"])
+        self.assertEqual(5, len(tier))
+        self.assertTrue(tier.is_interval())
+        self.assertFalse(tier.is_point())
+        self.assertEqual(["a", "b"], tier.get_texts())
+        self.assertEqual("b", tier.get_label_text(1))
+        self.assertIsNone(tier.get_label_text(2))
+        self.assertEqual(0.7, tier[1].get_labels()[0].get_score(sppasTag("b")))
+        self.assertEqual(sppasPoint(0.), tier.get_first_point())
+        self.assertEqual(sppasPoint(3.), tier.get_last_point())
+        self.assertEqual(10, len(tier.get_all_points()))
+        self.assertEqual([(0., 0.5), (0.5, 1.)],
+                         tier.get_midpoint_intervals()[:2])
+        self.assertTrue(tier.is_string())
+        self.assertEqual("str", tier.get_labels_type())
+
+        with self.assertRaises(IntervalBoundsError):
+            tier.append_interval(4., 3.)
+        with self.assertRaises(TierAppendError):
+            tier.append_interval(1., 4.)
+        with self.assertRaises(AnnDataTypeError):
+            tier.append_point(4.)
+        with self.assertRaises(AnnDataTypeError):
+            tier.append_interval(4, 5)
+        with self.assertRaises(IndexError):
+            tier[5]
+
+        points = sppasColumnTier()
+        self.assertEqual(points.get_meta("id"), points.get_name())
+        points.append_point(1, "a")
+        points.append_point(3, "b", radius=1)
+        self.assertTrue(points.is_point())
+        self.assertEqual(sppasPoint(3, 1), points[-1].get_location().get_best())
+        self.assertEqual(1, points.index(sppasPoint(4)))
+        self.assertEqual(-1, points.index(sppasPoint(5)))
+        with self.assertRaises(TierAppendError):
+            points.append_point(2)
+        with self.assertRaises(AnnDataTypeError):
+            points.append(sppasAnnotation(sppasLocation(
+                sppasInterval(sppasPoint(5), sppasPoint(6)))))
+        with self.assertRaises(AnnDataTypeError):
+            points.append(sppasAnnotation(sppasLocation(sppasDisjoint(
+                [sppasInterval(sppasPoint(5), sppasPoint(6)),
+                 sppasInterval(sppasPoint(7), sppasPoint(8))]))))
+
+    # -----------------------------------------------------------------------
+
+    def test_conversion(self):
+        columns = sppasColumnTier.from_tier(self.tier)
+        self.assertEqual(len(self.tier), len(columns))
+        self.assertEqual("value", columns.get_meta("key"))
+        self.assertEqual(["p1", "p2", "p0"], columns.get_texts())
+        for ann, other in zip(self.tier, columns):
+            self.assertEqual(ann, other)
+        self.assertEqual("", columns[1].get_meta("index"))
+        self.assertNotEqual(self.tier[1].get_meta("id"),
+                            columns[1].get_meta("id"))
+        self.assertEqual("{a|b}", columns.get_label_text(7))
+
+        # back to the object form
+        tier = columns.to_tier()
+        self.assertEqual(self.tier.get_name(), tier.get_name())
+        self.assertEqual(self.tier.get_meta("id"), tier.get_meta("id"))
+        for ann, other in zip(self.tier, tier):
+            self.assertEqual(ann, other)
+
+        # with the metadata of the annotations
+        columns = sppasColumnTier.from_tier(self.tier, metadata=True)
+        self.assertEqual("1", columns[1].get_meta("index"))
+        self.assertEqual(self.tier[1].get_meta("id"),
+                         columns[1].get_meta("id"))
+        identifier = self.tier[12].get_meta("id")
+        self.assertEqual(identifier, columns.get_annotation_meta(12, "id"))
+        self.assertEqual(self.tier[12], columns.get_annotation(identifier))
+        columns.set_annotation_meta(12, "key", "value")
+        self.assertEqual("value", columns[12].get_meta("key"))
+
+    # -----------------------------------------------------------------------
+
+    def test_map_tags(self):
+        columns = sppasColumnTier.from_tier(self.tier)
+        columns.map_tags(lambda text: text.upper()[0])
+        self.assertEqual(["P"], columns.get_texts())
+        self.assertEqual("P", columns.get_label_text(1))
+        self.assertEqual("{A|B}", columns.get_label_text(7))
+        self.assertEqual(0.6, columns[7].get_labels()[0].get_score(sppasTag("B")))
+
+    # -----------------------------------------------------------------------
+
+    def test_search(self):
+        """Same results as a sppasTier()."""
+        columns = sppasColumnTier.from_tier(self.tier)
+        moments = [sppasPoint(t / 40., r) for t in range(85)
+                   for r in (None, 0.001, 0.02)]
+        for m in moments:
+            self.assertEqual(self.tier.has_point(m), columns.has_point(m))
+            self.assertEqual(self.tier.lindex(m), columns.lindex(m))
+            self.assertEqual(self.tier.rindex(m), columns.rindex(m))
+            for bound in (-1, 0, 1, 2):
+                self.assertEqual(self.tier.mindex(m, bound),
+                                 columns.mindex(m, bound))
+            for direction in (-1, 0, 1):
+                self.assertEqual(self.tier.near(m, direction),
+                                 columns.near(m, direction))
+            for e in (sppasPoint(0.62), sppasPoint(1.2, 0.01), None):
+                for overlaps in (True, False):
+                    self.assertEqual(self.tier.find(m, e, overlaps),
+                                     columns.find(m, e, overlaps))
+
+        # a tier with points
+        tier = sppasTier()
+        columns = sppasColumnTier()
+        for i in range(10):
+            tier.create_annotation(sppasLocation(sppasPoint(i * 0.3, 0.01)))
+            columns.append_point(i * 0.3, radius=0.01)
+        for m in moments:
+            self.assertEqual(tier.index(m), columns.index(m))
+            self.assertEqual(tier.near(m, 1), columns.near(m, 1))
+            self.assertEqual(tier.find(m, sppasPoint(1.5)),
+                             columns.find(m, sppasPoint(1.5)))
+
+        # supersets
+        columns = sppasColumnTier.from_tier(self.tier)
+        self.assertTrue(columns.is_superset(self.tier))
+        self.assertTrue(self.tier.is_superset(columns))
+        self.assertTrue(columns.is_superset(sppasColumnTier()))
+        tier = sppasTier()
+        tier.create_annotation(sppasLocation(sppasInterval(
+            sppasPoint(0.3), sppasPoint(0.65))))
+        self.assertFalse(columns.is_superset(tier))
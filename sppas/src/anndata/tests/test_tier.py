@@ -169,6 +169,51 @@ class TestTier(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_loader(self):
+        """The annotations of a tier loaded on demand."""
+
+        loaded = list()
+
+        def loader(tier):
+            loaded.append(tier)
+            tier.create_annotation(
+                sppasLocation(sppasInterval(sppasPoint(1), sppasPoint(3))),
+                sppasLabel(sppasTag("toto")))
+
+        tier = sppasTier("lazy")
+        self.assertTrue(tier.is_loaded())
+        with self.assertRaises(AnnDataTypeError):
+            tier.set_loader("loader")
+        tier.set_loader(loader)
+        self.assertFalse(tier.is_loaded())
+
+        # the ctrl vocab is validated when the annotations are added
+        tier.set_ctrl_vocab(sppasCtrlVocab("vocab"))
+        self.assertFalse(tier.is_loaded())
+        with self.assertRaises(CtrlVocabContainsError):
+            len(tier)
+        self.assertTrue(tier.is_loaded())
+        self.assertEqual(0, len(tier))
+
+        tier = sppasTier("lazy")
+        tier.set_loader(loader)
+        self.assertEqual(sppasPoint(3), tier.get_last_point())
+        self.assertEqual(1, len(tier))
+        self.assertEqual([tier], loaded[1:])
+
+        # the loader is invoked once, even if the tier is modified
+        tier = sppasTier("lazy")
+        tier.set_loader(loader)
+        tier.create_annotation(
+            sppasLocation(sppasInterval(sppasPoint(3), sppasPoint(5))))
+        tier.load()
+        self.assertEqual(2, len(tier))
+        self.assertEqual(3, len(loaded))
+        tier.set_loader(None)
+        self.assertTrue(tier.is_loaded())
+
+    # -----------------------------------------------------------------------
+
     def test_create_ctrl_vocab(self):
         """The controlled vocabulary of a tier."""
 
@@ -493,6 +538,76 @@ class TestTier(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_find_index(self):
+        """Compare the searches to the ones browsing all the annotations."""
+        random.seed(7)
+        tier = sppasTier("IntervalsTier")
+        while len(tier) < 150:
+            b = round(random.uniform(0., 50.), 2)
+            e = round(b + random.uniform(0.05, random.choice((0.5, 5.))), 2)
+            try:
+                tier.add(sppasAnnotation(sppasLocation(
+                    sppasInterval(sppasPoint(b, 0.005), sppasPoint(e, 0.005)))))
+            except TierAddError:
+                pass
+
+        def first(indexes):
+            return indexes[0] if len(indexes) > 0 else -1
+
+        def check():
+            for i in range(50):
+                b = sppasPoint(round(random.uniform(0., 55.), 2), 0.005)
+                e = sppasPoint(b.get_midpoint() + round(random.uniform(0., 3.), 2), 0.005)
+                expected = [a for a in tier
+                            if a.get_lowest_localization() < e and
+                            b < a.get_highest_localization()]
+                self.assertEqual(expected, tier.find(b, e, overlaps=True))
+                expected = [a for a in tier
+                            if a.get_lowest_localization() >= b and
+                            a.get_highest_localization() <= e]
+                self.assertEqual(expected, tier.find(b, e, overlaps=False))
+                expected = [i for i, a in enumerate(tier)
+                            if a.get_lowest_localization() < b < a.get_highest_localization()]
+                self.assertEqual(first(expected), tier.mindex(b))
+
+                p = random.choice(tier).get_lowest_localization()
+                expected = [i for i, a in enumerate(tier)
+                            if a.get_lowest_localization() == p]
+                self.assertEqual(first(expected), tier.lindex(p))
+                expected = [i for i, a in enumerate(tier)
+                            if a.get_highest_localization() == p]
+                self.assertEqual(first(list(reversed(expected))), tier.rindex(p))
+                self.assertTrue(tier.has_point(p))
+                self.assertEqual(b in tier.get_all_points(), tier.has_point(b))
+
+        check()
+
+        # the index is updated when the tier or its annotations are modified
+        for i in range(20):
+            tier.pop(random.choice((-1, 0, random.randrange(len(tier)))))
+        tier.remove(sppasPoint(10.), sppasPoint(12.))
+        check()
+        for i in range(5):
+            a = random.choice(tier)
+            localization = a.get_location().get_best()
+            localization.set_end(sppasPoint(a.get_highest_localization().get_midpoint() + 10., 0.005))
+            a.set_best_localization(localization)
+        check()
+        tier.set_radius(0.01)
+        check()
+
+        tier = sppasTier("PointsTier")
+        for m in random.sample(range(1000), 200):
+            tier.add(sppasAnnotation(sppasLocation(sppasPoint(m / 10., 0.01))))
+        for m in range(0, 1000, 7):
+            p = sppasPoint(m / 10., 0.01)
+            expected = [i for i, a in enumerate(tier)
+                        if a.get_lowest_localization() == p]
+            self.assertEqual(first(expected), tier.index(p))
+            self.assertEqual(len(expected), len(tier.find(p, p)))
+
+    # -----------------------------------------------------------------------
+
     def test_find_point(self):
         tier = sppasTier("PointsTier")
         for i in range(5):
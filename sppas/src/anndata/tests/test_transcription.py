@@ -41,9 +41,13 @@
 
 """
 import unittest
+import copy
+
 from ..anndataexc import TrsAddError
 
 from ..ann.annlabel import sppasTag
+from ..ann.annlocation import sppasLocation
+from ..ann.annlocation import sppasPoint
 from ..tier import sppasTier
 from ..transcription import sppasTranscription
 
@@ -69,6 +73,15 @@ class TestTranscription(unittest.TestCase):
         self.assertEqual(trsI.get_meta('key'), trsP.get_meta('key'))
         self.assertEqual(trsI.get_meta('toto'), '')
 
+        # the ids are kept by copy.deepcopy, even if not generated yet
+        self.tier1.create_annotation(sppasLocation(sppasPoint(1.)))
+        copied = copy.deepcopy(self.trs)
+        self.assertEqual(self.trs.get_meta('id'), copied.get_meta('id'))
+        self.assertEqual(self.tier1.get_meta('id'),
+                         copied[0].get_meta('id'))
+        self.assertEqual(self.tier1[0].get_meta('id'),
+                         copied[0][0].get_meta('id'))
+
     def test_name(self):
         trsP = sppasTranscription()
         self.assertEqual(len(trsP.get_name()), 36)
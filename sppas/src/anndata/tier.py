@@ -34,6 +34,9 @@
 
 """
 
+from array import array
+from bisect import bisect_left, bisect_right
+
 from sppas.src.files import sppasGUID
 from sppas.src.utils import sppasUnicode
 
@@ -56,6 +59,202 @@ from .media import sppasMedia
 # ----------------------------------------------------------------------------
 
 
+class _LazyAnnotations(list):
+    """The list of annotations of a tier, loaded on demand.
+
+    The loader is invoked with the tier the first time the list is
+    accessed. It is unset before being invoked, so that the loader can
+    fill the tier with its usual methods.
+
+    """
+
+    def __init__(self, tier, annotations=()):
+        super(_LazyAnnotations, self).__init__(annotations)
+        self.__tier = tier
+        self.loader = None
+
+    def load(self):
+        if self.loader is not None:
+            loader = self.loader
+            self.loader = None
+            loader(self.__tier)
+
+    def __len__(self):
+        self.load()
+        return list.__len__(self)
+
+    def __iter__(self):
+        self.load()
+        return list.__iter__(self)
+
+    def __reversed__(self):
+        self.load()
+        return list.__reversed__(self)
+
+    def __contains__(self, item):
+        self.load()
+        return list.__contains__(self, item)
+
+    def __getitem__(self, i):
+        self.load()
+        return list.__getitem__(self, i)
+
+    def __getslice__(self, i, j):
+        self.load()
+        return list.__getitem__(self, slice(i, j))
+
+    def __setitem__(self, i, item):
+        self.load()
+        list.__setitem__(self, i, item)
+
+    def __delitem__(self, i):
+        self.load()
+        list.__delitem__(self, i)
+
+    def __eq__(self, other):
+        self.load()
+        return list.__eq__(self, other)
+
+    def __ne__(self, other):
+        self.load()
+        return list.__ne__(self, other)
+
+    def append(self, item):
+        self.load()
+        list.append(self, item)
+
+    def extend(self, items):
+        self.load()
+        list.extend(self, items)
+
+    def insert(self, i, item):
+        self.load()
+        list.insert(self, i, item)
+
+    def remove(self, item):
+        self.load()
+        list.remove(self, item)
+
+    def pop(self, i=-1):
+        self.load()
+        return list.pop(self, i)
+
+    def index(self, item, *args):
+        self.load()
+        return list.index(self, item, *args)
+
+    def count(self, item):
+        self.load()
+        return list.count(self, item)
+
+    def sort(self, *args, **kwargs):
+        self.load()
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self):
+        self.load()
+        list.reverse(self)
+
+# ----------------------------------------------------------------------------
+
+
+class _IntervalIndex(object):
+    """An index of the localizations of the annotations of a tier.
+
+    The midpoints of the lowest and highest points of the annotations are
+    stored in the order of the tier, with their running maximum. Both
+    running maximums are sorted even if the annotations are overlapping,
+    so that the annotations of a period are found by bisection: all the
+    annotations before the first end reaching the period and all the
+    annotations after the last begin reaching it can't be in the period.
+
+    The comparisons of sppasPoint are vague: the largest radius of the
+    points and the largest gap between a begin and the previous ones
+    widen the windows, so that they contain all the candidates.
+
+    """
+
+    EPSILON = 1e-9
+
+    def __init__(self, annotations=()):
+        self.begins = array('d')
+        self.ends = array('d')
+        self.max_begins = array('d')
+        self.max_ends = array('d')
+        self.radius = 0.
+        self.disorder = 0.
+        for ann in annotations:
+            self.append(ann)
+
+    def append(self, annotation):
+        self.insert(len(self.begins), annotation)
+
+    def insert(self, index, annotation):
+        lowest = annotation.get_lowest_localization()
+        highest = annotation.get_highest_localization()
+        b = float(lowest.get_midpoint())
+        e = float(highest.get_midpoint())
+        self.radius = max(self.radius,
+                          lowest.get_radius() or 0.,
+                          highest.get_radius() or 0.)
+
+        self.begins.insert(index, b)
+        self.ends.insert(index, e)
+        if index > 0:
+            self.max_begins.insert(index, max(self.max_begins[index-1], b))
+            self.max_ends.insert(index, max(self.max_ends[index-1], e))
+        else:
+            self.max_begins.insert(index, b)
+            self.max_ends.insert(index, e)
+        self.disorder = max(self.disorder, self.max_begins[index] - b)
+
+        # the running maximums of the next annotations can only increase
+        i = index + 1
+        while i < len(self.begins) and self.max_begins[i] < b:
+            self.max_begins[i] = b
+            self.disorder = max(self.disorder, b - self.begins[i])
+            i += 1
+        i = index + 1
+        while i < len(self.ends) and self.max_ends[i] < e:
+            self.max_ends[i] = e
+            i += 1
+
+    def pop(self, index):
+        del self.begins[index]
+        del self.ends[index]
+        del self.max_begins[index]
+        del self.max_ends[index]
+        self.__update(self.begins, self.max_begins, index)
+        self.__update(self.ends, self.max_ends, index)
+
+    def window(self, begin, end, radius=0.):
+        """Return (lo, hi) the indexes of the candidates for [begin, end].
+
+        :param begin: (float) Midpoint of the begin of the period
+        :param end: (float) Midpoint of the end of the period
+        :param radius: (float) Radius of the points of the period
+
+        """
+        delta = self.radius + (radius or 0.) + _IntervalIndex.EPSILON
+        lo = bisect_left(self.max_ends, begin - delta)
+        hi = bisect_right(self.max_begins, end + delta + self.disorder)
+        return lo, hi
+
+    @staticmethod
+    def __update(values, maximums, index):
+        """Update the running maximums from the given index."""
+        while index < len(values):
+            value = values[index]
+            if index > 0:
+                value = max(maximums[index-1], value)
+            if maximums[index] == value:
+                break
+            maximums[index] = value
+            index += 1
+
+# ----------------------------------------------------------------------------
+
+
 class sppasTier(sppasMetaData):
     """Representation of a tier, a structured set of annotations.
 
@@ -77,6 +276,14 @@ class sppasTier(sppasMetaData):
         - a media (optional),
         - a parent (optional).
 
+    The annotations of a tier can be loaded on demand: a loader is then
+    invoked the first time the annotations are accessed. It allows the
+    readers to create the tiers of a file without their annotations.
+
+    The localizations of the annotations are indexed the first time the
+    tier is searched, so that the annotations of a period are found
+    without browsing the tier, even if they are overlapping.
+
     """
 
     def __init__(self, name=None, ctrl_vocab=None, media=None, parent=None):
@@ -92,6 +299,7 @@ class sppasTier(sppasMetaData):
 
         self.__name = None
         self.__ann = list()
+        self.__index = None
         self.__ctrl_vocab = None
         self.__media = None
         self.__parent = None
@@ -175,10 +383,12 @@ class sppasTier(sppasMetaData):
                 raise AnnDataTypeError(ctrl_vocab, "sppasCtrlVocab")
 
             # Check all annotation tags to validate the
-            # ctrl_vocab before assignment
-            for annotation in self.__ann:
-                for label in annotation.get_labels():
-                    annotation.validate_label(label)
+            # ctrl_vocab before assignment. Annotations not loaded yet
+            # will be validated when added.
+            if self.is_loaded() is True:
+                for annotation in self.__ann:
+                    for label in annotation.get_labels():
+                        annotation.validate_label(label)
 
             if self.__parent is not None:
                 try:
@@ -235,6 +445,53 @@ class sppasTier(sppasMetaData):
 
     # -----------------------------------------------------------------------
 
+    def set_loader(self, loader):
+        """Set the function to load the annotations on demand.
+
+        The loader is invoked with this tier the first time its annotations
+        are accessed. Annotations already in the tier are kept.
+
+        :param loader: (callable or None) None if the tier is loaded
+
+        """
+        if loader is not None and callable(loader) is False:
+            raise AnnDataTypeError(loader, "callable")
+        if isinstance(self.__ann, _LazyAnnotations) is False:
+            if loader is None:
+                return
+            self.__ann = _LazyAnnotations(self, self.__ann)
+        self.__ann.loader = loader
+        self.__index = None
+
+    # -----------------------------------------------------------------------
+
+    def is_loaded(self):
+        """Return True if the annotations of the tier are loaded."""
+        if isinstance(self.__ann, _LazyAnnotations) is True:
+            return self.__ann.loader is None
+        return True
+
+    # -----------------------------------------------------------------------
+
+    def load(self):
+        """Load the annotations of the tier, if not already done."""
+        if isinstance(self.__ann, _LazyAnnotations) is True:
+            self.__ann.load()
+
+    # -----------------------------------------------------------------------
+
+    def invalidate_index(self):
+        """Invalidate the index of the localizations of the annotations.
+
+        The index is maintained by the methods of the tier and it is
+        invalidated when the location of an annotation is set. It must be
+        invalidated if the points of a location are modified in place.
+
+        """
+        self.__index = None
+
+    # -----------------------------------------------------------------------
+
     def copy(self):
         """Return a deep copy of the tier (including 'id')."""
         new_tier = sppasTier(self.__name)
@@ -294,6 +551,8 @@ class sppasTier(sppasMetaData):
                 raise TierAppendError(end, new)
 
         self.__ann.append(annotation)
+        if self.__index is not None:
+            self.__index.append(annotation)
 
     # -----------------------------------------------------------------------
 
@@ -321,11 +580,15 @@ class sppasTier(sppasMetaData):
                         raise TierAddError(index)
                 else:
                     index = self.near(annotation.get_lowest_localization(), direction=-1)
-                self.__ann.insert(index + 1, annotation)
+                self.__insert(index + 1, annotation)
                 return index + 1
 
             else:
                 index = self.mindex(annotation.get_lowest_localization(), bound=0)
+                # All the annotations before the candidates are ending
+                # before, so they are starting before.
+                lo, hi = self.__window(annotation.get_lowest_localization())
+                index = max(index, lo - 1)
 
                 # We go further to look at the next localizations until the begin is smaller.
                 while index + 1 < len(self.__ann) and \
@@ -344,7 +607,7 @@ class sppasTier(sppasMetaData):
                     if self.__ann[index+1].get_location() == annotation.get_location():
                         raise TierAddError(index+1)
 
-                self.__ann.insert(index + 1, annotation)
+                self.__insert(index + 1, annotation)
                 return index + 1
 
         return len(self.__ann) - 1
@@ -366,6 +629,8 @@ class sppasTier(sppasMetaData):
         annotations = self.find(begin, end, overlaps)
         for a in annotations:
             self.__ann.remove(a)
+        if len(annotations) > 0:
+            self.__index = None
 
         return len(annotations)
 
@@ -384,6 +649,10 @@ class sppasTier(sppasMetaData):
             self.__ann.pop(index)
         except IndexError:
             raise AnnDataIndexError(index)
+        if self.__index is not None:
+            if index < 0:
+                index += len(self.__index.begins)
+            self.__index.pop(index)
 
     # -----------------------------------------------------------------------
     # Localizations
@@ -430,7 +699,15 @@ class sppasTier(sppasMetaData):
         if isinstance(point, sppasPoint) is False:
             raise AnnDataTypeError(point, "sppasPoint")
 
-        return point in self.get_all_points()
+        if len(self.__ann) == 0:
+            return False
+
+        lo, hi = self.__window(point)
+        for ann in self.__ann[lo:hi]:
+            if point in ann.get_all_points():
+                return True
+
+        return False
 
     # -----------------------------------------------------------------------
 
@@ -505,61 +782,43 @@ class sppasTier(sppasMetaData):
         if end is None:
             end = self.get_last_point()
 
-        # Out of interval!
-        if begin > self.get_last_point() or end < self.get_first_point():
-            return []
+        # Only the annotations of the window can be in the interval
+        lo, hi = self.__window(begin, end)
+        inside = self.is_point() is True or overlaps is False
 
         annotations = list()
+        for ann in self.__ann[lo:hi]:
+            b = ann.get_lowest_localization()
+            e = ann.get_highest_localization()
+            if inside is True:
+                if b >= begin and e <= end:
+                    annotations.append(ann)
+            elif end > b and begin < e:
+                annotations.append(ann)
 
-        if self.is_point() is True:
+        return annotations
 
-            lo = self.index(begin)
-            if lo == -1:
-                lo = self.near(begin, direction=1)
-            for ann in self.__ann[lo:]:
-                lowest = ann.get_lowest_localization()
-                highest = ann.get_highest_localization()
-                if lowest > end and highest > end:
-                    break
-                if lowest >= begin and highest <= end:
-                    annotations.append(ann)
+    # -----------------------------------------------------------------------
 
-        else:
-            lo = self.__find(begin)
-
-            if overlaps is True:
-
-                if lo > 0:
-                    tmp_annotations = list()
-                    for ann in reversed(self.__ann[:lo]):
-                        b = ann.get_lowest_localization()
-                        e = ann.get_highest_localization()
-                        if b < begin < e:
-                            tmp_annotations.append(ann)
-                        if b > begin:
-                            break
-                    for ann in reversed(tmp_annotations):
-                        annotations.append(ann)
-                else:
-                    annotations = list()
-                for ann in self.__ann[lo:]:
-                    b = ann.get_lowest_localization()
-                    e = ann.get_highest_localization()
-                    if b >= end:
-                        break
-                    if end > b and begin < e:
-                        annotations.append(ann)
-            else:
-                annotations = list()
-                for ann in self.__ann[lo:]:
-                    b = ann.get_lowest_localization()
-                    e = ann.get_highest_localization()
-                    if b >= begin and e <= end:
-                        annotations.append(ann)
-                    if b >= end:
-                        break
+    def find_range(self, begin, end):
+        """Return the range of indexes of the annotations near an interval.
 
-        return annotations
+        All the annotations overlapping, containing or touching the interval
+        between begin and end are in the range, but the range can contain
+        some other ones. It allows to compare the annotations of a tier to
+        a period without browsing all of them.
+
+        :param begin: (sppasPoint)
+        :param end: (sppasPoint)
+        :returns: (lo, hi) The annotations are in tier[lo:hi]
+
+        """
+        if end < begin:
+            raise IntervalBoundsError(begin, end)
+        if len(self.__ann) == 0:
+            return 0, 0
+
+        return self.__window(begin, end)
 
     # -----------------------------------------------------------------------
 
@@ -574,25 +833,12 @@ class sppasTier(sppasMetaData):
         if self.is_point() is False:
             return -1
 
-        lo = 0
-        hi = len(self.__ann)
-        mid = (lo + hi) // 2
-        found = False
-        while lo < hi:
-            mid = (lo + hi) // 2
-            a = self.__ann[mid]
-            if moment < a.get_lowest_localization():
-                hi = mid
-            elif moment > a.get_lowest_localization():
-                lo = mid + 1
-            else:
-                found = True
-                break
-
-        if found is False:
-            return -1
+        lo, hi = self.__window(moment)
+        for i in range(lo, hi):
+            if self.__ann[i].get_lowest_localization() == moment:
+                return i
 
-        return mid
+        return -1
 
     # ------------------------------------------------------------------------
 
@@ -609,31 +855,12 @@ class sppasTier(sppasMetaData):
         if self.is_point() is True:
             return -1
 
-        lo = 0
-        hi = len(self.__ann)
-        mid = (lo + hi) // 2
-        found = False
-        while lo < hi:
-            mid = (lo + hi) // 2
-            begin = self.__ann[mid].get_lowest_localization()
-            if moment < begin:
-                hi = mid
-            elif moment > begin:
-                lo = mid + 1
-            else:
-                found = True
-                break
-        if found is False:
-            return -1
-        if mid == 0:
-            return 0
-
-        # We go back to look at the previous localizations
-        # until they are different.
-        while mid >= 0 and self.__ann[mid].get_lowest_localization() == moment:
-            mid -= 1
+        lo, hi = self.__window(moment)
+        for i in range(lo, hi):
+            if self.__ann[i].get_lowest_localization() == moment:
+                return i
 
-        return mid + 1
+        return -1
 
     # ------------------------------------------------------------------------
 
@@ -656,7 +883,9 @@ class sppasTier(sppasMetaData):
         if self.is_point() is True:
             return -1
 
-        for i, a in enumerate(self.__ann):
+        lo, hi = self.__window(moment)
+        for i in range(lo, hi):
+            a = self.__ann[i]
             b = a.get_lowest_localization()
             e = a.get_highest_localization()
             if bound == -1:
@@ -689,32 +918,12 @@ class sppasTier(sppasMetaData):
         if self.is_point() is True:
             return -1
 
-        lo = 0
-        hi = len(self.__ann)
-        mid = (lo + hi) // 2
-        found = False
-        while lo < hi:
-            mid = (lo + hi) // 2
-            a = self.__ann[mid]
-            if moment < a.get_highest_localization():
-                hi = mid
-            elif moment > a.get_highest_localization():
-                lo = mid + 1
-            else:
-                found = True
-                break
-
-        if found is False:
-            return -1
-        if mid == len(self.__ann) - 1:
-            return mid
-
-        # We go further to look at the next localizations until they are different.
-        while mid+1 < len(self.__ann) and \
-                self.__ann[mid+1].get_highest_localization() == moment:
-            mid += 1
+        lo, hi = self.__window(moment)
+        for i in reversed(range(lo, hi)):
+            if self.__ann[i].get_highest_localization() == moment:
+                return i
 
-        return mid
+        return -1
 
     # -----------------------------------------------------------------------
 
@@ -728,11 +937,8 @@ class sppasTier(sppasMetaData):
         if len(other) == 0:
             return True
 
-        tier_points = self.get_all_points()
-        other_points = other.get_all_points()
-
-        for op in other_points:
-            if op not in tier_points:
+        for op in other.get_all_points():
+            if self.has_point(op) is False:
                 return False
 
         return True
@@ -985,6 +1191,7 @@ class sppasTier(sppasMetaData):
         """
         for ann in self.__ann:
             ann.get_location().set_radius(radius)
+        self.__index = None
 
     # -----------------------------------------------------------------------
 
@@ -1040,6 +1247,44 @@ class sppasTier(sppasMetaData):
     # Private
     # -----------------------------------------------------------------------
 
+    def __get_index(self):
+        """Return the index of the localizations, created if needed."""
+        if self.__index is None:
+            self.load()
+            self.__index = _IntervalIndex(self.__ann)
+        return self.__index
+
+    # -----------------------------------------------------------------------
+
+    def __window(self, begin, end=None):
+        """Return the indexes (lo, hi) of the candidates for a period.
+
+        :param begin: (sppasPoint, int, float)
+        :param end: (sppasPoint, int, float) None for the begin only
+
+        """
+        if end is None:
+            end = begin
+        radius = 0.
+        values = list()
+        for moment in (begin, end):
+            if isinstance(moment, sppasPoint) is True:
+                radius = max(radius, moment.get_radius() or 0.)
+                moment = moment.get_midpoint()
+            values.append(float(moment))
+
+        return self.__get_index().window(values[0], values[1], radius)
+
+    # -----------------------------------------------------------------------
+
+    def __insert(self, index, annotation):
+        """Insert an annotation at the given index of the tier."""
+        self.__ann.insert(index, annotation)
+        if self.__index is not None:
+            self.__index.insert(index, annotation)
+
+    # -----------------------------------------------------------------------
+
     def __find(self, x):
         """Return the index of the annotation whose moment value contains x.
 
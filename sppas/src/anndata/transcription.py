@@ -611,6 +611,7 @@ class sppasTranscription(sppasMetaData):
                 # shifted to right: from the last to the first annotation
                 for ann in reversed(tier):
                     ann.get_location().shift(delay)
+            tier.invalidate_index()
 
     # -----------------------------------------------------------------------
     # Overloads
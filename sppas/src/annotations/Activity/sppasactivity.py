@@ -166,8 +166,7 @@ class sppasActivity(sppasBaseAnnotation):
 
         """
         # Get the time-aligned tokens tier
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
         tok_tier = sppasFindTier.aligned_tokens(trs_input)
         if tok_tier is None:
             raise NoInputError
@@ -52,6 +52,7 @@ How to get an instance of a given aligner?
 from .aligner import sppasAligners
 from .basicalign import BasicAligner
 from .juliusalign import JuliusAligner
+from .juliussession import JuliusSession
 from .hvitealign import HviteAligner
 
 # ---------------------------------------------------------------------------
@@ -59,6 +60,7 @@ from .hvitealign import HviteAligner
 __all__ = (
     'sppasAligners',
     'JuliusAligner',
+    'JuliusSession',
     'HviteAligner',
     'BasicAligner'
 )
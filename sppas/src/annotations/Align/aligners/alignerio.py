@@ -305,9 +305,22 @@ class palign(BaseAlignersReader):
             2. List of (start-time end-time word None)
             3. List of (start-time end-time pron_word score)
 
+        """
+        return palign.read_lines(BaseAlignersReader.get_lines(filename),
+                                 filename)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def read_lines(lines, filename=""):
+        """Read the lines of an alignment in the format of Julius CSR engine.
+
+        :param lines: (list of str) The content of a palign file.
+        :param filename: (str) Name of the file, used in the error messages.
+        :returns: 3 lists of tuples, like read()
+
         """
         b = BaseAlignersReader()
-        lines = b.get_lines(filename)
         try:
             phonemes = b.get_phonemes_julius(lines)
         except IOError:
@@ -356,53 +369,56 @@ class palign(BaseAlignersReader):
 
         """
         with codecs.open(outputfilename, 'w', sg.__encoding__) as fp:
+            for line in palign.format_lines(phoneslist, tokenslist, alignments):
+                fp.write(line)
+            fp.close()
 
-            fp.write("----------------------- System Information begin "
-                     "---------------------\n")
-            fp.write("\n")
-            fp.write("                        Basic Alignment\n")
-            fp.write("\n")
-            fp.write("----------------------- System Information end "
-                     "-----------------------\n")
-
-            fp.write("\n### Recognition: 1st pass\n")
-
-            fp.write("pass1_best: ")
-            fp.write("{:s}\n".format(" ".join(tokenslist)))
-
-            fp.write("pass1_best_wordseq: ")
-            fp.write("{:s}\n".format(" ".join(tokenslist)))
-
-            fp.write("pass1_best_phonemeseq: ")
-            fp.write("{:s}\n".format(" | ".join(phoneslist)))
-
-            fp.write("\n### Recognition: 2nd pass\n")
-
-            fp.write("ALIGN: === phoneme alignment begin ===\n")
-
-            fp.write("sentence1: ")
-            fp.write("{:s}\n".format(" ".join(tokenslist)))
+    # -----------------------------------------------------------------------
 
-            fp.write("wseq1: ")
-            fp.write("{:s}\n".format(" ".join(tokenslist)))
+    @staticmethod
+    def format_lines(phoneslist, tokenslist, alignments):
+        """Return the lines of an alignment output file.
 
-            fp.write("phseq1: ")
-            fp.write("{:s}\n".format(" | ".join(phoneslist)))
+        :param phoneslist: (list) The phonetization of each token
+        :param tokenslist: (list) Each token
+        :param alignments: (list) Tuples (start-time end-time phoneme)
+        :returns: (list of str) Lines, each one ending by a newline
 
-            fp.write("cmscore1: ")
-            fp.write("{:s}\n".format("0.000 "*len(phoneslist)))
+        """
+        lines = list()
+        lines.append("----------------------- System Information begin "
+                     "---------------------\n")
+        lines.append("\n")
+        lines.append("                        Basic Alignment\n")
+        lines.append("\n")
+        lines.append("----------------------- System Information end "
+                     "-----------------------\n")
 
-            fp.write("=== begin forced alignment ===\n")
-            fp.write("-- phoneme alignment --\n")
-            fp.write(" id: from  to    n_score    unit\n")
-            fp.write(" ----------------------------------------\n")
-            for tv1, tv2, phon in alignments:
-                fp.write("[ {:d} ".format(tv1))
-                fp.write(" {:d}]".format(tv2))
-                fp.write(" -30.000000 " + str(phon) + "\n")
-            fp.write("=== end forced alignment ===\n")
+        lines.append("\n")
+        lines.append("### Recognition: 1st pass\n")
+        lines.append("pass1_best: {:s}\n".format(" ".join(tokenslist)))
+        lines.append("pass1_best_wordseq: {:s}\n".format(" ".join(tokenslist)))
+        lines.append("pass1_best_phonemeseq: "
+                     "{:s}\n".format(" | ".join(phoneslist)))
+
+        lines.append("\n")
+        lines.append("### Recognition: 2nd pass\n")
+        lines.append("ALIGN: === phoneme alignment begin ===\n")
+        lines.append("sentence1: {:s}\n".format(" ".join(tokenslist)))
+        lines.append("wseq1: {:s}\n".format(" ".join(tokenslist)))
+        lines.append("phseq1: {:s}\n".format(" | ".join(phoneslist)))
+        lines.append("cmscore1: {:s}\n".format("0.000 "*len(phoneslist)))
+
+        lines.append("=== begin forced alignment ===\n")
+        lines.append("-- phoneme alignment --\n")
+        lines.append(" id: from  to    n_score    unit\n")
+        lines.append(" ----------------------------------------\n")
+        for tv1, tv2, phon in alignments:
+            lines.append("[ {:d}  {:d}] -30.000000 {:s}\n"
+                         "".format(tv1, tv2, str(phon)))
+        lines.append("=== end forced alignment ===\n")
 
-            fp.close()
+        return lines
 
 # ---------------------------------------------------------------------------
 
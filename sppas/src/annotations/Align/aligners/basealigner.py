@@ -77,6 +77,9 @@ class BaseAligner(object):
         self._phones = ""       # string of the phonemes to time-align
         self._tokens = ""       # string of the tokens to time-align
 
+        # a long-running process of the aligner, if any
+        self._session = None
+
     # ------------------------------------------------------------------------
     # members
     # ------------------------------------------------------------------------
@@ -97,6 +100,32 @@ class BaseAligner(object):
         """Return the extension of output files."""
         return self._outext
 
+    # -----------------------------------------------------------------------
+
+    def open_session(self):
+        """Return a new long-running process of the aligner.
+
+        By default, aligners don't support sessions and None is returned.
+
+        """
+        return None
+
+    # -----------------------------------------------------------------------
+
+    def get_session(self):
+        """Return the long-running process used to align, or None."""
+        return self._session
+
+    # -----------------------------------------------------------------------
+
+    def set_session(self, session):
+        """Fix the long-running process to use to align.
+
+        :param session: a session returned by open_session() or None
+
+        """
+        self._session = session
+
     # -----------------------------------------------------------------------
     # alignment options
     # -----------------------------------------------------------------------
@@ -110,6 +110,40 @@ class BasicAligner(BaseAligner):
 
         :returns: the List of tuples (begin, end, phone)
 
+        """
+        phonetization, tokenization, alignments = self.__basic(duration)
+        if output_align is not None:
+            output_align = output_align + "." + self._outext
+            palign().write(phonetization, tokenization,
+                           alignments, output_align)
+
+        return alignments
+
+    # ------------------------------------------------------------------------
+
+    def read_basic(self, duration):
+        """Perform the speech segmentation in memory.
+
+        Assign the same duration to each phoneme.
+
+        :param duration: (float) the duration of the audio input
+        :returns: the same lists than AlignerIO.read_aligned()
+        :raises: IOError if there's nothing to align
+
+        """
+        phonetization, tokenization, alignments = self.__basic(duration)
+        return palign.read_lines(
+            palign.format_lines(phonetization, tokenization, alignments))
+
+    # ------------------------------------------------------------------------
+    # private
+    # ------------------------------------------------------------------------
+
+    def __basic(self, duration):
+        """Return the phonetization, tokenization and alignment of phones.
+
+        :param duration: (float) the duration of the audio input
+
         """
         # Remove variants:
         # Select the first-shorter pronunciation of each token
@@ -131,35 +165,26 @@ class BasicAligner(BaseAligner):
 
         # Generate the result
         if delta < 1. or len(select_phonetization) == 0:
-            return self.__gen_alignment([],
-                                        [],
-                                        [],
-                                        int(duration*100.),
-                                        output_align)
-
-        return self.__gen_alignment(select_phonetization,
-                                    tokenization,
-                                    phones_list,
-                                    int(delta),
-                                    output_align)
+            return BasicAligner.__gen_alignment([],
+                                                [],
+                                                [],
+                                                int(duration*100.))
+
+        return BasicAligner.__gen_alignment(select_phonetization,
+                                            tokenization,
+                                            phones_list,
+                                            int(delta))
 
-    # ------------------------------------------------------------------------
-    # private
     # ------------------------------------------------------------------------
 
-    def __gen_alignment(self,
-                        phonetization,
-                        tokenization,
-                        phoneslist,
-                        phonesdur,
-                        output_align=None):
-        """Write an alignment in an output file.
+    @staticmethod
+    def __gen_alignment(phonetization, tokenization, phoneslist, phonesdur):
+        """Return an alignment with the same duration for each phone.
 
         :param phonetization: (list) phonetization of each token
         :param tokenization: (list) each token
         :param phoneslist: (list) each phone
         :param phonesdur: (int) the duration of each phone in centi-seconds
-        :param outputalign: (str) the output file name
 
         """
         timeval = 0
@@ -173,12 +198,7 @@ class BasicAligner(BaseAligner):
         if len(alignments) == 0:
             alignments = [(0, int(phonesdur), "")]
 
-        if output_align is not None:
-            output_align = output_align + "." + self._outext
-            palign().write(phonetization, tokenization,
-                           alignments, output_align)
-
-        return alignments
+        return phonetization, tokenization, alignments
 
     # ------------------------------------------------------------------------
 
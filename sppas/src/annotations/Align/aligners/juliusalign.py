@@ -71,6 +71,7 @@ from sppas.src.utils.makeunicode import sppasUnicode, u
 from sppas.src.resources.dictpron import sppasDictPron
 
 from .basealigner import BaseAligner
+from .juliussession import JuliusSession
 
 # ----------------------------------------------------------------------------
 
@@ -156,6 +157,20 @@ class JuliusAligner(BaseAligner):
 
     # -----------------------------------------------------------------------
 
+    def open_session(self):
+        """Return a new Julius process to align all tracks.
+
+        Julius can be kept alive only for grammar-based forced-alignment.
+
+        :returns: JuliusSession or None
+
+        """
+        if self._model is None:
+            return None
+        return JuliusSession(self._model)
+
+    # -----------------------------------------------------------------------
+
     def gen_slm_dependencies(self, basename, N=3):
         """Generate the dependencies (slm, dictionary) for julius.
 
@@ -351,7 +366,7 @@ class JuliusAligner(BaseAligner):
         else:
             self.gen_slm_dependencies(basename)
 
-        self.run_julius(input_wav, basename, output_align)
+        self._align(input_wav, basename, output_align)
         with codecs.open(output_align, 'r', sg.__encoding__) as f:
             lines = f.readlines()
             f.close()
@@ -379,7 +394,10 @@ class JuliusAligner(BaseAligner):
                            "entries were successfully added in the model: " \
                            "{:s}.\nSPPAS calls Julius alignment system for a 2nd time." \
                            "\n".format(",".join(added))
-                self.run_julius(input_wav, basename, output_align)
+                if self._session is not None:
+                    # the modified model must be loaded by a new process
+                    self._session.close()
+                self._align(input_wav, basename, output_align)
                 with codecs.open(output_align, 'r', sg.__encoding__) as f:
                     lines = f.readlines()
                     f.close()
@@ -405,3 +423,22 @@ class JuliusAligner(BaseAligner):
             raise Exception(message + error_lines)
 
         return message
+
+    # -----------------------------------------------------------------------
+
+    def _align(self, inputwav, basename, outputalign):
+        """Perform the speech segmentation with the session or a command.
+
+        If the session failed, the julius command is used instead.
+
+        """
+        if self._session is not None and self._outext == "palign" \
+                and self._session.is_failed() is False:
+            try:
+                self._session.align(inputwav, basename, outputalign)
+                return
+            except OSError as e:
+                logging.warning("Julius session failed: {:s}".format(str(e)))
+                logging.warning("julius command is used instead.")
+
+        self.run_julius(inputwav, basename, outputalign)
@@ -0,0 +1,440 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.Align.aligners.juliussession.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+A long-running Julius process to align a sequence of tracks.
+
+Julius is started only once, in module mode, and loads the acoustic model
+only once. Then, for each track:
+
+    1. the grammar and the dictionary of the track are sent to the module
+       socket with the CHANGEGRAM command, followed by a GRAMINFO command
+       whose answer indicates the grammar was received;
+    2. the name of the audio file is written to the standard input of
+       Julius (-input file);
+    3. the messages of the module are read until the recognition result,
+       and the result is saved in the same format than the output of the
+       julius command, so that it can be read by the palign reader.
+
+A message of the module is a set of lines ended by a line with only ".".
+
+"""
+import os
+import re
+import time
+import codecs
+import socket
+import logging
+import threading
+from subprocess import Popen, PIPE, STDOUT
+try:  # python 3
+    import queue
+except ImportError:  # python 2
+    import Queue as queue
+try:  # python 3
+    from html import unescape
+except ImportError:  # python 2
+    from xml.sax.saxutils import unescape
+
+from sppas.src.config import sg
+
+# ---------------------------------------------------------------------------
+
+
+class JuliusSession(object):
+    """A Julius process to align all the tracks of a file or of a batch.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    Only grammar-based forced-alignment (palign) is supported: a slm can't
+    be changed while Julius is running.
+
+    >>> session = JuliusSession(model_dir)
+    >>> session.align("track_000001.wav", "track_000001", "track_000001.palign")
+    >>> session.align("track_000002.wav", "track_000002", "track_000002.palign")
+    >>> session.close()
+
+    """
+
+    COMMAND = "julius"
+    HOST = "127.0.0.1"
+    ATTRIBUTES = re.compile(r'([A-Z_]+)="([^"]*)"')
+
+    # -----------------------------------------------------------------------
+
+    def __init__(self, model_dir, command=None, timeout=60.):
+        """Create a JuliusSession instance. Julius is not started yet.
+
+        :param model_dir: (str) Directory of the acoustic model
+        :param command: (list) Command to execute Julius
+        :param timeout: (float) Max time to wait for an answer of Julius
+
+        """
+        if command is None:
+            command = [JuliusSession.COMMAND]
+        self._model = model_dir
+        self._command = list(command)
+        self._timeout = float(timeout)
+
+        self._process = None
+        self._socket = None
+        self._messages = None
+        self._logs = None
+        self._nb_starts = 0
+        self._failed = False
+
+    # -----------------------------------------------------------------------
+
+    def is_running(self):
+        """Return True if the Julius process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    # -----------------------------------------------------------------------
+
+    def is_failed(self):
+        """Return True if an alignment of the session failed."""
+        return self._failed
+
+    # -----------------------------------------------------------------------
+
+    def get_nb_starts(self):
+        """Return the number of times Julius was started."""
+        return self._nb_starts
+
+    # -----------------------------------------------------------------------
+
+    def get_arguments(self, basename):
+        """Return the arguments of Julius, without the command.
+
+        :param basename: (str) base name of the grammar and dictionary files
+        used at start-up
+        :returns: (list of str)
+
+        """
+        tiedlist = os.path.join(self._model, "tiedlist")
+        config = os.path.join(self._model, "config")
+
+        # the global decoding parameters
+        args = ["-input", "file", "-gprune", "safe", "-iwcd1", "max",
+                "-smpFreq", "16000", "-multipath", "-iwsppenalty", "-70.0",
+                "-spmodel", "sp", "-b", "1000", "-b2", "1000",
+                "-sb", "1000.0", "-m", "10000"]
+
+        # 1. the acoustic model
+        args.extend(["-h", os.path.join(self._model, "hmmdefs")])
+        if os.path.isfile(tiedlist):
+            args.extend(["-hlist", tiedlist])
+        if os.path.isfile(config):
+            args.extend(["-htkconf", config])
+
+        # 2. the pronunciation dictionary and 3. the grammar
+        args.extend(["-v", basename + ".dict"])
+        args.extend(["-looktrellis", "-palign", "-dfa", basename + ".dfa"])
+
+        return args
+
+    # -----------------------------------------------------------------------
+
+    def start(self, basename):
+        """Start Julius in module mode and connect to its socket.
+
+        :param basename: (str) base name of the grammar and dictionary files
+        used at start-up
+        :raises: OSError
+
+        """
+        self.close()
+        if self._model is None:
+            raise IOError('Julius aligner requires an acoustic model')
+
+        port = JuliusSession._free_port()
+        command = self._command + self.get_arguments(basename)
+        command.extend(["-module", str(port)])
+        logging.debug("Start julius session: {:s}".format(" ".join(command)))
+
+        # Popen raises OSError if the command does not exist.
+        self._process = Popen(command, stdin=PIPE, stdout=PIPE, stderr=STDOUT)
+        self._nb_starts += 1
+
+        # The log of Julius is read continuously, to not block the process.
+        self._logs = queue.Queue()
+        reader = threading.Thread(target=JuliusSession._read_logs,
+                                  args=(self._process.stdout, self._logs))
+        reader.daemon = True
+        reader.start()
+
+        # Julius listens to the module port after the model was loaded.
+        start_time = time.time()
+        while self._socket is None:
+            if self._process.poll() is not None:
+                msg = "".join(self.pop_logs())
+                self.close()
+                raise OSError("julius session failed to start: {:s}"
+                              "".format(msg))
+            try:
+                self._socket = socket.create_connection(
+                    (JuliusSession.HOST, port), timeout=self._timeout)
+            except socket.error:
+                if time.time() - start_time > self._timeout:
+                    self.close()
+                    raise OSError("julius session failed to start: "
+                                  "no module connection.")
+                time.sleep(0.05)
+
+        self._messages = self._socket.makefile("rb")
+
+    # -----------------------------------------------------------------------
+
+    def close(self):
+        """Stop Julius. It will be started again by the next alignment."""
+        if self._socket is not None:
+            try:
+                self._send_command("DIE\n")
+            except (OSError, socket.error):
+                pass
+            try:
+                self._messages.close()
+                self._socket.close()
+            except (OSError, socket.error):
+                pass
+        self._socket = None
+        self._messages = None
+
+        if self._process is not None:
+            try:
+                self._process.stdin.close()
+            except (OSError, IOError):
+                pass
+            try:
+                if self._process.poll() is None:
+                    self._process.terminate()
+                self._process.wait()
+            except OSError:
+                pass
+            self._process.stdout.close()
+        self._process = None
+
+    # -----------------------------------------------------------------------
+
+    def pop_logs(self):
+        """Return the lines Julius printed since the last call."""
+        lines = list()
+        if self._logs is not None:
+            while True:
+                try:
+                    lines.append(self._logs.get_nowait())
+                except queue.Empty:
+                    break
+        return lines
+
+    # -----------------------------------------------------------------------
+
+    def align(self, inputwav, basename, outputalign):
+        """Perform the speech segmentation of a track.
+
+        Given audio file must match the ones we used to train the acoustic
+        model: PCM-WAV 16000 Hz, 16 bits
+
+        :param inputwav: (str) audio input file name
+        :param basename: (str) base name of grammar and dictionary files
+        :param outputalign: (str) output file name
+        :raises: OSError if the session failed
+
+        """
+        if self._failed is True:
+            raise OSError("julius session previously failed.")
+        try:
+            if self.is_running() is False:
+                self.start(basename)
+            else:
+                self.change_grammar(basename)
+        except OSError:
+            self._failed = True
+            raise
+
+        try:
+            self._process.stdin.write(
+                (inputwav + "\n").encode(sg.__encoding__))
+            self._process.stdin.flush()
+            result = None
+            while result is None:
+                message = self._read_message()
+                if message[0].startswith("<RECOGOUT>") or \
+                        message[0].startswith("<RECOGFAIL") or \
+                        message[0].startswith("<REJECTED"):
+                    result = message
+        except (IOError, socket.error) as e:
+            self._failed = True
+            self.close()
+            raise OSError("julius session failed: {:s}".format(str(e)))
+
+        # the log of Julius during this track is saved with the result
+        lines = self.pop_logs()
+        lines.extend(JuliusSession.format_result(result))
+        with codecs.open(outputalign, "w", sg.__encoding__) as fp:
+            for line in lines:
+                fp.write(line.rstrip("\r\n") + "\n")
+            fp.close()
+
+    # -----------------------------------------------------------------------
+
+    def change_grammar(self, basename):
+        """Replace the grammar and the dictionary of the running Julius.
+
+        :param basename: (str) base name of grammar and dictionary files
+
+        """
+        name = os.path.basename(basename)
+        command = "CHANGEGRAM {:s}\n".format(name)
+        with codecs.open(basename + ".dfa", "r", sg.__encoding__) as fp:
+            command += fp.read()
+        command += "DFAEND\n"
+        with codecs.open(basename + ".dict", "r", sg.__encoding__) as fp:
+            command += fp.read()
+        command += "DICEND\n"
+        command += "GRAMINFO\n"
+
+        try:
+            self._send_command(command)
+            while self._read_message()[0].startswith("<GRAMINFO>") is False:
+                pass
+        except (IOError, socket.error) as e:
+            self.close()
+            raise OSError("julius session failed: {:s}".format(str(e)))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def format_result(message):
+        """Return the result of a module message like the julius command.
+
+        :param message: (list of str) Lines of the message
+        :returns: (list of str) Lines as written by julius with -palign
+
+        """
+        words = list()
+        phones = list()
+        scores = list()
+        units = list()
+        for line in message:
+            line = line.strip()
+            if line.startswith("<WHYPO"):
+                attrs = JuliusSession._get_attributes(line)
+                words.append(attrs.get("WORD", ""))
+                phones.append(attrs.get("PHONE", ""))
+                scores.append(attrs.get("CM", "0.000"))
+            elif line.startswith("<PHONEME"):
+                attrs = JuliusSession._get_attributes(line)
+                units.append((int(attrs["BEGINFRAME"]),
+                              int(attrs["ENDFRAME"]),
+                              float(attrs.get("SCORE", 0.)),
+                              attrs.get("PHONE", "")))
+
+        if len(words) == 0:
+            return ["Error: julius session: "
+                    "{:s}".format(" ".join(m.strip() for m in message))]
+
+        lines = ["sentence1: " + " ".join(words),
+                 "wseq1: " + " ".join(str(i) for i in range(len(words))),
+                 "phseq1: " + " | ".join(phones),
+                 "cmscore1: " + " ".join(scores),
+                 "",
+                 "=== begin forced alignment ===",
+                 "-- phoneme alignment --",
+                 " id: from  to    n_score    unit",
+                 " ----------------------------------------"]
+        for begin, end, score, phone in units:
+            lines.append("[{:4d} {:4d}]  {:f}  {:s}"
+                         "".format(begin, end, score, phone))
+        lines.append("=== end forced alignment ===")
+        return lines
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def _send_command(self, command):
+        """Send a command to the module socket."""
+        self._socket.sendall(command.encode(sg.__encoding__))
+
+    # -----------------------------------------------------------------------
+
+    def _read_message(self):
+        """Read the next message of the module socket.
+
+        :returns: (list of str) Lines of the message
+        :raises: IOError if Julius closed the connection
+
+        """
+        lines = list()
+        while True:
+            line = self._messages.readline()
+            if not line:
+                raise IOError("connection closed by julius.")
+            line = line.decode(sg.__encoding__).rstrip("\r\n")
+            if line == ".":
+                if len(lines) > 0:
+                    return lines
+            else:
+                lines.append(line)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _get_attributes(line):
+        """Return the attributes of an element of a module message."""
+        return dict((k, unescape(v))
+                    for k, v in JuliusSession.ATTRIBUTES.findall(line))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _read_logs(stream, logs):
+        """Put each line of the stream into the queue."""
+        for line in iter(stream.readline, b''):
+            logs.put(line.decode(sg.__encoding__, "replace"))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def _free_port():
+        """Return a free port number on the local host."""
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            s.bind((JuliusSession.HOST, 0))
+            return s.getsockname()[1]
+        finally:
+            s.close()
@@ -35,8 +35,11 @@
 """
 import shutil
 import os
+import time
 import logging
 import traceback
+import threading
+from multiprocessing.pool import ThreadPool
 
 from sppas import NoDirectoryError
 from sppas.src.config import paths
@@ -51,6 +54,7 @@ from sppas.src.models.acm.modelmixer import sppasModelMixer
 from sppas.src.files.fileutils import sppasFileUtils
 
 from ..baseannot import sppasBaseAnnotation
+from ..annpool import sppasLogRecorder
 from ..searchtier import sppasFindTier
 from ..annotationsexc import AnnotationOptionError
 from ..annotationsexc import EmptyDirectoryError
@@ -63,6 +67,8 @@ from .tracksgmt import TrackSegmenter
 
 MSG_MODEL_L1_FAILED = (info(1210, "annotations"))
 MSG_ALIGN_TRACK = (info(1220, "annotations"))
+MSG_TRACK_TIME = (info(1226, "annotations"))
+MSG_TRACKS_TIME = (info(1228, "annotations"))
 MSG_ALIGN_FAILED = (info(1230, "annotations"))
 MSG_BASIC = (info(1240, "annotations"))
 MSG_ACTION_SPLIT_INTERVALS = (info(1250, "annotations"))
@@ -101,6 +107,11 @@ class sppasAlign(sppasBaseAnnotation):
 
     """
 
+    # A directory in RAM for the files of the external aligners
+    RAM_DIR = "/dev/shm"
+
+    # -----------------------------------------------------------------------
+
     def __init__(self, log=None):
         """Create a new sppasAlign instance.
 
@@ -170,6 +181,7 @@ class sppasAlign(sppasBaseAnnotation):
             - clean
             - basic
             - aligner
+            - workers
 
         :param options: (sppasOption)
 
@@ -187,6 +199,9 @@ class sppasAlign(sppasBaseAnnotation):
             elif "aligner" == key:
                 self.set_aligner(opt.get_value())
 
+            elif "workers" == key:
+                self.set_workers(opt.get_value())
+
             else:
                 raise AnnotationOptionError(key)
 
@@ -222,69 +237,191 @@ class sppasAlign(sppasBaseAnnotation):
         """
         self._options['basic'] = basic
 
+    # -----------------------------------------------------------------------
+
+    def set_workers(self, nb_workers):
+        """Fix the number of tracks to align at the same time.
+
+        :param nb_workers: (int) Number of aligners of the pool. With 1,
+        tracks are aligned one after the other.
+
+        """
+        self._options['workers'] = max(1, int(nb_workers))
+
     # -----------------------------------------------------------------------
     # Automatic Speech Segmentation
     # -----------------------------------------------------------------------
 
-    def _segment_track_with_basic(self, audio, phn, token, align):
+    def _segment_track_with_basic(self, segmenter, track, workdir, log):
         """Segmentation of a track with the basic alignment system."""
-        self.logfile.print_message(MSG_BASIC, indent=2)
-        aligner_id = self._segmenter.get_aligner_name()
-        self._segmenter.set_aligner('basic')
-        msg = self._segmenter.segment(audio, phn, token, align)
+        log.print_message(MSG_BASIC, indent=2)
+        aligner_id = segmenter.get_aligner_name()
+        segmenter.set_aligner('basic')
+        msg = segmenter.segment_track(track, workdir)
         if len(msg) > 0:
-            self.logfile.print_message(msg, indent=2, status=annots.info)
-        self._segmenter.set_aligner(aligner_id)
+            log.print_message(msg, indent=2, status=annots.info)
+        segmenter.set_aligner(aligner_id)
 
     # -----------------------------------------------------------------------
 
-    def _segment_tracks(self, workdir):
-        """Call the Aligner to align each unit of a directory.
+    def _segment_track(self, segmenter, track, workdir, log):
+        """Align a track.
 
-        :param workdir: (str) directory to get units and put alignments.
+        :param segmenter: (TrackSegmenter) Aligner of the track
+        :param track: (TrackData) The track to align
+        :param workdir: (str) directory for the files of the aligner
+        :param log: (sppasLog) Log to report about the track
+        :returns: (bool, bool) The aligner failed, the basic one was used
 
         """
-        # Search for the number of tracks
-        nb_tracks = len(self._tracksrw.get_units(workdir))
+        start_time = time.time()
+        log.print_message(
+            MSG_ALIGN_TRACK.format(number=track.get_number()), indent=1)
+
+        # Perform speech segmentation
+        failed = False
+        try:
+            msg = segmenter.segment_track(track, workdir,
+                                          self._options['clean'])
+            if len(msg) > 0:
+                log.print_message(msg, indent=2, status=annots.info)
+
+        except Exception as e:
+            # Something went wrong and the aligner failed
+            failed = True
+            log.print_message(
+                MSG_ALIGN_FAILED.format(name=segmenter.get_aligner_name()),
+                indent=2,
+                status=annots.error)
+            log.print_message(str(e), indent=3, status=annots.info)
+            logging.error(traceback.format_exc())
+
+            # Execute BasicAlign
+            if self._options['basic'] is True:
+                self._segment_track_with_basic(segmenter, track, workdir, log)
+            # or Create an empty alignment,
+            # to get an empty interval in the final result
+            else:
+                track.set_aligned([], [], [])
+
+        log.print_message(
+            MSG_TRACK_TIME.format(time=time.time() - start_time),
+            indent=2, status=annots.info)
+
+        return failed, failed and self._options['basic'] is True
+
+    # -----------------------------------------------------------------------
+
+    def _segment_tracks(self, tracks, workdir):
+        """Call the Aligner to align each track.
+
+        The tracks are aligned one after the other, or by a pool of aligners
+        if the 'workers' option is greater than 1.
+
+        :param tracks: (list of TrackData) tracks to align
+        :param workdir: (str) directory for the files of the aligner
+
+        """
+        nb_tracks = len(tracks)
         if nb_tracks == 0:
             raise EmptyDirectoryError(workdir)
 
-        # Align each track
-        track_number = 0
-        while track_number < nb_tracks:
+        start_time = time.time()
+        nb_workers = min(self._options['workers'], nb_tracks)
+        if nb_workers > 1:
+            status = self.__segment_tracks_in_pool(
+                tracks, workdir, nb_workers)
+        else:
+            nb_workers = 1
+            # Keep the aligner alive for all the tracks, if not already done
+            opened = self._segmenter.open_session()
+            try:
+                status = [self._segment_track(self._segmenter, track,
+                                              workdir, self.logfile)
+                          for track in tracks]
+            finally:
+                if opened is True:
+                    self._segmenter.close_session()
+
+        self.logfile.print_message(
+            MSG_TRACKS_TIME.format(
+                number=nb_tracks,
+                time=time.time() - start_time,
+                workers=nb_workers,
+                failed=len([s for s in status if s[0] is True]),
+                basic=len([s for s in status if s[1] is True])),
+            indent=1, status=annots.info)
 
-            # Fix track number (starts from 1)
-            track_number += 1
-            self.logfile.print_message(
-                MSG_ALIGN_TRACK.format(number=track_number), indent=1)
+    # -----------------------------------------------------------------------
 
-            # Fix the expected filenames for this track
-            (audio, phn, token, align) = \
-                self._tracksrw.get_filenames(workdir, track_number)
+    def __segment_tracks_in_pool(self, tracks, workdir, nb_workers):
+        """Align the tracks with a pool of aligners.
 
-            # Perform speech segmentation
-            try:
-                msg = self._segmenter.segment(audio, phn, token, align)
-                if len(msg) > 0:
-                    self.logfile.print_message(msg, indent=2, status=annots.info)
+        Each worker has its own aligner. The messages of the tracks are
+        reported into the log in the order of the tracks.
 
-            except Exception as e:
-                # Something went wrong and the aligner failed
-                self.logfile.print_message(
-                    MSG_ALIGN_FAILED.format(
-                        name=self._segmenter.get_aligner_name()),
-                    indent=2,
-                    status=annots.error)
-                self.logfile.print_message(str(e), indent=3, status=annots.info)
-                logging.error(traceback.format_exc())
+        :returns: (list) Status of each track
+
+        """
+        segmenters = list()
+        worker = threading.local()
+        lock = threading.Lock()
+
+        def align(track):
+            if getattr(worker, "segmenter", None) is None:
+                worker.segmenter = self.__new_segmenter()
+                with lock:
+                    segmenters.append(worker.segmenter)
+            log = sppasLogRecorder()
+            status = self._segment_track(worker.segmenter, track, workdir, log)
+            return status, log.pop_records()
+
+        status = list()
+        pool = ThreadPool(nb_workers)
+        try:
+            for track_status, records in pool.imap(align, tracks):
+                sppasLogRecorder.replay(records, self.logfile)
+                status.append(track_status)
+        finally:
+            pool.close()
+            pool.join()
+            for segmenter in segmenters:
+                segmenter.close_session()
 
-                # Execute BasicAlign
-                if self._options['basic'] is True:
-                    self._segment_track_with_basic(audio, phn, token, align)
-                # or Create an empty alignment,
-                # to get an empty interval in the final result
-                else:
-                    self._segmenter.segment(audio, None, None, align)
+        return status
+
+    # -----------------------------------------------------------------------
+
+    def __new_segmenter(self):
+        """Return a TrackSegmenter like the one of this annotation."""
+        segmenter = TrackSegmenter(model=self._segmenter.get_model(),
+                                   aligner_name=self._options['aligner'])
+        segmenter.open_session()
+        return segmenter
+
+    # -----------------------------------------------------------------------
+
+    def batch_processing(self,
+                         file_names,
+                         progress=None,
+                         output_format=annots.extension,
+                         pool=None):
+        """Perform the annotation on a bunch of files.
+
+        The aligner is kept alive for all the tracks of all the files, if
+        the files are processed one after the other.
+
+        """
+        opened = False
+        if pool is None:
+            self._segmenter.set_aligner(self._options['aligner'])
+            opened = self._segmenter.open_session()
+        try:
+            return sppasBaseAnnotation.batch_processing(
+                self, file_names, progress, output_format, pool)
+        finally:
+            if opened is True:
+                self._segmenter.close_session()
 
     # -----------------------------------------------------------------------
 
@@ -306,36 +443,41 @@ class sppasAlign(sppasBaseAnnotation):
         if os.path.exists(workdir) is False:
             raise NoDirectoryError(workdir)
 
-        # Split input into tracks
+        # Split input into tracks, in memory. Their files are written
+        # only if the working directory is kept.
         self.logfile.print_message(MSG_ACTION_SPLIT_INTERVALS, indent=1)
-        if os.path.exists(workdir) is False:
-            os.mkdir(workdir)
-        self._tracksrw.split_into_tracks(
-            input_audio, phon_tier, tok_tier, workdir)
+        tracks = self._tracksrw.create_tracks(input_audio, phon_tier, tok_tier)
+        if self._options['clean'] is False:
+            self._tracksrw.write_tracks(tracks, workdir)
 
         # Align each track
-        self._segment_tracks(workdir)
+        self._segment_tracks(tracks, workdir)
 
         # Merge track alignment results
         self.logfile.print_message(MSG_ACTION_MERGE_INTERVALS, indent=1)
-        tier_phn, tier_tok, tier_pron = \
-            self._tracksrw.read_aligned_tracks(workdir)
+        tier_phn, tier_tok, tier_pron = self._tracksrw.merge_tracks(tracks)
 
         return tier_phn, tier_tok, tier_pron
 
     # -----------------------------------------------------------------------
 
     @staticmethod
-    def fix_workingdir(inputaudio=None):
+    def fix_workingdir(inputaudio=None, tmpdir=None):
         """Fix the working directory to store temporarily the data.
 
         :param inputaudio: (str) Audio file name
+        :param tmpdir: (str) Directory to create the working directory in,
+        or None to use the temporary directory of the system.
 
         """
         sf = sppasFileUtils()
         workdir = sf.set_random()
+        if tmpdir is not None:
+            workdir = os.path.join(tmpdir, os.path.basename(workdir))
         while os.path.exists(workdir) is True:
             workdir = sf.set_random()
+            if tmpdir is not None:
+                workdir = os.path.join(tmpdir, os.path.basename(workdir))
         os.mkdir(workdir)
 
         if inputaudio is not None:
@@ -361,16 +503,14 @@ class sppasAlign(sppasBaseAnnotation):
 
         """
         # Get the phonemes tier to be time-aligned
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
         phon_tier = sppasFindTier.phonetization(trs_input)
         if phon_tier is None:
             raise NoInputError
 
         # Get the tokens tier to be time-aligned
         try:
-            parser = sppasRW(opt_input_file[1])
-            trs_input_tok = parser.read()
+            trs_input_tok = self._read_transcription(opt_input_file[1])
             tok_tier = sppasFindTier.tokenization(trs_input_tok, "std")
         except:   # IOError, AttributeError:
             tok_tier = None
@@ -398,8 +538,17 @@ class sppasAlign(sppasBaseAnnotation):
             # Disable the alignment with audio but perform with basic.
             self._options['aligner'] = "basic"
 
-        # Prepare data
-        workdir = sppasAlign.fix_workingdir(input_audio_filename)
+        # Prepare data. Tracks are in memory: the working directory is
+        # only used by the external aligner, so it is created in RAM if
+        # possible, except if it's kept.
+        if self._options['clean'] is True:
+            tmpdir = None
+            if os.path.isdir(sppasAlign.RAM_DIR) and \
+                    os.access(sppasAlign.RAM_DIR, os.W_OK):
+                tmpdir = sppasAlign.RAM_DIR
+            workdir = sppasAlign.fix_workingdir(None, tmpdir)
+        else:
+            workdir = sppasAlign.fix_workingdir(input_audio_filename)
         if self._options['clean'] is False:
             self.logfile.print_message(
                 MSG_WORKDIR.format(dirname=workdir), indent=3, status=None)
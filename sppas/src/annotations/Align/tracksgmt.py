@@ -33,6 +33,7 @@
 
 """
 import os
+import glob
 import codecs
 
 from sppas.src.config import sg
@@ -40,6 +41,8 @@ from sppas.src.config import info
 from sppas.src.utils.makeunicode import sppasUnicode
 
 from .aligners import sppasAligners
+from .aligners.alignerio import AlignerIO
+from .tracksio import TrackNamesGenerator
 
 # ---------------------------------------------------------------------------
 
@@ -99,6 +102,9 @@ class TrackSegmenter(object):
         #   - when the track segment contains only one phoneme;
         #   - when the track segment does not contain phonemes.
         self._aligner = None
+        # A long-running process of the aligner, shared by all the tracks
+        # segmented between open_session() and close_session().
+        self._session = None
         self.set_aligner(aligner_name)
 
         self._basic_aligner = TrackSegmenter.aligners.instantiate(None)
@@ -115,6 +121,7 @@ class TrackSegmenter(object):
 
         """
         self._model_dir = model
+        self.close_session()
 
         # re-instantiate the same aligner with the appropriate model
         self._instantiate_aligner(self._aligner.name())
@@ -155,6 +162,33 @@ class TrackSegmenter(object):
 
     # -----------------------------------------------------------------------
 
+    def open_session(self):
+        """Keep the aligner alive to segment the next tracks.
+
+        It is not supported by all aligners. The session is used until
+        close_session() is invoked or the model is changed.
+
+        :returns: (bool) True if a new session was opened
+
+        """
+        if self._session is not None:
+            return False
+        self._session = self._aligner.open_session()
+        self._aligner.set_session(self._session)
+        return self._session is not None
+
+    # -----------------------------------------------------------------------
+
+    def close_session(self):
+        """Stop the aligner of the current session, if any."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+            if self._aligner is not None:
+                self._aligner.set_session(None)
+
+    # -----------------------------------------------------------------------
+
     def segment(self, audio_filename, phon_name, token_name, align_name):
         """Call an aligner to perform speech segmentation and manage errors.
 
@@ -202,14 +236,91 @@ class TrackSegmenter(object):
 
         return ret
 
+    # -----------------------------------------------------------------------
+
+    def segment_track(self, track, workdir, clean=True):
+        """Call an aligner to perform speech segmentation of a track.
+
+        The data of the track are in memory. Only the external aligners
+        need files: the audio is written into the working directory,
+        then the alignment result is read back into the track.
+
+        :param track: (TrackData) the track to align
+        :param workdir: (str) directory for the files of the aligner
+        :param clean: (bool) remove the files of the aligner
+        :returns: A message of the aligner in case of any problem, or
+        an empty string if success.
+
+        """
+        phones = track.get_phones()
+        tokens = track.get_tokens()
+        self._aligner.set_phones(phones)
+        self._basic_aligner.set_phones(phones)
+        self._aligner.set_tokens(tokens)
+        self._basic_aligner.set_tokens(tokens)
+
+        # Do not align nothing!
+        if len(phones) == 0:
+            track.set_aligned([], [], [])
+            return info(1222, "annotations")
+
+        # If no audio available...
+        duration = track.get_duration()
+        if duration is None:
+            self.__set_basic_alignment(track, 1.)
+            return ""
+
+        # Do not align only one phoneme!
+        if len(phones.split()) <= 1 and "-" not in phones:
+            self.__set_basic_alignment(track, duration)
+            return ""
+
+        if self._aligner.name() == self._basic_aligner.name():
+            ret = self._aligner.check_data()
+            self.__set_basic_alignment(track, duration, self._aligner)
+            return ret
+
+        # Execute Alignment of the external aligner
+        number = track.get_number()
+        audio_filename = TrackNamesGenerator.audio_filename(workdir, number)
+        align_name = TrackNamesGenerator.align_filename(workdir, number)
+        if os.path.exists(audio_filename) is False:
+            track.write_audio(audio_filename)
+        try:
+            ret = self._aligner.check_data()
+            ret += self._aligner.run_alignment(audio_filename, align_name)
+            try:
+                track.set_aligned(*AlignerIO.read_aligned(align_name))
+            except IOError:
+                track.set_aligned([], [], [])
+        finally:
+            if clean is True:
+                for filename in glob.glob(align_name + ".*"):
+                    os.remove(filename)
+
+        return ret
+
     # -----------------------------------------------------------------------
     # Private
     # -----------------------------------------------------------------------
 
+    def __set_basic_alignment(self, track, duration, aligner=None):
+        """Align the track with the basic aligner."""
+        if aligner is None:
+            aligner = self._basic_aligner
+        try:
+            track.set_aligned(*aligner.read_basic(duration))
+        except IOError:
+            track.set_aligned([], [], [])
+
+    # -----------------------------------------------------------------------
+
     def _instantiate_aligner(self, name):
         """Instantiate self._aligner to the appropriate Aligner system."""
         self._aligner = TrackSegmenter.aligners.instantiate(
             self._model_dir, name)
+        if self._session is not None:
+            self._aligner.set_session(self._session)
 
     # -----------------------------------------------------------------------
 
@@ -39,6 +39,8 @@ import traceback
 
 from sppas import NoDirectoryError
 from sppas.src.anndata import sppasTier
+from sppas.src.anndata import sppasColumnTier
+from sppas.src.anndata import sppasAnnotation
 from sppas.src.anndata import sppasLocation
 from sppas.src.anndata import sppasInterval
 from sppas.src.anndata import sppasPoint
@@ -49,6 +51,10 @@ from sppas.src.resources.mapping import sppasMapping
 from sppas.src.utils.makeunicode import sppasUnicode
 from sppas.src.anndata import sppasTag, sppasLabel
 import sppas.src.audiodata.autils as autils
+from sppas.src.audiodata.aio import open as audio_open
+from sppas.src.audiodata.audiocache import sppasAudioCache
+from sppas.src.audiodata.channel import sppasChannel
+from sppas.src.audiodata.channelframes import sppasChannelFrames
 
 from ..annotationsexc import BadInputError
 from ..annotationsexc import SizeInputsError
@@ -101,46 +107,32 @@ class TracksReaderWriter(object):
     # Read files
     # ------------------------------------------------------------------------
 
-    def read_aligned_tracks(self, dir_name):
+    def read_aligned_tracks(self, dir_name, columns=False):
         """Read time-aligned tracks in a directory.
 
         :param dir_name: (str) Input directory to get files.
+        :param columns: (bool) Create sppasColumnTier instead of sppasTier
         :returns: (sppasTier, sppasTier, sppasTier)
 
         """
         tier_phn, tier_tok, tier_pron = \
-            TracksReader.read_aligned_tracks(dir_name)
+            TracksReader.read_aligned_tracks(dir_name, columns)
+        self._map_back(tier_phn, tier_pron)
+        return tier_phn, tier_tok, tier_pron
 
-        # map-back phonemes
-        self._mapping.set_keep_miss(True)
-        self._mapping.set_reverse(False)
+    # ------------------------------------------------------------------------
 
-        # Map-back time-aligned phonemes to SAMPA
-        # include the mapping of alternative tags
-        for ann in tier_phn:
-            labels = list()
-            for label in ann.get_labels():
-                tags = list()
-                scores = list()
-                for tag, score in label:
-                    text = tag.get_content()
-                    tags.append(sppasTag(self._mapping.map_entry(text)))
-                    scores.append(score)
-                labels.append(sppasLabel(tags, scores))
-            ann.set_labels(labels)
+    def merge_tracks(self, tracks, columns=False):
+        """Merge time-aligned tracks of the memory.
 
-        for ann in tier_pron:
-            labels = list()
-            for label in ann.get_labels():
-                tags = list()
-                scores = list()
-                for tag, score in label:
-                    text = tag.get_content()
-                    tags.append(sppasTag(
-                        self._mapping.map(text, [separators.phonemes])))
-                    scores.append(score)
-                labels.append(sppasLabel(tags, scores))
-            ann.set_labels(labels)
+        :param tracks: (list of TrackData)
+        :param columns: (bool) Create sppasColumnTier instead of sppasTier
+        :returns: (sppasTier, sppasTier, sppasTier)
+
+        """
+        tier_phn, tier_tok, tier_pron = \
+            TracksReader.merge_tracks(tracks, columns)
+        self._map_back(tier_phn, tier_pron)
         return tier_phn, tier_tok, tier_pron
 
     # ------------------------------------------------------------------------
@@ -158,7 +150,56 @@ class TracksReaderWriter(object):
         :returns: PhonAlign, TokensAlign
 
         """
-        # Map phonemes from SAMPA to the expected ones.
+        self._map(phon_tier)
+
+        try:
+            TracksWriter.write_tracks(input_audio, phon_tier, tok_tier,
+                                      dir_align)
+        except SizeInputsError:
+            # number of intervals are not matching
+            TracksWriter.write_tracks(input_audio, phon_tier, None, dir_align)
+        except BadInputError:
+            # either phonemes or tokens is wrong... re-try with phonemes only
+            TracksWriter.write_tracks(input_audio, phon_tier, None, dir_align)
+
+    # ------------------------------------------------------------------------
+
+    def create_tracks(self, input_audio, phon_tier, tok_tier):
+        """Create tracks in memory from the given data.
+
+        :param input_audio: (str) Audio file name. Or None if no needed (basic alignment).
+        :param phon_tier: (sppasTier) The phonetization tier.
+        :param tok_tier: (sppasTier) The tokenization tier, or None.
+        :returns: (list of TrackData)
+
+        """
+        self._map(phon_tier)
+
+        try:
+            return TracksWriter.create_tracks(input_audio, phon_tier, tok_tier)
+        except SizeInputsError:
+            # number of intervals are not matching
+            return TracksWriter.create_tracks(input_audio, phon_tier, None)
+        except BadInputError:
+            # either phonemes or tokens is wrong... re-try with phonemes only
+            return TracksWriter.create_tracks(input_audio, phon_tier, None)
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def write_tracks(tracks, dir_align):
+        """Write the files of tracks of the memory.
+
+        :param tracks: (list of TrackData)
+        :param dir_align: (str) Output directory to store files.
+
+        """
+        TracksWriter.write_track_files(tracks, dir_align)
+
+    # ------------------------------------------------------------------------
+
+    def _map(self, phon_tier):
+        """Map phonemes of the tier from SAMPA to the expected ones."""
         self._mapping.set_keep_miss(True)
         self._mapping.set_reverse(True)
 
@@ -178,15 +219,44 @@ class TracksReaderWriter(object):
                                        TracksReaderWriter.DELIMITERS)
             ann.set_labels(sppasLabel(sppasTag(mapped)))
 
-        try:
-            TracksWriter.write_tracks(input_audio, phon_tier, tok_tier,
-                                      dir_align)
-        except SizeInputsError:
-            # number of intervals are not matching
-            TracksWriter.write_tracks(input_audio, phon_tier, None, dir_align)
-        except BadInputError:
-            # either phonemes or tokens is wrong... re-try with phonemes only
-            TracksWriter.write_tracks(input_audio, phon_tier, None, dir_align)
+    # ------------------------------------------------------------------------
+
+    def _map_back(self, tier_phn, tier_pron):
+        """Map-back time-aligned phonemes of the tiers to SAMPA."""
+        # map-back phonemes
+        self._mapping.set_keep_miss(True)
+        self._mapping.set_reverse(False)
+
+        # Map-back time-aligned phonemes to SAMPA
+        # include the mapping of alternative tags
+        TracksReaderWriter._map_tags(
+            tier_phn,
+            self._mapping.map_entry)
+
+        TracksReaderWriter._map_tags(
+            tier_pron,
+            lambda text: self._mapping.map(text, [separators.phonemes]))
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _map_tags(tier, function):
+        """Replace the content of the tags of a tier by the function result."""
+        if isinstance(tier, sppasColumnTier) is True:
+            tier.map_tags(function)
+            return
+
+        for ann in tier:
+            labels = list()
+            for label in ann.get_labels():
+                tags = list()
+                scores = list()
+                for tag, score in label:
+                    text = tag.get_content()
+                    tags.append(sppasTag(function(text)))
+                    scores.append(score)
+                labels.append(sppasLabel(tags, scores))
+            ann.set_labels(labels)
 
     # ------------------------------------------------------------------------
 
@@ -267,10 +337,11 @@ class TracksReader:
     # ------------------------------------------------------------------------
 
     @staticmethod
-    def read_aligned_tracks(dir_name):
+    def read_aligned_tracks(dir_name, columns=False):
         """Read a set of alignment files and set as tiers.
 
         :param dir_name: (str) input directory containing a set of units
+        :param columns: (bool) Create sppasColumnTier instead of sppasTier
         :returns: PhonAlign, TokensAlign
 
         """
@@ -281,30 +352,60 @@ class TracksReader:
         if os.path.exists(dir_name) is False:
             raise NoDirectoryError(dirname=dir_name)
 
-        # Create new tiers
-        tier_phn = sppasTier("PhonAlign")
-        tier_tok = sppasTier("TokensAlign")
-        tier_pron = sppasTier("PronTokAlign")
-
         # Explore each unit to get alignments
+        aligned = list()
         track_number = 1
-        for unit_start, unit_end in units:
+        for unit in units:
 
             # Fix filename to read, and load the content
             basename = \
                 TrackNamesGenerator.align_filename(dir_name, track_number)
             try:
-                _phons, _words, _prons = AlignerIO.read_aligned(basename)
+                aligned.append((unit, AlignerIO.read_aligned(basename)))
             except IOError:
-                _phons, _words, _prons = [], [], []
-
-            # Append alignments in tiers
-            TracksReader._add_aligned_track_into_tier(tier_phn, _phons, unit_start, unit_end)
-            TracksReader._add_aligned_track_into_tier(tier_tok, _words, unit_start, unit_end)
-            TracksReader._add_aligned_track_into_tier(tier_pron, _prons, unit_start, unit_end)
+                aligned.append((unit, ([], [], [])))
 
             track_number += 1
 
+        return TracksReader._create_tiers(aligned, columns)
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def merge_tracks(tracks, columns=False):
+        """Set the time-aligned tracks of the memory as tiers.
+
+        :param tracks: (list of TrackData)
+        :param columns: (bool) Create sppasColumnTier instead of sppasTier
+        :returns: PhonAlign, TokensAlign, PronTokAlign
+
+        """
+        return TracksReader._create_tiers(
+            [(track.get_unit(), track.get_aligned()) for track in tracks],
+            columns)
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _create_tiers(aligned, columns=False):
+        """Create the tiers from a list of (unit, alignments) of tracks."""
+        if columns is True:
+            tier_phn = sppasColumnTier("PhonAlign")
+            tier_tok = sppasColumnTier("TokensAlign")
+            tier_pron = sppasColumnTier("PronTokAlign")
+            add_track = TracksReader._add_aligned_track_into_columns
+        else:
+            tier_phn = sppasTier("PhonAlign")
+            tier_tok = sppasTier("TokensAlign")
+            tier_pron = sppasTier("PronTokAlign")
+            add_track = TracksReader._add_aligned_track_into_tier
+
+        for (unit_start, unit_end), (_phons, _words, _prons) in aligned:
+            # Append alignments in tiers
+            add_track(tier_phn, _phons, unit_start, unit_end)
+            add_track(tier_tok, _words, unit_start, unit_end)
+            add_track(tier_pron, _prons, unit_start, unit_end)
+
         return tier_phn, tier_tok, tier_pron
 
     # ------------------------------------------------------------------------
@@ -352,6 +453,55 @@ class TracksReader:
 
         return True
 
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _add_aligned_track_into_columns(tier, tdata, delta, unitend):
+        """Append a list of (start, end, text, score) into a sppasColumnTier.
+
+        Shift start/end of a delta value and set the last end value.
+        Annotations with alternative tags are appended as objects.
+
+        """
+        try:
+
+            for i, t in enumerate(tdata):
+
+                (loc_s, loc_e, contents, scores) = t
+                loc_s += delta
+                loc_e += delta
+                if i == (len(tdata)-1):
+                    loc_e = unitend
+
+                if '|' not in contents:
+                    if scores is not None:
+                        scores = float(scores)
+                    tier.append_interval(loc_s, loc_e, contents, scores,
+                                         radius=TracksReader.RADIUS)
+                    continue
+
+                location = sppasLocation(
+                        sppasInterval(
+                            sppasPoint(loc_s, TracksReader.RADIUS),
+                            sppasPoint(loc_e, TracksReader.RADIUS)
+                        ))
+                tags = [sppasTag(c) for c in contents.split('|')]
+                if scores is not None:
+                    tag_scores = [float(s) for s in scores.split('|')]
+                else:
+                    tag_scores = None
+                tier.append(sppasAnnotation(location,
+                                            sppasLabel(tags, tag_scores)))
+
+        except:
+            logging.error('The following data were not added to the tier '
+                          '{:s} at position {:f}: {:s}'
+                          ''.format(tier.get_name(), delta, str(tdata)))
+            logging.error(traceback.format_exc())
+            return False
+
+        return True
+
 # ---------------------------------------------------------------------------
 
 
@@ -407,6 +557,135 @@ class TracksWriter:
 
     # ------------------------------------------------------------------------
 
+    @staticmethod
+    def create_tracks(input_audio, phon_tier, tok_tier):
+        """Main method to create tracks in memory from the given data.
+
+        :param input_audio: (src) File name of the audio file.
+        :param phon_tier: (Tier) Tier with phonetization to split.
+        :param tok_tier: (Tier) Tier with tokenization to split.
+        :returns: (list of TrackData)
+
+        """
+        if tok_tier is None:
+            tok_tier = TracksWriter._create_tok_tier(phon_tier)
+        if len(phon_tier) != len(tok_tier):
+            raise SizeInputsError(len(phon_tier), len(tok_tier))
+
+        audio_tracks = None
+        if input_audio is not None:
+            if phon_tier.is_interval() is False:
+                raise BadInputError
+            if tok_tier.is_interval() is False:
+                raise BadInputError
+
+            units = phon_tier.get_midpoint_intervals()
+            audio_tracks = TracksWriter._get_audio_tracks(input_audio, units)
+
+        else:
+            if phon_tier.is_interval() is True:
+                units = phon_tier.get_midpoint_intervals()
+            else:
+                # probably basic alignment of a written text!
+                units = phon_tier.get_midpoint_points()
+
+        units = ListOfTracks.get_intervals(units)
+        tracks = list()
+        for i in range(len(phon_tier)):
+            track = TrackData(
+                i + 1,
+                units[i],
+                TracksWriter._get_text(phon_tier[i]),
+                TracksWriter._get_text(tok_tier[i]))
+            if audio_tracks is not None:
+                track.set_audio(audio_tracks[i])
+            tracks.append(track)
+
+        return tracks
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def write_track_files(tracks, dir_align):
+        """Write the files of the given tracks.
+
+        :param tracks: (list of TrackData)
+        :param dir_align: (str) Directory to put units.
+
+        """
+        for track in tracks:
+            number = track.get_number()
+            fnp = TrackNamesGenerator.phones_filename(dir_align, number)
+            with codecs.open(fnp, "w", sg.__encoding__) as fp:
+                fp.write(track.get_phones())
+            fnt = TrackNamesGenerator.tokens_filename(dir_align, number)
+            with codecs.open(fnt, "w", sg.__encoding__) as fp:
+                fp.write(track.get_tokens())
+            if track.get_audio() is not None:
+                track.write_audio(
+                    TrackNamesGenerator.audio_filename(dir_align, number))
+
+        ListOfTracks.write(dir_align, [track.get_unit() for track in tracks])
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_audio_tracks(input_audio, units):
+        """Return the frames of the first channel of each track.
+
+        Re-sample to 16000 Hz, 16 bits.
+
+        :param input_audio: (src) File name of the audio file.
+        :param units: (list) List of tuples (start-time,end-time) of tracks.
+        :returns: (list of bytes)
+
+        """
+        return [channel.get_frames()
+                for channel in TracksWriter._read_audio_tracks(input_audio,
+                                                               units)]
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _read_audio_tracks(input_audio, units):
+        """Read the first channel of each track of an audio file.
+
+        The first channel is converted to 16000 Hz, 16 bits only once: its
+        copy is kept in the audio cache. Then, only the frames of the
+        tracks are read from it. The audio file is closed when all the
+        tracks were read.
+
+        :param input_audio: (src) File name of the audio file.
+        :param units: (list) List of tuples (start-time,end-time) of tracks.
+        :returns: generator of sppasChannel
+
+        """
+        input_audio = sppasAudioCache(framerate=16000, sampwidth=2).get(
+            input_audio)
+        audio = audio_open(input_audio)
+        try:
+            framerate = audio.get_framerate()
+            nframes = audio.get_nframes()
+            for s, e in units:
+                begin = max(0, min(int(s * framerate), nframes))
+                end = int(e * framerate)
+                if end < 0 or end > nframes:
+                    end = nframes
+                channel = audio.read_fragment(0, begin, max(begin, end))
+                yield autils.format_channel(channel, 16000, 2)
+        finally:
+            audio.close()
+
+    # ------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_text(annotation):
+        """Return the labels of an annotation like in a track file."""
+        text = annotation.serialize_labels(separator=" ", empty="", alt=True)
+        return sppasUnicode(text.split("\n")[0]).to_strip()
+
+    # ------------------------------------------------------------------------
+
     @staticmethod
     def _write_audio_tracks(input_audio, units, dir_align, silence=0.):
         """Write the first channel of an audio file into separated track files.
@@ -419,13 +698,13 @@ class TracksWriter:
         :param silence: (float) Duration of a silence to surround the tracks.
 
         """
-        channel = autils.extract_audio_channel(input_audio, 0)
-        channel = autils.format_channel(channel, 16000, 2)
-
-        for track, u in enumerate(units):
-            (s, e) = u
-            track_channel = \
-                autils.extract_channel_fragment(channel, s, e, silence)
+        channels = TracksWriter._read_audio_tracks(input_audio, units)
+        for track, track_channel in enumerate(channels):
+            if silence > 0.:
+                cf = sppasChannelFrames(track_channel.get_frames())
+                cf.prepend_silence(silence*16000)
+                cf.append_silence(silence*16000)
+                track_channel = sppasChannel(16000, 2, cf.get_frames())
             track_name = \
                 TrackNamesGenerator.audio_filename(dir_align, track + 1)
             autils.write_channel(track_name, track_channel)
@@ -563,6 +842,19 @@ class ListOfTracks:
 
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def get_intervals(units):
+        """Return the units, with points converted into intervals.
+
+        :param units: List of units (start-time end-time) or points.
+
+        """
+        if len(units) > 0 and isinstance(units[0], (tuple, list)) is False:
+            return [(i, i+1) for i in range(1, len(units)+1)]
+        return units
+
+    # ------------------------------------------------------------------
+
     @staticmethod
     def write(dir_name, units):
         """Write a list file (start-time end-time).
@@ -574,16 +866,135 @@ class ListOfTracks:
         if len(units) == 0:
             raise IOError('No filled tracks were founds in the annotations.')
 
-        # convert points into intervals.
-        u = units[0]
-        if isinstance(u, (tuple, list)) is False:
-            u = list()
-            for i in range(1, len(units)+1):
-                u.append((i, i+1))
-            units = u
+        units = ListOfTracks.get_intervals(units)
 
         filename = os.path.join(dir_name, ListOfTracks.DEFAULT_FILENAME)
         with open(filename, 'w') as fp:
             for start, end in units:
                 fp.write("{:6f} {:6f}\n".format(start, end))
             fp.close()
+
+# ---------------------------------------------------------------------------
+
+
+class TrackData(object):
+    """Data of a track in memory.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    A track is made of its time unit, its phonetization, its tokenization
+    and optionally its audio frames (mono, 16000 Hz, 16 bits). Once
+    aligned, it also stores the time-aligned phones, tokens and
+    pronunciations, like AlignerIO.read_aligned() returns them.
+
+    """
+
+    FRAMERATE = 16000
+    SAMPWIDTH = 2
+
+    # ------------------------------------------------------------------------
+
+    def __init__(self, number, unit, phones="", tokens="", audio=None):
+        """Create a new TrackData instance.
+
+        :param number: (int) Number of the track, starting from 1
+        :param unit: (tuple) start-time end-time of the track
+        :param phones: (str) Phonetization
+        :param tokens: (str) Tokenization
+        :param audio: (memoryview) Frames of the track, or None
+
+        """
+        self.__number = number
+        self.__unit = unit
+        self.__phones = phones
+        self.__tokens = tokens
+        self.__audio = None
+        self.__aligned = ([], [], [])
+        self.set_audio(audio)
+
+    # ------------------------------------------------------------------------
+
+    def get_number(self):
+        """Return the number of the track, starting from 1."""
+        return self.__number
+
+    # ------------------------------------------------------------------------
+
+    def get_unit(self):
+        """Return the (start-time, end-time) of the track."""
+        return self.__unit
+
+    # ------------------------------------------------------------------------
+
+    def get_phones(self):
+        """Return the phonetization of the track."""
+        return self.__phones
+
+    # ------------------------------------------------------------------------
+
+    def get_tokens(self):
+        """Return the tokenization of the track."""
+        return self.__tokens
+
+    # ------------------------------------------------------------------------
+
+    def get_audio(self):
+        """Return the frames of the track, or None."""
+        return self.__audio
+
+    # ------------------------------------------------------------------------
+
+    def set_audio(self, frames):
+        """Fix the frames of the track: mono, 16000 Hz, 16 bits.
+
+        :param frames: (bytes, memoryview) or None
+
+        """
+        if frames is not None:
+            frames = memoryview(frames)
+        self.__audio = frames
+
+    # ------------------------------------------------------------------------
+
+    def get_duration(self):
+        """Return the duration of the audio of the track, or None."""
+        if self.__audio is None:
+            return None
+        return float(self.__audio.nbytes) / \
+            float(TrackData.FRAMERATE * TrackData.SAMPWIDTH)
+
+    # ------------------------------------------------------------------------
+
+    def write_audio(self, filename):
+        """Write the audio of the track into a file.
+
+        :param filename: (str) Name of the audio file to write
+
+        """
+        channel = sppasChannel(TrackData.FRAMERATE, TrackData.SAMPWIDTH,
+                               self.__audio.tobytes())
+        autils.write_channel(filename, channel)
+
+    # ------------------------------------------------------------------------
+
+    def get_aligned(self):
+        """Return the time-aligned phones, tokens and pronunciations."""
+        return self.__aligned
+
+    # ------------------------------------------------------------------------
+
+    def set_aligned(self, phones, tokens, prons):
+        """Fix the time-aligned data of the track.
+
+        Times are relative to the beginning of the track.
+
+        :param phones: (list) Tuples (start-time end-time phoneme score)
+        :param tokens: (list) Tuples (start-time end-time token score)
+        :param prons: (list) Tuples (start-time end-time pron score)
+
+        """
+        self.__aligned = (phones, tokens, prons)
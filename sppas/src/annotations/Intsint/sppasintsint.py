@@ -150,8 +150,7 @@ class sppasIntsint(sppasBaseAnnotation):
 
         """
         # Get the tier to be annotated.
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
         tier_input = sppasFindTier.pitch_anchors(trs_input)
 
         # Annotate the tier
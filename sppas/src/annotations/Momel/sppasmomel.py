@@ -34,6 +34,8 @@
 
 """
 
+import os
+
 from sppas import sppasRW
 from sppas import sppasTranscription
 from sppas import sppasTier
@@ -45,12 +47,15 @@ from sppas import sppasTag
 from sppas import sppasOption
 
 import sppas.src.anndata.aio
+import sppas.src.audiodata.aio
+from sppas.src.audiodata.streampitch import sppasStreamPitch
 from sppas.src.config import annots
 
 from ..baseannot import sppasBaseAnnotation
 from ..annotationsexc import AnnotationOptionError
 from ..annotationsexc import EmptyInputError
 from ..annotationsexc import NoInputError
+from ..annotationsexc import AudioChannelError
 
 from .momel import Momel
 
@@ -214,6 +219,35 @@ class sppasMomel(sppasBaseAnnotation):
 
     # -----------------------------------------------------------------------
 
+    def eval_pitch(self, audio_filename):
+        """Estimate pitch values from an audio file.
+
+        The audio file is read block by block, and the pitch is searched
+        between the 'lo' and 'hi' options.
+
+        :param audio_filename: (str) Name of an audio file with one channel
+        :returns: A list of pitch values (one value each 10 ms).
+
+        """
+        audio = sppas.src.audiodata.aio.open(audio_filename)
+        try:
+            n = audio.get_nchannels()
+            if n != 1:
+                raise AudioChannelError(n)
+            stream = sppasStreamPitch(self._options['lo'],
+                                      self._options['hi'])
+            stream.estimate_audio(audio)
+        finally:
+            audio.close()
+
+        pitch_list = stream.values()
+        if len(pitch_list) == 0:
+            raise EmptyInputError(name="Pitch")
+
+        return pitch_list
+
+    # -----------------------------------------------------------------------
+
     def estimate_momel(self, ipu_pitch, current_time):
         """Estimate momel on an IPU.
 
@@ -325,14 +359,18 @@ class sppasMomel(sppasBaseAnnotation):
     def run(self, input_file, opt_input_file=None, output_file=None):
         """Run the automatic annotation process on an input.
 
-        :param input_file: (list of str) pitch values
+        :param input_file: (list of str) pitch values or audio
         :param opt_input_file: (list of str) ignored
         :param output_file: (str) the output file name
         :returns: (sppasTranscription)
 
         """
         # Get pitch values from the input
-        pitch = self.fix_pitch(input_file[0])
+        ext = os.path.splitext(input_file[0])[1].lower()
+        if ext in sppas.src.audiodata.aio.extensions:
+            pitch = self.eval_pitch(input_file[0])
+        else:
+            pitch = self.fix_pitch(input_file[0])
 
         # Search for anchors
         anchors_tier = self.convert(pitch)
@@ -359,5 +397,10 @@ class sppasMomel(sppasBaseAnnotation):
 
     @staticmethod
     def get_input_extensions():
-        """Extensions that the annotation expects for its input filename."""
-        return sppas.src.anndata.aio.primary_in
+        """Extensions that the annotation expects for its input filename.
+
+        Pitch files are preferred to audio files.
+
+        """
+        return sppas.src.anndata.aio.primary_in + \
+            sppas.src.audiodata.aio.extensions
@@ -234,15 +234,13 @@ class sppasOtherRepet(sppasBaseRepet):
         self.print_diagnosis(input_file[1])
 
         # Get the tier to be used
-        parser = sppasRW(input_file[0])
-        trs_input1 = parser.read()
+        trs_input1 = self._read_transcription(input_file[0])
         tier_tokens = sppasFindTier.aligned_tokens(trs_input1)
         tier_input1 = self.make_word_strain(tier_tokens)
         tier_input1.set_name(tier_input1.get_name() + "-source")
 
         # Get the tier to be used
-        parser = sppasRW(input_file[1])
-        trs_input2 = parser.read()
+        trs_input2 = self._read_transcription(input_file[1])
         tier_tokens = sppasFindTier.aligned_tokens(trs_input2)
         tier_input2 = self.make_word_strain(tier_tokens)
         tier_input2.set_name(tier_input2.get_name() + "-echo")
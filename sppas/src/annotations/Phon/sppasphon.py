@@ -287,8 +287,7 @@ class sppasPhon(sppasBaseAnnotation):
         pattern = ""
         if self._options['usestdtokens'] is True:
             pattern = "std"
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
         tier_input = sppasFindTier.tokenization(trs_input, pattern)
 
         # Phonetize the tier
@@ -42,9 +42,11 @@
 from .searchipus import SearchIPUs
 from .silences import sppasSilences
 from .sppassearchipus import sppasSearchIPUs
+from .streamipus import sppasStreamIPUs
 
 __all__ = (
     "SearchIPUs",
     "sppasSilences",
-    "sppasSearchIPUs"
+    "sppasSearchIPUs",
+    "sppasStreamIPUs"
 )
@@ -235,14 +235,28 @@ class sppasSilences(object):
         :returns: (int) volume value
 
         """
-        volumes = sorted(self.__volume_stats.volumes())
-        vmin = max(self.__volume_stats.min(), 0)  # provide negative values
+        return sppasSilences.estimate_threshold(self.__volume_stats)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def estimate_threshold(volume_stats):
+        """Estimate the threshold for tracks/silences segmentation.
+
+        The very high volume values of the given stats can be modified.
+
+        :param volume_stats: (sppasBaseVolume) with a set_volume_value()
+        :returns: (int) volume value
+
+        """
+        volumes = sorted(volume_stats.volumes())
+        vmin = max(volume_stats.min(), 0)  # provide negative values
         logging.info("RMS min={:d}".format(vmin))
-        vmean = self.__volume_stats.mean()
+        vmean = volume_stats.mean()
         logging.info("RMS mean={:.2f}".format(vmean))
-        vmedian = self.__volume_stats.median()
+        vmedian = volume_stats.median()
         logging.info("RMS median={:2f}".format(vmedian))
-        vvar = self.__volume_stats.coefvariation()
+        vvar = volume_stats.coefvariation()
         logging.info("RMS coef. var={:2f}".format(vvar))
 
         # Remove very high volume values (outliers)
@@ -252,14 +266,14 @@ class sppasSilences(object):
 
             rms_threshold = volumes[int(0.85 * len(volumes))]
             nb = 0
-            for i, v in enumerate(self.__volume_stats):
+            for i, v in enumerate(volume_stats):
                 if v > rms_threshold:
-                    self.__volume_stats.set_volume_value(i, rms_threshold)
+                    volume_stats.set_volume_value(i, rms_threshold)
                     nb += 1
 
-            vmean = self.__volume_stats.mean()
-            vmedian = self.__volume_stats.median()
-            vvar = self.__volume_stats.coefvariation()
+            vmean = volume_stats.mean()
+            vmedian = volume_stats.median()
+            vvar = volume_stats.coefvariation()
 
         # Normal situation... (more than 75% of the files!!!)
         vcvar = 1.5 * vvar
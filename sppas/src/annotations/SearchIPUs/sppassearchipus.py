@@ -54,6 +54,7 @@ from sppas import u
 from ..annotationsexc import AnnotationOptionError
 from ..baseannot import sppasBaseAnnotation
 from .searchipus import SearchIPUs
+from .streamipus import sppasStreamIPUs
 
 # ---------------------------------------------------------------------------
 
@@ -324,13 +325,7 @@ class sppasSearchIPUs(sppasBaseAnnotation):
         :returns: (sppasTier)
 
         """
-        # Fix options
-        self.__searcher.set_vol_threshold(self._options['threshold'])
-        self.__searcher.set_win_length(self._options['win_length'])
-        self.__searcher.set_min_sil(self._options['min_sil'])
-        self.__searcher.set_min_ipu(self._options['min_ipu'])
-        self.__searcher.set_shift_start(self._options['shift_start'])
-        self.__searcher.set_shift_end(self._options['shift_end'])
+        self.__fix_searcher(self.__searcher)
 
         # Process the data.
         self.__searcher.set_channel(channel)
@@ -346,6 +341,34 @@ class sppasSearchIPUs(sppasBaseAnnotation):
 
     # -----------------------------------------------------------------------
 
+    def stream_tracks(self, input_file):
+        """Search for the IPUs of an audio file while reading it.
+
+        The frames are read block by block and each IPU is generated as
+        soon as the silence following it is found. The IPUs are the ones
+        of convert() if the threshold is fixed. If automatic, the threshold
+        is estimated on the first seconds of the audio file.
+
+        :param input_file: (str) Name of a mono audio file
+        :returns: generator of tuples (from_time, to_time) of the IPUs
+
+        """
+        audio_speech = sppas.src.audiodata.aio.open(input_file)
+        try:
+            n = audio_speech.get_nchannels()
+            if n != 1:
+                raise IOError("An audio file with only one channel is "
+                              "expected. Got {:d} channels.".format(n))
+
+            stream = sppasStreamIPUs()
+            self.__fix_searcher(stream)
+            for track in stream.search_audio(audio_speech, time_domain=True):
+                yield track
+        finally:
+            audio_speech.close()
+
+    # -----------------------------------------------------------------------
+
     def run(self, input_file, opt_input_file=None, output_file=None):
         """Run the automatic annotation process on an input.
 
@@ -443,6 +466,17 @@ class sppasSearchIPUs(sppasBaseAnnotation):
 
     # -----------------------------------------------------------------------
 
+    def __fix_searcher(self, searcher):
+        """Fix the options of a SearchIPUs instance."""
+        searcher.set_vol_threshold(self._options['threshold'])
+        searcher.set_win_length(self._options['win_length'])
+        searcher.set_min_sil(self._options['min_sil'])
+        searcher.set_min_ipu(self._options['min_ipu'])
+        searcher.set_shift_start(self._options['shift_start'])
+        searcher.set_shift_end(self._options['shift_end'])
+
+    # -----------------------------------------------------------------------
+
     @staticmethod
     def get_input_extensions():
         """Extensions that the annotation expects for its input filename."""
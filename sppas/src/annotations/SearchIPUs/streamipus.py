@@ -0,0 +1,473 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.SearchIPUs.streamipus.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Search for the IPUs of a recording while reading it, block by block.
+
+    The tracks are the same as the ones of SearchIPUs when the threshold
+    is fixed: the silences are searched, filtered and adjusted in the same
+    way, but each IPU is returned as soon as the silence following it is
+    known. Only the frames required by the current windows are kept in
+    memory, so that recordings of several hours can be processed.
+
+"""
+
+from sppas.src.audiodata.channel import sppasChannel
+from sppas.src.audiodata.channelvolume import sppasChannelVolume
+from sppas.src.audiodata.audiodataexc import SampleWidthError
+from sppas.src.audiodata.backend import get_backend
+
+from .silences import sppasSilences
+from .searchipus import SearchIPUs
+
+# ---------------------------------------------------------------------------
+
+
+class sppasStreamIPUs(SearchIPUs):
+    """An automatic silence/tracks segmentation of a stream of frames.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The frames of a mono channel are appended block by block, and the
+    tracks (from_pos, to_pos) which are finalized are returned. When the
+    volume threshold is automatic (0), it is estimated on the first
+    seconds of the stream (the warm-up) and it is then fixed: no track
+    is returned before the end of the warm-up.
+
+    >>> stream = sppasStreamIPUs(framerate=16000, sampwidth=2)
+    >>> stream.set_vol_threshold(200)
+    >>> for frames in blocks:
+    >>>     for from_pos, to_pos in stream.append(frames):
+    >>>         print(from_pos, to_pos)
+    >>> tracks = stream.flush()
+
+    """
+
+    # Duration (seconds) of the stream to estimate an automatic threshold
+    DEFAULT_WARMUP = 30.
+
+    # Number of frames read at a time from an audio file
+    BLOCK_SIZE = 65536
+
+    def __init__(self, framerate=16000, sampwidth=2, win_len=0.02):
+        """Create a new sppasStreamIPUs instance.
+
+        :param framerate: (int) Frame rate of the stream
+        :param sampwidth: (int) Sample width of the stream: 1, 2 or 4
+        :param win_len: (float) Window length to estimate the volumes
+
+        """
+        super(sppasStreamIPUs, self).__init__(channel=None, win_len=win_len)
+        self._warmup = sppasStreamIPUs.DEFAULT_WARMUP
+        self._framerate = 16000
+        self._sampwidth = 2
+        self.set_format(framerate, sampwidth)
+
+    # -----------------------------------------------------------------------
+    # Getters and setters
+    # -----------------------------------------------------------------------
+
+    def get_framerate(self):
+        """Return the frame rate of the stream."""
+        return self._framerate
+
+    # -----------------------------------------------------------------------
+
+    def get_sampwidth(self):
+        """Return the sample width of the stream."""
+        return self._sampwidth
+
+    # -----------------------------------------------------------------------
+
+    def get_nframes(self):
+        """Return the number of frames appended since the last reset."""
+        return self.__offset + len(self.__buf) // self._sampwidth
+
+    # -----------------------------------------------------------------------
+
+    def get_warmup(self):
+        """Return the duration used to estimate an automatic threshold."""
+        return self._warmup
+
+    # -----------------------------------------------------------------------
+
+    def set_warmup(self, duration):
+        """Fix the duration used to estimate an automatic threshold.
+
+        The longer the warm-up, the closer the threshold is to the one
+        estimated on the whole recording, but the later the first tracks.
+
+        :param duration: (float) Duration in seconds.
+
+        """
+        self._warmup = max(float(duration), 2. * self._win_len)
+
+    # -----------------------------------------------------------------------
+
+    def set_format(self, framerate, sampwidth):
+        """Fix the format of the frames, then reset the stream.
+
+        :param framerate: (int) Frame rate in Hz
+        :param sampwidth: (int) 1, 2 or 4
+        :raises: SampleWidthError
+
+        """
+        if sampwidth not in (1, 2, 4):
+            raise SampleWidthError(sampwidth)
+        framerate = int(framerate)
+        if framerate <= 0:
+            raise ValueError("Expected a positive frame rate. Got {:d}."
+                             "".format(framerate))
+        self._framerate = framerate
+        self._sampwidth = sampwidth
+        self.reset()
+
+    # -----------------------------------------------------------------------
+
+    def reset(self):
+        """Forget the frames and the tracks of the current stream."""
+        self.__buf = bytearray()
+        self.__offset = 0        # index of the first frame of the buffer
+        self.__threshold = None  # not known before the end of the warm-up
+        self.__win_idx = 0       # index of the next volume window
+        self.__inside = False    # inside a silence or not
+        self.__idx_begin = 0     # index of the first window of the silence
+        self.__adjusted = None   # (start, adjusted start) of the current silence
+        self.__from_pos = 0      # start of the next track
+        self.__nb_silences = 0
+        self.__tracks = list()   # tracks waiting for their end shift
+
+    # -----------------------------------------------------------------------
+    # Silence/Speech segmentation
+    # -----------------------------------------------------------------------
+
+    def append(self, frames):
+        """Append frames to the stream.
+
+        :param frames: (bytes) Frames of a mono channel
+        :returns: (list of tuples) the (from_pos, to_pos) of the tracks
+        which are finalized
+
+        """
+        self.__buf.extend(frames)
+        if self.__threshold is None:
+            if self._vol_threshold == 0:
+                warmup = int(self._warmup * self._framerate)
+                if self.get_nframes() < warmup:
+                    return list()
+            self.__fix_threshold()
+
+        self.__search(final=False)
+        self.__discard()
+
+        return self.__pop_tracks(final=False)
+
+    # -----------------------------------------------------------------------
+
+    def flush(self):
+        """Finalize the tracks at the end of the stream, then reset it.
+
+        :returns: (list of tuples) the (from_pos, to_pos) of the tracks
+
+        """
+        nframes = self.get_nframes()
+        if nframes == 0:
+            self.reset()
+            return list()
+
+        if self.__threshold is None:
+            self.__fix_threshold()
+        self.__search(final=True)
+
+        # Last track after the last silence
+        # (if the silence does not end at the end of the stream)
+        if self.__nb_silences == 0:
+            self.__tracks.append((0, nframes))
+        elif (nframes - self.__from_pos) >= \
+                int(self._min_ipu_dur * self._framerate):
+            self.__tracks.append((int(self.__from_pos), nframes))
+
+        tracks = self.__pop_tracks(final=True)
+        self.reset()
+        return tracks
+
+    # -----------------------------------------------------------------------
+
+    def search_audio(self, audio, index=0, time_domain=False):
+        """Search for the tracks of a channel of an opened audio file.
+
+        The frames are read block by block and the tracks are generated
+        as soon as they are finalized.
+
+        :param audio: (sppasAudioPCM) An audio with an opened file
+        :param index: (int) Index of the channel
+        :param time_domain: (bool) Convert from/to values in seconds
+        :returns: generator of tuples (from, to)
+
+        """
+        view = audio.read_fragment(index)
+        self.set_format(view.get_framerate(), view.get_sampwidth())
+        nframes = view.get_nframes()
+        for pos in range(0, nframes, sppasStreamIPUs.BLOCK_SIZE):
+            block = view.extract_fragment(pos, pos + sppasStreamIPUs.BLOCK_SIZE)
+            for track in self.append(block.get_frames()):
+                yield self.__convert(track, time_domain)
+
+        for track in self.flush():
+            yield self.__convert(track, time_domain)
+
+    # -----------------------------------------------------------------------
+
+    def search_file(self, filename, index=0, time_domain=False):
+        """Search for the tracks of a channel of an audio file.
+
+        :param filename: (str) Name of the audio file
+        :param index: (int) Index of the channel
+        :param time_domain: (bool) Convert from/to values in seconds
+        :returns: generator of tuples (from, to)
+
+        """
+        # import here to avoid circular import
+        from sppas.src.audiodata.aio import open as audio_open
+        audio = audio_open(filename)
+        try:
+            for track in self.search_audio(audio, index, time_domain):
+                yield track
+        finally:
+            audio.close()
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __fix_threshold(self):
+        """Fix the threshold, from the frames of the warm-up if automatic."""
+        threshold = self._vol_threshold
+        if threshold == 0:
+            channel = sppasChannel(self._framerate, self._sampwidth,
+                                   bytes(self.__buf))
+            threshold = sppasSilences(channel, self._win_len).fix_threshold_vol()
+        self.__threshold = threshold
+        self._auto_threshold = threshold
+
+    # -----------------------------------------------------------------------
+
+    def __search(self, final):
+        """Compare the volume of the available windows to the threshold.
+
+        The windows are the ones of the volume estimation of the silences:
+        at the end of the stream, the last window can be partial and it is
+        ignored if its volume is 0.
+
+        """
+        rms = get_backend().rms
+        win = int(self._win_len * self._framerate)
+        nframes = self.get_nframes()
+
+        while (self.__win_idx + 1) * win <= nframes:
+            start = self.__win_idx * win
+            self.__add_volume(rms(self.__frames(start, start + win),
+                                  self._sampwidth))
+
+        if final is True:
+            duration = float(nframes) / float(self._framerate)
+            nb_vols = int(duration / self._win_len) + 1
+            volumes = list()
+            for i in range(self.__win_idx, nb_vols):
+                volumes.append(rms(self.__frames(i * win, (i + 1) * win),
+                                   self._sampwidth))
+            if len(volumes) > 0 and volumes[-1] == 0:
+                volumes.pop()
+            for v in volumes:
+                self.__add_volume(v)
+
+            # Last interval
+            if self.__inside is True:
+                start_pos = int(self.__idx_begin * self._win_len *
+                                self._framerate)
+                self.__add_silence(start_pos, nframes)
+                self.__inside = False
+
+        elif self.__inside is True and self.__adjusted is None:
+            # The start of the silence is adjusted as soon as possible,
+            # so that the frames around it can be discarded.
+            pos = int(self.__idx_begin * self.__step())
+            delta = int(1.5 * self._win_len * self._framerate)
+            if nframes >= int(max(pos - delta, 0)) + int(delta * 3):
+                self.__adjusted = (pos, self.__adjust_bound(pos))
+
+    # -----------------------------------------------------------------------
+
+    def __add_volume(self, v):
+        """Search for silences like SearchIPUs.search_silences()."""
+        i = self.__win_idx
+        if v < self.__threshold:
+            if self.__inside is False:
+                # We consider it like the beginning of a block of silences
+                self.__idx_begin = i
+                self.__adjusted = None
+                self.__inside = True
+
+        elif self.__inside is True:
+            # It's the first window of an IPU
+            # so the previous window was the end of a silence
+            step = self.__step()
+            from_pos = int(self.__idx_begin * step)
+            to_pos = int((i - 1) * step)
+            self.__add_silence(from_pos, to_pos)
+            self.__inside = False
+
+        self.__win_idx += 1
+
+    # -----------------------------------------------------------------------
+
+    def __step(self):
+        """Return the number of frames of a window, like SearchIPUs."""
+        return self._win_len * self._framerate
+
+    # -----------------------------------------------------------------------
+
+    def __add_silence(self, from_pos, to_pos):
+        """Filter a silence, then store the track before it, if any.
+
+        The silence is filtered like with SearchIPUs.get_tracks(): the very
+        small ones are removed, its start is adjusted then the ones which
+        are shorter than min_sil_dur are removed.
+
+        """
+        framerate = float(self._framerate)
+        if float(to_pos - from_pos) / framerate <= 2. * self._win_len:
+            return
+
+        # the start of the last silence is not computed like the others
+        if self.__adjusted is None or self.__adjusted[0] != from_pos:
+            self.__adjusted = (from_pos, self.__adjust_bound(from_pos))
+        from_pos = self.__adjusted[1]
+        if float(to_pos - from_pos) / framerate <= self._min_sil_dur:
+            return
+        self.__nb_silences += 1
+
+        # The track before the silence, if long enough to be an IPU
+        delta = int(self._min_ipu_dur * self._framerate)
+        shift_start = int(self._shift_start * self._framerate)
+        shift_end = int(self._shift_end * self._framerate)
+        if (from_pos - self.__from_pos) >= delta:
+            self.__tracks.append((int(max(self.__from_pos - shift_start, 0)),
+                                  int(from_pos + shift_end)))
+        self.__from_pos = to_pos
+
+    # -----------------------------------------------------------------------
+
+    def __adjust_bound(self, pos):
+        """Adjust the start of a silence, like sppasSilences does.
+
+        :param pos: (int) Initial position of the silence
+        :returns: new position
+
+        """
+        if self._vagueness == self._win_len:
+            return pos
+
+        delta = int(1.5 * self._win_len * self._framerate)
+        start_pos = int(max(pos - delta, 0))
+        c = sppasChannel(self._framerate, self._sampwidth,
+                         self.__frames(start_pos, start_pos + int(delta * 3)))
+        vol_stats = sppasChannelVolume(c, self._vagueness)
+
+        idx = len(vol_stats)
+        for v in reversed(vol_stats):
+            if v > self.__threshold:
+                shift = idx * (int(self._vagueness * self._framerate))
+                return start_pos + int(shift)
+            idx -= 1
+
+        return pos
+
+    # -----------------------------------------------------------------------
+
+    def __pop_tracks(self, final):
+        """Return the tracks whose end is known and remove them.
+
+        The end of a track can't be after the end of the stream.
+
+        """
+        nframes = self.get_nframes()
+        tracks = list()
+        while len(self.__tracks) > 0:
+            from_pos, to_pos = self.__tracks[0]
+            if final is False and to_pos > nframes:
+                break
+            tracks.append((from_pos, min(to_pos, nframes)))
+            self.__tracks.pop(0)
+
+        return tracks
+
+    # -----------------------------------------------------------------------
+
+    def __frames(self, begin, end):
+        """Return the frames from begin to end, if still in the buffer."""
+        begin = max(begin - self.__offset, 0) * self._sampwidth
+        end = max(end - self.__offset, 0) * self._sampwidth
+        return bytes(self.__buf[begin:end])
+
+    # -----------------------------------------------------------------------
+
+    def __discard(self):
+        """Remove the frames which are not needed anymore from the buffer."""
+        # the start of a next silence can be adjusted with the frames
+        # before the next window
+        delta = int(1.5 * self._win_len * self._framerate)
+        keep = self.__win_idx * int(self._win_len * self._framerate) - delta
+        if self.__inside is True:
+            # one more frame for the start of a last silence
+            pos = int(self.__idx_begin * self.__step())
+            keep = min(keep, pos - delta - 1)
+        keep = max(keep, 0)
+
+        nb = keep - self.__offset
+        if nb > 0:
+            del self.__buf[:nb * self._sampwidth]
+            self.__offset = keep
+
+    # -----------------------------------------------------------------------
+
+    def __convert(self, track, time_domain):
+        """Convert, or not, a track into the time domain."""
+        if time_domain is True:
+            return (float(track[0]) / float(self._framerate),
+                    float(track[1]) / float(self._framerate))
+        return track
@@ -216,8 +216,7 @@ class sppasSelfRepet(sppasBaseRepet):
 
         """
         # Get the tier to be used
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
 
         tier_tokens = sppasFindTier.aligned_tokens(trs_input)
         tier_input = self.make_word_strain(tier_tokens)
@@ -289,8 +289,7 @@ class sppasSyll(sppasBaseAnnotation):
 
         """
         # Get the tier to syllabify
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
         tier_input = sppasFindTier.aligned_phones(trs_input)
 
         # Create the transcription result
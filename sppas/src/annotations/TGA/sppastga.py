@@ -424,8 +424,7 @@ class sppasTGA(sppasBaseAnnotation):
 
         """
         # Get the tier to syllabify
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
         tier_input = sppasFindTier.aligned_syllables(trs_input)
 
         # Create the transcription result
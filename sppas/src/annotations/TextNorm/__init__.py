@@ -59,6 +59,7 @@ from .sppastextnorm import sppasTextNorm
 from .orthotranscription import sppasOrthoTranscription
 from .splitter import sppasSimpleSplitter
 from .tokenize import sppasTokenSegmenter
+from .latticeseg import sppasLatticeSegmenter
 from .normalize import TextNormalizer
 
 __all__ = (
@@ -66,5 +67,6 @@ __all__ = (
     'sppasOrthoTranscription',
     'sppasSimpleSplitter',
     'sppasTokenSegmenter',
+    'sppasLatticeSegmenter',
     'TextNormalizer'
 )
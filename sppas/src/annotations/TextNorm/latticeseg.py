@@ -0,0 +1,335 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+
+    src.annotations.latticeseg.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Probabilistic word segmentation for the text normalization system.
+
+"""
+from array import array
+from bisect import bisect_left
+
+from sppas.src.models.slm.arpaio import sppasArpaIO
+from sppas.src.models.modelsexc import ModelsDataTypeError
+
+# ---------------------------------------------------------------------------
+
+
+class sppasLatticeSegmenter(object):
+    """Find the best sequence of words in the lattice of a sequence of tokens.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    All the words of the vocabulary that can be made of the tokens are
+    stored into a lattice, i.e. a DAG with an edge for each word from the
+    position of its first token to the one after its last token. Any
+    token is also a word itself. The best path is then found with the
+    Viterbi algorithm, scored by the unigrams and bigrams of a statistical
+    language model.
+
+    A token which is not a word of the vocabulary costs one more
+    WORD_LOGPROB than an unknown word, and it is skipped in the history
+    of the next word. At each position, the paths with the same history
+    are merged and only the MAX_STATES best ones are kept, so that both
+    the lattice and the search are linear in the number of tokens.
+
+    The log-probabilities of the model are stored in compact arrays
+    indexed by word identifiers: unigrams and back-off weights, and the
+    bigrams sorted by history then by word.
+
+    Without model, each word has the same score: the segmentation with
+    the less words is chosen.
+
+    >>> model = sppasArpaIO().load("yue.arpa")
+    >>> segmenter = sppasLatticeSegmenter(model)
+    >>> spans = segmenter.segment(tokens, sppasTrie(vocab))
+
+    """
+
+    START = "<s>"
+    END = "</s>"
+    UNK = "<unk>"
+
+    # Score of a word if there is no model
+    WORD_LOGPROB = -1.
+
+    # Maximum number of paths kept at each position of the lattice
+    MAX_STATES = 16
+
+    # -------------------------------------------------------------------------
+
+    def __init__(self, model=None):
+        """Create a new sppasLatticeSegmenter instance.
+
+        :param model: (list) Log-probabilities of the n-grams, as returned by
+        sppasArpaIO.load() or sppasNgramsModel.probabilities("logml").
+
+        """
+        self.__ids = dict()
+        self.__unigrams = array('d')
+        self.__bows = array('d')
+        self.__bi_offsets = array('l', [0])
+        self.__bi_words = array('l')
+        self.__bi_logprobs = array('d')
+        self.__unk_logprob = sppasLatticeSegmenter.WORD_LOGPROB
+        self.__order = 0
+
+        if model is not None:
+            self.set_model(model)
+
+    # -------------------------------------------------------------------------
+
+    def load_from_arpa(self, filename):
+        """Load the model from an ARPA file.
+
+        :param filename: (str)
+
+        """
+        self.set_model(sppasArpaIO().load(filename))
+
+    # -------------------------------------------------------------------------
+
+    def set_model(self, model):
+        """Fix the log-probabilities of unigrams and bigrams.
+
+        Higher orders of the model are ignored.
+
+        :param model: (list) List of n-grams, each one a list of tuples
+        (token sequence, log-probability, back-off weight or None).
+
+        """
+        if not (isinstance(model, list) and
+                all([isinstance(m, list) for m in model])):
+            raise ModelsDataTypeError("model",
+                                      "list of lists of tuples",
+                                      type(model))
+
+        self.__ids = dict()
+        unigrams = list()
+        bows = list()
+        if len(model) > 0:
+            for entry, logprob, bow in model[0]:
+                self.__ids[entry] = len(unigrams)
+                unigrams.append(logprob)
+                bows.append(0. if bow is None else bow)
+
+        # Bigrams, grouped by history
+        bigrams = dict()
+        if len(model) > 1:
+            for entry, logprob, bow in model[1]:
+                words = entry.split()
+                if len(words) != 2:
+                    continue
+                ids = list()
+                for w in words:
+                    if w not in self.__ids:
+                        self.__ids[w] = len(unigrams)
+                        unigrams.append(float("-inf"))
+                        bows.append(0.)
+                    ids.append(self.__ids[w])
+                bigrams.setdefault(ids[0], list()).append((ids[1], logprob))
+
+        self.__unigrams = array('d', unigrams)
+        self.__bows = array('d', bows)
+        self.__bi_offsets = array('l', [0] * (len(unigrams) + 1))
+        self.__bi_words = array('l')
+        self.__bi_logprobs = array('d')
+        for wid in range(len(unigrams)):
+            for next_wid, logprob in sorted(bigrams.get(wid, [])):
+                self.__bi_words.append(next_wid)
+                self.__bi_logprobs.append(logprob)
+            self.__bi_offsets[wid + 1] = len(self.__bi_words)
+
+        # Unknown words are less probable than any observed one
+        self.__order = min(2, len(model))
+        unk = self.__ids.get(sppasLatticeSegmenter.UNK, None)
+        if unk is not None and self.__unigrams[unk] > float("-inf"):
+            self.__unk_logprob = self.__unigrams[unk]
+        else:
+            observed = [p for p in unigrams if p > -99.]
+            if len(observed) > 0:
+                self.__unk_logprob = min(observed) - 1.
+            else:
+                self.__unk_logprob = sppasLatticeSegmenter.WORD_LOGPROB
+
+        # Words observed only in bigrams
+        for wid, logprob in enumerate(self.__unigrams):
+            if logprob == float("-inf"):
+                self.__unigrams[wid] = self.__unk_logprob
+
+    # -------------------------------------------------------------------------
+
+    def get_order(self):
+        """Return the order of the n-grams in use (0 if no model)."""
+        return self.__order
+
+    # -------------------------------------------------------------------------
+
+    def logprob(self, word, history=None):
+        """Return the log-probability of a word after another one.
+
+        :param word: (str)
+        :param history: (str) Previous word or None
+        :returns: (float)
+
+        """
+        hid = -1 if history is None else self.__ids.get(history, -1)
+        return self.__logprob(hid, self.__ids.get(word, -1))
+
+    # -------------------------------------------------------------------------
+
+    def segment(self, tokens, trie, max_tokens=None, separator=""):
+        """Return the best segmentation of tokens into words.
+
+        :param tokens: (list of str)
+        :param trie: (sppasTrie) The vocabulary, matched from left to right
+        :param max_tokens: (int) Maximum number of tokens of a word
+        :param separator: (str) String to join the tokens of a word
+        :returns: list of tuples (index of first token, number of tokens)
+
+        """
+        n = len(tokens)
+        if n == 0:
+            return list()
+        ids = self.__ids
+
+        # states[j] are the words ending before token j, with their best
+        # score, the index of their first token, their id, the index of
+        # the previous word in states[start] and the id of the history of
+        # the next word.
+        states = [list() for _ in range(n + 1)]
+        start_id = ids.get(sppasLatticeSegmenter.START, -1)
+        states[0].append((0., -1, start_id, -1, start_id))
+
+        for i in range(n):
+            states[i] = sppasLatticeSegmenter.__prune(states[i])
+            previous = states[i]
+            lengths = trie.matches(tokens, i, max_tokens, separator)
+            known = set(lengths)
+            if 1 not in known:
+                lengths.insert(0, 1)
+
+            for nb in lengths:
+                if nb in known:
+                    wid = ids.get(separator.join(tokens[i:i + nb]), -1)
+                else:
+                    wid = -2
+                best_score = None
+                best_back = 0
+                for back, state in enumerate(previous):
+                    score = state[0] + self.__logprob(state[4], wid)
+                    if best_score is None or score > best_score:
+                        best_score = score
+                        best_back = back
+                history = wid
+                if wid == -2:
+                    history = previous[best_back][4]
+                states[i + nb].append((best_score, i, wid, best_back, history))
+
+        # Close the sentence then backtrack the best path
+        end_id = ids.get(sppasLatticeSegmenter.END, -1)
+        best_score = None
+        best_back = 0
+        for back, state in enumerate(states[n]):
+            score = state[0]
+            if end_id >= 0:
+                score += self.__logprob(state[4], end_id)
+            if best_score is None or score > best_score:
+                best_score = score
+                best_back = back
+
+        spans = list()
+        j = n
+        while j > 0:
+            score, start, wid, back, history = states[j][best_back]
+            spans.append((start, j - start))
+            j = start
+            best_back = back
+
+        spans.reverse()
+        return spans
+
+    # -------------------------------------------------------------------------
+    # Private
+    # -------------------------------------------------------------------------
+
+    def __logprob(self, hid, wid):
+        """Return the log-probability of word id wid after word id hid.
+
+        Negative ids are unknown words: -1 for a word of the vocabulary
+        and -2 for a token that is not a word.
+
+        """
+        if self.__order == 0:
+            if wid == -2:
+                return 2. * sppasLatticeSegmenter.WORD_LOGPROB
+            return sppasLatticeSegmenter.WORD_LOGPROB
+
+        if wid == -2:
+            return self.__unk_logprob + sppasLatticeSegmenter.WORD_LOGPROB
+        if wid == -1:
+            return self.__unk_logprob
+
+        if self.__order > 1 and hid >= 0:
+            lo = self.__bi_offsets[hid]
+            hi = self.__bi_offsets[hid + 1]
+            if lo < hi:
+                idx = bisect_left(self.__bi_words, wid, lo, hi)
+                if idx < hi and self.__bi_words[idx] == wid:
+                    return self.__bi_logprobs[idx]
+            return self.__bows[hid] + self.__unigrams[wid]
+
+        return self.__unigrams[wid]
+
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def __prune(states):
+        """Return the best state of each history, at most MAX_STATES.
+
+        With bigrams, the next words are scored only by the history, so
+        that only the best of the states with the same history is useful.
+
+        """
+        best = dict()
+        for state in states:
+            kept = best.get(state[4], None)
+            if kept is None or state[0] > kept[0]:
+                best[state[4]] = state
+        if len(best) == len(states) and \
+                len(states) <= sppasLatticeSegmenter.MAX_STATES:
+            return states
+        pruned = sorted(best.values(), key=lambda x: x[0], reverse=True)
+        return pruned[:sppasLatticeSegmenter.MAX_STATES]
@@ -109,6 +109,9 @@ class TextNormalizer(object):
         self.lang = lang
         self.delimiter = ' '
 
+        # the tokenizer is kept: its index of the vocabulary is built once
+        self.__tokenizer = sppasTokenSegmenter(self.vocab)
+
     # -----------------------------------------------------------------------
 
     def get_vocab_filename(self):
@@ -140,6 +143,27 @@ class TextNormalizer(object):
 
     # -----------------------------------------------------------------------
 
+    def set_segmentation(self, strategy):
+        """Set the word segmentation strategy of the tokenizer.
+
+        :param strategy: (str) One of "lr", "rl", "bi" or "viterbi".
+
+        """
+        self.__tokenizer.set_strategy(strategy)
+
+    # -----------------------------------------------------------------------
+
+    def set_ngrams(self, model):
+        """Set the language model of the "viterbi" segmentation.
+
+        :param model: (list) Log-probabilities of the n-grams, as returned
+        by sppasArpaIO.load() or sppasNgramsModel.probabilities("logml").
+
+        """
+        self.__tokenizer.set_ngrams(model)
+
+    # -----------------------------------------------------------------------
+
     def set_repl(self, repl):
         """Set the dictionary of replacements.
 
@@ -229,7 +253,9 @@ class TextNormalizer(object):
         :returns: (list)
 
         """
-        tok = sppasTokenSegmenter(self.vocab)
+        tok = self.__tokenizer
+        if tok.get_vocab() is not self.vocab:
+            tok.set_vocab(self.vocab)
 
         # rules for - ' .
         unbind_result = tok.unbind(utt)
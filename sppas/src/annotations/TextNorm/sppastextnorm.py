@@ -44,6 +44,7 @@ from sppas.src.config import info
 
 from sppas import sppasDictRepl
 from sppas import sppasVocabulary
+from sppas import sppasArpaIO
 
 from sppas import sppasRW
 from sppas import sppasTranscription
@@ -87,6 +88,7 @@ class sppasTextNorm(sppasBaseAnnotation):
         """
         super(sppasTextNorm, self).__init__("textnorm.json", log)
         self.__normalizer = TextNormalizer()
+        self.__ngrams = None
 
     # -----------------------------------------------------------------------
 
@@ -106,6 +108,8 @@ class sppasTextNorm(sppasBaseAnnotation):
             voc = sppasVocabulary()
             logging.warning('Vocabulary file {:s} for language {:s} not found.'.format(vocab_filename, lang))
         self.__normalizer = TextNormalizer(voc, lang)
+        self.__normalizer.set_segmentation(self._options['segment'])
+        self.__normalizer.set_ngrams(self.__ngrams)
         self.logfile.print_message(
             (info(1164, "annotations")).format(len(voc)),
             indent=0)
@@ -148,6 +152,9 @@ class sppasTextNorm(sppasBaseAnnotation):
             - faked
             - std
             - custom
+            - occ_dur
+            - segment
+            - lm
 
         :param options: (sppasOption)
 
@@ -163,6 +170,10 @@ class sppasTextNorm(sppasBaseAnnotation):
                 self.set_custom(opt.get_value())
             elif key == "occ_dur":
                 self.set_occ_dur(opt.get_value())
+            elif key == "segment":
+                self.set_segment(opt.get_value())
+            elif key == "lm":
+                self.set_lm(opt.get_value())
 
             else:
                 raise AnnotationOptionError(key)
@@ -207,6 +218,36 @@ class sppasTextNorm(sppasBaseAnnotation):
         """
         self._options['occ_dur'] = value
 
+    # -----------------------------------------------------------------------
+
+    def set_segment(self, value):
+        """Fix the word segmentation option.
+
+        Only used with languages without whitespace.
+
+        :param value: (str) One of "lr", "rl", "bi" or "viterbi"
+
+        """
+        self.__normalizer.set_segmentation(value)
+        self._options['segment'] = value
+
+    # -----------------------------------------------------------------------
+
+    def set_lm(self, value):
+        """Fix the language model of the viterbi word segmentation.
+
+        :param value: (str) Name of an ARPA file, or an empty string
+
+        """
+        self.__ngrams = None
+        if len(value) > 0:
+            if os.path.isfile(value) is True:
+                self.__ngrams = sppasArpaIO().load(value)
+            else:
+                logging.warning('Language model {:s} not found.'.format(value))
+        self.__normalizer.set_ngrams(self.__ngrams)
+        self._options['lm'] = value
+
     # -----------------------------------------------------------------------
     # Methods to tokenize series of data
     # -----------------------------------------------------------------------
@@ -292,8 +333,7 @@ class sppasTextNorm(sppasBaseAnnotation):
 
         """
         # Get input tier to tokenize
-        parser = sppasRW(input_file[0])
-        trs_input = parser.read()
+        trs_input = self._read_transcription(input_file[0])
         tier_input = sppasFindTier.transcription(trs_input)
 
         # Tokenize the tier
@@ -38,6 +38,9 @@
 import re
 
 from sppas.src.utils.makeunicode import sppasUnicode
+from sppas.src.structs.trie import sppasTrie
+
+from .latticeseg import sppasLatticeSegmenter
 
 # ---------------------------------------------------------------------------
 
@@ -66,10 +69,18 @@ class sppasTokenSegmenter(object):
         - parce que -> parce_que
         - rock'n roll -> rock'n_roll
 
+    The words of the lexicon are stored into a prefix tree, so that the
+    longest word starting (or ending) at a given token is found in one walk.
+    The longest matching can be applied from left to right, from right to
+    left or in both directions. Instead, the most probable sequence of words
+    can be found with a language model.
+
     """
 
     SEPARATOR = "_"
     STICK_MAX = 7
+    LR = "lr"
+    STRATEGIES = ("lr", "rl", "bi", "viterbi")
 
     # -------------------------------------------------------------------------
 
@@ -82,6 +93,9 @@ class sppasTokenSegmenter(object):
         self.__vocab = vocab
         self.__separator = sppasTokenSegmenter.SEPARATOR
         self.__aggregate_max = sppasTokenSegmenter.STICK_MAX
+        self.__strategy = sppasTokenSegmenter.LR
+        self.__tries = dict()
+        self.__lattice = sppasLatticeSegmenter()
 
     # -------------------------------------------------------------------------
 
@@ -120,36 +134,141 @@ class sppasTokenSegmenter(object):
 
     # -------------------------------------------------------------------------
 
-    def __stick_longest_lr(self, phrase, separator):
-        """Return the longest first word of a phrase.
+    def set_strategy(self, value=LR):
+        """Fix the word segmentation strategy of the bind method.
 
-        A longest matching algorithm is applied from left to right.
+        :param value: (str) One of:
 
-        :param phrase: (str)
-        :returns: tuple of (index of the first longest token, the longest token)
+            - "lr": longest matching from left to right (max-match);
+            - "rl": longest matching from right to left (reverse max-match);
+            - "bi": bidirectional max-match, i.e. the best of both;
+            - "viterbi": best path in the lattice of words, scored by the
+              n-grams fixed with set_ngrams().
 
         """
-        tab_toks = phrase.split(" ")
-        token = tab_toks[0]
-        i = len(tab_toks)
+        value = str(value).lower()
+        if value not in sppasTokenSegmenter.STRATEGIES:
+            raise ValueError('set_strategy: value should be one of {:s}.'
+                             ''.format(", ".join(sppasTokenSegmenter.STRATEGIES)))
 
-        if self.__vocab is None:
-            return 1, token
+        self.__strategy = value
+
+    # -------------------------------------------------------------------------
+
+    def get_strategy(self):
+        """Return the word segmentation strategy of the bind method."""
+        return self.__strategy
+
+    # -------------------------------------------------------------------------
+
+    def set_ngrams(self, model):
+        """Fix the n-grams to score the words with the viterbi strategy.
+
+        :param model: (list) Log-probabilities of the n-grams, as returned
+        by sppasArpaIO.load(), or None to give the same score to all words.
+
+        """
+        self.__lattice = sppasLatticeSegmenter(model)
+
+    # -------------------------------------------------------------------------
+
+    def set_vocab(self, vocab):
+        """Fix the vocabulary the words are found in.
 
-        while i > 0:
-            # try to aggregate all tokens
-            token = separator.join(tab_toks)
+        :param vocab: (sppasVocabulary)
 
-            # next round will try without the last token
-            tab_toks.pop()
-            i -= 1
+        """
+        self.__vocab = vocab
+        self.__tries = dict()
+
+    # -------------------------------------------------------------------------
+
+    def get_vocab(self):
+        """Return the vocabulary the words are found in."""
+        return self.__vocab
+
+    # -------------------------------------------------------------------------
+
+    def __get_trie(self, reverse=False):
+        """Return the prefix tree of the vocabulary.
+
+        The tree is built at the first use, and re-built only if the
+        number of entries of the vocabulary has changed.
+
+        :param reverse: (bool) Tree to match from right to left
+        :returns: (sppasTrie)
+
+        """
+        trie = self.__tries.get(reverse, None)
+        if trie is None or len(trie) != len(self.__vocab):
+            trie = sppasTrie(self.__vocab, reverse=reverse)
+            self.__tries[reverse] = trie
+
+        return trie
+
+    # -------------------------------------------------------------------------
 
-            # find if this is a word in the vocabulary
-            if self.__vocab.is_unk(token) is False:
-                break
+    def __stick_longest_lr(self, tokens, max_tokens, separator):
+        """Return the segmentation of tokens by longest matching from left.
 
-        # the first real token is the first given token
-        return i, sppasUnicode(token).to_strip()
+        :param tokens: (list of str)
+        :param max_tokens: (int) Maximum number of tokens of a word
+        :param separator: (str)
+        :returns: list of tuples (index of first token, number of tokens)
+
+        """
+        trie = self.__get_trie(reverse=False)
+        spans = list()
+        idx_start = 0
+        while idx_start < len(tokens):
+            nb = max(1, trie.longest_match(tokens, idx_start, max_tokens, separator))
+            spans.append((idx_start, nb))
+            idx_start += nb
+
+        return spans
+
+    # -----------------------------------------------------------------------
+
+    def __stick_longest_rl(self, tokens, max_tokens, separator):
+        """Return the segmentation of tokens by longest matching from right.
+
+        :param tokens: (list of str)
+        :param max_tokens: (int) Maximum number of tokens of a word
+        :param separator: (str)
+        :returns: list of tuples (index of first token, number of tokens)
+
+        """
+        trie = self.__get_trie(reverse=True)
+        spans = list()
+        idx_end = len(tokens) - 1
+        while idx_end >= 0:
+            nb = max(1, trie.longest_match(tokens, idx_end, max_tokens, separator))
+            spans.append((idx_end - nb + 1, nb))
+            idx_end -= nb
+
+        spans.reverse()
+        return spans
+
+    # -----------------------------------------------------------------------
+
+    def __stick_longest_bi(self, tokens, max_tokens, separator):
+        """Return the best of both left and right longest matching.
+
+        The segmentation with the less words is chosen. If both have the
+        same number of words, the one with the less single-token unknown
+        words is chosen. The right-to-left one is preferred in case of a tie.
+
+        """
+        lr = self.__stick_longest_lr(tokens, max_tokens, separator)
+        rl = self.__stick_longest_rl(tokens, max_tokens, separator)
+        if len(lr) != len(rl):
+            return lr if len(lr) < len(rl) else rl
+
+        unk_lr = sum(1 for i, nb in lr if nb == 1 and self.__vocab.is_unk(tokens[i]))
+        unk_rl = sum(1 for i, nb in rl if nb == 1 and self.__vocab.is_unk(tokens[i]))
+        if unk_lr < unk_rl:
+            return lr
+        return rl
 
     # -----------------------------------------------------------------------
 
@@ -160,18 +279,44 @@ class sppasTokenSegmenter(object):
         :returns: A list of strings
 
         """
-        new_utt = list()
+        tokens = " ".join(utt).split()
+        if self.__vocab is None:
+            return [sppasUnicode(t).to_strip() for t in tokens]
+
+        max_tokens = self.__aggregate_max + 1
+        if self.__strategy == "rl":
+            spans = self.__stick_longest_rl(tokens, max_tokens, self.__separator)
+        elif self.__strategy == "bi":
+            spans = self.__stick_longest_bi(tokens, max_tokens, self.__separator)
+        elif self.__strategy == "viterbi":
+            spans = self.__lattice.segment(tokens, self.__get_trie(),
+                                           max_tokens, self.__separator)
+        elif tokens != utt:
+            # some tokens are containing whitespace
+            return self.__bind_phrases(utt, max_tokens)
+        else:
+            spans = self.__stick_longest_lr(tokens, max_tokens, self.__separator)
+
+        return [self.__separator.join(tokens[i:i+nb]) for i, nb in spans]
 
-        idx_start = 0
-        while idx_start < len(utt):
+    # -----------------------------------------------------------------------
 
-            # use a longest matching to aggregate the current token with the next ones
-            idx_end = min(len(utt), idx_start+self.__aggregate_max+1)
-            phrase = " ".join(utt[idx_start:idx_end])
-            idx_end, word = self.__stick_longest_lr(sppasUnicode(phrase).to_strip(), self.__separator)
+    def __bind_phrases(self, utt, max_tokens):
+        """Bind tokens of an utterance, each one possibly made of several.
 
-            new_utt.append(word)
-            idx_start += idx_end + 1
+        The longest matching is applied from left to right on the phrase
+        made of the current token and the next ones.
+
+        """
+        trie = self.__get_trie(reverse=False)
+        new_utt = list()
+        idx_start = 0
+        while idx_start < len(utt):
+            phrase = " ".join(utt[idx_start:idx_start+max_tokens])
+            tokens = sppasUnicode(phrase).to_strip().split(" ")
+            nb = max(1, trie.longest_match(tokens, 0, None, self.__separator))
+            new_utt.append(sppasUnicode(self.__separator.join(tokens[:nb])).to_strip())
+            idx_start += nb
 
         return new_utt
 
@@ -202,16 +347,10 @@ class sppasTokenSegmenter(object):
                 # KEEP special chars in the array!
                 tab_split = re.split("([-'.])", tok)
                 tab_tok = list(entry for entry in tab_split if len(entry) > 0)
-                idx_start = 0
-                while idx_start < len(tab_tok):
-
-                    # use a longest matching to aggregate the current token with the next ones
-                    idx_end = min(len(tab_tok), idx_start + 5)
-                    phrase = " ".join(tab_tok[idx_start:idx_end])
-                    idx_end, word = self.__stick_longest_lr(sppasUnicode(phrase).to_strip(), "")
 
-                    new_utt.append(word)
-                    idx_start += idx_end + 1
+                # use a longest matching to aggregate each token with the next ones
+                for i, nb in self.__stick_longest_lr(tab_tok, 5, ""):
+                    new_utt.append("".join(tab_tok[i:i+nb]))
 
             else:
                 new_utt.append(sppasUnicode(tok).to_strip())
@@ -0,0 +1,248 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.annotations.annpool.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Apply an automatic annotation on files with a pool of workers.
+
+    Each worker creates its own instance of the annotation and loads its
+    linguistic resources once, then it processes files one after the
+    other. The messages a worker sends to its log are recorded and
+    returned with the result of each file, so that they are written into
+    the Procedure Outcome Report in the order of the files.
+
+"""
+
+import threading
+import traceback
+import logging
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+from sppas.src.config import annots
+
+# ---------------------------------------------------------------------------
+
+# The annotation instance of the current worker
+_worker = threading.local()
+
+# ---------------------------------------------------------------------------
+
+
+class sppasLogRecorder(object):
+    """Record the messages sent to a sppasLog, to replay them later.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    Any call to a "print_*" method is recorded with its arguments.
+
+    """
+
+    def __init__(self):
+        self.__records = list()
+
+    # -----------------------------------------------------------------------
+
+    def pop_records(self):
+        """Return the recorded messages and clear the list."""
+        records = self.__records
+        self.__records = list()
+        return records
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def replay(records, log):
+        """Send recorded messages to a log.
+
+        :param records: (list) Returned by pop_records()
+        :param log: (sppasLog)
+
+        """
+        for name, args, kwargs in records:
+            getattr(log, name)(*args, **kwargs)
+
+    # -----------------------------------------------------------------------
+
+    def __getattr__(self, name):
+        if name.startswith("print_") is False:
+            raise AttributeError(name)
+
+        def record(*args, **kwargs):
+            self.__records.append((name, args, kwargs))
+        return record
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAnnotationPool(object):
+    """Apply an automatic annotation on files with a pool of workers.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    Workers are processes by default, or threads. The results are returned
+    in the order of the files, and the failure of a file does not disturb
+    the other ones.
+
+    >>> pool = sppasAnnotationPool(sppasPhon, options, ("eng.dict", ), "eng")
+    >>> ann = sppasPhon()
+    >>> ann.fix_options(options)
+    >>> ann.batch_processing(files, pool=pool)
+
+    """
+
+    def __init__(self, ann_class, options=(), resources=(), lang=None,
+                 nb_workers=0, use_threads=False):
+        """Create a new sppasAnnotationPool instance.
+
+        :param ann_class: (sppasBaseAnnotation) Class of the annotation
+        :param options: (list of sppasOption) Options of the annotation
+        :param resources: (list) Arguments of load_resources()
+        :param lang: (str) Language of the resources
+        :param nb_workers: (int) Number of workers. 0 means the number of
+        CPUs of the computer.
+        :param use_threads: (bool) Use threads instead of processes
+
+        """
+        self.__ann_args = (ann_class, list(options), list(resources), lang)
+        self.__nb_workers = 0
+        self.__use_threads = bool(use_threads)
+        self.set_nb_workers(nb_workers)
+
+    # -----------------------------------------------------------------------
+
+    def get_nb_workers(self):
+        """Return the number of workers."""
+        return self.__nb_workers
+
+    # -----------------------------------------------------------------------
+
+    def set_nb_workers(self, nb_workers=0):
+        """Fix the number of workers.
+
+        :param nb_workers: (int) 0 means the number of CPUs
+
+        """
+        nb_workers = int(nb_workers)
+        if nb_workers <= 0:
+            nb_workers = sppasAnnotationPool.cpu_count()
+        self.__nb_workers = nb_workers
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def cpu_count():
+        """Return the number of CPUs, or 1 if unknown."""
+        try:
+            return multiprocessing.cpu_count()
+        except NotImplementedError:
+            return 1
+
+    # -----------------------------------------------------------------------
+
+    def process(self, file_names, output_format=annots.extension):
+        """Process the files and return the results in the given order.
+
+        :param file_names: (list) List of inputs, see batch_processing()
+        :param output_format: (str) Extension of the output files
+        :returns: generator of tuples (output file name or None, records
+        of the log messages)
+
+        """
+        jobs = [(input_files, output_format) for input_files in file_names]
+        nb_workers = min(self.__nb_workers, len(jobs))
+        if nb_workers == 0:
+            return
+
+        if self.__use_threads is True:
+            pool = ThreadPool(nb_workers, _init_worker, self.__ann_args)
+        else:
+            pool = multiprocessing.Pool(nb_workers, _init_worker, self.__ann_args)
+
+        try:
+            for result in pool.imap(_process_job, jobs):
+                yield result
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+# ---------------------------------------------------------------------------
+# Functions executed by the workers
+# ---------------------------------------------------------------------------
+
+
+def _init_worker(ann_class, options, resources, lang):
+    """Create the annotation of a worker and load its resources."""
+    _worker.annotation = None
+    _worker.error = ""
+    try:
+        ann = ann_class(sppasLogRecorder())
+        if len(options) > 0:
+            ann.fix_options(options)
+        ann.load_resources(*resources, lang=lang)
+        _worker.annotation = ann
+    except Exception as e:
+        # The error will be reported with the result of each file
+        _worker.error = str(e)
+        logging.info(traceback.format_exc())
+
+# ---------------------------------------------------------------------------
+
+
+def _process_job(job):
+    """Process the input files of a job with the annotation of the worker."""
+    input_files, output_format = job
+    ann = _worker.annotation
+    if ann is None:
+        return None, [("print_message", (_worker.error, ),
+                       {"indent": 1, "status": annots.error})]
+
+    try:
+        out_name = ann.run_batch_job(input_files, output_format)
+    except Exception as e:
+        out_name = None
+        ann.logfile.print_message("{:s}\n".format(str(e)),
+                                  indent=1, status=annots.error)
+        logging.info(traceback.format_exc())
+
+    return out_name, ann.logfile.pop_records()
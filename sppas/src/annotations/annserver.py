@@ -0,0 +1,342 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.annotations.annserver.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Keep an automatic annotation alive to process a stream of jobs.
+
+    An annotation is instantiated and its resources are loaded only once,
+    then it can be applied on any number of files given either:
+
+        - as a batch: directories, glob patterns or lists of files;
+        - as a server: job lines read from a stream (stdin) or from the
+          clients of a local socket.
+
+    A job line is an input file name, optionally followed by a tabulation
+    and the output file name. Each job is answered by one line:
+
+        - ok<TAB>input<TAB>output
+        - error<TAB>input<TAB>message
+
+"""
+
+import os
+import glob
+import codecs
+import logging
+try:  # python 3
+    import socketserver
+except ImportError:  # python 2
+    import SocketServer as socketserver
+
+from sppas.src.config import sg
+from sppas.src.config import annots
+from sppas.src.exc import NoDirectoryError
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAnnotationServer(object):
+    """Apply an already configured annotation on a stream of files.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    >>> ann = sppasTextNorm()
+    >>> ann.load_resources("yue.vocab", lang="yue")
+    >>> server = sppasAnnotationServer(ann, ".csv", "output")
+    >>> for in_name, out_name, msg in server.batch(["txt"]):
+    >>>     print(in_name, out_name)
+
+    """
+
+    GLOB_CHARS = "*?["
+    LIST_PREFIX = "@"
+
+    # -----------------------------------------------------------------------
+
+    def __init__(self, annotation, output_format=annots.extension, out_dir=None):
+        """Create a new sppasAnnotationServer instance.
+
+        :param annotation: (sppasBaseAnnotation) with resources and options
+        already fixed.
+        :param output_format: (str) Extension of the output files
+        :param out_dir: (str) Directory of the output files. If None, the
+        output files are created in the directory of the input files.
+
+        """
+        self.__ann = annotation
+        self.__output_format = output_format
+        if output_format.startswith(".") is False:
+            self.__output_format = "." + output_format
+        if out_dir is not None and os.path.isdir(out_dir) is False:
+            raise NoDirectoryError(out_dir)
+        self.__out_dir = out_dir
+
+    # -----------------------------------------------------------------------
+
+    def get_annotation(self):
+        """Return the annotation this server is applying."""
+        return self.__ann
+
+    # -----------------------------------------------------------------------
+
+    def get_out_name(self, input_file):
+        """Return the output filename of an input file.
+
+        :param input_file: (str)
+        :returns: (str)
+
+        """
+        out_name = self.__ann.get_out_name(input_file, self.__output_format)
+        if self.__out_dir is not None:
+            out_name = os.path.join(self.__out_dir, os.path.basename(out_name))
+        return out_name
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def get_input_files(entries, extensions=None):
+        """Return the list of files matching the given entries.
+
+        Each entry is either:
+
+            - the name of a directory: its files are returned;
+            - a glob pattern, like "txt/*.txt";
+            - the name of a file prefixed by "@": the file contains the
+              list of input files, one per line;
+            - the name of an input file.
+
+        :param entries: (list of str)
+        :param extensions: (list of str) Expected file extensions, or None
+        to accept any of them.
+        :returns: (list of str) in the given order, without duplicates
+
+        """
+        if extensions is not None:
+            extensions = [e.lower() for e in extensions]
+
+        files = list()
+        known = set()
+        for entry in entries:
+            if entry.startswith(sppasAnnotationServer.LIST_PREFIX):
+                found = sppasAnnotationServer.__read_list(entry[1:])
+
+            elif os.path.isdir(entry):
+                found = [os.path.join(entry, f)
+                         for f in sorted(os.listdir(entry))]
+                found = [f for f in found if os.path.isfile(f)]
+
+            elif any(c in entry for c in sppasAnnotationServer.GLOB_CHARS):
+                found = sorted(glob.glob(entry))
+
+            else:
+                found = [entry]
+
+            for filename in found:
+                ext = os.path.splitext(filename)[1].lower()
+                if extensions is not None and ext not in extensions:
+                    continue
+                if filename not in known:
+                    known.add(filename)
+                    files.append(filename)
+
+        return files
+
+    # -----------------------------------------------------------------------
+    # Process jobs
+    # -----------------------------------------------------------------------
+
+    def process(self, input_file, output_file=None):
+        """Apply the annotation on a single input file.
+
+        :param input_file: (str)
+        :param output_file: (str) If None, the name is fixed from the input
+        :returns: (str) output file name
+        :raises: any exception of the annotation
+
+        """
+        if os.path.isfile(input_file) is False:
+            raise IOError("No such file: {:s}".format(input_file))
+        if output_file is None:
+            output_file = self.get_out_name(input_file)
+
+        # 'run' could modify the options
+        options = self.__ann._options.copy()
+        try:
+            self.__ann.run([input_file], output_file=output_file)
+        finally:
+            self.__ann._options = options
+
+        return output_file
+
+    # -----------------------------------------------------------------------
+
+    def batch(self, entries, extensions=None):
+        """Apply the annotation on the files matching the given entries.
+
+        Results are generated while processing: a failure on a file does
+        not stop the process of the next ones.
+
+        :param entries: (list of str) See get_input_files()
+        :param extensions: (list of str) Expected file extensions
+        :returns: generator of tuples (input, output or None, error message)
+
+        """
+        for input_file in self.get_input_files(entries, extensions):
+            yield self.__job(input_file)
+
+    # -----------------------------------------------------------------------
+
+    def serve(self, instream, outstream):
+        """Read job lines from a stream and write the answers to another one.
+
+        The process stops at the end of the input stream or when a line
+        with "quit" is read.
+
+        :param instream: (file-like) Stream to read the jobs from
+        :param outstream: (file-like) Stream to write the answers to
+        :returns: (int) Number of jobs processed
+
+        """
+        nb = 0
+        while True:
+            line = instream.readline()
+            if not line:
+                break
+            binary = isinstance(line, bytes)
+            if binary is True:
+                line = line.decode(sg.__encoding__)
+            line = line.strip("\r\n")
+            if len(line.strip()) == 0:
+                continue
+            if line.strip() == "quit":
+                break
+
+            if "\t" in line:
+                input_file, output_file = line.split("\t", 1)
+                # no output file name: the default one is used
+                output_file = output_file.strip()
+                if len(output_file) == 0:
+                    output_file = None
+            else:
+                input_file, output_file = line, None
+            answer = sppasAnnotationServer.format_answer(
+                *self.__job(input_file.strip(), output_file))
+
+            if binary is True:
+                answer = answer.encode(sg.__encoding__)
+            outstream.write(answer)
+            outstream.flush()
+            nb += 1
+
+        return nb
+
+    # -----------------------------------------------------------------------
+
+    def serve_socket(self, address):
+        """Serve the jobs sent by the clients of a local (unix) socket.
+
+        Each client connection is processed like a stream of job lines.
+        Jobs are processed one after the other: the annotation is not
+        thread-safe.
+
+        :param address: (str) File name of the socket
+        :raises: AttributeError if unix sockets are not supported
+
+        """
+        if os.path.exists(address):
+            os.remove(address)
+        server = socketserver.UnixStreamServer(address, _JobsRequestHandler)
+        server.annotation_server = self
+        logging.info("Annotation server listening on {:s}".format(address))
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            if os.path.exists(address):
+                os.remove(address)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def format_answer(input_file, output_file, message):
+        """Return the answer line of a job.
+
+        :param input_file: (str)
+        :param output_file: (str or None)
+        :param message: (str) Error message if output_file is None
+
+        """
+        if output_file is None:
+            return "error\t{:s}\t{:s}\n".format(input_file, message)
+        return "ok\t{:s}\t{:s}\n".format(input_file, output_file)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __job(self, input_file, output_file=None):
+        """Process a job and return (input, output or None, message)."""
+        try:
+            output_file = self.process(input_file, output_file)
+            message = ""
+        except Exception as e:
+            output_file = None
+            message = str(e).replace("\n", " ")
+            logging.error("{:s}: {:s}".format(input_file, message))
+
+        return input_file, output_file, message
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __read_list(filename):
+        """Return the list of file names of a file (one per line)."""
+        files = list()
+        with codecs.open(filename, "r", sg.__encoding__) as fp:
+            for line in fp:
+                line = line.strip()
+                if len(line) > 0 and line.startswith("#") is False:
+                    files.append(line)
+        return files
+
+# ---------------------------------------------------------------------------
+
+
+class _JobsRequestHandler(socketserver.StreamRequestHandler):
+    """Process the job lines sent by a client of the socket."""
+
+    def handle(self):
+        self.server.annotation_server.serve(self.rfile, self.wfile)
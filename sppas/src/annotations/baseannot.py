@@ -38,6 +38,7 @@ import os
 import json
 
 import sppas.src.anndata.aio
+from sppas.src.anndata import sppasRW
 from sppas.src.config import annots
 from sppas.src.config import paths
 from sppas.src.config import info
@@ -45,6 +46,7 @@ from sppas.src.files import sppasFileUtils
 
 from .diagnosis import sppasDiagnosis
 from .log import sppasLog
+from .annpool import sppasLogRecorder
 
 # ---------------------------------------------------------------------------
 
@@ -85,6 +87,10 @@ class sppasBaseAnnotation(object):
         self._options = dict()
         self.name = self.__class__.__name__
 
+        # Transcriptions shared in memory with other annotations
+        self.__memory = None
+        self.__write_output = True
+
         # Then, fill in the values from a configuration file
         self.__load(config)
 
@@ -153,6 +159,26 @@ class sppasBaseAnnotation(object):
         """
         return self.__types
 
+    # -----------------------------------------------------------------------
+
+    def set_memory(self, memory=None, write_output=True):
+        """Share transcriptions in memory with other annotations.
+
+        The results of 'run_for_batch_processing' are added into the
+        memory, and the input transcriptions found in the memory are used
+        instead of reading the files.
+
+        :param memory: (dict) Transcriptions with a file name as key, or
+        None to disable the sharing.
+        :param write_output: (bool) Write the output file or only add the
+        result into the memory.
+
+        """
+        self.__memory = memory
+        self.__write_output = bool(write_output)
+        if memory is None:
+            self.__write_output = True
+
     # -----------------------------------------------------------------------
     # Load the linguistic resources
     # -----------------------------------------------------------------------
@@ -251,14 +277,19 @@ class sppasBaseAnnotation(object):
         out_name = self.get_out_name(input_file[0], output_format)
 
         # If out_name exists, it is overridden
-        if os.path.exists(out_name):
+        if self.__write_output is True and os.path.exists(out_name):
             self.logfile.print_message(
                 (info(1300, "annotations")).format(out_name) + " " +
                 info(1304, "annotations"), indent=2, status=annots.warning)
 
         # Execute annotation
         try:
-            self.run(input_file, opt_input_file, out_name)
+            if self.__write_output is True:
+                trs = self.run(input_file, opt_input_file, out_name)
+            else:
+                trs = self.run(input_file, opt_input_file)
+            if self.__memory is not None and trs is not None:
+                self.__memory[out_name] = trs
         except Exception as e:
             out_name = None
             self.logfile.print_message(
@@ -274,7 +305,8 @@ class sppasBaseAnnotation(object):
     def batch_processing(self,
                          file_names,
                          progress=None,
-                         output_format=annots.extension):
+                         output_format=annots.extension,
+                         pool=None):
         """Perform the annotation on a bunch of files.
 
         The given list of inputs can be either:
@@ -291,6 +323,8 @@ class sppasBaseAnnotation(object):
         :param file_names: (list) List of inputs
         :param progress: ProcessProgressTerminal() or ProcessProgressDialog()
         :param output_format: (str)
+        :param pool: (sppasAnnotationPool) Workers to process the files in
+        parallel, or None to process them one after the other.
         :returns: (list of str) List of created files
 
         """
@@ -304,27 +338,29 @@ class sppasBaseAnnotation(object):
         if progress:
             progress.update(0, "")
 
-        # Execute the annotation for each file in the list
-        for i, input_files in enumerate(file_names):
-
-            required_inputs, optional_inputs = self._split_inputs(input_files)
-            self.print_diagnosis(*required_inputs)
-            self.print_diagnosis(*optional_inputs)
-            if progress:
-                progress.set_fraction(round(float(i)/float(total), 2))
-                progress.set_text("{!s:s}".format(*required_inputs))
+        if pool is not None:
+            # Execute the annotation in parallel. Results and messages are
+            # received in the order of the list.
+            results = pool.process(file_names, output_format)
+            for i, (out_name, records) in enumerate(results):
+                sppasLogRecorder.replay(records, self.logfile)
+                if out_name is not None:
+                    files_processed_success.append(out_name)
+                if progress:
+                    progress.set_fraction(round(float(i+1)/float(total), 2))
+                    progress.set_text("{!s:s}".format(file_names[i]))
 
-            out_name = self.run_for_batch_processing(required_inputs,
-                                                     optional_inputs,
-                                                     output_format)
+        else:
+            # Execute the annotation for each file in the list
+            for i, input_files in enumerate(file_names):
+                if progress:
+                    required_inputs, _ = self._split_inputs(input_files)
+                    progress.set_fraction(round(float(i)/float(total), 2))
+                    progress.set_text("{!s:s}".format(*required_inputs))
 
-            if out_name is None:
-                self.logfile.print_message(
-                    info(1306, "annotations"), indent=1, status=annots.info)
-            else:
-                files_processed_success.append(out_name)
-                self.logfile.print_message(out_name, indent=1, status=annots.ok)
-            self.logfile.print_newline()
+                out_name = self.run_batch_job(input_files, output_format)
+                if out_name is not None:
+                    files_processed_success.append(out_name)
 
         # Indicate completed!
         if progress:
@@ -335,6 +371,33 @@ class sppasBaseAnnotation(object):
 
     # -----------------------------------------------------------------------
 
+    def run_batch_job(self, input_files, output_format=annots.extension):
+        """Perform the annotation on one of the inputs of a batch.
+
+        :param input_files: (str, list, tuple) See batch_processing()
+        :param output_format: (str)
+        :returns: output file name or None
+
+        """
+        required_inputs, optional_inputs = self._split_inputs(input_files)
+        self.print_diagnosis(*required_inputs)
+        self.print_diagnosis(*optional_inputs)
+
+        out_name = self.run_for_batch_processing(required_inputs,
+                                                 optional_inputs,
+                                                 output_format)
+
+        if out_name is None:
+            self.logfile.print_message(
+                info(1306, "annotations"), indent=1, status=annots.info)
+        else:
+            self.logfile.print_message(out_name, indent=1, status=annots.ok)
+        self.logfile.print_newline()
+
+        return out_name
+
+    # -----------------------------------------------------------------------
+
     def _split_inputs(self, input_files):
         """Return required and optional inputs from the input files.
 
@@ -382,7 +445,7 @@ class sppasBaseAnnotation(object):
                         optional_inputs = input_files[1]
 
         for fn in required_inputs:
-            if os.path.exists(fn) is False:
+            if os.path.exists(fn) is False and self.__in_memory(fn) is False:
                 msg = info(1308, "annotations") + " " + (info(1310, "annotations")).format(fn)
                 self.print_filename(input_files[0])
                 self.logfile.print_message(msg, indent=1, status=annots.error)
@@ -392,6 +455,27 @@ class sppasBaseAnnotation(object):
 
         return required_inputs, optional_inputs
 
+    # -----------------------------------------------------------------------
+
+    def _read_transcription(self, filename):
+        """Return the transcription of a file, from the memory if possible.
+
+        :param filename: (str) Name of an input file
+        :returns: (sppasTranscription)
+
+        """
+        if self.__in_memory(filename) is True:
+            return self.__memory[filename]
+
+        parser = sppasRW(filename)
+        return parser.read()
+
+    # -----------------------------------------------------------------------
+
+    def __in_memory(self, filename):
+        """Return True if the transcription of a file is in the memory."""
+        return self.__memory is not None and filename in self.__memory
+
     # -----------------------------------------------------------------------
     # To communicate with the interface:
     # -----------------------------------------------------------------------
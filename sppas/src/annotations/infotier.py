@@ -114,5 +114,7 @@ class sppasMetaInfoTier(sppasMetaInfo):
             ann_begin = ann_end
             ann_end = ann_begin + ann_dur
 
-        tier[-1].get_location().get_best().set_end(sppasPoint(end))
+        localization = tier[-1].get_location().get_best()
+        localization.set_end(sppasPoint(end))
+        tier[-1].set_best_localization(localization)
         return tier
@@ -60,6 +60,9 @@ from sppas.src.annotations.SelfRepet import sppasSelfRepet
 from sppas.src.annotations.OtherRepet import sppasOtherRepet
 
 from .infotier import sppasMetaInfoTier
+from .annpool import sppasAnnotationPool
+from .annpool import sppasLogRecorder
+from .pipeline import sppasAnnotationsPipeline
 from .log import sppasLog
 
 # ----------------------------------------------------------------------------
@@ -93,6 +96,10 @@ class sppasAnnotationsManager(Thread):
 
         # fix optional members
         self.__do_merge = False
+        self.__nb_workers = 1
+        self.__use_threads = False
+        self.__pipeline = False
+        self.__write_intermediates = True
 
         # start threading
         self.start()
@@ -109,6 +116,40 @@ class sppasAnnotationsManager(Thread):
         """
         self.__do_merge = do_merge
 
+    # -----------------------------------------------------------------------
+
+    def set_nb_workers(self, nb_workers=1, use_threads=False):
+        """Fix the number of files the annotations can process in parallel.
+
+        :param nb_workers: (int) Number of workers. 1 means to process the
+        files one after the other, 0 means the number of CPUs.
+        :param use_threads: (bool) Workers are threads instead of processes
+
+        """
+        nb_workers = int(nb_workers)
+        if nb_workers <= 0:
+            nb_workers = sppasAnnotationPool.cpu_count()
+        self.__nb_workers = nb_workers
+        self.__use_threads = bool(use_threads)
+
+    # -----------------------------------------------------------------------
+
+    def set_pipeline(self, pipeline=True, write_intermediates=True):
+        """Fix if the annotations are running as a pipeline.
+
+        In a pipeline, a file is annotated by an annotation as soon as it
+        was annotated by the previous ones, and the results are shared in
+        memory. The annotations of type INTERACTION are not part of the
+        pipeline: they are performed after it.
+
+        :param pipeline: (bool) Run annotations as a pipeline
+        :param write_intermediates: (bool) Write the results that are used
+        by another annotation of the pipeline.
+
+        """
+        self.__pipeline = bool(pipeline)
+        self.__write_intermediates = bool(write_intermediates)
+
     # ------------------------------------------------------------------------
     # Run annotations
     # ------------------------------------------------------------------------
@@ -137,12 +178,22 @@ class sppasAnnotationsManager(Thread):
 
         # Run all enabled annotations
         ann_stats = [-1] * self._parameters.get_step_numbers()
+        pipelined = list()
+        if self.__pipeline is True:
+            try:
+                pipelined = self._run_pipeline(ann_stats)
+            except Exception as e:
+                self._logfile.print_message(
+                    "{:s}\n".format(str(e)), indent=1, status=-1)
+                logging.info(traceback.format_exc())
 
         for i in range(self._parameters.get_step_numbers()):
 
-            # ignore disabled annotations
+            # ignore disabled annotations, or already performed ones
             if self._parameters.get_step_status(i) is False:
                 continue
+            if i in pipelined:
+                continue
 
             # ok, this annotation is enabled.
             annotation_key = self._parameters.get_step_key(i)
@@ -209,17 +260,42 @@ class sppasAnnotationsManager(Thread):
         auto_annot = self._get_instance(annotation_key)(self._logfile)
         self._fix_ann_options(annotation_key, auto_annot)
 
-        # Load language resources
-        if self._progress:
-            self._progress.set_text("Loading resources...")
-        step = self._parameters.get_step(step_idx)
-        auto_annot.load_resources(*step.get_langresource(), 
-                                  lang=step.get_lang())
+        # Load language resources.
+        # With several workers, each one is loading its own resources.
+        if self.__nb_workers <= 1 or self.__pipeline is True:
+            if self._progress:
+                self._progress.set_text("Loading resources...")
+            step = self._parameters.get_step(step_idx)
+            auto_annot.load_resources(*step.get_langresource(),
+                                      lang=step.get_lang())
 
         return auto_annot
 
     # -----------------------------------------------------------------------
 
+    def _create_ann_pool(self, annotation_key):
+        """Create the workers to process files with an annotation.
+
+        :param annotation_key: (str) Key of an annotation
+        :returns: sppasAnnotationPool or None if files are processed one
+        after the other.
+
+        """
+        if self.__nb_workers <= 1:
+            return None
+
+        step_idx = self._parameters.get_step_idx(annotation_key)
+        step = self._parameters.get_step(step_idx)
+        return sppasAnnotationPool(
+            self._get_instance(annotation_key),
+            self._parameters.get_options(step_idx),
+            step.get_langresource(),
+            step.get_lang(),
+            nb_workers=self.__nb_workers,
+            use_threads=self.__use_threads)
+
+    # -----------------------------------------------------------------------
+
     def _fix_ann_options(self, annotation_key, auto_annot):
         """Set the options to an automatic annotation.
 
@@ -256,7 +332,8 @@ class sppasAnnotationsManager(Thread):
         out_files = a.batch_processing(
             files_to_process,
             self._progress,
-            self._parameters.get_output_format())
+            self._parameters.get_output_format(),
+            self._create_ann_pool(annotation_key))
 
         self._parameters.add_to_workspace(out_files)
         return len(out_files)
@@ -285,7 +362,8 @@ class sppasAnnotationsManager(Thread):
         out_files = a.batch_processing(
             files,
             self._progress,
-            self._parameters.get_output_format())
+            self._parameters.get_output_format(),
+            self._create_ann_pool("fillipus"))
 
         self._parameters.add_to_workspace(out_files)
         return len(out_files)
@@ -333,11 +411,72 @@ class sppasAnnotationsManager(Thread):
         out_files = a.batch_processing(
             files,
             self._progress,
-            self._parameters.get_output_format())
+            self._parameters.get_output_format(),
+            self._create_ann_pool("alignment"))
 
         self._parameters.add_to_workspace(out_files)
         return len(out_files)
 
+    # -----------------------------------------------------------------------
+
+    def _run_pipeline(self, ann_stats):
+        """Execute the enabled annotations of type STANDALONE as a pipeline.
+
+        :param ann_stats: (list) Number of files processed successfully by
+        each annotation. It is filled in.
+        :returns: (list of int) Index of the annotations performed
+
+        """
+        steps = list()
+        for i in range(self._parameters.get_step_numbers()):
+            if self._parameters.get_step_status(i) is False:
+                continue
+            annotation_key = self._parameters.get_step_key(i)
+            types = self._get_instance(annotation_key)(self._logfile).get_types()
+            if len(types) == 0 or "STANDALONE" in types:
+                steps.append(i)
+
+        if len(steps) == 0:
+            return steps
+
+        if self._progress:
+            self._progress.set_new()
+            self._progress.set_header(
+                " + ".join(self._parameters.get_step_name(i) for i in steps))
+
+        pipeline = sppasAnnotationsPipeline(
+            self._parameters.get_output_format(),
+            self.__write_intermediates)
+        for i in steps:
+            annotation_key = self._parameters.get_step_key(i)
+            pipeline.add_step(annotation_key,
+                              self._create_ann_instance(annotation_key))
+
+        roots = [root.id for root in self._get_roots()]
+        results = pipeline.annotate(roots, self._progress)
+
+        # Print the log messages in the order of the steps then of the files
+        for s, (key, ann) in enumerate(pipeline.get_steps()):
+            i = steps[s]
+            self._logfile.print_step(i)
+            if len(ann._options) > 0:
+                ann.print_options()
+
+            out_files = list()
+            for result in results[s]:
+                if result is None:
+                    continue
+                out_name, records = result
+                sppasLogRecorder.replay(records, self._logfile)
+                if out_name is not None:
+                    out_files.append(out_name)
+
+            if pipeline.is_written(s) is True:
+                self._parameters.add_to_workspace(out_files)
+            ann_stats[i] = len(out_files)
+
+        return steps
+
     # -----------------------------------------------------------------------
     # Manage annotations:
     # -----------------------------------------------------------------------
@@ -346,7 +485,7 @@ class sppasAnnotationsManager(Thread):
 
         try:
             parser = sppasRW(trs_inputfile)
-            trs_input = parser.read(trs_inputfile)
+            trs_input = parser.read(lazy=True)
         except IOError:
             return 0
 
@@ -444,10 +583,7 @@ class sppasAnnotationsManager(Thread):
         else:
             pat_ext = extensions
 
-        roots = wkp.get_fileroot_from_state(States().CHECKED) + \
-                wkp.get_fileroot_from_state(States().AT_LEAST_ONE_CHECKED)
-
-        for root in roots:
+        for root in self._get_roots():
 
             new_file = sppasAnnotationsManager._get_filename(root.id, pat_ext)
             if new_file is None:
@@ -472,6 +608,14 @@ class sppasAnnotationsManager(Thread):
 
     # ------------------------------------------------------------------------
 
+    def _get_roots(self):
+        """Return the checked roots of the workspace."""
+        wkp = self._parameters.get_workspace()
+        return wkp.get_fileroot_from_state(States().CHECKED) + \
+            wkp.get_fileroot_from_state(States().AT_LEAST_ONE_CHECKED)
+
+    # ------------------------------------------------------------------------
+
     @staticmethod
     def _get_filename(rootname, extensions):
         """Return a filename corresponding to one of extensions.
@@ -0,0 +1,357 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.annotations.pipeline.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Run several automatic annotations on files as a pipeline.
+
+    The annotations depend on each other through the patterns of their
+    file names: the phonetization is expecting the output of the text
+    normalization, the alignment is expecting the output of the
+    phonetization, etc. The pipeline builds these dependencies and each
+    annotation processes a file as soon as the annotations it depends on
+    have processed it: a file can be aligned while the next one is still
+    normalized. The results are shared in memory: the intermediate files
+    are not read, and writing them is optional.
+
+"""
+
+import os
+import threading
+import traceback
+import logging
+try:  # python 3
+    import queue
+except ImportError:  # python 2
+    import Queue as queue
+
+import sppas.src.audiodata.aio
+import sppas.src.anndata.aio
+from sppas.src.config import annots
+from sppas.src.files import sppasFileUtils
+
+from .annpool import sppasLogRecorder
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAnnotationsPipeline(object):
+    """Run automatic annotations on files with a per-file dependency graph.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    Each annotation is running in its own thread, on the files of its
+    queue. The messages each annotation sends to its log are recorded and
+    returned with the results, in the order of the files.
+
+    >>> pipeline = sppasAnnotationsPipeline(".xra", write_intermediates=False)
+    >>> pipeline.add_step("textnorm", ann_textnorm)
+    >>> pipeline.add_step("phonetize", ann_phon)
+    >>> results = pipeline.annotate(["/data/file1", "/data/file2"])
+
+    """
+
+    def __init__(self, output_format=annots.extension, write_intermediates=True):
+        """Create a new sppasAnnotationsPipeline instance.
+
+        :param output_format: (str) Extension of the output files
+        :param write_intermediates: (bool) Write the results that are used
+        by another annotation of the pipeline. The other ones are always
+        written.
+
+        """
+        self.__output_format = output_format
+        self.__write_intermediates = bool(write_intermediates)
+        self.__steps = list()
+
+    # -----------------------------------------------------------------------
+
+    def add_step(self, key, annotation):
+        """Append an annotation to the pipeline.
+
+        The annotations must be added in the order of their dependencies.
+
+        :param key: (str) Key of the annotation, like "textnorm"
+        :param annotation: (sppasBaseAnnotation) with options and resources
+
+        """
+        self.__steps.append((key, annotation))
+
+    # -----------------------------------------------------------------------
+
+    def get_steps(self):
+        """Return the list of (key, annotation) of the pipeline."""
+        return list(self.__steps)
+
+    # -----------------------------------------------------------------------
+
+    def get_producers(self, step_idx):
+        """Return the index of the steps the given step depends on.
+
+        A step depends on the steps creating its inputs, and on the
+        previous step creating the same output file name.
+
+        :param step_idx: (int) Index of a step in the pipeline
+        :returns: (list of int)
+
+        """
+        producers = self.__get_input_producers(step_idx)
+        pattern = self.__steps[step_idx][1].get_pattern()
+        for i in reversed(range(step_idx)):
+            if self.__steps[i][1].get_pattern() == pattern:
+                if i not in producers:
+                    producers.append(i)
+                break
+
+        return producers
+
+    # -----------------------------------------------------------------------
+
+    def is_written(self, step_idx):
+        """Return True if the results of a step are written into files."""
+        if self.__write_intermediates is True:
+            return True
+        for i in range(step_idx + 1, len(self.__steps)):
+            if step_idx in self.__get_input_producers(i):
+                return False
+        return True
+
+    # -----------------------------------------------------------------------
+
+    def annotate(self, roots, progress=None):
+        """Run the pipeline on files.
+
+        :param roots: (list of str) Name of the files, without extension
+        :param progress: ProcessProgressTerminal() or ProcessProgressDialog()
+        :returns: (list) For each step, the list of the results of each root:
+        None if there was no input, or a tuple (output file name or None,
+        records of the log messages).
+
+        """
+        nb_steps = len(self.__steps)
+        total = nb_steps * len(roots)
+        results = [[None] * len(roots) for _ in range(nb_steps)]
+        if total == 0:
+            return results
+
+        producers = [self.get_producers(i) for i in range(nb_steps)]
+        consumers = [[j for j in range(nb_steps) if i in producers[j]]
+                     for i in range(nb_steps)]
+        written = [self.is_written(i) for i in range(nb_steps)]
+
+        # Transcriptions in memory and output file names of each root
+        memory = [dict() for _ in roots]
+        outputs = [dict() for _ in roots]
+        pending = [[len(producers[i])] * len(roots) for i in range(nb_steps)]
+        nb_done = [0] * len(roots)
+
+        # Start one thread for each annotation.
+        # Each annotation is used by only one thread.
+        done = queue.Queue()
+        jobs = [queue.Queue() for _ in range(nb_steps)]
+        logs = [ann.logfile for key, ann in self.__steps]
+        threads = list()
+        for i in range(nb_steps):
+            self.__steps[i][1].logfile = sppasLogRecorder()
+            t = threading.Thread(target=self.__stage,
+                                 args=(i, jobs[i], done, roots, memory,
+                                       outputs, written[i]))
+            t.daemon = True
+            t.start()
+            threads.append(t)
+
+        if progress:
+            progress.update(0, "")
+
+        try:
+            for i in range(nb_steps):
+                if len(producers[i]) == 0:
+                    for r in range(len(roots)):
+                        jobs[i].put(r)
+
+            for n in range(total):
+                i, r, result = done.get()
+                results[i][r] = result
+
+                # Next steps of this root can start when ready
+                for c in consumers[i]:
+                    pending[c][r] -= 1
+                    if pending[c][r] == 0:
+                        jobs[c].put(r)
+
+                # Free the memory when the root is finished
+                nb_done[r] += 1
+                if nb_done[r] == nb_steps:
+                    memory[r].clear()
+
+                if progress:
+                    progress.set_fraction(round(float(n+1)/float(total), 2))
+                    progress.set_text("{:s} ({:s})".format(
+                        os.path.basename(roots[r]), self.__steps[i][0]))
+        finally:
+            for i in range(nb_steps):
+                jobs[i].put(None)
+            for t in threads:
+                t.join()
+            for i in range(nb_steps):
+                self.__steps[i][1].logfile = logs[i]
+
+        if progress:
+            progress.update(1, "")
+
+        return results
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __get_input_producers(self, step_idx):
+        """Return the index of the steps creating the inputs of a step."""
+        key, ann = self.__steps[step_idx]
+        producers = list()
+        for pattern in self.__get_input_patterns(key, ann):
+            for i in reversed(range(step_idx)):
+                if self.__steps[i][1].get_pattern() == pattern:
+                    producers.append(i)
+                    break
+
+        return producers
+
+    # -----------------------------------------------------------------------
+
+    def __stage(self, step_idx, jobs, done, roots, memory, outputs, write):
+        """Process the roots of a queue with the annotation of a step."""
+        key, ann = self.__steps[step_idx]
+        while True:
+            r = jobs.get()
+            if r is None:
+                break
+
+            result = None
+            try:
+                inputs = self.__get_inputs(key, ann, roots[r], outputs[r])
+                if inputs is not None:
+                    ann.set_memory(memory[r], write)
+                    try:
+                        out_name = ann.run_batch_job(inputs,
+                                                     self.__output_format)
+                    finally:
+                        ann.set_memory(None)
+                    if out_name is not None:
+                        outputs[r][ann.get_pattern()] = out_name
+                    result = (out_name, ann.logfile.pop_records())
+
+            except Exception as e:
+                ann.logfile.print_message("{:s}\n".format(str(e)),
+                                          indent=1, status=annots.error)
+                logging.info(traceback.format_exc())
+                result = (None, ann.logfile.pop_records())
+
+            done.put((step_idx, r, result))
+
+    # -----------------------------------------------------------------------
+
+    def __get_inputs(self, key, ann, root, outputs):
+        """Return the inputs of an annotation for a root, or None."""
+        if key == "fillipus":
+            audio = self.__find(root, "", sppas.src.audiodata.aio.extensions)
+            if audio is None:
+                return None
+            return audio, os.path.splitext(audio)[0] + ".txt"
+
+        # The results of the previous steps are preferred to the files
+        patterns = self.__get_input_patterns(key, ann)
+        required = None
+        if len(patterns) > 0:
+            required = outputs.get(patterns[0], None)
+        if required is None:
+            required = self.__find(root, ann.get_input_pattern(),
+                                   ann.get_input_extensions())
+        if required is None:
+            return None
+
+        if key == "alignment":
+            tok = outputs.get(ann.get_opt_input_pattern(), None)
+            if tok is None:
+                tok = self.__find(root, ann.get_opt_input_pattern(),
+                                  sppas.src.anndata.aio.extensions_out)
+            audio = self.__find(root, "", sppas.src.audiodata.aio.extensions)
+            return [required], (audio, tok)
+
+        return required
+
+    # -----------------------------------------------------------------------
+
+    def __get_input_patterns(self, key, ann):
+        """Return the patterns of the transcriptions an annotation reads."""
+        if key == "fillipus" or self.__is_audio_input(ann) is True:
+            return []
+        extensions = [e.lower() for e in ann.get_input_extensions()]
+        if self.__output_format.lower() not in extensions:
+            return []
+
+        patterns = [ann.get_input_pattern()]
+        if key == "alignment":
+            patterns.append(ann.get_opt_input_pattern())
+        return patterns
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __is_audio_input(ann):
+        """Return True if an annotation is expecting an audio file."""
+        return ann.get_input_extensions() == sppas.src.audiodata.aio.extensions
+
+    # -----------------------------------------------------------------------
+
+    def __find(self, root, pattern, extensions):
+        """Return the name of an existing file of a root, or None."""
+        if len(pattern) > 0:
+            pat_ext = [pattern + self.__output_format]
+            for e in extensions:
+                pat_ext.append(pattern + e)
+        else:
+            pat_ext = extensions
+
+        if os.path.isdir(os.path.dirname(root)) is False:
+            return None
+        for ext in pat_ext:
+            filename = root + ext
+            new_filename = sppasFileUtils(filename).exists()
+            if new_filename is not None and os.path.isfile(new_filename):
+                return new_filename
+
+        return None
@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+"""
+A stand-in of the julius command in module mode, for the tests.
+
+It accepts the arguments of JuliusSession, loads the given grammar and
+dictionary, then for each audio file name read from stdin, it sends a
+forced-alignment result to the module client: the phonemes of the
+dictionary (first variant) are equally distributed over the audio frames
+(10ms). The CHANGEGRAM, GRAMINFO and DIE commands are supported.
+
+"""
+import sys
+import wave
+import codecs
+import socket
+import threading
+
+
+class FakeJulius(object):
+
+    def __init__(self, dfa, dictionary):
+        self.lock = threading.Lock()
+        self.grammar = "_default"
+        self.entries = self.parse_dict(
+            codecs.open(dictionary, "r", "utf-8").read())
+        self.client = None
+
+    @staticmethod
+    def parse_dict(content):
+        """Return a list of (word, phones) from a Julius dictionary."""
+        entries = list()
+        categories = set()
+        for line in content.split("\n"):
+            tab = line.split()
+            if len(tab) < 3:
+                continue
+            if tab[0] not in categories:
+                categories.add(tab[0])
+                entries.append((tab[1].strip("[]"), tab[2:]))
+        return entries
+
+    def send(self, message):
+        self.client.sendall((message + "\n.\n").encode("utf-8"))
+
+    def commands(self, stream):
+        """Read the commands of the module client."""
+        while True:
+            line = stream.readline()
+            if not line:
+                break
+            line = line.decode("utf-8").strip()
+            if line.startswith("CHANGEGRAM"):
+                name = line[10:].strip()
+                while stream.readline().decode("utf-8").strip() != "DFAEND":
+                    pass
+                content = list()
+                while True:
+                    l = stream.readline().decode("utf-8")
+                    if l.strip() == "DICEND":
+                        break
+                    content.append(l)
+                with self.lock:
+                    self.grammar = name
+                    self.entries = self.parse_dict("".join(content))
+                sys.stdout.write("STAT: Gram #0 {:s}: installed\n"
+                                 "".format(name))
+                sys.stdout.flush()
+            elif line == "GRAMINFO":
+                with self.lock:
+                    self.send("<GRAMINFO>\n  #0: [active] {:s}\n</GRAMINFO>"
+                              "".format(self.grammar))
+            elif line == "DIE":
+                break
+
+    def recognize(self, filename):
+        """Send the result of an audio file."""
+        w = wave.open(filename, "rb")
+        nb_frames = int(100. * w.getnframes() / w.getframerate())
+        w.close()
+        sys.stdout.write("### read waveform input\n")
+        sys.stdout.flush()
+
+        with self.lock:
+            entries = list(self.entries)
+        phones = [p for word, pron in entries for p in pron]
+        if len(phones) == 0 or nb_frames < len(phones):
+            self.send("<RECOGFAIL/>")
+            return
+
+        step = nb_frames // len(phones)
+        result = ["<RECOGOUT>", '  <SHYPO RANK="1" SCORE="-100.0" GRAM="0">']
+        for word, pron in entries:
+            result.append('    <WHYPO WORD="{:s}" CLASSID="0" PHONE="{:s}" '
+                          'CM="1.000"/>'.format(word, " ".join(pron)))
+        result.append("  </SHYPO>")
+        result.append('  <ALIGN TYPE="phoneme">')
+        for i, phone in enumerate(phones):
+            end = (i + 1) * step - 1
+            if i == len(phones) - 1:
+                end = nb_frames - 1
+            result.append('    <PHONEME BEGINFRAME="{:d}" ENDFRAME="{:d}" '
+                          'SCORE="-30.0" PHONE="{:s}"/>'
+                          ''.format(i * step, end, phone))
+        result.append("  </ALIGN>")
+        result.append("</RECOGOUT>")
+        self.send('<INPUT STATUS="STARTREC" TIME="0"/>')
+        self.send("\n".join(result))
+
+
+def main(argv):
+    args = dict()
+    i = 0
+    while i < len(argv):
+        if argv[i] in ("-module", "-dfa", "-v", "-h"):
+            args[argv[i]] = argv[i + 1]
+            i += 1
+        i += 1
+
+    julius = FakeJulius(args["-dfa"], args["-v"])
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    server.bind(("127.0.0.1", int(args["-module"])))
+    server.listen(1)
+    sys.stdout.write("STAT: All init successfully done\n")
+    sys.stdout.flush()
+
+    julius.client, _ = server.accept()
+    reader = threading.Thread(target=julius.commands,
+                              args=(julius.client.makefile("rb"),))
+    reader.daemon = True
+    reader.start()
+
+    while reader.is_alive():
+        line = sys.stdin.readline()
+        if not line:
+            break
+        julius.recognize(line.strip())
+
+    julius.client.close()
+    server.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
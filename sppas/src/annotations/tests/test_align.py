@@ -58,6 +58,9 @@ from ..Align.tracksio import TrackNamesGenerator
 from ..Align.tracksio import TracksWriter
 from ..Align.tracksio import TracksReader
 from ..Align.tracksio import TracksReaderWriter
+from ..Align.tracksio import TrackData
+from ..Align.aligners.alignerio import AlignerIO
+import sppas.src.audiodata.aio as audioaio
 from ..Align.sppasalign import sppasAlign
 
 # ---------------------------------------------------------------------------
@@ -418,6 +421,73 @@ class TestTracksReaderWriter(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_create_tracks(self):
+        """Test to create tracks in memory, like the track files."""
+        audio = os.path.join(DATA, "oriana1.wav")
+        t = sppasXRA()
+        t.read(os.path.join(DATA, "oriana1-phon.xra"))
+        t.read(os.path.join(DATA, "oriana1-token.xra"))
+        mapping = sppasMapping(os.path.join(DATA, "monophones.repl"))
+
+        trks = TracksReaderWriter(mapping)
+        tracks = trks.create_tracks(audio, t.find('Phones'), t.find('Tokens'))
+        self.assertEqual(7, len(tracks))
+        self.assertEqual(2, tracks[1].get_number())
+        self.assertEqual("the flight was twelve hours long and "
+                         "we really got bored", tracks[1].get_tokens())
+        self.assertTrue(tracks[1].get_phones().startswith(
+            "dh-ax|dh-iy|dh-ah f-l-ay-t "))
+        self.assertIsInstance(tracks[1].get_audio(), memoryview)
+
+        # The files of the tracks are the same than the split ones
+        t = sppasXRA()
+        t.read(os.path.join(DATA, "oriana1-phon.xra"))
+        t.read(os.path.join(DATA, "oriana1-token.xra"))
+        temp1 = os.path.join(TEMP, "split")
+        temp2 = os.path.join(TEMP, "memory")
+        os.mkdir(temp1)
+        os.mkdir(temp2)
+        TracksReaderWriter(mapping).split_into_tracks(
+            audio, t.find('Phones'), t.find('Tokens'), temp1)
+        trks.write_tracks(tracks, temp2)
+        self.assertEqual(sorted(os.listdir(temp1)), sorted(os.listdir(temp2)))
+        self.assertEqual(ListOfTracks.read(temp1), ListOfTracks.read(temp2))
+        for track in tracks:
+            a1 = audioaio.open(TrackNamesGenerator.audio_filename(
+                temp1, track.get_number()))
+            frames = a1.read_frames(a1.get_nframes())
+            duration = a1.get_duration()
+            a1.close()
+            self.assertEqual(frames, track.get_audio().tobytes())
+            self.assertEqual(duration, track.get_duration())
+
+    # -----------------------------------------------------------------------
+
+    def test_merge_tracks(self):
+        trks = TracksReaderWriter(sppasMapping(
+            os.path.join(DATA, "monophones.repl")
+        ))
+        tracks = list()
+        for i, unit in enumerate(ListOfTracks.read(DATA)):
+            track = TrackData(i + 1, unit)
+            try:
+                track.set_aligned(*AlignerIO.read_aligned(
+                    TrackNamesGenerator.align_filename(DATA, i + 1)))
+            except IOError:
+                pass
+            tracks.append(track)
+
+        expected = trks.read_aligned_tracks(DATA)
+        merged = trks.merge_tracks(tracks)
+        for tier1, tier2 in zip(expected, merged):
+            self.assertEqual(tier1.get_name(), tier2.get_name())
+            self.assertEqual(len(tier1), len(tier2))
+            for a1, a2 in zip(tier1, tier2):
+                self.assertEqual(a1.get_location(), a2.get_location())
+                self.assertEqual(a1.serialize_labels(), a2.serialize_labels())
+
+    # -----------------------------------------------------------------------
+
     def test_read_aligned_tracks(self):
         trks = TracksReaderWriter(sppasMapping(
             os.path.join(DATA, "monophones.repl")
@@ -438,6 +508,14 @@ class TestTracksReaderWriter(unittest.TestCase):
         self.assertEqual("D-@", tier_pron[1].serialize_labels())
         self.assertEqual("f-l-aI-t", tier_pron[2].serialize_labels())
 
+        # the same tiers, in columns
+        columns = trks.read_aligned_tracks(DATA, columns=True)
+        for tier1, tier2 in zip((tier_phn, tier_tok, tier_pron), columns):
+            self.assertEqual(tier1.get_name(), tier2.get_name())
+            self.assertEqual(len(tier1), len(tier2))
+            for a1, a2 in zip(tier1, tier2):
+                self.assertEqual(a1, a2)
+
 # ---------------------------------------------------------------------------
 
 
@@ -495,6 +573,40 @@ class TestAlign(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_convert_workers(self):
+        model = os.path.join(paths.resources, "models", 'models-eng')
+        audio = os.path.join(DATA, "oriana1.wav")
+        t = sppasXRA()
+        t.read(os.path.join(DATA, "oriana1-phon.xra"))
+        t.read(os.path.join(DATA, "oriana1-token.xra"))
+        phn_tier = t.find('Phones')
+        tok_tier = t.find('Tokens')
+
+        results = list()
+        for aligner, nb_workers in (("basic", 1), ("basic", 4),
+                                    ("julius", 3)):
+            a = sppasAlign()
+            a.load_resources(model)
+            a.set_basic(True)
+            a.set_aligner(aligner)
+            a.set_workers(nb_workers)
+            workdir = os.path.join(TEMP, str(len(results)))
+            os.mkdir(workdir)
+            tiers = a.convert(phn_tier, tok_tier, audio, workdir)
+            results.append([[(ann.get_location().get_best().get_begin(),
+                              ann.get_location().get_best().get_end(),
+                              ann.serialize_labels())
+                             for ann in tier] for tier in tiers])
+
+        # the merge of the tracks does not depend on the order they were
+        # aligned in
+        self.assertEqual(results[0], results[1])
+        for result in results:
+            self.assertEqual(123, len(result[0]))
+            self.assertEqual(39, len(result[1]))
+
+    # -----------------------------------------------------------------------
+
     def test_samples_fra(self):
         """... Compare if the current result is the same as the existing one."""
         self.compare_samples("fra")
@@ -35,13 +35,17 @@
 """
 import unittest
 import os
+import sys
+import shutil
 
 from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
 
 from ..Align.aligners import sppasAligners
 from ..Align.aligners.basealigner import BaseAligner
 from ..Align.aligners.basicalign import BasicAligner
 from ..Align.aligners.juliusalign import JuliusAligner
+from ..Align.aligners.juliussession import JuliusSession
 from ..Align.aligners.hvitealign import HviteAligner
 from ..Align.aligners.alignerio import BaseAlignersReader
 from ..Align.aligners.alignerio import palign, walign, mlf
@@ -51,6 +55,8 @@ from ..Align.aligners.alignerio import palign, walign, mlf
 MODELDIR = os.path.join(paths.resources, "models")
 sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")  # mono; 16000Hz; 16bits
 DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+FAKE_JULIUS = [sys.executable, os.path.join(DATA, "fakejulius.py")]
+TEMP = sppasFileUtils().set_random()
 
 # ---------------------------------------------------------------------------
 
@@ -287,6 +293,89 @@ class TestJuliusAlign(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+class TestJuliusSession(unittest.TestCase):
+    """A Julius process to align all the tracks (with a fake julius)."""
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+        self._modeldir = os.path.join(MODELDIR, "models-eng")
+        self._aligner = JuliusAligner(self._modeldir)
+        for i in (1, 2):
+            shutil.copy(os.path.join(DATA, "track_00000{:d}.wav".format(i)),
+                        TEMP)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    def test_open_session(self):
+        self.assertIsNone(JuliusAligner().open_session())
+        self.assertIsNone(BasicAligner().open_session())
+        session = self._aligner.open_session()
+        self.assertIsInstance(session, JuliusSession)
+        self.assertFalse(session.is_running())
+
+    def test_format_result(self):
+        message = ['<RECOGOUT>',
+                   '<WHYPO WORD="the" CLASSID="0" PHONE="dh ax" CM="0.618"/>',
+                   '<WHYPO WORD="end" CLASSID="1" PHONE="eh n d" CM="1.0"/>',
+                   '<PHONEME BEGINFRAME="0" ENDFRAME="2" SCORE="-3.5" PHONE="dh"/>',
+                   '<PHONEME BEGINFRAME="3" ENDFRAME="5" SCORE="-1" PHONE="ax"/>',
+                   '</RECOGOUT>']
+        lines = JuliusSession.format_result(message)
+        self.assertEqual(["the", "end"],
+                         BaseAlignersReader.get_words_julius(lines))
+        self.assertEqual([("dh", "ax"), ("eh", "n", "d")],
+                         BaseAlignersReader.get_phonemes_julius(lines))
+        self.assertEqual([(0, 2), (3, 5)],
+                         BaseAlignersReader.get_units_julius(lines))
+        lines = JuliusSession.format_result(["<RECOGFAIL/>"])
+        self.assertTrue(lines[0].startswith("Error:"))
+
+    def test_align_tracks(self):
+        session = JuliusSession(self._modeldir, command=FAKE_JULIUS)
+        self._aligner.set_session(session)
+        data = (("dh-ax f-l-ay-t", "the flight"),
+                ("w-ax-z|w-aa-z t-w-eh-l-v aw-er-z", "was twelve hours"))
+        try:
+            for i, (phones, tokens) in enumerate(data):
+                self._aligner.set_phones(phones)
+                self._aligner.set_tokens(tokens)
+                wav = os.path.join(TEMP, "track_00000{:d}.wav".format(i+1))
+                out = os.path.join(TEMP, "track_00000{:d}".format(i+1))
+                self._aligner.run_alignment(wav, out)
+                self.assertTrue(session.is_running())
+
+                phons, toks, prons = palign.read(out + ".palign")
+                self.assertEqual(tokens.split(), [t[2] for t in toks])
+                self.assertEqual(phones.replace("|w-aa-z", "").split(),
+                                 [p[2] for p in prons])
+                self.assertEqual(0., phons[0][0])
+        finally:
+            session.close()
+
+        # Julius was started only once for all the tracks.
+        self.assertEqual(1, session.get_nb_starts())
+        self.assertFalse(session.is_running())
+        self.assertFalse(session.is_failed())
+
+    def test_failed_session(self):
+        session = JuliusSession(self._modeldir,
+                                command=[os.path.join(TEMP, "nojulius")])
+        self._aligner.set_phones("dh-ax f-l-ay-t")
+        self._aligner.set_tokens("the flight")
+        self._aligner.gen_grammar_dependencies(
+            os.path.join(TEMP, "track_000001"))
+        with self.assertRaises(OSError):
+            session.align(os.path.join(TEMP, "track_000001.wav"),
+                          os.path.join(TEMP, "track_000001"),
+                          os.path.join(TEMP, "track_000001.palign"))
+        self.assertTrue(session.is_failed())
+        self.assertFalse(session.is_running())
+
+# ---------------------------------------------------------------------------
+
+
 class TestHviteAlign(unittest.TestCase):
 
     def setUp(self):
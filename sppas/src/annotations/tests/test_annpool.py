@@ -0,0 +1,156 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.annotations.tests.test_annpool.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+    :summary:      Test the pool of workers to annotate files in parallel.
+
+"""
+import unittest
+import os
+import shutil
+import codecs
+
+from sppas.src.config import sg
+from sppas.src.config import annots
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..TextNorm.sppastextnorm import sppasTextNorm
+from ..annpool import sppasAnnotationPool
+from ..annpool import sppasLogRecorder
+
+# ---------------------------------------------------------------------------
+
+TEMP = sppasFileUtils().set_random()
+
+# ---------------------------------------------------------------------------
+
+
+class TestAnnotationPool(unittest.TestCase):
+    """Annotate files with a pool of workers."""
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+        self.vocab = os.path.join(TEMP, "fra.vocab")
+        with codecs.open(self.vocab, "w", sg.__encoding__) as fp:
+            fp.write(u"bonjour\nau\nrevoir\nmerci\n")
+
+        self.files = list()
+        for name, text in (("a.txt", u"bonjour"),
+                           ("b.txt", u"au revoir"),
+                           ("c.txt", u"merci")):
+            filename = os.path.join(TEMP, name)
+            with codecs.open(filename, "w", sg.__encoding__) as fp:
+                fp.write(text)
+            self.files.append(filename)
+        # a missing file is in the middle of the list
+        self.files.insert(1, os.path.join(TEMP, "x.txt"))
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_log_recorder(self):
+        log = sppasLogRecorder()
+        log.print_message("message", indent=1, status=annots.ok)
+        log.print_newline()
+        with self.assertRaises(AttributeError):
+            log.close()
+        records = log.pop_records()
+        self.assertEqual(2, len(records))
+        self.assertEqual(("print_message", ("message", ),
+                          {"indent": 1, "status": annots.ok}), records[0])
+        self.assertEqual(0, len(log.pop_records()))
+
+        other = sppasLogRecorder()
+        sppasLogRecorder.replay(records, other)
+        self.assertEqual(records, other.pop_records())
+
+    # -----------------------------------------------------------------------
+
+    def test_nb_workers(self):
+        pool = sppasAnnotationPool(sppasTextNorm, nb_workers=3)
+        self.assertEqual(3, pool.get_nb_workers())
+        pool.set_nb_workers(0)
+        self.assertEqual(sppasAnnotationPool.cpu_count(), pool.get_nb_workers())
+
+    # -----------------------------------------------------------------------
+
+    def test_process(self):
+        for use_threads in (True, False):
+            pool = sppasAnnotationPool(sppasTextNorm,
+                                       resources=(self.vocab, ),
+                                       lang="fra",
+                                       nb_workers=2,
+                                       use_threads=use_threads)
+            results = list(pool.process(self.files, ".xra"))
+            self.assertEqual(4, len(results))
+            # results are in the order of the files
+            self.assertEqual(os.path.join(TEMP, "a-token.xra"), results[0][0])
+            self.assertIsNone(results[1][0])
+            self.assertEqual(os.path.join(TEMP, "b-token.xra"), results[2][0])
+            self.assertEqual(os.path.join(TEMP, "c-token.xra"), results[3][0])
+            for out_name, records in results:
+                self.assertTrue(len(records) > 0)
+                if out_name is not None:
+                    self.assertTrue(os.path.exists(out_name))
+                    os.remove(out_name)
+
+    # -----------------------------------------------------------------------
+
+    def test_batch_processing(self):
+        log = sppasLogRecorder()
+        ann = sppasTextNorm(log)
+        pool = sppasAnnotationPool(sppasTextNorm,
+                                   resources=(self.vocab, ),
+                                   lang="fra",
+                                   nb_workers=2)
+        out_files = ann.batch_processing(self.files, output_format=".xra",
+                                         pool=pool)
+        self.assertEqual([os.path.join(TEMP, "a-token.xra"),
+                          os.path.join(TEMP, "b-token.xra"),
+                          os.path.join(TEMP, "c-token.xra")], out_files)
+
+        # The messages of the workers were replayed in the order of files
+        messages = [args[0] for name, args, kwargs in log.pop_records()
+                    if name == "print_message"]
+        ok = [m for m in messages if m in out_files]
+        self.assertEqual(out_files, ok)
+
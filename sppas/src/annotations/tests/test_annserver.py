@@ -0,0 +1,159 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.annotations.tests.test_annserver.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+    :summary:      Test the annotation server (batch and server modes).
+
+"""
+import unittest
+import os
+import io
+import shutil
+import codecs
+
+from sppas.src.config import sg
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..TextNorm.sppastextnorm import sppasTextNorm
+from ..annserver import sppasAnnotationServer
+
+# ---------------------------------------------------------------------------
+
+TEMP = sppasFileUtils().set_random()
+
+# ---------------------------------------------------------------------------
+
+
+class TestAnnotationServer(unittest.TestCase):
+    """Apply an annotation on a stream of files."""
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+        for name, text in (("a.txt", u"bonjour"), ("b.txt", u"au revoir")):
+            with codecs.open(os.path.join(TEMP, name), "w", sg.__encoding__) as fp:
+                fp.write(text)
+        with codecs.open(os.path.join(TEMP, "c.lst"), "w", sg.__encoding__) as fp:
+            fp.write(os.path.join(TEMP, "b.txt") + "\n")
+            fp.write("# a comment\n")
+
+        self.ann = sppasTextNorm()
+        self.ann.load_resources(os.path.join(paths.resources, "vocab", "fra.vocab"),
+                                lang="fra")
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_get_input_files(self):
+        a = os.path.join(TEMP, "a.txt")
+        b = os.path.join(TEMP, "b.txt")
+        self.assertEqual([a, b], sppasAnnotationServer.get_input_files(
+            [TEMP], [".txt"]))
+        self.assertEqual([a, b], sppasAnnotationServer.get_input_files(
+            [os.path.join(TEMP, "*.txt"), a]))
+        self.assertEqual([b], sppasAnnotationServer.get_input_files(
+            ["@" + os.path.join(TEMP, "c.lst")]))
+        self.assertEqual(3, len(sppasAnnotationServer.get_input_files(
+            [TEMP])))
+
+    # -----------------------------------------------------------------------
+
+    def test_out_name(self):
+        server = sppasAnnotationServer(self.ann, "csv")
+        self.assertEqual(os.path.join(TEMP, "a-token.csv"),
+                         server.get_out_name(os.path.join(TEMP, "a.txt")))
+        out_dir = os.path.join(TEMP, "out")
+        os.mkdir(out_dir)
+        server = sppasAnnotationServer(self.ann, ".csv", out_dir)
+        self.assertEqual(os.path.join(out_dir, "a-token.csv"),
+                         server.get_out_name(os.path.join(TEMP, "a.txt")))
+        with self.assertRaises(IOError):
+            sppasAnnotationServer(self.ann, ".csv", os.path.join(TEMP, "x"))
+
+    # -----------------------------------------------------------------------
+
+    def test_batch(self):
+        server = sppasAnnotationServer(self.ann, ".xra")
+        results = list(server.batch([TEMP, os.path.join(TEMP, "x.txt")],
+                                    [".txt"]))
+        self.assertEqual(3, len(results))
+        for in_name, out_name, msg in results[:2]:
+            self.assertTrue(os.path.exists(out_name))
+            self.assertEqual("", msg)
+        self.assertIsNone(results[2][1])
+        self.assertTrue(len(results[2][2]) > 0)
+
+    # -----------------------------------------------------------------------
+
+    def test_serve(self):
+        server = sppasAnnotationServer(self.ann, ".xra")
+        a = os.path.join(TEMP, "a.txt")
+        out = os.path.join(TEMP, "out.xra")
+        jobs = u"{:s}\t{:s}\n\nx.txt\nquit\n{:s}\n".format(a, out, a)
+        instream = io.StringIO(jobs)
+        outstream = io.StringIO()
+        self.assertEqual(2, server.serve(instream, outstream))
+
+        answers = outstream.getvalue().splitlines()
+        self.assertEqual(u"ok\t{:s}\t{:s}".format(a, out), answers[0])
+        self.assertTrue(answers[1].startswith(u"error\tx.txt\t"))
+        self.assertTrue(os.path.exists(out))
+        self.assertFalse(os.path.exists(os.path.join(TEMP, "a-token.xra")))
+
+        # the output file name is stripped, and the default one is used
+        # if it is empty
+        b = os.path.join(TEMP, "b.txt")
+        out = os.path.join(TEMP, "out2.xra")
+        instream = io.StringIO(u"{:s}\t\n{:s}\t {:s}\n".format(a, b, out))
+        outstream = io.StringIO()
+        self.assertEqual(2, server.serve(instream, outstream))
+        answers = outstream.getvalue().splitlines()
+        self.assertTrue(answers[0].startswith(u"ok\t"))
+        self.assertTrue(os.path.exists(os.path.join(TEMP, "a-token.xra")))
+        self.assertEqual(u"ok\t{:s}\t{:s}".format(b, out), answers[1])
+        self.assertTrue(os.path.exists(out))
+
+        # bytes in, bytes out (like the stream of a socket)
+        instream = io.BytesIO(a.encode(sg.__encoding__) + b"\n")
+        outstream = io.BytesIO()
+        self.assertEqual(1, server.serve(instream, outstream))
+        self.assertTrue(outstream.getvalue().startswith(b"ok\t"))
@@ -41,10 +41,20 @@
 
 """
 import unittest
+import os.path
+import random
 import struct
 
+from sppas.src.config import paths
 from sppas.src.annotations.SearchIPUs.silences import sppasSilences
+from sppas.src.annotations.SearchIPUs.searchipus import SearchIPUs
+from sppas.src.annotations.SearchIPUs.streamipus import sppasStreamIPUs
+from sppas.src.annotations.SearchIPUs.sppassearchipus import sppasSearchIPUs
 from sppas.src.audiodata import sppasChannel
+from sppas.src.audiodata.aio import open as audio_open
+
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+sample_48k = os.path.join(paths.samples, "samples-deu", "DEU_F10_DEU_T02.wav")
 
 # ---------------------------------------------------------------------------
 
@@ -191,3 +201,128 @@ class TestSilences(unittest.TestCase):
 
 # ---------------------------------------------------------------------------
 
+
+class TestStreamIPUs(unittest.TestCase):
+    """Test the search of IPUs block by block.
+
+    """
+
+    def setUp(self):
+        audio = audio_open(sample_1)
+        audio.extract_channel(0)
+        self.channel = audio.get_channel(0)
+        audio.close()
+
+    # -----------------------------------------------------------------------
+
+    def stream_tracks(self, stream, frames, max_size):
+        """Return the tracks of the frames appended by random blocks."""
+        tracks = list()
+        i = 0
+        while i < len(frames):
+            n = random.randint(1, max_size) * 2
+            tracks.extend(stream.append(frames[i:i+n]))
+            i += n
+        tracks.extend(stream.flush())
+        return tracks
+
+    # -----------------------------------------------------------------------
+
+    def test_same_tracks(self):
+        """The tracks are the same as the ones of SearchIPUs."""
+        random.seed(9)
+        frames = self.channel.get_frames()
+        for threshold in (0, 200, 700, 1500):
+            for min_sil, min_ipu, shift in ((0.25, 0.3, 0.02),
+                                            (0.2, 0.1, 0.),
+                                            (0.5, 0.6, -0.04)):
+                searcher = SearchIPUs(self.channel)
+                searcher.set_vol_threshold(threshold)
+                searcher.set_min_sil(min_sil)
+                searcher.set_min_ipu(min_ipu)
+                searcher.set_shift_start(shift)
+                searcher.set_shift_end(shift)
+                stream = sppasStreamIPUs(16000, 2)
+                stream.set_vol_threshold(threshold)
+                stream.set_min_sil(min_sil)
+                stream.set_min_ipu(min_ipu)
+                stream.set_shift_start(shift)
+                stream.set_shift_end(shift)
+                if threshold == 0:
+                    stream.set_warmup(60.)
+                tracks = self.stream_tracks(stream, frames, 20000)
+                self.assertEqual(searcher.get_tracks(), tracks)
+                self.assertGreater(len(tracks), 0)
+
+        # small blocks
+        stream = sppasStreamIPUs(16000, 2)
+        stream.set_vol_threshold(700)
+        searcher = SearchIPUs(sppasChannel(16000, 2, frames[:64000]))
+        searcher.set_vol_threshold(700)
+        self.assertEqual(searcher.get_tracks(),
+                         self.stream_tracks(stream, frames[:64000], 50))
+        self.assertEqual([], stream.flush())
+
+    # -----------------------------------------------------------------------
+
+    def test_same_tracks_48k(self):
+        """The tracks are the same as the ones of SearchIPUs at 48kHz."""
+        audio = audio_open(sample_48k)
+        audio.extract_channel(0)
+        channel = audio.get_channel(0)
+        audio.close()
+        framerate = channel.get_framerate()
+        sampwidth = channel.get_sampwidth()
+        self.assertEqual(48000, framerate)
+        frames = channel.get_frames()
+
+        searcher = SearchIPUs(channel)
+        searcher.set_vol_threshold(400)
+        expected = searcher.get_tracks()
+        self.assertGreater(len(expected), 0)
+        for block in (1000, 4096, 65536):
+            stream = sppasStreamIPUs(framerate, sampwidth)
+            stream.set_vol_threshold(400)
+            tracks = list()
+            for i in range(0, len(frames), block * sampwidth):
+                tracks.extend(stream.append(frames[i:i + block * sampwidth]))
+            tracks.extend(stream.flush())
+            self.assertEqual(expected, tracks, block)
+
+    # -----------------------------------------------------------------------
+
+    def test_stream(self):
+        """The tracks are returned as soon as they are found."""
+        frames = self.channel.get_frames()
+        stream = sppasStreamIPUs(16000, 2)
+        stream.set_vol_threshold(700)
+        tracks = stream.append(frames[:len(frames) // 2])
+        self.assertGreater(len(tracks), 0)
+        self.assertEqual(len(frames) // 4, stream.get_nframes())
+        tracks.extend(stream.append(frames[len(frames) // 2:]))
+        tracks.extend(stream.flush())
+        self.assertEqual(0, stream.get_nframes())
+
+        searcher = SearchIPUs(self.channel)
+        searcher.set_vol_threshold(700)
+        self.assertEqual(searcher.get_tracks(), tracks)
+
+        # nothing is returned during the warm-up of an automatic threshold
+        stream.set_vol_threshold(0)
+        stream.set_warmup(10.)
+        self.assertEqual([], stream.append(frames[:16000 * 2 * 9]))
+        self.assertGreater(len(stream.append(frames[16000 * 2 * 9:])), 0)
+        self.assertGreater(stream.get_effective_threshold(), 0)
+
+    # -----------------------------------------------------------------------
+
+    def test_annotation(self):
+        """The annotation gives the IPUs of the tier, in seconds."""
+        ann = sppasSearchIPUs()
+        ann.set_threshold(500)
+        tier = ann.convert(self.channel)
+        tracks = list(ann.stream_tracks(sample_1))
+        ipus = [(a.get_lowest_localization().get_midpoint(),
+                 a.get_highest_localization().get_midpoint())
+                for a in tier if a.get_best_tag().get_content() != "#"]
+        self.assertEqual(ipus, tracks)
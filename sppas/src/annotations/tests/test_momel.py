@@ -0,0 +1,100 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+        ---------------------------------------------------------------------
+
+    src.annotations.tests.test_momel.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os.path
+import shutil
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+from sppas.src.audiodata.aio import open as audio_open
+from sppas.src.audiodata.aio import save as audio_save
+from sppas.src.audiodata.audio import sppasAudioPCM
+
+from ..annotationsexc import AudioChannelError
+from ..Momel import sppasMomel
+
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+sample_3 = os.path.join(paths.samples, "samples-eng", "oriana3.wave")
+
+# ---------------------------------------------------------------------------
+
+
+class TestMomel(unittest.TestCase):
+    """Test of the class sppasMomel."""
+
+    def setUp(self):
+        self._temp = sppasFileUtils().set_random()
+        os.mkdir(self._temp)
+
+    def tearDown(self):
+        shutil.rmtree(self._temp)
+
+    # -----------------------------------------------------------------------
+
+    def test_extensions(self):
+        extensions = sppasMomel.get_input_extensions()
+        self.assertIn(".hz", extensions)
+        self.assertIn(".wav", extensions)
+        self.assertLess(extensions.index(".hz"), extensions.index(".wav"))
+
+    # -----------------------------------------------------------------------
+
+    def test_run_audio(self):
+        """Momel on the pitch estimated from an audio file."""
+        audio = audio_open(sample_1)
+        audio.extract_channel(0)
+        channel = audio.get_channel(0).extract_fragment(0, 48000)
+        audio.close()
+        filename = os.path.join(self._temp, "oriana.wav")
+        out = sppasAudioPCM()
+        out.append_channel(channel)
+        audio_save(filename, out)
+
+        momel = sppasMomel()
+        pitch = momel.eval_pitch(filename)
+        self.assertEqual(301, len(pitch))
+        voiced = [p for p in pitch if p > 0.]
+        self.assertGreater(len(voiced), 50)
+        self.assertTrue(all(50. <= p <= 600. for p in voiced))
+
+        trs = momel.run([filename])
+        anchors = trs.find("Momel")
+        self.assertGreater(len(anchors), 0)
+        for a in anchors:
+            self.assertLessEqual(a.get_location().get_best().get_midpoint(), 3.)
+
+        with self.assertRaises(AudioChannelError):
+            momel.run([sample_3])
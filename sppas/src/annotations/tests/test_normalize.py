@@ -50,10 +50,13 @@ from sppas.src.utils.makeunicode import u
 from sppas.src.resources.vocab import sppasVocabulary
 from sppas.src.resources.dictrepl import sppasDictRepl
 from sppas.src.anndata import sppasRW
+from sppas.src.structs.trie import sppasTrie
+from sppas.src.models.slm.ngramsmodel import sppasNgramsModel
 
 from ..TextNorm.normalize import TextNormalizer
 from ..TextNorm.orthotranscription import sppasOrthoTranscription
 from ..TextNorm.tokenize import sppasTokenSegmenter
+from ..TextNorm.latticeseg import sppasLatticeSegmenter
 from ..TextNorm.splitter import sppasSimpleSplitter
 from ..TextNorm.sppastextnorm import sppasTextNorm
 
@@ -307,6 +310,62 @@ class TestNormalizer(unittest.TestCase):
 
     # -----------------------------------------------------------------------
 
+    def test_stick_strategies(self):
+        """... Token Segmenter with the longest matching strategies."""
+
+        vocab = sppasVocabulary()
+        for w in (u("研究"), u("研究生"), u("生命"), u("的"), u("起源")):
+            vocab.add(w)
+        t = sppasTokenSegmenter(vocab)
+        t.set_separator("")
+        t.set_aggregate_max(15)
+        utt = list(u("研究生命的起源"))
+
+        self.assertEqual("lr", t.get_strategy())
+        self.assertEqual(u("研究生 命 的 起源").split(), t.bind(utt))
+        t.set_strategy("rl")
+        self.assertEqual(u("研究 生命 的 起源").split(), t.bind(utt))
+        t.set_strategy("bi")
+        self.assertEqual(u("研究 生命 的 起源").split(), t.bind(utt))
+        with self.assertRaises(ValueError):
+            t.set_strategy("xx")
+
+        # the index of the vocabulary follows its changes
+        t.set_strategy("lr")
+        vocab.add(u("命的"))
+        self.assertEqual(u("研究生 命的 起源").split(), t.bind(utt))
+
+    # -----------------------------------------------------------------------
+
+    def test_stick_viterbi(self):
+        """... Token Segmenter with the most probable sequence of words."""
+
+        vocab = sppasVocabulary()
+        for w in (u("研究"), u("研究生"), u("生命"), u("的"), u("起源")):
+            vocab.add(w)
+        t = sppasTokenSegmenter(vocab)
+        t.set_separator("")
+        t.set_aggregate_max(15)
+        t.set_strategy("viterbi")
+        utt = list(u("研究生命的起源"))
+
+        # without model: the less words, with less unknown tokens
+        self.assertEqual(u("研究 生命 的 起源").split(), t.bind(utt))
+
+        model = [[(u("<s>"), -99., 0.), (u("</s>"), -1., None),
+                  (u("研究"), -2., -0.3), (u("研究生"), -1., -0.3),
+                  (u("生命"), -2., -0.3), (u("的"), -1., -0.3),
+                  (u("起源"), -1.5, -0.3)],
+                 [(u("<s> 研究生"), -0.1, None)]]
+        t.set_ngrams(model)
+        self.assertEqual(u("研究生 命 的 起源").split(), t.bind(utt))
+
+        model[1].append((u("研究 生命"), -0.1, None))
+        t.set_ngrams(model)
+        self.assertEqual(u("研究 生命 的 起源").split(), t.bind(utt))
+
+    # -----------------------------------------------------------------------
+
     def test_sampa(self):
         """... X-SAMPA included into the ortho transcription."""
 
@@ -351,6 +410,74 @@ class TestNormalizer(unittest.TestCase):
 # ---------------------------------------------------------------------------
 
 
+class TestLatticeSegmenter(unittest.TestCase):
+    """Probabilistic word segmentation."""
+
+    def test_logprob(self):
+        seg = sppasLatticeSegmenter()
+        self.assertEqual(0, seg.get_order())
+        self.assertEqual(sppasLatticeSegmenter.WORD_LOGPROB, seg.logprob("a"))
+
+        model = [[("<s>", -99., 0.), ("</s>", -1., None),
+                  ("a", -1., -0.5), ("b", -2., -0.3)],
+                 [("a b", -0.2, None), ("<s> a", -0.1, None),
+                  ("b c", -0.4, None)]]
+        seg = sppasLatticeSegmenter(model)
+        self.assertEqual(2, seg.get_order())
+        self.assertEqual(-1., seg.logprob("a"))
+        self.assertEqual(-0.2, seg.logprob("b", "a"))
+        self.assertEqual(-0.1, seg.logprob("a", "<s>"))
+        self.assertEqual(-1.5, seg.logprob("a", "a"))
+        # 'c' is only in bigrams, 'x' is unknown
+        self.assertEqual(-0.4, seg.logprob("c", "b"))
+        self.assertEqual(-3., seg.logprob("c"))
+        self.assertEqual(-3., seg.logprob("x", "a"))
+
+        with self.assertRaises(TypeError):
+            sppasLatticeSegmenter("model")
+
+    def test_segment(self):
+        trie = sppasTrie(["ab", "abc", "cd", "d"])
+        tokens = list("abcd")
+        seg = sppasLatticeSegmenter()
+        self.assertEqual([], seg.segment([], trie))
+        self.assertEqual([(0, 2), (2, 2)], seg.segment(tokens, trie))
+        self.assertEqual([(0, 1), (1, 1), (2, 1), (3, 1)],
+                         seg.segment(tokens, trie, max_tokens=1))
+
+        model = sppasNgramsModel(2)
+        model.append_sentences(["abc d", "abc d", "ab cd"])
+        seg = sppasLatticeSegmenter(model.probabilities("logml"))
+        self.assertEqual([(0, 3), (3, 1)], seg.segment(tokens, trie))
+
+        # 'x' is not a word: 'b' is scored after 'a'
+        model = [[("<s>", -99., 0.), ("</s>", -1., 0.), ("a", -1., 0.),
+                  ("b", -3., 0.), ("c", -1., 0.), ("bc", -1., 0.)],
+                 [("a b", -0.1, None), ("b c", -0.1, None)]]
+        seg = sppasLatticeSegmenter(model)
+        trie = sppasTrie(["a", "b", "c", "bc"])
+        self.assertEqual([(0, 1), (1, 1), (2, 1), (3, 1)],
+                         seg.segment(list("axbc"), trie))
+        self.assertEqual([(0, 1), (1, 2)], seg.segment(list("xbc"), trie))
+
+    def test_segment_pruned(self):
+        tokens = list("abcdefghij" * 20)
+        trie = sppasTrie([a + b for a in "abcdefghij" for b in "abcdefghij"] +
+                         list("abcdefghij") + ["abc", "cde", "efg"])
+        seg = sppasLatticeSegmenter()
+        expected = seg.segment(tokens, trie, max_tokens=3)
+        max_states = sppasLatticeSegmenter.MAX_STATES
+        sppasLatticeSegmenter.MAX_STATES = 1
+        try:
+            spans = seg.segment(tokens, trie, max_tokens=3)
+        finally:
+            sppasLatticeSegmenter.MAX_STATES = max_states
+        self.assertEqual(len(tokens), sum(nb for i, nb in spans))
+        self.assertEqual(expected, spans)
+
+# ---------------------------------------------------------------------------
+
+
 class TestTextNorm(unittest.TestCase):
     """Test the SPPAS integration of the TextNormalizer."""
 
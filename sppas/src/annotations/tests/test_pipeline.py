@@ -0,0 +1,147 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.annotations.tests.test_pipeline.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+    :summary:      Test the pipeline of annotations.
+
+"""
+import unittest
+import os
+import shutil
+import codecs
+
+from sppas.src.config import sg
+from sppas.src.anndata import sppasRW
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..TextNorm.sppastextnorm import sppasTextNorm
+from ..Phon.sppasphon import sppasPhon
+from ..Momel.sppasmomel import sppasMomel
+from ..pipeline import sppasAnnotationsPipeline
+
+# ---------------------------------------------------------------------------
+
+TEMP = sppasFileUtils().set_random()
+
+# ---------------------------------------------------------------------------
+
+
+class TestAnnotationsPipeline(unittest.TestCase):
+    """Run annotations as a pipeline."""
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+        vocab = os.path.join(TEMP, "words.vocab")
+        with codecs.open(vocab, "w", sg.__encoding__) as fp:
+            fp.write(u"bonjour\nau\nrevoir\n")
+        pron = os.path.join(TEMP, "fra.dict")
+        with codecs.open(pron, "w", sg.__encoding__) as fp:
+            fp.write(u"bonjour [bonjour] b o~ Z u R\n")
+            fp.write(u"au [au] o\n")
+            fp.write(u"revoir [revoir] R @ v w a R\n")
+
+        self.roots = list()
+        for name, text in (("a", u"bonjour"), ("b", u"au revoir")):
+            root = os.path.join(TEMP, name)
+            with codecs.open(root + ".txt", "w", sg.__encoding__) as fp:
+                fp.write(text)
+            self.roots.append(root)
+        # no input file for this one
+        self.roots.append(os.path.join(TEMP, "c"))
+
+        self.textnorm = sppasTextNorm()
+        self.textnorm.load_resources(vocab, lang="fra")
+        self.phon = sppasPhon()
+        self.phon.load_resources(pron)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_producers(self):
+        pipeline = sppasAnnotationsPipeline(".xra", write_intermediates=False)
+        pipeline.add_step("momel", sppasMomel())
+        pipeline.add_step("textnorm", self.textnorm)
+        pipeline.add_step("phonetize", self.phon)
+        self.assertEqual([], pipeline.get_producers(0))
+        self.assertEqual([], pipeline.get_producers(1))
+        self.assertEqual([1], pipeline.get_producers(2))
+        self.assertTrue(pipeline.is_written(0))
+        self.assertFalse(pipeline.is_written(1))
+        self.assertTrue(pipeline.is_written(2))
+
+    # -----------------------------------------------------------------------
+
+    def test_annotate(self):
+        pipeline = sppasAnnotationsPipeline(".xra", write_intermediates=False)
+        pipeline.add_step("textnorm", self.textnorm)
+        pipeline.add_step("phonetize", self.phon)
+        log = self.phon.logfile
+        results = pipeline.annotate(self.roots)
+        self.assertIs(log, self.phon.logfile)
+
+        self.assertEqual(2, len(results))
+        self.assertIsNone(results[0][2])
+        self.assertIsNone(results[1][2])
+        for r, root in enumerate(self.roots[:2]):
+            out_name, records = results[0][r]
+            self.assertEqual(root + "-token.xra", out_name)
+            self.assertTrue(len(records) > 0)
+            self.assertFalse(os.path.exists(out_name))
+
+            out_name, records = results[1][r]
+            self.assertEqual(root + "-phon.xra", out_name)
+            self.assertTrue(os.path.exists(out_name))
+
+        trs = sppasRW(self.roots[1] + "-phon.xra").read()
+        self.assertEqual(u"o R-@-v-w-a-R",
+                         " ".join(a.serialize_labels(" ") for a in trs[0]))
+
+    # -----------------------------------------------------------------------
+
+    def test_write_intermediates(self):
+        pipeline = sppasAnnotationsPipeline(".xra")
+        pipeline.add_step("textnorm", self.textnorm)
+        pipeline.add_step("phonetize", self.phon)
+        pipeline.annotate(self.roots)
+        for root in self.roots[:2]:
+            self.assertTrue(os.path.exists(root + "-token.xra"))
+            self.assertTrue(os.path.exists(root + "-phon.xra"))
@@ -39,6 +39,7 @@ import wave
 from sppas.src.utils import u
 
 from ..audio import sppasAudioPCM
+from .wavereader import sppasWaveReader
 
 # ---------------------------------------------------------------------------
 
@@ -70,9 +71,12 @@ class WaveIO(sppasAudioPCM):
         :param filename (str) input file name.
 
         """
-        # Use the standard wave library to load the wave file
-        # open method returns a Wave_read() object
-        self._audio_fp = wave.open(u(filename), "r")
+        # Map the PCM wave file in memory, or use the standard wave library
+        # to load other ones: open method returns a Wave_read() object
+        try:
+            self._audio_fp = sppasWaveReader(u(filename))
+        except (IOError, ValueError):
+            self._audio_fp = wave.open(u(filename), "r")
 
     # -----------------------------------------------------------------------
 
@@ -0,0 +1,376 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.aio.wavereader.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A reader of PCM WAV files mapped in memory.
+
+    The RIFF chunks are parsed to find the format and the data chunks, then
+    the data chunk is a memoryview of the mapped file: the frames can be
+    accessed without any copy. RF64 (and BW64) files, with the sizes stored
+    in a 'ds64' chunk, and the WAVE_FORMAT_EXTENSIBLE format are supported,
+    so that files over 4 GB can be read.
+
+"""
+
+import io
+import mmap
+import struct
+
+# ---------------------------------------------------------------------------
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Format of the memoryview of the samples, for each sample width
+SAMPLE_FORMATS = {1: 'B', 2: 'h', 4: 'i'}
+
+# ---------------------------------------------------------------------------
+
+
+class sppasWaveReader(object):
+    """Read a PCM WAV file mapped in memory.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The methods of wave.Wave_read used by sppasAudioPCM are implemented,
+    so that this reader can replace it, and the frames can also be read
+    without a copy:
+
+        - readview(): like readframes() but returns a memoryview;
+        - get_data(): all the frames of the data chunk;
+        - get_channel_view(): the samples of a channel, a strided view.
+
+    The views are valid until the reader is closed.
+
+    >>> r = sppasWaveReader("oriana1.wav")
+    >>> left = r.get_channel_view(0)
+    >>> left[1000]
+
+    """
+
+    def __init__(self, filename):
+        """Create a sppasWaveReader instance and map the file in memory.
+
+        :param filename: (str) Name of a WAV file
+        :raises: IOError if the file is not a PCM WAV file
+
+        """
+        self.__nchannels = 0
+        self.__sampwidth = 0
+        self.__framerate = 0
+        self.__nframes = 0
+        self.__blockalign = 0
+        self.__position = 0
+        self.__data = None
+        self.__mmap = None
+
+        self.__fp = io.open(filename, "rb")
+        try:
+            self.__mmap = mmap.mmap(self.__fp.fileno(), 0,
+                                    access=mmap.ACCESS_READ)
+            self.__parse()
+        except Exception:
+            self.close()
+            raise
+
+    # -----------------------------------------------------------------------
+    # Getters, like in wave.Wave_read
+    # -----------------------------------------------------------------------
+
+    def getnchannels(self):
+        """Return the number of channels."""
+        return self.__nchannels
+
+    # -----------------------------------------------------------------------
+
+    def getsampwidth(self):
+        """Return the sample width, in bytes."""
+        return self.__sampwidth
+
+    # -----------------------------------------------------------------------
+
+    def getframerate(self):
+        """Return the frame rate, in Hz."""
+        return self.__framerate
+
+    # -----------------------------------------------------------------------
+
+    def getnframes(self):
+        """Return the number of frames."""
+        return self.__nframes
+
+    # -----------------------------------------------------------------------
+
+    def getcomptype(self):
+        """Return the compression type: always 'NONE'."""
+        return "NONE"
+
+    # -----------------------------------------------------------------------
+
+    def getcompname(self):
+        """Return the compression name."""
+        return "not compressed"
+
+    # -----------------------------------------------------------------------
+
+    def getparams(self):
+        """Return the tuple of the parameters, like wave.getparams()."""
+        return (self.__nchannels, self.__sampwidth, self.__framerate,
+                self.__nframes, "NONE", "not compressed")
+
+    # -----------------------------------------------------------------------
+    # Read frames
+    # -----------------------------------------------------------------------
+
+    def readframes(self, nframes):
+        """Read and return at most n frames, as bytes.
+
+        :param nframes: (int)
+        :returns: (bytes)
+
+        """
+        return self.readview(nframes).tobytes()
+
+    # -----------------------------------------------------------------------
+
+    def readview(self, nframes):
+        """Read and return at most n frames, without a copy.
+
+        :param nframes: (int)
+        :returns: (memoryview)
+
+        """
+        self.__check_opened()
+        nframes = max(0, min(int(nframes), self.__nframes - self.__position))
+        start = self.__position * self.__blockalign
+        self.__position += nframes
+        return self.__data[start:start + nframes * self.__blockalign]
+
+    # -----------------------------------------------------------------------
+
+    def get_data(self):
+        """Return all the frames of the data chunk, without a copy.
+
+        :returns: (memoryview)
+
+        """
+        self.__check_opened()
+        return self.__data
+
+    # -----------------------------------------------------------------------
+
+    def get_channel_view(self, index, begin=0, end=None):
+        """Return the samples of a channel, without a copy.
+
+        The samples of the channel are a strided view on the data chunk:
+        its items are the values of the samples (8 bits samples are
+        unsigned, like in the file). 24 bits samples can't be viewed.
+
+        :param index: (int) Index of the channel
+        :param begin: (int) First frame
+        :param end: (int) Frame after the last one, or None
+        :returns: (memoryview) of format 'B', 'h' or 'i'
+        :raises: ValueError
+
+        """
+        self.__check_opened()
+        if self.__sampwidth not in SAMPLE_FORMATS:
+            raise ValueError("No view of samples of {:d} bytes."
+                             "".format(self.__sampwidth))
+        index = int(index)
+        if index < 0 or index >= self.__nchannels:
+            raise ValueError("Invalid channel index {:d}.".format(index))
+        if end is None or end > self.__nframes:
+            end = self.__nframes
+        begin = max(0, min(int(begin), end))
+
+        data = self.__data[:self.__nframes * self.__blockalign]
+        samples = data.cast(SAMPLE_FORMATS[self.__sampwidth])
+        nc = self.__nchannels
+        return samples[begin * nc + index:end * nc:nc]
+
+    # -----------------------------------------------------------------------
+    # Position, like in wave.Wave_read
+    # -----------------------------------------------------------------------
+
+    def setpos(self, pos):
+        """Set the position of the next frame to read.
+
+        :param pos: (int)
+        :raises: ValueError
+
+        """
+        pos = int(pos)
+        if pos < 0 or pos > self.__nframes:
+            raise ValueError("Position not in range.")
+        self.__position = pos
+
+    # -----------------------------------------------------------------------
+
+    def tell(self):
+        """Return the position of the next frame to read."""
+        return self.__position
+
+    # -----------------------------------------------------------------------
+
+    def rewind(self):
+        """Set the position to the first frame."""
+        self.__position = 0
+
+    # -----------------------------------------------------------------------
+
+    def close(self):
+        """Release the mapping and close the file.
+
+        If some views are still used, the mapping is released when the
+        last one is deleted.
+
+        """
+        if self.__data is not None:
+            self.__data.release()
+            self.__data = None
+        if self.__mmap is not None:
+            try:
+                self.__mmap.close()
+            except BufferError:
+                # views exported with cast() or slices are still alive
+                pass
+            self.__mmap = None
+        if self.__fp is not None:
+            self.__fp.close()
+            self.__fp = None
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __check_opened(self):
+        if self.__data is None:
+            raise ValueError("I/O operation on a closed file.")
+
+    # -----------------------------------------------------------------------
+
+    def __parse(self):
+        """Parse the RIFF chunks of the mapped file."""
+        m = self.__mmap
+        size = len(m)
+        if size < 12:
+            raise IOError("File too short to be a WAV file.")
+        riff_id, riff_size, wave_id = struct.unpack("<4sI4s", m[:12])
+        if riff_id not in (b"RIFF", b"RF64", b"BW64") or wave_id != b"WAVE":
+            raise IOError("Not a RIFF/RF64 WAVE file.")
+
+        ds64_size = None
+        data_size = 0
+        data_offset = None
+        fmt = None
+        pos = 12
+        while pos + 8 <= size:
+            chunk_id, chunk_size = struct.unpack("<4sI", m[pos:pos + 8])
+            pos += 8
+            if chunk_id == b"ds64":
+                # 64 bits sizes of the RIFF and data chunks of a RF64 file
+                ds64_size = struct.unpack("<Q", m[pos + 8:pos + 16])[0]
+            elif chunk_id == b"fmt ":
+                fmt = self.__parse_fmt(m[pos:pos + chunk_size])
+            elif chunk_id == b"data":
+                data_offset = pos
+                data_size = sppasWaveReader.__data_size(
+                    chunk_size, ds64_size, size - pos)
+                if fmt is not None:
+                    break
+                chunk_size = data_size
+            pos += chunk_size + (chunk_size & 1)
+
+        if fmt is None:
+            raise IOError("No 'fmt ' chunk in the WAV file.")
+        if data_offset is None:
+            raise IOError("No 'data' chunk in the WAV file.")
+
+        self.__nchannels, self.__sampwidth, self.__framerate = fmt
+        self.__blockalign = self.__nchannels * self.__sampwidth
+        self.__nframes = data_size // self.__blockalign
+        view = memoryview(m)
+        self.__data = view[data_offset:data_offset + data_size]
+        view.release()
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __data_size(chunk_size, ds64_size, remaining):
+        """Return the size of the data chunk.
+
+        :param chunk_size: (int) 32 bits size of the chunk header
+        :param ds64_size: (int) 64 bits size of a 'ds64' chunk, or None
+        :param remaining: (int) Number of bytes after the chunk header
+
+        """
+        if chunk_size == 0xFFFFFFFF:
+            if ds64_size is not None:
+                return min(ds64_size, remaining)
+            # size not fixed by the writer
+            return remaining
+
+        # RIFF files over 4 GB: the 32 bits size was truncated
+        if remaining > 0xFFFFFFFF and \
+                (remaining - chunk_size) % (1 << 32) == 0:
+            return remaining
+
+        return min(chunk_size, remaining)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __parse_fmt(chunk):
+        """Return (nchannels, sampwidth, framerate) of a 'fmt ' chunk."""
+        if len(chunk) < 16:
+            raise IOError("Invalid 'fmt ' chunk.")
+        fmt_tag, nchannels, framerate, _, block_align, bits = \
+            struct.unpack("<HHIIHH", chunk[:16])
+        if fmt_tag == WAVE_FORMAT_EXTENSIBLE and len(chunk) >= 26:
+            # the format is the first 2 bytes of the sub-format GUID
+            fmt_tag = struct.unpack("<H", chunk[24:26])[0]
+        if fmt_tag != WAVE_FORMAT_PCM:
+            raise IOError("Unsupported WAV format: {:d}.".format(fmt_tag))
+        if nchannels == 0:
+            raise IOError("Invalid number of channels: 0.")
+
+        sampwidth = (bits + 7) // 8
+        if sampwidth == 0 or block_align != nchannels * sampwidth:
+            raise IOError("Invalid 'fmt ' chunk.")
+
+        return nchannels, sampwidth, framerate
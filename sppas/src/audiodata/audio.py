@@ -58,6 +58,7 @@ from .audiodataexc import AudioDataError
 from .audiodataexc import ChannelIndexError
 from .audiodataexc import MixChannelError
 from .channel import sppasChannel
+from .channelview import sppasChannelView
 from .channelsmixer import sppasChannelMixer
 
 # ---------------------------------------------------------------------------
@@ -94,6 +95,9 @@ class sppasAudioPCM(object):
 
     """
 
+    # Number of frames read at a time to extract the channels
+    BLOCK_SIZE = 65536
+
     def __init__(self):
         """Create a new sppasAudioPCM instance."""
         super(sppasAudioPCM, self).__init__()
@@ -220,9 +224,6 @@ class sppasAudioPCM(object):
             raise ChannelIndexError(index)
 
         nc = self.get_nchannels()
-        self.seek(0)
-        data = self.read_frames(self.get_nframes())
-
         if nc == 0:
             raise AudioDataError
 
@@ -230,15 +231,14 @@ class sppasAudioPCM(object):
             raise ChannelIndexError(index)
 
         if nc == 1:
+            self.seek(0)
+            data = self.read_frames(self.get_nframes())
             channel = sppasChannel(self.get_framerate(),
                                    self.get_sampwidth(),
                                    data)
             return self.append_channel(channel)
 
-        frames = b""
-        sw = self.get_sampwidth()
-        for i in range(index*sw, len(data), nc*sw):
-            frames += data[i:i+sw]
+        frames = self._read_channels_frames([index])[0]
         channel = sppasChannel(self.get_framerate(),
                                self.get_sampwidth(),
                                frames)
@@ -257,22 +257,113 @@ class sppasAudioPCM(object):
             raise AudioError
 
         nc = self.get_nchannels()
-        sw = self.get_sampwidth()
-        self.seek(0)
-        data = self.read_frames(self.get_nframes())
-
         if nc == 0:
             raise AudioDataError
 
-        for index in range(nc):
-            frames = b""
-            for i in range(index*sw, len(data), nc*sw):
-                frames = frames + data[i:i+sw]
+        for frames in self._read_channels_frames(range(nc)):
             channel = sppasChannel(self.get_framerate(),
                                    self.get_sampwidth(),
                                    frames)
             self.append_channel(channel)
 
+    # ----------------------------------------------------------------------
+
+    def _read_channels_frames(self, indexes, begin=0, end=None):
+        """Read the frames of the given channels of the audio file.
+
+        The frames are read and de-interleaved by blocks of BLOCK_SIZE
+        frames, so that the memory used is about the size of the extracted
+        channels.
+
+        :param indexes: (list of int) Indexes of the channels
+        :param begin: (int) First frame to read
+        :param end: (int) Frame after the last one to read, or None
+        :returns: (list of bytes) frames of each channel
+
+        """
+        nc = self.get_nchannels()
+        sw = self.get_sampwidth()
+        if end is None:
+            end = self.get_nframes()
+        nframes = max(0, end - begin)
+        buffers = [bytearray(nframes*sw) for _ in indexes]
+
+        self.seek(begin)
+        pos = 0
+        while pos < nframes:
+            data = self.read_view(min(sppasAudioPCM.BLOCK_SIZE,
+                                      nframes - pos))
+            n = len(data) // (sw*nc)
+            if n == 0:
+                break
+            blocks = sppasAudioFrames.deinterleave(data, sw, nc, indexes)
+            for buf, frames in zip(buffers, blocks):
+                buf[pos*sw:(pos+n)*sw] = frames
+            pos += n
+
+        # convert one channel at a time to limit the memory peak
+        channels = list()
+        while len(buffers) > 0:
+            buf = buffers.pop(0)
+            channels.append(bytes(buf[:pos*sw]) if pos < nframes
+                            else bytes(buf))
+            del buf
+
+        return channels
+
+    # ----------------------------------------------------------------------
+
+    def read_fragment(self, channel=0, begin=None, end=None):
+        """Return a fragment of a channel of the audio file.
+
+        Nothing is read: the frames of the returned channel are read from
+        the audio file the first time they are accessed, so the audio file
+        must not be closed before. Contrariwise to extract_channel(), the
+        channel is not appended into the list of channels.
+
+        :param channel: (int) Index of the channel in the audio file
+        :param begin: (int: number of frames) the beginning of the fragment
+        :param end: (int: number of frames) the end of the fragment
+        :returns: (sppasChannelView)
+
+        """
+        if self._audio_fp is None:
+            raise AudioError
+
+        channel = int(channel)
+        if channel < 0 or channel+1 > self.get_nchannels():
+            raise ChannelIndexError(channel)
+
+        begin, end = sppasChannelView.fragment_limits(self.get_nframes(),
+                                                      begin, end)
+        return sppasChannelView(self, channel, begin, end)
+
+    # ----------------------------------------------------------------------
+
+    def read_channel_frames(self, channel, begin, end):
+        """Read the frames of a channel between two positions.
+
+        The reader pointer position is restored.
+
+        :param channel: (int) Index of the channel in the audio file
+        :param begin: (int) First frame to read
+        :param end: (int) Frame after the last one to read
+        :returns: (bytes) frames
+
+        """
+        if self._audio_fp is None:
+            raise AudioError
+
+        pos = self.tell()
+        if self.get_nchannels() == 1:
+            self.seek(begin)
+            frames = self.read_frames(max(0, end - begin))
+        else:
+            frames = self._read_channels_frames([channel], begin, end)[0]
+        self.seek(pos)
+
+        return frames
+
     # ----------------------------------------------------------------------
     # Read content, for audiofp
     # ----------------------------------------------------------------------
@@ -301,6 +392,27 @@ class sppasAudioPCM(object):
 
     # ----------------------------------------------------------------------
 
+    def read_view(self, nframes):
+        """Read n frames from the audio file, without a copy if possible.
+
+        The frames are a memoryview if the audio file pointer supports it,
+        like the reader of WAV files mapped in memory. They must not be
+        used after the audio file is closed.
+
+        :param nframes: (int) the number of frames to read
+        :returns: (memoryview or str) frames
+
+        """
+        if self._audio_fp is None:
+            raise AudioError
+
+        readview = getattr(self._audio_fp, "readview", None)
+        if readview is None:
+            return self.read_frames(nframes)
+        return readview(nframes)
+
+    # ----------------------------------------------------------------------
+
     def read_samples(self, nframes):
         """Read the samples from the audio file.
 
@@ -407,7 +519,7 @@ class sppasAudioPCM(object):
         """
         pos = self.tell()
         self.seek(0)
-        a = sppasAudioFrames(self.read_frames(self.get_nframes()),
+        a = sppasAudioFrames(self.read_view(self.get_nframes()),
                              self.get_sampwidth(),
                              self.get_nchannels())
         self.seek(pos)
@@ -427,7 +539,7 @@ class sppasAudioPCM(object):
         """
         pos = self.tell()
         self.seek(0)
-        a = sppasAudioFrames(self.read_frames(self.get_nframes()),
+        a = sppasAudioFrames(self.read_view(self.get_nframes()),
                              self.get_sampwidth())
         self.seek(pos)
 
@@ -0,0 +1,268 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.audiocache.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+import os
+import time
+import hashlib
+import tempfile
+
+from .channelformatter import sppasChannelFormatter
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAudioCache(object):
+    """A cache of the converted copies of audio files.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    A channel of an audio file is converted once to the expected frame rate
+    and sample width, into a WAV file of the cache directory. The next
+    requests of the same channel return this file, until the audio file is
+    modified. A WAV file which is already mono with the expected frame rate
+    and sample width is not copied.
+
+    The conversion is streamed: neither the audio file nor its copy are
+    loaded in memory. Copies are written under a temporary name then
+    renamed, so that several processes can share the cache.
+
+    When a copy is created, the previous copies of the same channel are
+    removed, then the copies older than the maximum age and the oldest
+    ones beyond the maximum size of the cache.
+
+    The alignment and the split into tracks read their audio through the
+    cache. SearchIPUs analyses the files at their own frame rate.
+
+    >>> cache = sppasAudioCache(framerate=16000, sampwidth=2)
+    >>> filename = cache.get("file-44100Hz-24bits.wav")
+
+    """
+
+    # Default directory of the cache
+    DIRECTORY = os.path.join(tempfile.gettempdir(), "sppas_audio_cache")
+
+    # Default maximum size of the cache, in bytes
+    MAX_SIZE = 2 * 1024 * 1024 * 1024
+
+    # Default maximum age of a copy, in seconds
+    MAX_AGE = 30 * 24 * 3600
+
+    def __init__(self, directory=None, framerate=16000, sampwidth=2,
+                 max_size=None, max_age=None):
+        """Create a sppasAudioCache instance.
+
+        :param directory: (str) Directory of the converted files
+        :param framerate: (int) Expected frame rate, in Hz
+        :param sampwidth: (int) Expected sample width, in bytes
+        :param max_size: (int) Maximum size of the cache, in bytes
+        :param max_age: (float) Maximum age of a copy, in seconds
+
+        """
+        if directory is None:
+            directory = sppasAudioCache.DIRECTORY
+        if max_size is None:
+            max_size = sppasAudioCache.MAX_SIZE
+        if max_age is None:
+            max_age = sppasAudioCache.MAX_AGE
+        self._directory = directory
+        self._framerate = int(framerate)
+        self._sampwidth = int(sampwidth)
+        self._max_size = int(max_size)
+        self._max_age = float(max_age)
+
+    # -----------------------------------------------------------------------
+
+    def get_directory(self):
+        """Return the directory of the converted files."""
+        return self._directory
+
+    # -----------------------------------------------------------------------
+
+    def get_filename(self, filename, channel=0):
+        """Return the name of the converted copy of a channel of a file.
+
+        The name is made of a key of the file, the channel and the
+        expected parameters, then a key of the size and the modification
+        time of the file.
+
+        :param filename: (str) Name of an audio file
+        :param channel: (int) Index of the channel
+        :returns: (str)
+
+        """
+        st = os.stat(filename)
+        version = "{:d}|{:f}".format(st.st_size, st.st_mtime)
+        digest = hashlib.sha1(version.encode("utf-8")).hexdigest()
+        return os.path.join(
+            self._directory,
+            "{:s}-{:s}.wav".format(self.__source_key(filename, channel),
+                                   digest))
+
+    # -----------------------------------------------------------------------
+
+    def get(self, filename, channel=0):
+        """Return the name of a file with the converted channel.
+
+        :param filename: (str) Name of an audio file
+        :param channel: (int) Index of the channel
+        :returns: (str) the name of the audio file if it does not need a
+        conversion, or the name of its copy in the cache
+
+        """
+        from .aio import open as audio_open
+
+        cached = self.get_filename(filename, channel)
+        if os.path.exists(cached):
+            return cached
+
+        audio = audio_open(filename)
+        try:
+            if os.path.splitext(filename)[1].lower() in (".wav", ".wave") \
+                    and audio.get_nchannels() == 1 \
+                    and audio.get_framerate() == self._framerate \
+                    and audio.get_sampwidth() == self._sampwidth:
+                return filename
+
+            if os.path.exists(self._directory) is False:
+                try:
+                    os.makedirs(self._directory)
+                except OSError:
+                    # created by another process
+                    if os.path.isdir(self._directory) is False:
+                        raise
+
+            formatter = sppasChannelFormatter(audio.read_fragment(channel))
+            formatter.set_framerate(self._framerate)
+            formatter.set_sampwidth(self._sampwidth)
+            tmp = "{:s}.{:d}.tmp".format(cached, os.getpid())
+            try:
+                formatter.convert_file(tmp)
+            except:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+            try:
+                os.rename(tmp, cached)
+            except OSError:
+                # Windows: the copy was renamed by another process
+                os.remove(tmp)
+        finally:
+            audio.close()
+
+        # the copies of the previous versions of the file are stale
+        prefix = self.__source_key(filename, channel) + "-"
+        for name in os.listdir(self._directory):
+            if name.startswith(prefix) and name.endswith(".wav") and \
+                    os.path.join(self._directory, name) != cached:
+                self.__remove(os.path.join(self._directory, name))
+        self.evict(keep=cached)
+
+        return cached
+
+    # -----------------------------------------------------------------------
+
+    def evict(self, keep=None):
+        """Remove the copies beyond the maximum age and size of the cache.
+
+        The copies older than the maximum age are removed, then the oldest
+        ones until the cache is smaller than its maximum size.
+
+        :param keep: (str) Name of a copy to never remove
+
+        """
+        if os.path.isdir(self._directory) is False:
+            return
+
+        now = time.time()
+        copies = list()
+        for name in os.listdir(self._directory):
+            if name.endswith(".wav") is False and name.endswith(".tmp") is False:
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                # removed by another process
+                continue
+            if path == keep:
+                copies.append((now, st.st_size, path))
+            elif now - st.st_mtime > self._max_age:
+                self.__remove(path)
+            elif name.endswith(".wav"):
+                copies.append((st.st_mtime, st.st_size, path))
+
+        size = sum(c[1] for c in copies)
+        for mtime, nbytes, path in sorted(copies):
+            if size <= self._max_size:
+                break
+            if path != keep:
+                self.__remove(path)
+                size -= nbytes
+
+    # -----------------------------------------------------------------------
+
+    def clear(self):
+        """Remove all the converted files of the cache."""
+        if os.path.isdir(self._directory) is False:
+            return
+        for name in os.listdir(self._directory):
+            if name.endswith(".wav") or name.endswith(".tmp"):
+                os.remove(os.path.join(self._directory, name))
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __source_key(self, filename, channel):
+        """Return the key of a channel of a file and the parameters."""
+        key = "{:s}|{:d}|{:d}|{:d}".format(
+            os.path.abspath(filename), channel,
+            self._framerate, self._sampwidth)
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __remove(filename):
+        """Remove a file, unless another process already removed it."""
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
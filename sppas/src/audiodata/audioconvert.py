@@ -34,10 +34,10 @@
 
 """
 
-import struct
 import math
 
-from .audiodataexc import SampleWidthError, ChannelIndexError
+from .audiodataexc import ChannelIndexError
+from .backend import get_backend
 
 # ---------------------------------------------------------------------------
 
@@ -64,37 +64,15 @@ class sppasAudioConverter(object):
         """Turn frames into samples.
 
         Unpack the data frames depending on their sample width.
+        The 8 bits frames are unsigned, like in WAV files.
 
         :param frames: (str) Audio frames
         :param samples_width: (int)
         :param nchannels: (int) number of channels in the frames
 
         """
-        samples_width = int(samples_width)
-
-        # Unpack to get all values, depending on the number of bytes of each value.
-        if samples_width == 4:
-            data = list(struct.unpack("<%ul" % (len(frames) / 4), frames))
-
-        elif samples_width == 2:
-            data = list(struct.unpack("<%uh" % (len(frames) / 2), frames))
-
-        elif samples_width == 1:
-            tmp_data = struct.unpack("%uB" % len(frames), frames)
-            data = [s - 128 for s in tmp_data]
-
-        else:
-            raise SampleWidthError(samples_width)
-
-        samples = list()
-        if nchannels > 1:
-            # Split channels
-            for i in range(nchannels):
-                samples.append([data[j] for j in range(i, len(data), nchannels)])
-        else:
-            samples.append(list(data))
-
-        return samples
+        return get_backend().samples(frames, int(samples_width),
+                                     int(nchannels), unsigned=True)
 
     # ----------------------------------------------------------------------------
 
@@ -114,28 +92,7 @@ class sppasAudioConverter(object):
         if nchannels < 1:
             raise ChannelIndexError(nchannels)
 
-        nframes = len(samples[0])
-        frames = b""
-
-        if samples_width == 4:
-            for i in range(nframes):
-                for j in range(nchannels):
-                    frames += struct.pack("<l", samples[j][i])
-            return frames
-
-        if samples_width == 2:
-            for i in range(nframes):
-                for j in range(nchannels):
-                    frames += struct.pack("<h", samples[j][i])
-            return frames
-
-        if samples_width == 1:
-            for i in range(nframes):
-                for j in range(nchannels):
-                    frames += struct.pack("<b", samples[j][i])
-            return frames
-
-        raise SampleWidthError(samples_width)
+        return get_backend().frames(samples, samples_width, nchannels)
 
     # -----------------------------------------------------------------------
 
@@ -34,10 +34,8 @@
 
 """
 
-import audioop
-import struct
-
 from .audiodataexc import SampleWidthError, ChannelIndexError
+from .backend import get_backend
 
 # ---------------------------------------------------------------------------
 
@@ -53,6 +51,8 @@ class sppasAudioFrames(object):
 
     TODO: There's no unittests of this class.
 
+    The samples are processed by the backend returned by get_backend().
+
     """
     def __init__(self, frames=b"", sampwidth=2, nchannels=1):
         """Create an sppasAudioFrames instance.
@@ -64,7 +64,7 @@ class sppasAudioFrames(object):
         """
         # Check the type and if values are appropriate
         # frames = str(frames)
-        if sampwidth not in [1, 2, 4]:
+        if sampwidth not in [1, 2, 3, 4]:
             raise SampleWidthError
         nchannels = int(nchannels)
         if nchannels < 1:
@@ -85,7 +85,8 @@ class sppasAudioFrames(object):
         :returns: (str) converted frames
 
         """
-        return audioop.ratecv(self._frames, self._sampwidth, self._nchannels, rate, new_rate, None)[0]
+        return get_backend().ratecv(self._frames, self._sampwidth,
+                                    self._nchannels, rate, new_rate)
 
     # -----------------------------------------------------------------------
 
@@ -97,9 +98,10 @@ class sppasAudioFrames(object):
         :returns: (str) converted frames
 
         """
-        if new_sampwidth not in [1, 2, 4]:
-            raise SampleWidthError
-        return audioop.lin2lin(self._frames, self._sampwidth, new_sampwidth)
+        if new_sampwidth not in [1, 2, 3, 4]:
+            raise SampleWidthError(new_sampwidth)
+        return get_backend().lin2lin(self._frames, self._sampwidth,
+                                     new_sampwidth)
 
     # -----------------------------------------------------------------------
 
@@ -112,7 +114,7 @@ class sppasAudioFrames(object):
 
         """
         value = int(value)
-        return audioop.bias(self._frames, self._sampwidth, value)
+        return get_backend().bias(self._frames, self._sampwidth, value)
 
     # -----------------------------------------------------------------------
 
@@ -124,7 +126,7 @@ class sppasAudioFrames(object):
         :returns: (str) converted frames
 
         """
-        return audioop.mul(self._frames, self._sampwidth, factor)
+        return get_backend().mul(self._frames, self._sampwidth, factor)
 
     # -----------------------------------------------------------------------
 
@@ -134,7 +136,7 @@ class sppasAudioFrames(object):
         :returns: number of zero crossing
 
         """
-        return audioop.cross(self._frames, self._sampwidth)
+        return get_backend().cross(self._frames, self._sampwidth)
 
     # -----------------------------------------------------------------------
 
@@ -144,46 +146,41 @@ class sppasAudioFrames(object):
         :returns (min,max)
 
         """
-        return audioop.minmax(self._frames, self._sampwidth)
+        return get_backend().minmax(self._frames, self._sampwidth)
 
     # -----------------------------------------------------------------------
 
     def min(self):
         """Return the minimum of the values of all frames."""
 
-        return audioop.minmax(self._frames, self._sampwidth)[0]
+        return get_backend().minmax(self._frames, self._sampwidth)[0]
 
     # -----------------------------------------------------------------------
 
     def max(self):
         """Return the maximum of the values of all frames."""
 
-        return audioop.minmax(self._frames, self._sampwidth)[1]
+        return get_backend().minmax(self._frames, self._sampwidth)[1]
 
     # -----------------------------------------------------------------------
 
     def avg(self):
         """Return the average of all the frames."""
 
-        return audioop.avg(self._frames, self._sampwidth)
+        return get_backend().avg(self._frames, self._sampwidth)
 
     # -----------------------------------------------------------------------
 
     def rms(self):
         """Return the root mean square of the frames."""
         if self._nchannels == 1:
-            return audioop.rms(self._frames, self._sampwidth)
+            return get_backend().rms(self._frames, self._sampwidth)
 
         rms_sum = 0
-        for i in range(self._nchannels):
-            new_frames = b""
-            for j in range(i*self._sampwidth,
-                           len(self._frames),
-                           self._sampwidth*self._nchannels):
-
-                for k in range(self._sampwidth):
-                    new_frames += self._frames[j+k]
-            rms_sum += audioop.rms(new_frames, self._sampwidth)
+        for new_frames in sppasAudioFrames.deinterleave(self._frames,
+                                                        self._sampwidth,
+                                                        self._nchannels):
+            rms_sum += get_backend().rms(new_frames, self._sampwidth)
 
         return int(rms_sum/self._nchannels)
 
@@ -198,23 +195,55 @@ class sppasAudioFrames(object):
         :returns: (float) the clipping rate
 
         """
-        if self._sampwidth == 4:
-            data = struct.unpack("<%ul" % (len(self._frames) / 4), self._frames)
-        elif self._sampwidth == 2:
-            data = struct.unpack("<%uh" % (len(self._frames) / 2), self._frames)
-        else:
-            data = struct.unpack("%uB" % len(self._frames), self._frames)
-            data = [s - 128 for s in data]
+        # the 8 bits samples are unsigned, like in WAV files
+        return get_backend().clipping_rate(self._frames, self._sampwidth,
+                                           factor, unsigned=True)
+
+    # -----------------------------------------------------------------------
 
-        max_val = int(sppasAudioFrames.get_maxval(self._sampwidth) * (factor/2.))
-        min_val = int(sppasAudioFrames.get_minval(self._sampwidth) * (factor/2.))
+    @staticmethod
+    def deinterleave(frames, sampwidth, nchannels, indexes=None):
+        """Return the frames of each channel of interleaved frames.
+
+        The bytes of the samples are copied with one extended slice for
+        each byte of a sample, so that the time is linear with the number
+        of frames, whatever the sample width (24 bits included).
+        An incomplete frame at the end of the given frames is ignored.
 
-        nb_clipping = 0
-        for i in range(len(data)):
-            if data[i] >= max_val or data[i] <= min_val:
-                nb_clipping += 1
+        :param frames: (str) interleaved frames
+        :param sampwidth: (int) sample width of the frames
+        :param nchannels: (int) number of channels in the frames
+        :param indexes: (list of int) indexes of the channels to extract.
+        All channels are extracted if None.
+        :returns: (list of bytearray) frames of each extracted channel
 
-        return float(nb_clipping)/len(data)
+        """
+        sampwidth = int(sampwidth)
+        nchannels = int(nchannels)
+        if sampwidth < 1:
+            raise SampleWidthError(sampwidth)
+        if nchannels < 1:
+            raise ChannelIndexError(nchannels)
+        if indexes is None:
+            indexes = range(nchannels)
+
+        step = sampwidth * nchannels
+        nframes = len(frames) // step
+        data = frames
+        if len(frames) != nframes*step:
+            data = frames[:nframes*step]
+
+        channels = list()
+        for index in indexes:
+            if index < 0 or index >= nchannels:
+                raise ChannelIndexError(index)
+            channel = bytearray(nframes*sampwidth)
+            for k in range(sampwidth):
+                start = index*sampwidth + k
+                channel[k::sampwidth] = data[start::step]
+            channels.append(channel)
+
+        return channels
 
     # -----------------------------------------------------------------------
 
@@ -235,6 +264,10 @@ class sppasAudioFrames(object):
             return 0x7fff
         elif size == 2:
             return 0xffff
+        elif signed and size == 3:
+            return 0x7fffff
+        elif size == 3:
+            return 0xffffff
         elif signed and size == 4:
             return 0x7fffffff
         elif size == 4:
@@ -257,5 +290,7 @@ class sppasAudioFrames(object):
             return -0x80
         elif size == 2:
             return -0x8000
+        elif size == 3:
+            return -0x800000
         elif size == 4:
             return -0x80000000
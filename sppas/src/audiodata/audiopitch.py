@@ -32,10 +32,12 @@
     src.audiodata.audiopitch.py
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-    TO BE IMPLEMENTED.
-
 """
 
+from .streampitch import sppasStreamPitch
+
+# ---------------------------------------------------------------------------
+
 
 class AudioPitch(object):
     """
@@ -44,14 +46,24 @@ class AudioPitch(object):
     :contact:      develop@sppas.org
     :license:      GPL, v3
     :copyright:    Copyright (C) 2011-2017  Brigitte Bigi
-    :summary:      A pitch audio utility class. NOT IMPLEMENTED!!!!
+    :summary:      A pitch audio utility class.
+
+    The pitch values are estimated by sppasStreamPitch, one every delta
+    seconds. Unvoiced values are 0.
 
     """
-    def __init__(self, delta=0.01):
-        """Create a new AudioPitch instance."""
+    def __init__(self, delta=0.01, lo=50., hi=600.):
+        """Create a new AudioPitch instance.
+
+        :param delta: (float) Delay between two pitch values, in seconds
+        :param lo: (float) Lowest expected pitch value, in Hz
+        :param hi: (float) Highest expected pitch value, in Hz
 
+        """
         self.pitch = []
         self.delta = delta
+        self.lo = lo
+        self.hi = hi
 
     # ------------------------------------------------------------------
 
@@ -62,8 +74,8 @@ class AudioPitch(object):
         :returns: float
 
         """
-        idx = int(time/self.delta) + 1
-        if len(self.pitch) < idx:
+        idx = int(round(time/self.delta))
+        if 0 <= idx < len(self.pitch):
             return self.pitch[idx]
         else:
             raise ValueError('%d not in range' % idx)
@@ -84,11 +96,21 @@ class AudioPitch(object):
 
     # ------------------------------------------------------------------
 
-    def eval_pitch(self, filename):
-        """WILL evaluate pitch values...
+    def eval_pitch(self, filename, channel=0):
+        """Evaluate pitch values of a channel of an audio file.
+
+        The audio file is read block by block.
+
+        :param filename: (str) Name of the audio file
+        :param channel: (int) Index of the channel
+        :returns: (list of float)
 
         """
-        raise NotImplementedError
+        stream = sppasStreamPitch(self.lo, self.hi, self.delta)
+        stream.estimate_file(filename, channel)
+        self.pitch = stream.values()
+
+        return self.pitch
 
     # -----------------------------------------------------------------------
     # Overloads
@@ -0,0 +1,523 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.audiostats.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Statistics of audio files, estimated once and stored in a cache.
+
+    The duration, the volumes and the clipping rates of the channels of an
+    audio file are estimated by reading the frames block by block, then
+    they are saved into a JSON "sidecar" file. They are estimated again
+    only if the audio file was modified: its size and its time of
+    modification are compared first, then the SHA1 of its content.
+
+"""
+
+import os
+import json
+import codecs
+import hashlib
+import logging
+import multiprocessing
+from array import array
+
+from sppas.src.config import sg
+
+from .basevolume import sppasBaseVolume
+from .streamvolume import sppasStreamVolume
+from .backend import get_backend
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAudioStats(object):
+    """The statistics of the channels of an audio file.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The volumes are the RMS values of the windows used by the search for
+    IPUs. They are kept in the order of the windows, so that any estimator
+    of sppasBaseVolume gives the result of the audio file.
+
+    >>> stats = sppasAudioStats()
+    >>> stats.estimate_file("oriana1.wav")
+    >>> stats.get_duration(), stats.get_clipping_rate(0.6)
+    >>> stats.get_volumes(0).mean()
+
+    """
+
+    # Version of the stored statistics
+    VERSION = 1
+
+    # Window length to estimate the volumes, in seconds
+    WIN_LEN = 0.02
+
+    # Factors of the estimated clipping rates
+    CLIPPING_FACTORS = (0.2, 0.4, 0.6, 0.8)
+
+    # Number of bytes read at a time to estimate the SHA1
+    BLOCK_SIZE = 1048576
+
+    def __init__(self, stats=None):
+        """Create a sppasAudioStats instance.
+
+        :param stats: (dict) Statistics previously returned by get_dict()
+
+        """
+        self.__stats = dict()
+        if stats is not None:
+            self.set_dict(stats)
+
+    # -----------------------------------------------------------------------
+    # Getters
+    # -----------------------------------------------------------------------
+
+    def get_dict(self):
+        """Return the statistics as a dict that can be saved in JSON."""
+        return self.__stats
+
+    # -----------------------------------------------------------------------
+
+    def set_dict(self, stats):
+        """Fix the statistics from a dict returned by get_dict().
+
+        :param stats: (dict)
+        :raises: ValueError if the statistics are not of this version
+
+        """
+        if stats.get("version", 0) != sppasAudioStats.VERSION or \
+                stats.get("win_len", 0.) != sppasAudioStats.WIN_LEN:
+            raise ValueError("Statistics of an unsupported version.")
+        self.__stats = stats
+
+    # -----------------------------------------------------------------------
+
+    def get_size(self):
+        """Return the size of the audio file, in bytes."""
+        return self.__stats.get("size", 0)
+
+    def get_mtime(self):
+        """Return the time of modification of the audio file."""
+        return self.__stats.get("mtime", 0.)
+
+    def get_sha1(self):
+        """Return the SHA1 of the content of the audio file."""
+        return self.__stats.get("sha1", "")
+
+    def get_framerate(self):
+        """Return the frame rate of the audio file, in Hz."""
+        return self.__stats.get("framerate", 0)
+
+    def get_sampwidth(self):
+        """Return the sample width of the audio file, in bytes."""
+        return self.__stats.get("sampwidth", 0)
+
+    def get_nchannels(self):
+        """Return the number of channels of the audio file."""
+        return len(self.__stats.get("channels", list()))
+
+    def get_nframes(self):
+        """Return the number of frames of the audio file."""
+        return self.__stats.get("nframes", 0)
+
+    # -----------------------------------------------------------------------
+
+    def get_duration(self):
+        """Return the duration of the audio file, in seconds."""
+        if self.get_framerate() == 0:
+            return 0.
+        return float(self.get_nframes()) / float(self.get_framerate())
+
+    # -----------------------------------------------------------------------
+
+    def get_rms(self, index=0):
+        """Return the global volume of a channel.
+
+        :param index: (int) Index of the channel
+        :returns: (int)
+
+        """
+        return self.__channel(index)["rms"]
+
+    # -----------------------------------------------------------------------
+
+    def get_clipping_rate(self, factor, index=0):
+        """Return the clipping rate of a channel.
+
+        :param factor: (float) One of CLIPPING_FACTORS
+        :param index: (int) Index of the channel
+        :returns: (float)
+        :raises: ValueError if the rate of the factor was not estimated
+
+        """
+        rates = self.__channel(index)["clipping"]
+        for f, rate in zip(sppasAudioStats.CLIPPING_FACTORS, rates):
+            if abs(f - float(factor)) < 1e-6:
+                return rate
+        raise ValueError("No clipping rate estimated for the factor {:f}."
+                         "".format(factor))
+
+    # -----------------------------------------------------------------------
+
+    def get_volumes(self, index=0):
+        """Return the volumes of a channel.
+
+        :param index: (int) Index of the channel
+        :returns: (sppasBaseVolume)
+
+        """
+        channel = self.__channel(index)
+        return _CachedVolume(channel["volumes"], channel["rms"],
+                             sppasAudioStats.WIN_LEN)
+
+    # -----------------------------------------------------------------------
+
+    def get_silence_rate(self, threshold, index=0):
+        """Return the rate of windows with a volume lesser than a threshold.
+
+        :param threshold: (int) Volume (rms) of a silence
+        :param index: (int) Index of the channel
+        :returns: (float)
+
+        """
+        volumes = self.__channel(index)["volumes"]
+        if len(volumes) == 0:
+            return 0.
+        nb = sum(1 for v in volumes if v < threshold)
+        return float(nb) / float(len(volumes))
+
+    # -----------------------------------------------------------------------
+    # Estimators
+    # -----------------------------------------------------------------------
+
+    def estimate_file(self, filename):
+        """Estimate the statistics of all the channels of an audio file.
+
+        :param filename: (str) Name of the audio file
+
+        """
+        from .aio import open as audio_open
+
+        st = os.stat(filename)
+        stats = dict(version=sppasAudioStats.VERSION,
+                     win_len=sppasAudioStats.WIN_LEN,
+                     size=st.st_size,
+                     mtime=st.st_mtime,
+                     sha1=sppasAudioStats.file_sha1(filename))
+
+        audio = audio_open(filename)
+        try:
+            stats["framerate"] = audio.get_framerate()
+            stats["sampwidth"] = audio.get_sampwidth()
+            stats["nframes"] = audio.get_nframes()
+            stats["channels"] = list()
+            for index in range(audio.get_nchannels()):
+                stats["channels"].append(self.__estimate_channel(audio, index))
+        finally:
+            audio.close()
+
+        self.__stats = stats
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def file_sha1(filename):
+        """Return the SHA1 of the content of a file.
+
+        :param filename: (str)
+        :returns: (str) hexadecimal digest
+
+        """
+        sha1 = hashlib.sha1()
+        with open(filename, "rb") as fp:
+            while True:
+                data = fp.read(sppasAudioStats.BLOCK_SIZE)
+                if not data:
+                    break
+                sha1.update(data)
+        return sha1.hexdigest()
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __channel(self, index):
+        """Return the statistics of a channel."""
+        channels = self.__stats.get("channels", list())
+        if index < 0 or index >= len(channels):
+            raise IndexError("Invalid channel index {:d}.".format(index))
+        return channels[index]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __estimate_channel(audio, index):
+        """Estimate the statistics of a channel of an opened audio file."""
+        volume = sppasStreamVolume(sppasAudioStats.WIN_LEN)
+        volume.estimate_audio(audio, index)
+
+        # the 8 bits samples are unsigned, like in WAV files
+        backend = get_backend()
+        view = audio.read_fragment(index)
+        sampwidth = view.get_sampwidth()
+        nframes = view.get_nframes()
+        clipped = [0.] * len(sppasAudioStats.CLIPPING_FACTORS)
+        for pos in range(0, nframes, sppasStreamVolume.BLOCK_SIZE):
+            frames = view.extract_fragment(
+                pos, pos + sppasStreamVolume.BLOCK_SIZE).get_frames()
+            n = len(frames) // sampwidth
+            for i, factor in enumerate(sppasAudioStats.CLIPPING_FACTORS):
+                clipped[i] += backend.clipping_rate(frames, sampwidth,
+                                                    factor, True) * n
+
+        rates = [0.] * len(clipped)
+        if nframes > 0:
+            rates = [c / float(nframes) for c in clipped]
+
+        return dict(rms=volume.volume(),
+                    clipping=rates,
+                    volumes=list(volume.volumes()))
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAudioStatsCache(object):
+    """A cache of the statistics of audio files.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The statistics of an audio file are saved next to it, in a file with
+    the same name and the ".stats" extension, or in a given directory.
+    If the sidecar file can't be written, the statistics are estimated at
+    each request.
+
+    >>> cache = sppasAudioStatsCache()
+    >>> for filename, stats, error in cache.get_files(files, nb_workers=4):
+    >>>     print(filename, stats.get_duration())
+
+    """
+
+    EXTENSION = ".stats"
+
+    def __init__(self, directory=None):
+        """Create a sppasAudioStatsCache instance.
+
+        :param directory: (str) Directory of the statistics. If None, the
+        statistics are saved next to the audio files.
+
+        """
+        self._directory = directory
+
+    # -----------------------------------------------------------------------
+
+    def get_directory(self):
+        """Return the directory of the statistics or None."""
+        return self._directory
+
+    # -----------------------------------------------------------------------
+
+    def get_filename(self, filename):
+        """Return the name of the file with the statistics of an audio file.
+
+        :param filename: (str) Name of an audio file
+        :returns: (str)
+
+        """
+        if self._directory is None:
+            return filename + sppasAudioStatsCache.EXTENSION
+
+        key = os.path.abspath(filename).encode("utf-8")
+        digest = hashlib.sha1(key).hexdigest()
+        return os.path.join(self._directory,
+                            digest + sppasAudioStatsCache.EXTENSION)
+
+    # -----------------------------------------------------------------------
+
+    def get(self, filename):
+        """Return the statistics of an audio file.
+
+        :param filename: (str) Name of an audio file
+        :returns: (sppasAudioStats)
+
+        """
+        st = os.stat(filename)
+        stats = self.__load(filename)
+        if stats is not None and stats.get_size() == st.st_size:
+            if stats.get_mtime() == st.st_mtime:
+                return stats
+
+            # the file was touched or copied
+            if stats.get_sha1() == sppasAudioStats.file_sha1(filename):
+                stats.get_dict()["mtime"] = st.st_mtime
+                self.__save(filename, stats)
+                return stats
+
+        stats = sppasAudioStats()
+        stats.estimate_file(filename)
+        self.__save(filename, stats)
+        return stats
+
+    # -----------------------------------------------------------------------
+
+    def get_files(self, filenames, nb_workers=1, function=None):
+        """Return the statistics of audio files, with a pool of processes.
+
+        :param filenames: (list of str) Names of audio files
+        :param nb_workers: (int) Number of processes, 0 for the number of
+        CPUs
+        :param function: (function) A function applied to the statistics
+        by the workers, defined at the top level of a module
+        :returns: generator of tuples (filename, statistics or the result
+        of the function, error message or None) in the order of the files
+
+        """
+        nb_workers = int(nb_workers)
+        if nb_workers <= 0:
+            try:
+                nb_workers = multiprocessing.cpu_count()
+            except NotImplementedError:
+                nb_workers = 1
+        nb_workers = min(nb_workers, len(filenames))
+        if nb_workers == 0:
+            return
+
+        if nb_workers == 1:
+            _init_worker(self._directory, function)
+            for filename in filenames:
+                yield _stats_job(filename)
+            return
+
+        pool = multiprocessing.Pool(nb_workers, _init_worker,
+                                    (self._directory, function))
+        try:
+            for result in pool.imap(_stats_job, filenames):
+                yield result
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __load(self, filename):
+        """Return the saved statistics of an audio file or None."""
+        stats_filename = self.get_filename(filename)
+        if os.path.exists(stats_filename) is False:
+            return None
+        try:
+            with codecs.open(stats_filename, "r", sg.__encoding__) as fp:
+                return sppasAudioStats(json.load(fp))
+        except (IOError, ValueError) as e:
+            logging.warning("Statistics of {:s} ignored: {:s}"
+                            "".format(filename, str(e)))
+        return None
+
+    # -----------------------------------------------------------------------
+
+    def __save(self, filename, stats):
+        """Save the statistics of an audio file, if possible."""
+        stats_filename = self.get_filename(filename)
+        tmp = "{:s}.{:d}.tmp".format(stats_filename, os.getpid())
+        try:
+            if self._directory is not None and \
+                    os.path.exists(self._directory) is False:
+                try:
+                    os.makedirs(self._directory)
+                except OSError:
+                    # created by another process
+                    if os.path.isdir(self._directory) is False:
+                        raise
+            with codecs.open(tmp, "w", sg.__encoding__) as fp:
+                json.dump(stats.get_dict(), fp)
+            if os.path.exists(stats_filename):
+                os.remove(stats_filename)
+            os.rename(tmp, stats_filename)
+        except (IOError, OSError) as e:
+            logging.warning("Statistics of {:s} not saved: {:s}"
+                            "".format(filename, str(e)))
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+# ---------------------------------------------------------------------------
+
+
+class _CachedVolume(sppasBaseVolume):
+    """The volumes of a channel, restored from its statistics."""
+
+    def __init__(self, volumes, rms, win_len):
+        super(_CachedVolume, self).__init__(win_len)
+        self._volumes = array('L', volumes)
+        self._rms = rms
+
+    def set_volume_value(self, index, value):
+        """Set manually the rms at a given position."""
+        self._volumes[index] = value
+
+# ---------------------------------------------------------------------------
+# Functions executed by the workers
+# ---------------------------------------------------------------------------
+
+# The cache and the function of the current worker
+_worker = dict()
+
+
+def _init_worker(directory, function):
+    """Create the cache of a worker."""
+    _worker["cache"] = sppasAudioStatsCache(directory)
+    _worker["function"] = function
+
+# ---------------------------------------------------------------------------
+
+
+def _stats_job(filename):
+    """Return the statistics of an audio file with the cache of the worker."""
+    try:
+        stats = _worker["cache"].get(filename)
+        if _worker["function"] is not None:
+            stats = _worker["function"](stats)
+    except Exception as e:
+        logging.error("{:s}: {:s}".format(filename, str(e)))
+        return filename, None, str(e)
+
+    return filename, stats, None
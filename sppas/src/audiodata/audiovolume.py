@@ -36,8 +36,11 @@
 
 """
 
+from array import array
+
 from .audioframes import sppasAudioFrames
 from .basevolume import sppasBaseVolume
+from .streamvolume import sppasStreamVolume
 
 # ----------------------------------------------------------------------------
 
@@ -68,13 +71,22 @@ class sppasAudioVolume(sppasBaseVolume):
         # Rewind to the beginning
         audio.rewind()
 
-        # Find the rms values (explore all frames)
+        # Find the rms values (explore all frames), reading large blocks
+        # of an entire number of windows
         nb_frames = int(win_len * audio.get_framerate())
+        win_size = nb_frames * audio.get_sampwidth() * audio.get_nchannels()
+        block = nb_frames * max(1, sppasStreamVolume.BLOCK_SIZE // nb_frames)
+        self._volumes = array('L')
 
         while audio.tell() < audio.get_nframes():
-            frames = audio.read_frames(nb_frames)
-            a = sppasAudioFrames(frames, audio.get_sampwidth(), audio.get_nchannels())
-            self._volumes.append(a.rms())
+            data = audio.read_view(block)
+            if len(data) == 0:
+                break
+            for i in range(0, len(data), win_size):
+                a = sppasAudioFrames(data[i:i+win_size],
+                                     audio.get_sampwidth(),
+                                     audio.get_nchannels())
+                self._volumes.append(a.rms())
 
         # Returns to the position where we was before
         audio.seek(pos)
@@ -0,0 +1,118 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.backend.__init__.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Backends to process the samples of audio frames.
+
+    The samples can be processed with NumPy, the audioop module (removed
+    in Python 3.13) or in pure Python. The results are the same whatever
+    the backend: the first available one of this list is used by default.
+
+    >>> get_backend().rms(frames, 2)
+    >>> set_backend("python")
+
+"""
+
+from collections import OrderedDict
+
+from .basebackend import sppasBaseBackend
+from .pybackend import sppasPythonBackend
+
+try:
+    from .npbackend import sppasNumpyBackend
+    IMPORT_NUMPY = True
+except ImportError:
+    IMPORT_NUMPY = False
+
+try:
+    from .aopbackend import sppasAudioopBackend
+    IMPORT_AUDIOOP = True
+except ImportError:
+    IMPORT_AUDIOOP = False
+
+# ---------------------------------------------------------------------------
+
+_backends = OrderedDict()
+if IMPORT_NUMPY is True:
+    _backends[sppasNumpyBackend.NAME] = sppasNumpyBackend
+if IMPORT_AUDIOOP is True:
+    _backends[sppasAudioopBackend.NAME] = sppasAudioopBackend
+_backends[sppasPythonBackend.NAME] = sppasPythonBackend
+
+_current = [list(_backends.values())[0]()]
+
+# ---------------------------------------------------------------------------
+
+
+def get_backends():
+    """Return the names of the available backends, by order of preference."""
+    return list(_backends.keys())
+
+# ---------------------------------------------------------------------------
+
+
+def get_backend():
+    """Return the backend in use to process the samples."""
+    return _current[0]
+
+# ---------------------------------------------------------------------------
+
+
+def set_backend(name=None):
+    """Fix the backend to process the samples.
+
+    :param name: (str) Name of the backend. None for the default one.
+    :raises: ValueError if the backend is not available
+    :returns: previous backend in use
+
+    """
+    if name is None:
+        name = get_backends()[0]
+    if name not in _backends:
+        raise ValueError("Unknown or not available backend {:s}. Expected "
+                         "one of: {:s}.".format(name,
+                                                ", ".join(get_backends())))
+    previous = _current[0]
+    _current[0] = _backends[name]()
+    return previous
+
+# ---------------------------------------------------------------------------
+
+
+__all__ = (
+    'sppasBaseBackend',
+    'sppasPythonBackend',
+    'get_backends',
+    'get_backend',
+    'set_backend'
+)
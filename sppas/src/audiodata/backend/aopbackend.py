@@ -0,0 +1,130 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.backend.aopbackend.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The audioop module is deprecated since Python 3.11 and removed in
+    Python 3.13: importing this module raises ImportError then.
+
+"""
+
+import audioop
+
+from .pybackend import sppasPythonBackend
+
+# ---------------------------------------------------------------------------
+
+
+class sppasAudioopBackend(sppasPythonBackend):
+    """Process the samples of audio frames with the audioop module.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The conversions between samples and frames are the ones of the Python
+    backend.
+
+    """
+
+    NAME = "audioop"
+
+    # -----------------------------------------------------------------------
+
+    def rms(self, frames, sampwidth):
+        """Return the root mean square of the samples of the frames."""
+        self.check(sampwidth)
+        return audioop.rms(frames, sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def rms_windows(self, frames, sampwidth, win, shift):
+        """Return the root mean square of all the windows of the frames."""
+        self.check(sampwidth)
+        view = memoryview(frames)
+        width = win * sampwidth
+        step = shift * sampwidth
+        return [audioop.rms(view[start:start+width], sampwidth)
+                for start in range(0, len(frames) - width + 1, step)]
+
+    # -----------------------------------------------------------------------
+
+    def minmax(self, frames, sampwidth):
+        """Return the (minimum, maximum) of the samples of the frames."""
+        self.check(sampwidth)
+        return audioop.minmax(frames, sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def avg(self, frames, sampwidth):
+        """Return the average of the samples, rounded down."""
+        self.check(sampwidth)
+        return audioop.avg(frames, sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def cross(self, frames, sampwidth):
+        """Return the number of zero crossings in the frames."""
+        self.check(sampwidth)
+        return audioop.cross(frames, sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def bias(self, frames, sampwidth, value):
+        """Return frames with a bias added to each sample (wrap around)."""
+        self.check(sampwidth)
+        return audioop.bias(frames, sampwidth, int(value))
+
+    # -----------------------------------------------------------------------
+
+    def mul(self, frames, sampwidth, factor):
+        """Return frames multiplied by a factor (rounded down and clipped)."""
+        self.check(sampwidth)
+        return audioop.mul(frames, sampwidth, factor)
+
+    # -----------------------------------------------------------------------
+
+    def lin2lin(self, frames, sampwidth, new_sampwidth):
+        """Return frames converted to another sample width."""
+        self.check(sampwidth)
+        self.check(new_sampwidth)
+        return audioop.lin2lin(frames, sampwidth, new_sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def ratecv(self, frames, sampwidth, nchannels, rate, new_rate):
+        """Return frames converted to another frame rate."""
+        self.check(sampwidth, nchannels)
+        return audioop.ratecv(frames, sampwidth, nchannels,
+                              rate, new_rate, None)[0]
@@ -0,0 +1,286 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.backend.basebackend.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+import math
+
+from ..audiodataexc import SampleWidthError
+from ..audiodataexc import ChannelIndexError
+
+# ---------------------------------------------------------------------------
+
+
+class sppasBaseBackend(object):
+    """Base class of the processing of the samples of audio frames.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    A backend implements the operations on the samples of frames that were
+    previously done with the audioop module. The results of all backends
+    are the ones of audioop: samples are signed integers of 1, 2, 3 or 4
+    bytes with the byte order of the machine, and the frames of several
+    channels are interleaved.
+
+    Only the 8 bits samples of WAV files are unsigned: they are supported
+    by samples() and clipping_rate() with the 'unsigned' option.
+
+    """
+
+    # Name of the backend
+    NAME = ""
+
+    # Supported sample widths
+    SAMPWIDTHS = (1, 2, 3, 4)
+
+    def __init__(self):
+        """Create a sppasBaseBackend instance."""
+        pass
+
+    # -----------------------------------------------------------------------
+
+    def get_name(self):
+        """Return the name of the backend."""
+        return self.NAME
+
+    # -----------------------------------------------------------------------
+    # Conversions samples <-> frames
+    # -----------------------------------------------------------------------
+
+    def samples(self, frames, sampwidth, nchannels=1, unsigned=False):
+        """Turn frames into samples.
+
+        :param frames: (str) Audio frames
+        :param sampwidth: (int) Sample width of the frames
+        :param nchannels: (int) Number of channels in the frames
+        :param unsigned: (bool) 8 bits frames are unsigned, like in WAV
+        :returns: (list of list) the samples of each channel
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def frames(self, samples, sampwidth, nchannels=1):
+        """Turn samples into frames.
+
+        :param samples: (list of list) The samples of each channel
+        :param sampwidth: (int) Sample width of the frames
+        :param nchannels: (int) Number of channels in the samples
+        :returns: (bytes) interleaved frames
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+    # Estimators
+    # -----------------------------------------------------------------------
+
+    def rms(self, frames, sampwidth):
+        """Return the root mean square of the samples of the frames."""
+        n = len(frames) // sampwidth
+        if n == 0:
+            return 0
+        return int(math.sqrt(float(self.sum_squares(frames, sampwidth)) / n))
+
+    # -----------------------------------------------------------------------
+
+    def rms_windows(self, frames, sampwidth, win, shift):
+        """Return the root mean square of all the windows of the frames.
+
+        :param frames: (str) Audio frames of a mono channel
+        :param sampwidth: (int) Sample width of the frames
+        :param win: (int) Number of frames of a window, at least 1
+        :param shift: (int) Number of frames between two windows
+        :returns: (list of int) the rms of the windows starting at 0,
+        shift, 2*shift... which are ending before the end of the frames
+
+        """
+        width = win * sampwidth
+        step = shift * sampwidth
+        return [self.rms(frames[start:start+width], sampwidth)
+                for start in range(0, len(frames) - width + 1, step)]
+
+    # -----------------------------------------------------------------------
+
+    def sum_squares(self, frames, sampwidth):
+        """Return the exact sum of the squares of the samples."""
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def minmax(self, frames, sampwidth):
+        """Return the (minimum, maximum) of the samples of the frames."""
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def avg(self, frames, sampwidth):
+        """Return the average of the samples, rounded down."""
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def cross(self, frames, sampwidth):
+        """Return the number of zero crossings in the frames.
+
+        Like audioop, the first sample is a crossing (-1 for no sample).
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def clipping_rate(self, frames, sampwidth, factor, unsigned=False):
+        """Return the rate of samples out of the factor of the range.
+
+        :param frames: (str) Audio frames
+        :param sampwidth: (int) Sample width of the frames
+        :param factor: (float) A factor between 0 and 1 of the range of
+        the values of the samples.
+        :param unsigned: (bool) 8 bits frames are unsigned, like in WAV
+        :returns: (float)
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+    # Transformations
+    # -----------------------------------------------------------------------
+
+    def bias(self, frames, sampwidth, value):
+        """Return frames with a bias added to each sample (wrap around)."""
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def mul(self, frames, sampwidth, factor):
+        """Return frames multiplied by a factor (rounded down and clipped)."""
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def lin2lin(self, frames, sampwidth, new_sampwidth):
+        """Return frames converted to another sample width."""
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def ratecv(self, frames, sampwidth, nchannels, rate, new_rate):
+        """Return frames converted to another frame rate.
+
+        The samples are linearly interpolated, like audioop.ratecv()
+        without a state and with the default weights.
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+
+    def mix(self, fragments, sampwidth, factors, attenuator=1.,
+            unsigned=False):
+        """Return the frames of the weighted sum of several fragments.
+
+        Each sample of the result is the sum of the samples of the
+        fragments multiplied by their factor and by the attenuator. It is
+        clipped to the range of the samples then truncated toward zero.
+
+        :param fragments: (list of str) Frames of the same sample width
+        :param sampwidth: (int) Sample width of the frames
+        :param factors: (list of float) A factor for each fragment
+        :param attenuator: (float) A factor applied to each sum
+        :param unsigned: (bool) 8 bits frames are unsigned, like in WAV
+        :returns: (bytes) frames of the length of the shortest fragment
+
+        """
+        raise NotImplementedError
+
+    # -----------------------------------------------------------------------
+    # Utilities for the backends
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def check(sampwidth, nchannels=1):
+        """Raise an exception if the sample width or channels are invalid."""
+        if sampwidth not in sppasBaseBackend.SAMPWIDTHS:
+            raise SampleWidthError(sampwidth)
+        if nchannels < 1:
+            raise ChannelIndexError(nchannels)
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def get_maxval(sampwidth):
+        """Return the max value of a signed sample."""
+        return (1 << (8 * sampwidth - 1)) - 1
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def get_minval(sampwidth):
+        """Return the min value of a signed sample."""
+        return -(1 << (8 * sampwidth - 1))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def clip_limits(sampwidth, factor):
+        """Return the (min, max) values out of which a sample is clipped."""
+        max_val = int(sppasBaseBackend.get_maxval(sampwidth) * (factor / 2.))
+        min_val = int(sppasBaseBackend.get_minval(sampwidth) * (factor / 2.))
+        return min_val, max_val
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def ratecv_size(nframes, rate, new_rate):
+        """Return the reduced rates and the number of converted frames.
+
+        The frame m of the result interpolates the input frames k-1 and k,
+        with k the smallest integer such as k*new_rate >= m*rate (after the
+        reduction of the rates by their gcd).
+
+        """
+        a, b = rate, new_rate
+        while b:
+            a, b = b, a % b
+        rate //= a
+        new_rate //= a
+        if nframes == 0:
+            return rate, new_rate, 0
+        return rate, new_rate, (nframes - 1) * new_rate // rate + 1
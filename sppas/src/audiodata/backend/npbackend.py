@@ -0,0 +1,322 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.backend.npbackend.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Requires NumPy: importing this module raises ImportError otherwise.
+
+"""
+
+import math
+import numpy as np
+
+from .basebackend import sppasBaseBackend
+
+# ---------------------------------------------------------------------------
+
+
+class sppasNumpyBackend(sppasBaseBackend):
+    """Process the samples of audio frames with NumPy.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The frames of 1, 2 or 4 bytes are viewed as arrays without any copy
+    (np.frombuffer), and the operations are vectorized. The sums are
+    computed with 64 bits integers by chunks, so they are exact.
+
+    """
+
+    NAME = "numpy"
+
+    # Types of the arrays for the sample widths
+    DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+    # Number of samples of the chunks to sum squares
+    CHUNK_SIZE = 1 << 24
+
+    # -----------------------------------------------------------------------
+    # Conversions samples <-> frames
+    # -----------------------------------------------------------------------
+
+    def samples(self, frames, sampwidth, nchannels=1, unsigned=False):
+        """Turn frames into samples.
+
+        :param frames: (str) Audio frames
+        :param sampwidth: (int) Sample width of the frames
+        :param nchannels: (int) Number of channels in the frames
+        :param unsigned: (bool) 8 bits frames are unsigned, like in WAV
+        :returns: (list of list) the samples of each channel
+
+        """
+        sampwidth = int(sampwidth)
+        nchannels = int(nchannels)
+        self.check(sampwidth, nchannels)
+        data = self.unpack(frames, sampwidth, unsigned)
+        if nchannels == 1:
+            return [data.tolist()]
+        nframes = len(data) // nchannels
+        data = data[:nframes * nchannels].reshape(nframes, nchannels)
+        return [data[:, i].tolist() for i in range(nchannels)]
+
+    # -----------------------------------------------------------------------
+
+    def frames(self, samples, sampwidth, nchannels=1):
+        """Turn samples into frames.
+
+        :param samples: (list of list) The samples of each channel
+        :param sampwidth: (int) Sample width of the frames
+        :param nchannels: (int) Number of channels in the samples
+        :returns: (bytes) interleaved frames
+
+        """
+        sampwidth = int(sampwidth)
+        nchannels = int(nchannels)
+        self.check(sampwidth, nchannels)
+        nframes = len(samples[0])
+        data = np.empty((nframes, nchannels), dtype=np.int64)
+        for i in range(nchannels):
+            data[:, i] = samples[i][:nframes]
+        return self.pack(data.ravel(), sampwidth)
+
+    # -----------------------------------------------------------------------
+    # Estimators
+    # -----------------------------------------------------------------------
+
+    def sum_squares(self, frames, sampwidth):
+        """Return the exact sum of the squares of the samples.
+
+        A sample is split into x = h*2^16 + l, so that each term of
+        x^2 = h^2*2^32 + h*l*2^17 + l^2 is summed without overflow.
+
+        """
+        data = self.unpack(frames, sampwidth)
+        total = 0
+        for i in range(0, len(data), sppasNumpyBackend.CHUNK_SIZE):
+            chunk = data[i:i+sppasNumpyBackend.CHUNK_SIZE].astype(np.int64)
+            if sampwidth < 3:
+                total += int(np.dot(chunk, chunk))
+            else:
+                high = chunk >> 16
+                low = chunk & 0xffff
+                total += (int(np.dot(high, high)) << 32) + \
+                         (int(np.dot(high, low)) << 17) + \
+                         int(np.dot(low, low))
+        return total
+
+    # -----------------------------------------------------------------------
+
+    def rms_windows(self, frames, sampwidth, win, shift):
+        """Return the root mean square of all the windows of the frames.
+
+        The windows are the rows of a strided view of the squares, so that
+        they are summed without any copy. Like in sum_squares(), 24 and
+        32 bits samples are split in two parts to sum without overflow.
+
+        """
+        data = self.unpack(frames, sampwidth)
+        if len(data) < win:
+            return list()
+        nwin = (len(data) - win) // shift + 1
+        data = data.astype(np.int64)
+        if sampwidth < 3:
+            sums = self.__window_sums(data * data, win, shift, nwin)
+            return np.sqrt(sums / float(win)).astype(np.int64).tolist()
+
+        high = data >> 16
+        low = data & 0xffff
+        sums = zip(self.__window_sums(high * high, win, shift, nwin).tolist(),
+                   self.__window_sums(high * low, win, shift, nwin).tolist(),
+                   self.__window_sums(low * low, win, shift, nwin).tolist())
+        return [int(math.sqrt(float((hh << 32) + (hl << 17) + ll) / win))
+                for hh, hl, ll in sums]
+
+    # -----------------------------------------------------------------------
+
+    def minmax(self, frames, sampwidth):
+        """Return the (minimum, maximum) of the samples of the frames."""
+        data = self.unpack(frames, sampwidth)
+        if len(data) == 0:
+            return 0x7fffffff, -0x80000000
+        return int(data.min()), int(data.max())
+
+    # -----------------------------------------------------------------------
+
+    def avg(self, frames, sampwidth):
+        """Return the average of the samples, rounded down."""
+        data = self.unpack(frames, sampwidth)
+        if len(data) == 0:
+            return 0
+        total = int(data.sum(dtype=np.int64))
+        return int(np.floor(float(total) / float(len(data))))
+
+    # -----------------------------------------------------------------------
+
+    def cross(self, frames, sampwidth):
+        """Return the number of zero crossings in the frames."""
+        data = self.unpack(frames, sampwidth)
+        if len(data) == 0:
+            return -1
+        signs = data < 0
+        return int(np.count_nonzero(signs[1:] != signs[:-1]))
+
+    # -----------------------------------------------------------------------
+
+    def clipping_rate(self, frames, sampwidth, factor, unsigned=False):
+        """Return the rate of samples out of the factor of the range."""
+        data = self.unpack(frames, sampwidth, unsigned)
+        min_val, max_val = self.clip_limits(sampwidth, factor)
+        nb_clipping = np.count_nonzero((data >= max_val) | (data <= min_val))
+        return float(nb_clipping) / len(data)
+
+    # -----------------------------------------------------------------------
+    # Transformations
+    # -----------------------------------------------------------------------
+
+    def bias(self, frames, sampwidth, value):
+        """Return frames with a bias added to each sample (wrap around)."""
+        modulo = 1 << (8 * sampwidth)
+        half = modulo >> 1
+        data = self.unpack(frames, sampwidth).astype(np.int64)
+        data = np.mod(data + (int(value) % modulo) + half, modulo) - half
+        return self.pack(data, sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def mul(self, frames, sampwidth, factor):
+        """Return frames multiplied by a factor (rounded down and clipped)."""
+        data = self.unpack(frames, sampwidth).astype(np.float64)
+        data = np.floor(data * float(factor))
+        data = np.clip(data, self.get_minval(sampwidth),
+                       self.get_maxval(sampwidth))
+        return self.pack(data.astype(np.int64), sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def lin2lin(self, frames, sampwidth, new_sampwidth):
+        """Return frames converted to another sample width."""
+        self.check(new_sampwidth)
+        data = self.unpack(frames, sampwidth).astype(np.int64)
+        data = (data << (32 - 8 * sampwidth)) >> (32 - 8 * new_sampwidth)
+        return self.pack(data, new_sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def ratecv(self, frames, sampwidth, nchannels, rate, new_rate):
+        """Return frames converted to another frame rate."""
+        nchannels = int(nchannels)
+        self.check(sampwidth, nchannels)
+        shift = 32 - 8 * sampwidth
+        data = self.unpack(frames, sampwidth).astype(np.int64) << shift
+        nframes = len(data) // nchannels
+        rate, new_rate, size = self.ratecv_size(nframes, int(rate),
+                                                int(new_rate))
+        if size == 0:
+            return b""
+        data = data[:nframes * nchannels].reshape(nframes, nchannels)
+
+        m = np.arange(size, dtype=np.int64)
+        k = -((-m * rate) // new_rate)
+        d = (k * new_rate - m * rate).astype(np.float64)[:, np.newaxis]
+        cur = data[k].astype(np.float64)
+        prev = np.where((k > 0)[:, np.newaxis],
+                        data[np.maximum(k - 1, 0)], 0).astype(np.float64)
+        values = (prev * d + cur * (float(new_rate) - d)) / float(new_rate)
+        values = np.trunc(values).astype(np.int64) >> shift
+
+        return self.pack(values.ravel(), sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def mix(self, fragments, sampwidth, factors, attenuator=1.,
+            unsigned=False):
+        """Return the frames of the weighted sum of several fragments."""
+        attenuator = float(attenuator)
+        data = [self.unpack(f, sampwidth, unsigned) for f in fragments]
+        n = min(len(d) for d in data)
+        sums = np.zeros(n, dtype=np.float64)
+        for values, factor in zip(data, factors):
+            sums += values[:n].astype(np.float64) * float(factor) * attenuator
+
+        sums = np.clip(sums, self.get_minval(sampwidth),
+                       self.get_maxval(sampwidth))
+        values = np.trunc(sums).astype(np.int64)
+        if sampwidth == 1 and unsigned is True:
+            return (values + 128).astype(np.uint8).tobytes()
+        return self.pack(values, sampwidth)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __window_sums(values, win, shift, nwin):
+        """Return the sums of nwin windows of a contiguous int64 array."""
+        step = values.strides[0]
+        windows = np.lib.stride_tricks.as_strided(
+            values, shape=(nwin, win), strides=(shift * step, step),
+            writeable=False)
+        return windows.sum(axis=1)
+
+    # -----------------------------------------------------------------------
+
+    def unpack(self, frames, sampwidth, unsigned=False):
+        """Return the samples of the frames into a numpy array."""
+        self.check(sampwidth)
+        n = len(frames) // sampwidth
+        if sampwidth == 1 and unsigned is True:
+            data = np.frombuffer(frames, dtype=np.uint8, count=n)
+            return data.astype(np.int16) - 128
+
+        if sampwidth == 3:
+            raw = np.frombuffer(frames, dtype=np.uint8, count=n * 3)
+            padded = np.zeros((n, 4), dtype=np.uint8)
+            padded[:, 1:] = raw.reshape(n, 3)
+            return padded.view(np.int32).ravel() >> 8
+
+        return np.frombuffer(frames, dtype=sppasNumpyBackend.DTYPES[sampwidth],
+                             count=n)
+
+    # -----------------------------------------------------------------------
+
+    def pack(self, values, sampwidth):
+        """Return the frames of an array of samples."""
+        self.check(sampwidth)
+        if sampwidth == 3:
+            data = (np.asarray(values, dtype=np.int64) << 8).astype(np.int32)
+            return data.view(np.uint8).reshape(-1, 4)[:, 1:].tobytes()
+
+        dtype = sppasNumpyBackend.DTYPES[sampwidth]
+        return np.asarray(values).astype(dtype).tobytes()
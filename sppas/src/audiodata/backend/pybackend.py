@@ -0,0 +1,299 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.backend.pybackend.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+import math
+import operator
+from array import array
+
+from .basebackend import sppasBaseBackend
+
+# ---------------------------------------------------------------------------
+
+
+class sppasPythonBackend(sppasBaseBackend):
+    """Process the samples of audio frames in pure Python.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The frames are turned into arrays of integers with the array module.
+    This is the fallback backend, available with any version of Python.
+
+    """
+
+    NAME = "python"
+
+    # Type of the arrays for the sample widths
+    TYPECODES = {1: 'b', 2: 'h', 4: 'i'}
+
+    # -----------------------------------------------------------------------
+    # Conversions samples <-> frames
+    # -----------------------------------------------------------------------
+
+    def samples(self, frames, sampwidth, nchannels=1, unsigned=False):
+        """Turn frames into samples.
+
+        :param frames: (str) Audio frames
+        :param sampwidth: (int) Sample width of the frames
+        :param nchannels: (int) Number of channels in the frames
+        :param unsigned: (bool) 8 bits frames are unsigned, like in WAV
+        :returns: (list of list) the samples of each channel
+
+        """
+        sampwidth = int(sampwidth)
+        nchannels = int(nchannels)
+        self.check(sampwidth, nchannels)
+        data = self.unpack(frames, sampwidth, unsigned)
+        if nchannels == 1:
+            return [list(data)]
+        return [list(data[i::nchannels]) for i in range(nchannels)]
+
+    # -----------------------------------------------------------------------
+
+    def frames(self, samples, sampwidth, nchannels=1):
+        """Turn samples into frames.
+
+        :param samples: (list of list) The samples of each channel
+        :param sampwidth: (int) Sample width of the frames
+        :param nchannels: (int) Number of channels in the samples
+        :returns: (bytes) interleaved frames
+
+        """
+        sampwidth = int(sampwidth)
+        nchannels = int(nchannels)
+        self.check(sampwidth, nchannels)
+        nframes = len(samples[0])
+        if nchannels == 1:
+            return self.pack(samples[0], sampwidth)
+        data = [0] * (nframes * nchannels)
+        for i in range(nchannels):
+            data[i::nchannels] = samples[i][:nframes]
+        return self.pack(data, sampwidth)
+
+    # -----------------------------------------------------------------------
+    # Estimators
+    # -----------------------------------------------------------------------
+
+    def sum_squares(self, frames, sampwidth):
+        """Return the exact sum of the squares of the samples."""
+        data = self.unpack(frames, sampwidth)
+        return sum(map(operator.mul, data, data))
+
+    # -----------------------------------------------------------------------
+
+    def rms_windows(self, frames, sampwidth, win, shift):
+        """Return the root mean square of all the windows of the frames.
+
+        The squares of overlapping windows are estimated only once.
+
+        """
+        data = self.unpack(frames, sampwidth)
+        starts = range(0, len(data) - win + 1, shift)
+        if shift < win:
+            squares = list(map(operator.mul, data, data))
+            sums = [sum(squares[start:start+win]) for start in starts]
+        else:
+            sums = [sum(map(operator.mul, data[start:start+win],
+                            data[start:start+win])) for start in starts]
+        return [int(math.sqrt(float(total) / win)) for total in sums]
+
+    # -----------------------------------------------------------------------
+
+    def minmax(self, frames, sampwidth):
+        """Return the (minimum, maximum) of the samples of the frames."""
+        data = self.unpack(frames, sampwidth)
+        if len(data) == 0:
+            return 0x7fffffff, -0x80000000
+        return min(data), max(data)
+
+    # -----------------------------------------------------------------------
+
+    def avg(self, frames, sampwidth):
+        """Return the average of the samples, rounded down."""
+        data = self.unpack(frames, sampwidth)
+        if len(data) == 0:
+            return 0
+        return int(math.floor(float(sum(data)) / float(len(data))))
+
+    # -----------------------------------------------------------------------
+
+    def cross(self, frames, sampwidth):
+        """Return the number of zero crossings in the frames."""
+        data = self.unpack(frames, sampwidth)
+        if len(data) == 0:
+            return -1
+        signs = [v < 0 for v in data]
+        return sum(map(operator.ne, signs[1:], signs[:-1]))
+
+    # -----------------------------------------------------------------------
+
+    def clipping_rate(self, frames, sampwidth, factor, unsigned=False):
+        """Return the rate of samples out of the factor of the range."""
+        data = self.unpack(frames, sampwidth, unsigned)
+        min_val, max_val = self.clip_limits(sampwidth, factor)
+        nb_clipping = 0
+        for v in data:
+            if v >= max_val or v <= min_val:
+                nb_clipping += 1
+
+        return float(nb_clipping) / len(data)
+
+    # -----------------------------------------------------------------------
+    # Transformations
+    # -----------------------------------------------------------------------
+
+    def bias(self, frames, sampwidth, value):
+        """Return frames with a bias added to each sample (wrap around)."""
+        value = int(value)
+        modulo = 1 << (8 * sampwidth)
+        half = modulo >> 1
+        data = self.unpack(frames, sampwidth)
+        return self.pack([((v + value + half) % modulo) - half for v in data],
+                         sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def mul(self, frames, sampwidth, factor):
+        """Return frames multiplied by a factor (rounded down and clipped)."""
+        factor = float(factor)
+        max_val = self.get_maxval(sampwidth)
+        min_val = self.get_minval(sampwidth)
+        floor = math.floor
+        data = self.unpack(frames, sampwidth)
+        return self.pack([min(max(int(floor(v * factor)), min_val), max_val)
+                          for v in data], sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def lin2lin(self, frames, sampwidth, new_sampwidth):
+        """Return frames converted to another sample width."""
+        self.check(new_sampwidth)
+        left = 32 - 8 * sampwidth
+        right = 32 - 8 * new_sampwidth
+        data = self.unpack(frames, sampwidth)
+        return self.pack([(v << left) >> right for v in data], new_sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def ratecv(self, frames, sampwidth, nchannels, rate, new_rate):
+        """Return frames converted to another frame rate."""
+        nchannels = int(nchannels)
+        self.check(sampwidth, nchannels)
+        shift = 32 - 8 * sampwidth
+        data = [v << shift for v in self.unpack(frames, sampwidth)]
+        nframes = len(data) // nchannels
+        rate, new_rate, size = self.ratecv_size(nframes, int(rate),
+                                                int(new_rate))
+
+        result = [0] * (size * nchannels)
+        fr = float(new_rate)
+        for m in range(size):
+            k = -((-m * rate) // new_rate)
+            d = k * new_rate - m * rate
+            for c in range(nchannels):
+                cur = data[k * nchannels + c]
+                prev = data[(k - 1) * nchannels + c] if k > 0 else 0
+                value = int((float(prev) * float(d) +
+                             float(cur) * float(new_rate - d)) / fr)
+                result[m * nchannels + c] = value >> shift
+
+        return self.pack(result, sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def mix(self, fragments, sampwidth, factors, attenuator=1.,
+            unsigned=False):
+        """Return the frames of the weighted sum of several fragments."""
+        attenuator = float(attenuator)
+        data = [self.unpack(f, sampwidth, unsigned) for f in fragments]
+        n = min(len(d) for d in data)
+        sums = [0.] * n
+        for values, factor in zip(data, factors):
+            factor = float(factor)
+            sums = [s + v * factor * attenuator
+                    for s, v in zip(sums, values)]
+
+        max_val = self.get_maxval(sampwidth)
+        min_val = self.get_minval(sampwidth)
+        values = [int(min(max(s, min_val), max_val)) for s in sums]
+        if sampwidth == 1 and unsigned is True:
+            return array('B', [v + 128 for v in values]).tobytes()
+        return self.pack(values, sampwidth)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def unpack(self, frames, sampwidth, unsigned=False):
+        """Return the samples of the frames into an array of integers."""
+        self.check(sampwidth)
+        if len(frames) % sampwidth:
+            frames = frames[:len(frames) - len(frames) % sampwidth]
+
+        if sampwidth == 1 and unsigned is True:
+            data = array('B')
+            data.frombytes(frames)
+            return [v - 128 for v in data]
+
+        if sampwidth == 3:
+            # insert a null byte: the 32 bits values are 256 times the samples
+            padded = bytearray(len(frames) // 3 * 4)
+            for k in range(3):
+                padded[k+1::4] = frames[k::3]
+            data = array('i')
+            data.frombytes(bytes(padded))
+            return [v >> 8 for v in data]
+
+        data = array(sppasPythonBackend.TYPECODES[sampwidth])
+        data.frombytes(frames)
+        return data
+
+    # -----------------------------------------------------------------------
+
+    def pack(self, values, sampwidth):
+        """Return the frames of a list of samples."""
+        self.check(sampwidth)
+        if sampwidth == 3:
+            data = array('i', [v << 8 for v in values]).tobytes()
+            frames = bytearray(len(values) * 3)
+            for k in range(3):
+                frames[k::3] = data[k+1::4]
+            return bytes(frames)
+
+        return array(sppasPythonBackend.TYPECODES[sampwidth], values).tobytes()
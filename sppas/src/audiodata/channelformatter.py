@@ -31,11 +31,19 @@
     src.audiodata.channelformatter.py
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+    The frame rate and the sample width are converted block by block, by
+    a polyphase filter with a dither (see sppasResampler): the channel can
+    be a view of an audio file, only a block of it is then read at a time.
+
 """
 
-from .channelframes import sppasChannelFrames
+import wave
+
+from sppas.src.utils import u
+
 from .channel import sppasChannel
 from .audioframes import sppasAudioFrames
+from .resampler import sppasResampler
 
 # ---------------------------------------------------------------------------
 
@@ -50,6 +58,10 @@ class sppasChannelFormatter(object):
     :summary:      A channel formatter class.
 
     """
+
+    # Number of frames converted at a time
+    BLOCK_SIZE = 65536
+
     def __init__(self, channel):
         """Create a sppasChannelFormatter instance.
 
@@ -130,12 +142,35 @@ class sppasChannelFormatter(object):
         Convert to the expected (already) given sample width and frame rate.
 
         """
-        new_channel = sppasChannel()
-        new_channel.set_frames(self.__convert_frames(self._channel.get_frames()))
-        new_channel.set_sampwidth(self._sampwidth)
-        new_channel.set_framerate(self._framerate)
+        if self.__is_converted() is True:
+            return
+        frames = b"".join(self.__convert_blocks())
+        self._channel = sppasChannel(self._framerate, self._sampwidth, frames)
 
-        self._channel = new_channel
+    # -----------------------------------------------------------------------
+
+    def convert_file(self, filename):
+        """Convert the channel and write it into a WAV file.
+
+        The converted frames are written block by block: the converted
+        channel is never in memory.
+
+        :param filename: (str) Name of the WAV file to write
+
+        """
+        f = wave.Wave_write(u(filename))
+        f.setnchannels(1)
+        f.setsampwidth(self._sampwidth)
+        f.setframerate(self._framerate)
+        try:
+            if self.__is_converted() is True:
+                blocks = self.__read_blocks()
+            else:
+                blocks = self.__convert_blocks()
+            for frames in blocks:
+                f.writeframes(frames)
+        finally:
+            f.close()
 
     # -----------------------------------------------------------------------
     # Workers
@@ -267,21 +302,29 @@ class sppasChannelFormatter(object):
     # Private
     # ----------------------------------------------------------------------
 
-    def __convert_frames(self, frames):
-        """Convert frames to the expected sample width and frame rate.
-
-        :param frames: (str) the frames to convert
+    def __is_converted(self):
+        """Return True if the channel has the expected parameters."""
+        return self._channel.get_framerate() == self._framerate and \
+            self._channel.get_sampwidth() == self._sampwidth
 
-        """
-        f = frames
-        fragment = sppasChannelFrames(f)
+    # ----------------------------------------------------------------------
 
-        # Convert the sample width if it needs to
-        if self._channel.get_sampwidth() != self._sampwidth:
-            fragment.change_sampwidth(self._channel.get_sampwidth(), self._sampwidth)
+    def __read_blocks(self):
+        """Return a generator of the frames of the channel, block by block."""
+        nframes = int(self._channel.get_nframes())
+        size = sppasChannelFormatter.BLOCK_SIZE
+        for begin in range(0, nframes, size):
+            fragment = self._channel.extract_fragment(begin, begin + size)
+            yield fragment.get_frames()
 
-        # Convert the self._framerate if it needs to
-        if self._channel.get_framerate() != self._framerate:
-            fragment.resample(self._sampwidth, self._channel.get_framerate(), self._framerate)
+    # ----------------------------------------------------------------------
 
-        return fragment.get_frames()
+    def __convert_blocks(self):
+        """Return a generator of the converted frames, block by block."""
+        resampler = sppasResampler(self._channel.get_framerate(),
+                                   self._channel.get_sampwidth(),
+                                   self._framerate,
+                                   self._sampwidth)
+        for frames in self.__read_blocks():
+            yield resampler.convert(frames)
+        yield resampler.flush()
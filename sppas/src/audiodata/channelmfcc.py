@@ -31,9 +31,6 @@
     src.audiodata.channelmfcc.py
     ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
-    Requires HTK to be installed.
-
-
     Mel-frequency cepstrum (MFC) is a representation of the short-term power
     spectrum of a sound, based on a linear cosine transform of a log power
     spectrum on a nonlinear mel scale of frequency.
@@ -46,10 +43,15 @@
         4. Take the discrete cosine transform of the list of mel log powers, as if it were a signal.
         5. The MFCCs are the amplitudes of the resulting spectrum.
 
+    The features are estimated by sppasMFCC, like HCopy of HTK does: HTK
+    is not required.
+
 """
 import os
 import subprocess
 
+from .mfcc import sppasMFCC
+
 # ---------------------------------------------------------------------------
 
 
@@ -85,36 +87,85 @@ class sppasChannelMFCC(object):
     def __init__(self, channel=None):
         """Create a sppasChannelMFCC instance.
 
-        :param channel: (sppasChannel) The channel to work on. Currently not used...!!!
+        :param channel: (sppasChannel) The channel to work on.
 
         """
         self._channel = channel
 
     # ----------------------------------------------------------------------
 
-    def hcopy(self, wavconfigfile, scpfile):
+    def hcopy(self, wavconfigfile, scpfile, nb_workers=1):
         """Create MFCC files from features described in the config file.
-        Requires HCopy to be installed.
 
-        :param wavconfigfile: (str)
+        The scp file is a list of lines with the name of an audio file and
+        the name of the MFCC file to create, like the ones of HCopy.
+
+        :param wavconfigfile: (str) Configuration file of HTK
         :param scpfile: (str)
+        :param nb_workers: (int) Number of processes, 0 for the number of CPUs
+        :returns: (bool) All the files were created
 
         """
-        if test_command("HCopy") is False:
-            return False
-
         try:
-            subprocess.check_call(["HCopy", "-T", "0",
-                                   "-C", wavconfigfile,
-                                   "-S", scpfile])
-        except subprocess.CalledProcessError:
+            mfcc = sppasMFCC(wavconfigfile)
+            files = sppasChannelMFCC.read_scp(scpfile)
+        except (IOError, ValueError):
             return False
 
-        return True
+        done = True
+        for filename, error in mfcc.convert_files(files, nb_workers):
+            if error is not None:
+                done = False
+
+        return done
 
     # ----------------------------------------------------------------------
 
     def evaluate(self, features):
-        """Evaluate MFCC of the given channel."""
+        """Evaluate MFCC of the given channel.
+
+        :param features: (str or sppasMFCC) Configuration file of HTK or
+        features extractor
+        :returns: (list) Feature vectors, one every TARGETRATE
+
+        """
+        if isinstance(features, sppasMFCC) is False:
+            features = sppasMFCC(features)
+
+        return features.evaluate_channel(self._channel)
 
-        raise NotImplementedError
+    # ----------------------------------------------------------------------
+
+    def write(self, features, filename):
+        """Save the MFCC of the given channel into a file of the HTK format.
+
+        :param features: (str or sppasMFCC) Configuration file of HTK or
+        features extractor
+        :param filename: (str) Name of the MFCC file
+
+        """
+        if isinstance(features, sppasMFCC) is False:
+            features = sppasMFCC(features)
+
+        features.write_htk(filename, features.evaluate_channel(self._channel))
+
+    # ----------------------------------------------------------------------
+
+    @staticmethod
+    def read_scp(filename):
+        """Return the list of (source, target) of an scp file of HTK.
+
+        :param filename: (str)
+        :returns: list of tuples
+
+        """
+        files = list()
+        with open(filename, "r") as fp:
+            for line in fp:
+                tab = line.split()
+                if len(tab) == 2:
+                    files.append((tab[0], tab[1]))
+                elif len(tab) > 0:
+                    raise ValueError("Invalid line in {:s}: {:s}"
+                                     "".format(filename, line.strip()))
+        return files
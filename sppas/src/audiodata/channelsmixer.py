@@ -33,12 +33,10 @@
 
 """
 
-import struct
-
 from .channel import sppasChannel
 from .channelframes import sppasChannelFrames
 from .audiodataexc import MixChannelError
-from .audioconvert import sppasAudioConverter
+from .backend import get_backend
 
 # ---------------------------------------------------------------------------
 
@@ -53,6 +51,10 @@ class sppasChannelMixer(object):
     :summary:      A channel utility class to mix several channels in one.
 
     """
+
+    # Number of frames of the blocks to mix
+    BLOCK_SIZE = 65536
+
     def __init__(self):
         """Create a ChannelMixer instance."""
         
@@ -107,46 +109,13 @@ class sppasChannelMixer(object):
 
     # -----------------------------------------------------------------------
 
-    @staticmethod
-    def _sample_calculator(channels, pos, sampwidth, factors, attenuator):
-        """Return the sample value, applying a factor and an attenuator.
-
-        :param channels: (Channel[]) the list of channels
-        :param pos: (int) the position of the sample to calculate
-        :param sampwidth: (int) the sample width
-        :param factors: (float[]) the list of factors to apply to each sample of a channel (1 channel = 1 factor)
-        :param attenuator: (float) a factor to apply to each sum of samples
-
-        :returns: (float) the value of the sample calculated
-
-        """
-        # variables to compare the value of the result sample to avoid clipping
-        minval = float(sppasChannelFrames().get_minval(sampwidth))
-        maxval = float(sppasChannelFrames().get_maxval(sampwidth))
-
-        # the result sample is the sum of each sample with the application of the factors
-        sampsum = 0
-        for factor, channel in zip(factors, channels):
-            data = channel.get_frames()[pos:pos+sampwidth]
-            data = sppasAudioConverter().unpack_data(data, sampwidth, 1)
-            data = data[0]
-            # without a cast, sum is a float!
-            sampsum += (data[0] * factor * attenuator)
-
-        # truncate the values if there is clipping
-        if sampsum < 0:
-            return max(sampsum, minval)
-
-        elif sampsum > 0:
-            return min(sampsum, maxval)
-
-        return 0.
-
-    # -----------------------------------------------------------------------
-
     def mix(self, attenuator=1):
         """Mix the channels of the list in one.
 
+        The channels are processed by blocks: each sample of the result is
+        the sum of the samples of the channels multiplied by their factor
+        and by the attenuator, clipped to the range of the samples.
+
         :param attenuator: (float) the factor to apply to each sample calculated
         :returns: the result Channel
 
@@ -156,26 +125,11 @@ class sppasChannelMixer(object):
         sampwidth = self._channels[0].get_sampwidth()
         framerate = self._channels[0].get_framerate()
 
-        frames = b""
-        if sampwidth == 4:
-            for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-                value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, attenuator)
-                try:
-                    frames += struct.pack("<l", long(value))  # python 2
-                except:
-                    frames += struct.pack("<l", int(value))  # python 3
-
-        elif sampwidth == 2:
-            for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-                value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, attenuator)
-                frames += struct.pack("<h", int(value))
-
-        else:
-            for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-                value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, attenuator)
-                frames += struct.pack("<b", int(value))
+        frames = bytearray(len(self._channels[0].get_frames()))
+        for start, block in self._mix_blocks(attenuator):
+            frames[start:start+len(block)] = block
 
-        return sppasChannel(framerate, sampwidth, frames)
+        return sppasChannel(framerate, sampwidth, bytes(frames))
 
     # -----------------------------------------------------------------------
 
@@ -189,17 +143,16 @@ class sppasChannelMixer(object):
         self.check_channels()
 
         sampwidth = self._channels[0].get_sampwidth()
+        backend = get_backend()
         minval = 0
         maxval = 0
-        sampsum = 0
-        for s in range(0, len(self._channels[0].get_frames()), sampwidth):
-            value = sppasChannelMixer._sample_calculator(self._channels, s, sampwidth, self._factors, 1)
-            try:
-                sampsum = long(value)   # python 2
-            except:
-                sampsum = int(value)  # python 3
-            maxval = max(sampsum, maxval)
-            minval = min(sampsum, minval)
+        for start, block in self._mix_blocks(1):
+            if sampwidth == 1:
+                # unsigned to signed samples
+                block = backend.bias(block, 1, 128)
+            block_min, block_max = backend.minmax(block, sampwidth)
+            minval = min(block_min, minval)
+            maxval = max(block_max, maxval)
 
         return minval, maxval
 
@@ -221,3 +174,29 @@ class sppasChannelMixer(object):
                 self._channels[i] = sppasChannel(self._channels[i].get_framerate(),
                                                  self._channels[i].get_sampwidth(),
                                                  fragment.get_frames())
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def _mix_blocks(self, attenuator):
+        """Mix the channels by blocks of frames.
+
+        Like in WAV files, 8 bits samples are unsigned.
+
+        :param attenuator: (float) the factor to apply to each sum
+        :returns: generator of tuples (position in bytes, mixed frames)
+
+        """
+        sampwidth = self._channels[0].get_sampwidth()
+        backend = get_backend()
+        block_size = self.BLOCK_SIZE * sampwidth
+        fragments = [memoryview(c.get_frames()) for c in self._channels]
+
+        for start in range(0, len(fragments[0]), block_size):
+            end = start + block_size
+            yield start, backend.mix([f[start:end] for f in fragments],
+                                     sampwidth,
+                                     self._factors,
+                                     attenuator,
+                                     unsigned=(sampwidth == 1))
@@ -0,0 +1,175 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.channelview.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+
+from .audiodataexc import IntervalError
+from .channel import sppasChannel
+
+# ----------------------------------------------------------------------------
+
+
+class sppasChannelView(sppasChannel):
+    """A channel of which frames are read from the audio file when used.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    A view is a fragment of a channel of an audio file. Only the number of
+    frames is known at creation: the frames of the fragment are read the
+    first time they are accessed, then they are kept like in a
+    sppasChannel. The audio file must not be closed before.
+
+    Views are created by sppasAudioPCM.read_fragment().
+
+    """
+
+    def __init__(self, audio, index, begin, end):
+        """Create a sppasChannelView instance.
+
+        :param audio: (sppasAudioPCM) An audio with an opened file
+        :param index: (int) Index of the channel in the audio file
+        :param begin: (int) First frame of the fragment
+        :param end: (int) Frame after the last one of the fragment
+
+        """
+        super(sppasChannelView, self).__init__(audio.get_framerate(),
+                                               audio.get_sampwidth())
+        self.__audio = audio
+        self.__index = index
+        self.__begin = begin
+        self.__end = end
+        self.__frames = None
+
+    # -----------------------------------------------------------------------
+
+    @property
+    def _frames(self):
+        """Frames of the fragment, read at first access."""
+        if self.__frames is None:
+            self.__frames = self.__audio.read_channel_frames(self.__index,
+                                                             self.__begin,
+                                                             self.__end)
+        return self.__frames
+
+    @_frames.setter
+    def _frames(self, frames):
+        self.__frames = frames
+
+    # -----------------------------------------------------------------------
+
+    def is_loaded(self):
+        """Return True if the frames were read from the audio file."""
+        return self.__frames is not None
+
+    # -----------------------------------------------------------------------
+
+    def get_begin(self):
+        """Return the position of the first frame in the audio file."""
+        return self.__begin
+
+    # -----------------------------------------------------------------------
+
+    def get_nframes(self):
+        """Return the number of frames, without reading them.
+
+        :returns: (int) the total number of frames
+
+        """
+        if self.__frames is None:
+            return self.__end - self.__begin
+        return super(sppasChannelView, self).get_nframes()
+
+    # -----------------------------------------------------------------------
+
+    def extract_fragment(self, begin=None, end=None):
+        """Extract a fragment between the beginning and the end.
+
+        If the frames were not read, the fragment is another view.
+
+        :param begin: (int: number of frames) the beginning of the fragment to extract
+        :param end: (int: number of frames) the end of the fragment to extract
+        :returns: (sppasChannel) the fragment extracted.
+
+        """
+        if self.__frames is not None:
+            return super(sppasChannelView, self).extract_fragment(begin, end)
+
+        nframes = self.get_nframes()
+        begin, end = sppasChannelView.fragment_limits(nframes, begin, end)
+        return sppasChannelView(self.__audio,
+                                self.__index,
+                                self.__begin + begin,
+                                self.__begin + end)
+
+    # -----------------------------------------------------------------------
+
+    def seek(self, position):
+        """Fix the current position.
+
+        :param position: (int)
+
+        """
+        self._position = max(0, min(position, self.get_nframes()))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def fragment_limits(nframes, begin=None, end=None):
+        """Return the (begin, end) frames of a fragment, like in a channel.
+
+        :param nframes: (int) Number of frames of the channel
+        :param begin: (int: number of frames) the beginning of the fragment
+        :param end: (int: number of frames) the end of the fragment
+        :raises: IntervalError
+
+        """
+        if begin is None:
+            begin = 0
+        if end is None:
+            end = nframes
+        begin = int(begin)
+        end = int(end)
+        if end < 0 or end > nframes:
+            end = nframes
+        if begin > nframes:
+            return nframes, nframes
+        begin = max(0, begin)
+        if begin > end:
+            raise IntervalError(begin, end)
+
+        return begin, end
@@ -34,10 +34,8 @@
 
 """
 
-import logging
-
-from .audioframes import sppasAudioFrames
 from .basevolume import sppasBaseVolume
+from .streamvolume import sppasStreamVolume
 
 # ----------------------------------------------------------------------------
 
@@ -52,6 +50,7 @@ class sppasChannelVolume(sppasBaseVolume):
     :copyright:    Copyright (C) 2011-2016  Brigitte Bigi
 
     The volume is the estimation of RMS values, sampled with a window of 10ms.
+    The estimation is delegated to sppasStreamVolume.
 
     """
 
@@ -65,38 +64,7 @@ class sppasChannelVolume(sppasBaseVolume):
         super(sppasChannelVolume, self).__init__(win_len)
         self._channel = channel
         self._win_len = win_len
-
-        # Remember current position
-        pos = channel.tell()
-
-        # Rewind to the beginning
-        channel.rewind()
-
-        # Constants
-        nb_frames = int(win_len * channel.get_framerate())
-        nb_vols = int(channel.get_duration()/win_len) + 1
-        self._volumes = [0] * nb_vols
-
-        previous_rms = 0
-        for i in range(nb_vols):
-            frames = channel.get_frames(nb_frames)
-            a = sppasAudioFrames(frames, channel.get_sampwidth(), 1)
-            rms = a.rms()
-            if rms > 0:  # provide negative values of corrupted audio files
-                self._volumes[i] = rms
-            elif rms < 0:
-                self._volumes[i] = previous_rms
-                logging.warning("Corrupted audio? "
-                                "The RMS is a negative value {:d}".format(rms))
-            previous_rms = rms
-
-        if self._volumes[-1] == 0:
-            self._volumes.pop()
-
-        # Returns to the position where we was before
-        channel.seek(pos)
-
-        self._rms = channel.rms()
+        self.evaluate(win_len)
 
     # -----------------------------------------------------------------------
 
@@ -108,33 +76,8 @@ class sppasChannelVolume(sppasBaseVolume):
 
     def evaluate(self, win_len):
         """Force to re-estimate the global rms value."""
-
-        # Remember current position
-        pos = self._channel.tell()
-
-        # Rewind to the beginning
-        self._channel.rewind()
-
-        nb_frames = int(win_len * self._channel.get_framerate())
-        nb_vols = int(self._channel.get_duration()/win_len) + 1
-        previous_rms = 0
-        for i in range(nb_vols):
-            frames = self._channel.get_frames(nb_frames)
-            a = sppasAudioFrames(frames, self._channel.get_sampwidth(), 1)
-            rms = a.rms()
-            if rms > 0:  # provide negative values of corrupted audio files
-                self._volumes[i] = rms
-            elif rms < 0:
-                self._volumes[i] = previous_rms
-                logging.warning("Corrupted audio? "
-                                "The RMS is a negative value {:d}".format(rms))
-            previous_rms = rms
-
-        if self._volumes[-1] == 0:
-            self._volumes.pop()
-
-        # Returns to the position where we was before
-        self._channel.seek(pos)
-
-        self._rms = self._channel.rms()
+        stream = sppasStreamVolume(win_len)
+        stream.estimate_channel(self._channel)
+        self._volumes = stream.volumes()
+        self._rms = stream.volume()
         self._win_len = win_len
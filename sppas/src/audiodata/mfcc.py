@@ -0,0 +1,843 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.mfcc.py
+    ~~~~~~~~~~~~~~~~~~~~~
+
+    Extract the acoustic features of HTK, without HTK.
+
+    The MFCC, FBANK and MELSPEC parameters are estimated like HCopy does,
+    from the same configuration file, and they are saved into files of
+    the HTK format. The analysis of a frame is:
+
+        1. pre-emphasis and Hamming window;
+        2. magnitude of the Fourier transform, zero-padded to a power of 2;
+        3. triangular mel filterbank and logarithm;
+        4. discrete cosine transform and liftering of the cepstrum.
+
+    Then, the energy and C0 are appended, and the delta and acceleration
+    coefficients are estimated on the whole file.
+
+    The frames are processed at once with NumPy if it is installed, or one
+    after the other in pure Python otherwise.
+
+"""
+
+import os
+import io
+import math
+import cmath
+import struct
+import logging
+import multiprocessing
+
+try:
+    import numpy as np
+    IMPORT_NUMPY = True
+except ImportError:
+    IMPORT_NUMPY = False
+
+from .audiodataexc import SampleWidthError
+
+# ---------------------------------------------------------------------------
+
+# Codes of the basic parameter kinds of HTK
+HTK_BASE_KINDS = {"MFCC": 6, "FBANK": 7, "MELSPEC": 8}
+
+# Codes of the qualifiers of the parameter kinds of HTK
+HTK_QUALIFIERS = {"E": 0o100, "N": 0o200, "D": 0o400, "A": 0o1000,
+                  "C": 0o2000, "Z": 0o4000, "K": 0o10000, "0": 0o20000}
+
+# Log of zero and its smallest argument, like in HTK
+LZERO = -1.0E10
+MINLARG = 2.45E-308
+
+# ---------------------------------------------------------------------------
+
+
+class sppasMFCC(object):
+    """Estimate the MFCC of audio channels, like HCopy of HTK.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The parameters are the ones of the configuration files of HTK, with
+    their default values. Parameters which are not used by the analysis,
+    like SOURCEFORMAT, are ignored.
+
+    The output files are not compressed and without checksum, whatever
+    SAVECOMPRESSED and SAVEWITHCRC: HTK tools read them all the same.
+
+    >>> mfcc = sppasMFCC("config")
+    >>> mfcc.convert("file.wav", "file.mfc")
+
+    """
+
+    DEFAULTS = {
+        "TARGETKIND": "MFCC_0_D",
+        "TARGETRATE": 100000.,
+        "WINDOWSIZE": 256000.,
+        "USEHAMMING": True,
+        "PREEMCOEF": 0.97,
+        "NUMCHANS": 20,
+        "LOFREQ": -1.,
+        "HIFREQ": -1.,
+        "USEPOWER": False,
+        "NUMCEPS": 12,
+        "CEPLIFTER": 22,
+        "ENORMALISE": True,
+        "ESCALE": 0.1,
+        "SILFLOOR": 50.,
+        "RAWENERGY": True,
+        "ZMEANSOURCE": False,
+        "DELTAWINDOW": 2,
+        "ACCWINDOW": 2,
+    }
+
+    def __init__(self, config=None):
+        """Create a sppasMFCC instance.
+
+        :param config: (str) Name of a configuration file of HTK
+
+        """
+        self._config = dict(sppasMFCC.DEFAULTS)
+        if config is not None:
+            self.load_config(config)
+
+    # -----------------------------------------------------------------------
+    # Configuration
+    # -----------------------------------------------------------------------
+
+    def load_config(self, filename):
+        """Load a configuration file of HTK.
+
+        Each line is "PARAMETER = value", and the parameter can be
+        prefixed by the name of a module of HTK, like "HPARM: NUMCEPS".
+
+        :param filename: (str)
+
+        """
+        with io.open(filename, "r") as fp:
+            for line in fp:
+                line = line.split("#")[0].strip()
+                if "=" not in line:
+                    continue
+                key, value = line.split("=", 1)
+                self.set_config(key.split(":")[-1], value)
+
+    # -----------------------------------------------------------------------
+
+    def set_config(self, key, value):
+        """Set the value of a parameter, converted to the type of its default.
+
+        :param key: (str) Name of the parameter
+        :param value: (any) Value of the parameter
+
+        """
+        key = key.strip().upper()
+        default = sppasMFCC.DEFAULTS.get(key, None)
+        if isinstance(value, str):
+            value = value.strip().strip('"')
+            if isinstance(default, bool):
+                value = value.upper() in ("T", "TRUE")
+            elif isinstance(default, int):
+                value = int(float(value))
+            elif isinstance(default, float):
+                value = float(value)
+        if key == "TARGETKIND":
+            sppasMFCC.parse_kind(value)
+        self._config[key] = value
+
+    # -----------------------------------------------------------------------
+
+    def get_config(self, key):
+        """Return the value of a parameter.
+
+        :param key: (str) Name of the parameter
+        :raises: KeyError
+
+        """
+        return self._config[key.strip().upper()]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def parse_kind(kind):
+        """Return the base and the qualifiers of a parameter kind.
+
+        :param kind: (str) Parameter kind, like "MFCC_0_D_N_Z"
+        :returns: (str, str)
+        :raises: ValueError if the parameter kind is not supported
+
+        """
+        items = kind.strip().upper().split("_")
+        base = items[0]
+        qualifiers = "".join(items[1:])
+        if base not in HTK_BASE_KINDS:
+            raise ValueError("Unsupported parameter kind {:s}."
+                             "".format(kind))
+        for q in qualifiers:
+            if q not in HTK_QUALIFIERS:
+                raise ValueError("Unsupported qualifier {:s} of {:s}."
+                                 "".format(q, kind))
+        if "N" in qualifiers and "D" not in qualifiers:
+            raise ValueError("Qualifier N requires D in {:s}.".format(kind))
+        if "N" in qualifiers and "E" not in qualifiers and \
+                "0" not in qualifiers:
+            raise ValueError("Qualifier N requires E or 0 in {:s}."
+                             "".format(kind))
+        if "A" in qualifiers and "D" not in qualifiers:
+            raise ValueError("Qualifier A requires D in {:s}.".format(kind))
+
+        return base, qualifiers
+
+    # -----------------------------------------------------------------------
+
+    def get_parm_kind(self):
+        """Return the code of the parameter kind of the output files.
+
+        Compression and checksum qualifiers are ignored.
+
+        """
+        base, qualifiers = sppasMFCC.parse_kind(self._config["TARGETKIND"])
+        code = HTK_BASE_KINDS[base]
+        for q in qualifiers:
+            if q not in "CK":
+                code |= HTK_QUALIFIERS[q]
+        return code
+
+    # -----------------------------------------------------------------------
+    # Estimate the features
+    # -----------------------------------------------------------------------
+
+    def evaluate(self, samples, framerate):
+        """Return the feature vectors of the samples of a channel.
+
+        :param samples: (list of int or numpy array) Samples of a channel
+        :param framerate: (int) Frame rate of the samples, in Hz
+        :returns: (list of list of float or numpy array) One vector for
+        each frame of TARGETRATE
+
+        """
+        base, qualifiers = sppasMFCC.parse_kind(self._config["TARGETKIND"])
+        analysis = _Analysis(self._config, framerate)
+        if IMPORT_NUMPY is True:
+            return analysis.estimate_numpy(samples, base, qualifiers)
+        return analysis.estimate_python(samples, base, qualifiers)
+
+    # -----------------------------------------------------------------------
+
+    def evaluate_channel(self, channel):
+        """Return the feature vectors of a sppasChannel.
+
+        :param channel: (sppasChannel)
+        :returns: (list of list of float or numpy array)
+
+        """
+        return self.evaluate(sppasMFCC.channel_samples(channel),
+                             channel.get_framerate())
+
+    # -----------------------------------------------------------------------
+
+    def evaluate_file(self, filename):
+        """Return the feature vectors of the first channel of an audio file.
+
+        :param filename: (str) Name of an audio file
+        :returns: (list of list of float or numpy array)
+
+        """
+        from .aio import open as audio_open
+
+        audio = audio_open(filename)
+        try:
+            framerate = audio.get_framerate()
+            frames = audio.read_channel_frames(0, 0, audio.get_nframes())
+            samples = sppasMFCC.frames_samples(frames, audio.get_sampwidth())
+        finally:
+            audio.close()
+
+        return self.evaluate(samples, framerate)
+
+    # -----------------------------------------------------------------------
+
+    def convert(self, audio_filename, mfc_filename):
+        """Estimate the features of an audio file and save them.
+
+        :param audio_filename: (str) Name of the audio file
+        :param mfc_filename: (str) Name of the HTK file to write
+
+        """
+        self.write_htk(mfc_filename, self.evaluate_file(audio_filename))
+
+    # -----------------------------------------------------------------------
+
+    def convert_files(self, files, nb_workers=1):
+        """Convert audio files with a pool of processes.
+
+        :param files: (list of tuples) Audio and HTK file names
+        :param nb_workers: (int) Number of processes, 0 for the number of
+        CPUs
+        :returns: generator of tuples (HTK file name, error message or
+        None) in the order of the files
+
+        """
+        nb_workers = int(nb_workers)
+        if nb_workers <= 0:
+            try:
+                nb_workers = multiprocessing.cpu_count()
+            except NotImplementedError:
+                nb_workers = 1
+        nb_workers = min(nb_workers, len(files))
+        if nb_workers == 0:
+            return
+
+        if nb_workers == 1:
+            _init_worker(self._config)
+            for job in files:
+                yield _convert_job(job)
+            return
+
+        pool = multiprocessing.Pool(nb_workers, _init_worker, (self._config, ))
+        try:
+            for result in pool.imap(_convert_job, files):
+                yield result
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+    # -----------------------------------------------------------------------
+    # Write
+    # -----------------------------------------------------------------------
+
+    def write_htk(self, filename, vectors):
+        """Write feature vectors into a file of the HTK format.
+
+        Big-endian header: number of vectors, sample period in 100ns
+        units, size of a vector in bytes and parameter kind, then the
+        vectors of 32 bits floats.
+
+        :param filename: (str)
+        :param vectors: (list of list of float or numpy array)
+
+        """
+        nvectors = len(vectors)
+        dim = len(vectors[0]) if nvectors > 0 else 0
+        period = int(round(self._config["TARGETRATE"]))
+        with open(filename, "wb") as fp:
+            fp.write(struct.pack(">iihh", nvectors, period, 4 * dim,
+                                 self.get_parm_kind()))
+            if IMPORT_NUMPY is True and isinstance(vectors, np.ndarray):
+                fp.write(vectors.astype(">f4").tobytes())
+            else:
+                fmt = ">%df" % dim
+                for v in vectors:
+                    fp.write(struct.pack(fmt, *v))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def read_htk(filename):
+        """Read a file of the HTK format, not compressed.
+
+        :param filename: (str)
+        :returns: (tuple) parameter kind, sample period and list of vectors
+
+        """
+        with open(filename, "rb") as fp:
+            nvectors, period, size, kind = struct.unpack(">iihh", fp.read(12))
+            if kind & HTK_QUALIFIERS["C"]:
+                raise IOError("Compressed HTK files are not supported.")
+            dim = size // 4
+            fmt = ">%df" % dim
+            vectors = [list(struct.unpack(fmt, fp.read(size)))
+                       for _ in range(nvectors)]
+
+        return kind, period, vectors
+
+    # -----------------------------------------------------------------------
+    # Utilities
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def channel_samples(channel):
+        """Return the samples of a sppasChannel."""
+        return sppasMFCC.frames_samples(channel.get_frames(),
+                                        channel.get_sampwidth())
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def frames_samples(frames, sampwidth):
+        """Return the samples of the frames of a mono channel.
+
+        8 bits frames are unsigned, like in WAV files.
+
+        """
+        from .backend import get_backend, sppasPythonBackend
+
+        if sampwidth not in (1, 2, 3, 4):
+            raise SampleWidthError(sampwidth)
+        backend = get_backend()
+        if hasattr(backend, "unpack") is False:
+            backend = sppasPythonBackend()
+        return backend.unpack(frames, sampwidth, unsigned=True)
+
+# ---------------------------------------------------------------------------
+
+
+class _Analysis(object):
+    """The tables of the analysis of the frames of a given frame rate."""
+
+    def __init__(self, config, framerate):
+        self.config = config
+        period = 1.0E7 / float(framerate)
+        self.frame_size = int(config["WINDOWSIZE"] / period + 1e-6)
+        self.frame_shift = int(config["TARGETRATE"] / period + 1e-6)
+        if self.frame_size < 2 or self.frame_shift < 1:
+            raise ValueError("Invalid WINDOWSIZE or TARGETRATE.")
+        self.fft_size = 2
+        while self.fft_size < self.frame_size:
+            self.fft_size *= 2
+        self.num_chans = config["NUMCHANS"]
+        self.num_ceps = config["NUMCEPS"]
+
+        n = self.frame_size
+        self.hamming = [0.54 - 0.46 * math.cos(2. * math.pi * i / (n - 1))
+                        for i in range(n)]
+        self.__init_fbank(period)
+
+    # -----------------------------------------------------------------------
+
+    def __init_fbank(self, period):
+        """Fix the triangular filters on the mel scale, like HTK.
+
+        The FFT bin k-1 (k in [klo, khi]) gives its (1-weight) to the
+        channel lo_chan[k]+1 and its weight to the channel lo_chan[k].
+
+        """
+        fft_n = self.fft_size
+        half = fft_n // 2
+        fres = 1.0E7 / (period * fft_n * 700.)
+        max_chan = self.num_chans + 1
+
+        def mel(k):
+            return 1127. * math.log(1. + (k - 1) * fres)
+
+        klo = 2
+        khi = half
+        mlo = 0.
+        mhi = mel(half + 1)
+        lofreq = self.config["LOFREQ"]
+        hifreq = self.config["HIFREQ"]
+        if lofreq >= 0.:
+            mlo = 1127. * math.log(1. + lofreq / 700.)
+            klo = max(2, int(lofreq * period * 1.0E-7 * fft_n + 2.5))
+        if hifreq >= 0.:
+            mhi = 1127. * math.log(1. + hifreq / 700.)
+            khi = min(half, int(hifreq * period * 1.0E-7 * fft_n + 0.5))
+
+        # centers of the channels, indexed from 1
+        cf = [0.] + [float(c) / float(max_chan) * (mhi - mlo) + mlo
+                     for c in range(1, max_chan + 1)]
+
+        self.klo = klo
+        self.khi = khi
+        self.lo_chan = dict()
+        self.lo_wt = dict()
+        chan = 1
+        for k in range(klo, khi + 1):
+            melk = mel(k)
+            while chan <= max_chan and cf[chan] < melk:
+                chan += 1
+            lo = chan - 1
+            self.lo_chan[k] = lo
+            if lo > 0:
+                self.lo_wt[k] = (cf[lo + 1] - melk) / (cf[lo + 1] - cf[lo])
+            else:
+                self.lo_wt[k] = (cf[1] - melk) / (cf[1] - mlo)
+
+    # -----------------------------------------------------------------------
+    # Estimation with numpy
+    # -----------------------------------------------------------------------
+
+    def estimate_numpy(self, samples, base, qualifiers):
+        """Return the array of the feature vectors of the samples."""
+        x = np.asarray(samples, dtype=np.float64)
+        n = self.nb_frames(len(x))
+        if n == 0:
+            return np.zeros((0, self.dimension(base, qualifiers)))
+        index = (np.arange(self.frame_size)[np.newaxis, :] +
+                 self.frame_shift * np.arange(n)[:, np.newaxis])
+        frames = x[index]
+
+        if self.config["ZMEANSOURCE"] is True:
+            frames -= frames.mean(axis=1)[:, np.newaxis]
+        raw_energy = (frames * frames).sum(axis=1)
+        k = self.config["PREEMCOEF"]
+        if k > 0.:
+            frames[:, 1:] = frames[:, 1:] - k * frames[:, :-1]
+            frames[:, 0] *= 1. - k
+        if self.config["USEHAMMING"] is True:
+            frames *= np.array(self.hamming)
+        energy = raw_energy
+        if self.config["RAWENERGY"] is False:
+            energy = (frames * frames).sum(axis=1)
+
+        spectrum = np.fft.rfft(frames, n=self.fft_size)
+        spectrum = spectrum[:, self.klo - 1:self.khi]
+        if self.config["USEPOWER"] is True:
+            spectrum = spectrum.real ** 2 + spectrum.imag ** 2
+        else:
+            spectrum = np.abs(spectrum)
+
+        weights = np.zeros((self.khi - self.klo + 1, self.num_chans))
+        for k in range(self.klo, self.khi + 1):
+            chan = self.lo_chan[k]
+            if chan > 0:
+                weights[k - self.klo, chan - 1] += self.lo_wt[k]
+            if chan < self.num_chans:
+                weights[k - self.klo, chan] += 1. - self.lo_wt[k]
+        fbank = spectrum.dot(weights)
+
+        if base == "MELSPEC":
+            static = [fbank]
+        else:
+            fbank = np.log(np.maximum(fbank, 1.))
+            if base == "FBANK":
+                static = [fbank]
+            else:
+                static = [self.__cepstrum_numpy(fbank)]
+                if "0" in qualifiers:
+                    c0 = fbank.sum(axis=1) * math.sqrt(2. / self.num_chans)
+                    static.append(c0[:, np.newaxis])
+        if "Z" in qualifiers:
+            static[0] = static[0] - static[0].mean(axis=0)
+        if "E" in qualifiers:
+            log_e = np.full(len(energy), LZERO)
+            valid = energy >= MINLARG
+            log_e[valid] = np.log(energy[valid])
+            if self.config["ENORMALISE"] is True:
+                log_e = self.normalise_energy_numpy(log_e)
+            static.append(log_e[:, np.newaxis])
+
+        static = np.hstack(static)
+        vectors = [static]
+        if "D" in qualifiers:
+            delta = self.regression_numpy(static, self.config["DELTAWINDOW"])
+            vectors.append(delta)
+            if "A" in qualifiers:
+                vectors.append(self.regression_numpy(
+                    delta, self.config["ACCWINDOW"]))
+        if "N" in qualifiers:
+            vectors[0] = static[:, :-1]
+
+        return np.hstack(vectors)
+
+    # -----------------------------------------------------------------------
+
+    def __cepstrum_numpy(self, fbank):
+        """Return the liftered cepstrum of log filterbanks."""
+        nc = self.num_chans
+        j = np.arange(1, self.num_ceps + 1)[np.newaxis, :]
+        k = np.arange(1, nc + 1)[:, np.newaxis]
+        dct = np.cos(j * math.pi / nc * (k - 0.5)) * math.sqrt(2. / nc)
+        cep = fbank.dot(dct)
+        lifter = self.config["CEPLIFTER"]
+        if lifter > 0:
+            cep *= 1. + (lifter / 2.) * np.sin(j * math.pi / lifter)
+        return cep
+
+    # -----------------------------------------------------------------------
+
+    def normalise_energy_numpy(self, log_e):
+        """Normalise the log energy, like HTK."""
+        max_e = log_e.max()
+        min_e = max_e - (self.config["SILFLOOR"] * math.log(10.)) / 10.
+        log_e = np.maximum(log_e, min_e)
+        return 1. - (max_e - log_e) * self.config["ESCALE"]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def regression_numpy(data, window):
+        """Return the regression coefficients, with replicated edges."""
+        n = len(data)
+        sigma = 2. * sum(t * t for t in range(1, window + 1))
+        padded = np.vstack([data[:1]] * window + [data] + [data[-1:]] * window)
+        result = np.zeros_like(data)
+        for t in range(1, window + 1):
+            result += t * (padded[window + t:window + t + n] -
+                           padded[window - t:window - t + n])
+        return result / sigma
+
+    # -----------------------------------------------------------------------
+    # Estimation in pure python
+    # -----------------------------------------------------------------------
+
+    def estimate_python(self, samples, base, qualifiers):
+        """Return the list of the feature vectors of the samples."""
+        n = self.nb_frames(len(samples))
+        k = self.config["PREEMCOEF"]
+        zmean = self.config["ZMEANSOURCE"]
+        raw = self.config["RAWENERGY"]
+        hamming = self.hamming if self.config["USEHAMMING"] is True else None
+        nc = self.num_chans
+        mfnorm = math.sqrt(2. / nc)
+        dct = [[math.cos(j * math.pi / nc * (c - 0.5)) * mfnorm
+                for c in range(1, nc + 1)]
+               for j in range(1, self.num_ceps + 1)]
+        lifter = self.config["CEPLIFTER"]
+        lifters = [1. + (lifter / 2.) * math.sin(j * math.pi / lifter)
+                   if lifter > 0 else 1.
+                   for j in range(1, self.num_ceps + 1)]
+        fft = _RealFFT(self.fft_size)
+
+        statics = list()
+        energies = list()
+        for i in range(n):
+            start = i * self.frame_shift
+            frame = [float(v)
+                     for v in samples[start:start + self.frame_size]]
+            if zmean is True:
+                mean = sum(frame) / len(frame)
+                frame = [v - mean for v in frame]
+            if raw is True:
+                energies.append(sum(v * v for v in frame))
+            if k > 0.:
+                frame = [frame[0] * (1. - k)] + \
+                        [frame[j] - k * frame[j - 1]
+                         for j in range(1, len(frame))]
+            if hamming is not None:
+                frame = [v * w for v, w in zip(frame, hamming)]
+            if raw is False:
+                energies.append(sum(v * v for v in frame))
+
+            fbank = self.__fbank_python(fft.magnitudes(frame))
+            if base == "MELSPEC":
+                statics.append(fbank)
+                continue
+            fbank = [math.log(max(v, 1.)) for v in fbank]
+            if base == "FBANK":
+                statics.append(fbank)
+                continue
+            cep = [sum(f * d for f, d in zip(fbank, row)) * w
+                   for row, w in zip(dct, lifters)]
+            if "0" in qualifiers:
+                cep.append(sum(fbank) * mfnorm)
+            statics.append(cep)
+
+        nb_coefs = len(statics[0]) if n > 0 else 0
+        if "0" in qualifiers and base == "MFCC":
+            nb_coefs -= 1
+        if "Z" in qualifiers and n > 0:
+            means = [sum(v[c] for v in statics) / n for c in range(nb_coefs)]
+            for v in statics:
+                for c in range(nb_coefs):
+                    v[c] -= means[c]
+        if "E" in qualifiers:
+            log_e = [math.log(e) if e >= MINLARG else LZERO
+                     for e in energies]
+            if self.config["ENORMALISE"] is True and n > 0:
+                max_e = max(log_e)
+                min_e = max_e - (self.config["SILFLOOR"] * math.log(10.)) / 10.
+                escale = self.config["ESCALE"]
+                log_e = [1. - (max_e - max(e, min_e)) * escale for e in log_e]
+            for v, e in zip(statics, log_e):
+                v.append(e)
+
+        vectors = [list(v) for v in statics]
+        if "D" in qualifiers:
+            delta = self.regression_python(statics,
+                                           self.config["DELTAWINDOW"])
+            if "A" in qualifiers:
+                acc = self.regression_python(delta, self.config["ACCWINDOW"])
+                delta = [d + a for d, a in zip(delta, acc)]
+            if "N" in qualifiers:
+                vectors = [v[:-1] for v in vectors]
+            vectors = [v + d for v, d in zip(vectors, delta)]
+
+        return vectors
+
+    # -----------------------------------------------------------------------
+
+    def __fbank_python(self, magnitudes):
+        """Return the filterbank of the magnitudes of bins [klo-1, khi-1]."""
+        nc = self.num_chans
+        fbank = [0.] * (nc + 1)
+        power = self.config["USEPOWER"]
+        for k in range(self.klo, self.khi + 1):
+            ek = magnitudes[k - 1]
+            if power is True:
+                ek *= ek
+            chan = self.lo_chan[k]
+            t1 = self.lo_wt[k] * ek
+            if chan > 0:
+                fbank[chan] += t1
+            if chan < nc:
+                fbank[chan + 1] += ek - t1
+        return fbank[1:]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def regression_python(data, window):
+        """Return the regression coefficients, with replicated edges."""
+        n = len(data)
+        sigma = 2. * sum(t * t for t in range(1, window + 1))
+        result = list()
+        for i in range(n):
+            values = [0.] * len(data[i])
+            for t in range(1, window + 1):
+                fore = data[min(i + t, n - 1)]
+                back = data[max(i - t, 0)]
+                values = [v + t * (f - b)
+                          for v, f, b in zip(values, fore, back)]
+            result.append([v / sigma for v in values])
+        return result
+
+    # -----------------------------------------------------------------------
+    # Utilities
+    # -----------------------------------------------------------------------
+
+    def nb_frames(self, nb_samples):
+        """Return the number of analysed frames, like HTK."""
+        if nb_samples < self.frame_size:
+            return 0
+        return (nb_samples - self.frame_size) // self.frame_shift + 1
+
+    # -----------------------------------------------------------------------
+
+    def dimension(self, base, qualifiers):
+        """Return the size of the feature vectors."""
+        dim = self.num_ceps if base == "MFCC" else self.num_chans
+        if "0" in qualifiers and base == "MFCC":
+            dim += 1
+        if "E" in qualifiers:
+            dim += 1
+        static = dim
+        if "N" in qualifiers:
+            static -= 1
+        if "D" in qualifiers:
+            static += dim
+        if "A" in qualifiers:
+            static += dim
+        return static
+
+# ---------------------------------------------------------------------------
+
+
+class _RealFFT(object):
+    """Magnitudes of the FFT of real signals, in pure python.
+
+    A real signal of size N is transformed with a complex FFT of size N/2
+    of its even and odd samples.
+
+    """
+
+    def __init__(self, size):
+        self.size = size
+        half = size // 2
+        self.half = half
+        bits = half.bit_length() - 1
+        self.reverse = [int(format(i, "0%db" % bits)[::-1], 2) if bits > 0
+                        else 0 for i in range(half)]
+        self.twiddles = [cmath.exp(-2j * math.pi * k / half)
+                         for k in range(half // 2)]
+        self.post = [cmath.exp(-2j * math.pi * k / size) for k in range(half)]
+
+    # -----------------------------------------------------------------------
+
+    def magnitudes(self, frame):
+        """Return |X(k)| for k in [0, N/2) of a zero-padded real frame."""
+        half = self.half
+        x = list(frame) + [0.] * (self.size - len(frame))
+        z = [complex(x[2 * self.reverse[i]], x[2 * self.reverse[i] + 1])
+             for i in range(half)]
+
+        # iterative radix-2 FFT of size N/2
+        step = 1
+        while step < half:
+            jump = step * 2
+            stride = half // jump
+            for j in range(step):
+                w = self.twiddles[j * stride]
+                for i in range(j, half, jump):
+                    t = w * z[i + step]
+                    z[i + step] = z[i] - t
+                    z[i] += t
+            step = jump
+
+        # spectrum of the real signal
+        mags = list()
+        for k in range(half):
+            zk = z[k]
+            zc = z[(half - k) % half].conjugate()
+            even = (zk + zc) * 0.5
+            odd = (zk - zc) * -0.5j
+            mags.append(abs(even + self.post[k] * odd))
+        return mags
+
+# ---------------------------------------------------------------------------
+# Functions executed by the workers
+# ---------------------------------------------------------------------------
+
+# The extractor of the current worker
+_worker = dict()
+
+
+def _init_worker(config):
+    """Create the extractor of a worker."""
+    mfcc = sppasMFCC()
+    for key, value in config.items():
+        mfcc.set_config(key, value)
+    _worker["mfcc"] = mfcc
+
+# ---------------------------------------------------------------------------
+
+
+def _convert_job(job):
+    """Convert an audio file with the extractor of the worker."""
+    audio_filename, mfc_filename = job
+    try:
+        _worker["mfcc"].convert(audio_filename, mfc_filename)
+    except Exception as e:
+        logging.error("{:s}: {:s}".format(audio_filename, str(e)))
+        if os.path.exists(mfc_filename):
+            os.remove(mfc_filename)
+        return mfc_filename, str(e)
+
+    return mfc_filename, None
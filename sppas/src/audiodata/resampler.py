@@ -0,0 +1,418 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.resampler.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Convert the frame rate and the sample width of a stream of frames.
+
+    The frame rate is converted with a polyphase filter: the output rate
+    is L/M times the input one, and each output sample is the sum of the
+    nearest input samples weighted by a windowed sinc, sampled at one of
+    the L phases. The cutoff frequency is slightly below the lowest of
+    both Nyquist frequencies, so that the down-sampling does not alias.
+
+    The samples are estimated as floats, then quantized to the new sample
+    width. When the sample width is reduced (24 to 16 bits for example),
+    a triangular dither of one quantization step is added before the
+    rounding, to turn the quantization error into a white noise. The
+    noise is drawn from the same seeded generator with or without NumPy,
+    so that both give the same frames.
+
+    All the samples of a block are processed at once with NumPy if it is
+    installed, or one after the other in pure Python otherwise.
+
+"""
+
+import math
+import random
+import operator
+from array import array
+
+try:
+    import numpy as np
+    IMPORT_NUMPY = True
+except ImportError:
+    IMPORT_NUMPY = False
+
+from .audiodataexc import SampleWidthError
+from .audiodataexc import FrameRateError
+from .backend import get_backend, sppasPythonBackend
+
+# ---------------------------------------------------------------------------
+
+
+class sppasResampler(object):
+    """Convert frames of a mono channel block by block.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The frames are given by successive calls to convert() and the last
+    frames are returned by flush(): the result is the same whatever the
+    size of the blocks. 8 bits frames are unsigned, like in WAV files.
+
+    >>> r = sppasResampler(44100, 3, 16000, 2)
+    >>> frames = b"".join(r.convert(block) for block in blocks) + r.flush()
+
+    """
+
+    # Number of zero crossings of the sinc on each side of the filter
+    NB_ZEROS = 16
+
+    # Cutoff frequency, relatively to the lowest Nyquist frequency
+    ROLLOFF = 0.945
+
+    # Shape parameter of the Kaiser window
+    BETA = 8.6
+
+    def __init__(self, framerate, sampwidth, new_framerate, new_sampwidth,
+                 dither=True):
+        """Create a sppasResampler instance.
+
+        :param framerate: (int) Frame rate of the input frames
+        :param sampwidth: (int) Sample width of the input frames
+        :param new_framerate: (int) Frame rate of the output frames
+        :param new_sampwidth: (int) Sample width of the output frames
+        :param dither: (bool) Add a dither if the sample width is reduced
+
+        """
+        for sw in (sampwidth, new_sampwidth):
+            if sw not in (1, 2, 3, 4):
+                raise SampleWidthError(sw)
+        for fr in (framerate, new_framerate):
+            if int(fr) <= 0:
+                raise FrameRateError(fr)
+
+        self._sampwidth = sampwidth
+        self._new_sampwidth = new_sampwidth
+        g = sppasResampler.__gcd(int(framerate), int(new_framerate))
+        self._up = int(new_framerate) // g
+        self._down = int(framerate) // g
+
+        self._scale = float(1 << (8 * new_sampwidth - 1)) / \
+            float(1 << (8 * sampwidth - 1))
+        self._maxval = (1 << (8 * new_sampwidth - 1)) - 1
+        self._minval = -(1 << (8 * new_sampwidth - 1))
+        self._dither = dither is True and new_sampwidth < sampwidth
+
+        # the filter and its phases
+        self._cutoff = sppasResampler.ROLLOFF * min(
+            1., float(self._up) / float(self._down))
+        half = float(sppasResampler.NB_ZEROS) / self._cutoff
+        self._half = int(math.ceil(half))
+        if self._up == self._down:
+            # only the sample width is converted
+            self._half = 0
+        self._phases = dict()
+
+        backend = get_backend()
+        if hasattr(backend, "unpack") is False:
+            backend = sppasPythonBackend()
+        self._backend = backend
+        self.reset()
+
+    # -----------------------------------------------------------------------
+
+    def reset(self):
+        """Forget the frames already given, to convert another stream."""
+        # the input samples not used yet, preceded by zeros
+        self._samples = [0.] * self._half
+        # index of the first sample of the buffer, in the input stream
+        self._first = -self._half
+        # number of input samples and of output samples of the stream
+        self._nin = 0
+        self._nout = 0
+        self._pending = b""
+        self._random = random.Random(1)
+        if IMPORT_NUMPY is True:
+            self._samples = np.zeros(self._half)
+
+    # -----------------------------------------------------------------------
+
+    def get_ratio(self):
+        """Return the reduced ratio (L, M) of the output and input rates."""
+        return self._up, self._down
+
+    # -----------------------------------------------------------------------
+
+    def convert(self, frames):
+        """Convert a block of frames.
+
+        :param frames: (bytes) Frames following the previous ones
+        :returns: (bytes) The frames which can already be converted
+
+        """
+        if len(self._pending) > 0:
+            frames = self._pending + bytes(frames)
+        extra = len(frames) % self._sampwidth
+        if extra > 0:
+            self._pending = bytes(frames[len(frames) - extra:])
+            frames = frames[:len(frames) - extra]
+        else:
+            self._pending = b""
+        if len(frames) == 0:
+            return b""
+
+        samples = self._backend.unpack(frames, self._sampwidth, unsigned=True)
+        self._nin += len(samples)
+        self.__append(samples)
+
+        # the output sample m needs the input samples until n(m) + half
+        last = ((self._nin - self._half) * self._up + self._down - 1) // \
+            self._down
+        return self.__process(max(self._nout, last))
+
+    # -----------------------------------------------------------------------
+
+    def flush(self):
+        """Convert the last frames of the stream.
+
+        :returns: (bytes)
+
+        """
+        self.__append([0] * (self._half + 1))
+        total = (self._nin * self._up + self._down - 1) // self._down
+        return self.__process(total)
+
+    # -----------------------------------------------------------------------
+
+    def convert_all(self, frames):
+        """Convert all the frames of a stream at once.
+
+        :param frames: (bytes)
+        :returns: (bytes)
+
+        """
+        self.reset()
+        result = self.convert(frames) + self.flush()
+        self.reset()
+        return result
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def get_nframes(nframes, framerate, new_framerate):
+        """Return the number of frames of a converted stream."""
+        return (nframes * int(new_framerate) + int(framerate) - 1) // \
+            int(framerate)
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __append(self, samples):
+        """Append samples to the buffer."""
+        if IMPORT_NUMPY is True:
+            self._samples = np.concatenate(
+                (self._samples, np.asarray(samples, dtype=np.float64)))
+        else:
+            self._samples.extend(float(s) for s in samples)
+
+    # -----------------------------------------------------------------------
+
+    def __process(self, end):
+        """Return the frames of the output samples until end (excluded)."""
+        start = self._nout
+        if end <= start:
+            return b""
+
+        if IMPORT_NUMPY is True:
+            values = self.__filter_numpy(start, end)
+        else:
+            values = self.__filter_python(start, end)
+        self._nout = end
+
+        # forget the input samples which are not needed anymore
+        n = (end * self._down) // self._up - self._half + 1
+        drop = min(n - self._first, len(self._samples))
+        if drop > 0:
+            self._samples = self._samples[drop:]
+            self._first += drop
+
+        return self.__pack(values)
+
+    # -----------------------------------------------------------------------
+
+    def __filter_python(self, start, end):
+        """Return the quantized output samples, in pure python."""
+        samples = self._samples
+        first = self._first
+        if self._half == 0:
+            values = [v * self._scale for v in samples[start - first:end - first]]
+            if self._dither is True:
+                values = list(map(operator.add, values,
+                                  self.__noise(len(values))))
+            return self.__quantize(values)
+
+        values = list()
+        width = 2 * self._half
+        for m in range(start, end):
+            n, p = divmod(m * self._down, self._up)
+            i = n - self._half + 1 - first
+            y = sum(map(operator.mul, samples[i:i + width], self.__phase(p)))
+            y *= self._scale
+            if self._dither is True:
+                y += self.__noise(1)[0]
+            values.append(y)
+        return self.__quantize(values)
+
+    # -----------------------------------------------------------------------
+
+    def __filter_numpy(self, start, end):
+        """Return the quantized output samples, with numpy."""
+        if self._half == 0:
+            values = self._samples[start - self._first:end - self._first] * \
+                self._scale
+            if self._dither is True:
+                values = values + np.array(self.__noise(len(values)))
+            return np.clip(np.floor(values + 0.5), self._minval, self._maxval)
+
+        width = 2 * self._half
+        table = self.__table()
+        values = np.empty(end - start)
+        step = 8192
+        for s in range(start, end, step):
+            m = np.arange(s, min(s + step, end), dtype=np.int64)
+            n = (m * self._down) // self._up
+            p = (m * self._down) % self._up
+            index = (n - self._half + 1 - self._first)[:, np.newaxis] + \
+                np.arange(width)[np.newaxis, :]
+            y = (self._samples[index] * table[p]).sum(axis=1) * self._scale
+            if self._dither is True:
+                y += np.array(self.__noise(len(m)))
+            values[s - start:s - start + len(m)] = y
+        return np.clip(np.floor(values + 0.5), self._minval, self._maxval)
+
+    # -----------------------------------------------------------------------
+
+    def __noise(self, n):
+        """Return n values of a triangular noise, in range ]-1;1[."""
+        rand = self._random.random
+        return [rand() - rand() for _ in range(n)]
+
+    # -----------------------------------------------------------------------
+
+    def __quantize(self, values):
+        """Round and clip the samples to the new sample width."""
+        maxval = self._maxval
+        minval = self._minval
+        return [max(minval, min(maxval, int(math.floor(v + 0.5))))
+                for v in values]
+
+    # -----------------------------------------------------------------------
+
+    def __pack(self, values):
+        """Return the frames of the output samples."""
+        sw = self._new_sampwidth
+        if IMPORT_NUMPY is True:
+            if sw == 1:
+                return (values + 128).astype(np.uint8).tobytes()
+            if sw == 3:
+                v = values.astype('<i4').view(np.uint8).reshape(-1, 4)
+                return v[:, :3].tobytes()
+            return values.astype('<i%d' % sw).tobytes()
+
+        if sw == 1:
+            return array('B', [v + 128 for v in values]).tobytes()
+        return sppasPythonBackend().pack(values, sw)
+
+    # -----------------------------------------------------------------------
+
+    def __phase(self, p):
+        """Return the weights of the phase p, for the samples n-h+1..n+h."""
+        weights = self._phases.get(p, None)
+        if weights is None:
+            frac = float(p) / float(self._up)
+            weights = [self.__kernel(frac + self._half - 1 - i)
+                       for i in range(2 * self._half)]
+            self._phases[p] = weights
+        return weights
+
+    # -----------------------------------------------------------------------
+
+    def __table(self):
+        """Return the weights of all the phases, into a numpy array."""
+        table = self._phases.get("table", None)
+        if table is None:
+            width = 2 * self._half
+            d = (np.arange(self._up)[:, np.newaxis] / float(self._up) +
+                 self._half - 1 - np.arange(width)[np.newaxis, :])
+            fc = self._cutoff
+            x = d / (float(sppasResampler.NB_ZEROS) / fc)
+            window = np.zeros_like(d)
+            inside = np.abs(x) < 1.
+            window[inside] = np.i0(sppasResampler.BETA *
+                                   np.sqrt(1. - x[inside] ** 2)) / \
+                np.i0(sppasResampler.BETA)
+            table = fc * np.sinc(fc * d) * window
+            self._phases["table"] = table
+        return table
+
+    # -----------------------------------------------------------------------
+
+    def __kernel(self, d):
+        """Return the weight of an input sample at a distance d."""
+        fc = self._cutoff
+        x = d / (float(sppasResampler.NB_ZEROS) / fc)
+        if abs(x) >= 1.:
+            return 0.
+        window = sppasResampler.__i0(
+            sppasResampler.BETA * math.sqrt(1. - x * x)) / \
+            sppasResampler.__i0(sppasResampler.BETA)
+        t = math.pi * fc * d
+        sinc = 1. if t == 0. else math.sin(t) / t
+        return fc * sinc * window
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __i0(x):
+        """Return the modified Bessel function of order 0."""
+        total = 1.
+        term = 1.
+        k = 1
+        while term > 1e-12 * total:
+            term *= (x / (2. * k)) ** 2
+            total += term
+            k += 1
+        return total
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __gcd(a, b):
+        while b:
+            a, b = b, a % b
+        return a
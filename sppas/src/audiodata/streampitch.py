@@ -0,0 +1,319 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.streampitch.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Estimate the fundamental frequency (F0) of a channel, block by block.
+
+    The estimator is YIN (de Cheveigné & Kawahara, 2002): for each window,
+    the cumulative mean normalized difference function is computed, and
+    the period is the first lag with a value under a threshold. Windows
+    without such a lag are unvoiced and their pitch is 0.
+
+    The frames are processed block by block: the pitch of an audio file can
+    be estimated without loading all its frames in memory. All the windows
+    of a block are processed at once with NumPy if it is installed, or one
+    after the other in pure Python otherwise.
+
+"""
+
+import math
+import operator
+from array import array
+
+try:
+    import numpy as np
+    IMPORT_NUMPY = True
+except ImportError:
+    IMPORT_NUMPY = False
+
+from .backend import get_backend, sppasPythonBackend
+
+# ----------------------------------------------------------------------------
+
+
+class sppasStreamPitch(object):
+    """Estimate the pitch of a channel, block by block.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    A pitch value is estimated every win_shift seconds: the i-th value is
+    the one of the window centered at i*win_shift seconds, like the pitch
+    files of Praat. The values are stored into a compact array of floats.
+
+    Frame rates higher than 8000 Hz are decimated before the estimation,
+    by averaging consecutive samples.
+
+    >>> pitch = sppasStreamPitch(lo=50, hi=600)
+    >>> pitch.estimate_file("oriana1.wav")
+    >>> pitch.values()
+
+    """
+
+    # Number of pitch values estimated at a time
+    BLOCK_SIZE = 1000
+
+    # Lowest frame rate of the estimation
+    MIN_FRAMERATE = 8000
+
+    def __init__(self, lo=50., hi=600., win_shift=0.01, threshold=0.3):
+        """Create a sppasStreamPitch instance.
+
+        :param lo: (float) Lowest expected pitch value, in Hz
+        :param hi: (float) Highest expected pitch value, in Hz
+        :param win_shift: (float) Delay between two values, in seconds
+        :param threshold: (float) Max of the normalized difference of a
+        voiced window, in range [0;1]
+
+        """
+        lo = float(lo)
+        hi = float(hi)
+        if lo <= 0. or hi <= lo:
+            raise ValueError("Invalid pitch range: {:f}-{:f}".format(lo, hi))
+        if win_shift <= 0.:
+            raise ValueError("Invalid window shift: {:f}".format(win_shift))
+        self._lo = lo
+        self._hi = hi
+        self._win_shift = float(win_shift)
+        self._threshold = float(threshold)
+        self._pitch = array('f')
+
+    # -----------------------------------------------------------------------
+
+    def get_winshift(self):
+        """Return the delay between two pitch values, in seconds."""
+        return self._win_shift
+
+    # -----------------------------------------------------------------------
+
+    def values(self):
+        """Return the list of the estimated pitch values."""
+        return [round(p, 6) for p in self._pitch]
+
+    # -----------------------------------------------------------------------
+
+    def len(self):
+        """Return the number of pitch values."""
+        return len(self._pitch)
+
+    # -----------------------------------------------------------------------
+    # Estimate
+    # -----------------------------------------------------------------------
+
+    def estimate_channel(self, channel):
+        """Estimate the pitch values of a sppasChannel.
+
+        The frames are extracted block by block: if the channel is a view
+        of an audio file (sppasChannelView), only a block is read at a time.
+
+        :param channel: (sppasChannel) The channel to work on.
+
+        """
+        framerate = channel.get_framerate()
+        sampwidth = channel.get_sampwidth()
+        nframes = int(channel.get_nframes())
+        backend = get_backend()
+        if hasattr(backend, "unpack") is False:
+            backend = sppasPythonBackend()
+
+        # decimation factor and the frame rate of the estimation
+        factor = max(1, framerate // sppasStreamPitch.MIN_FRAMERATE)
+        rate = float(framerate) / float(factor)
+        nsamples = nframes // factor
+
+        # size of the integration window and max lag, in samples
+        max_lag = int(math.ceil(rate / self._lo))
+        min_lag = max(2, int(rate / self._hi))
+        length = 2 * max_lag
+        half = length // 2
+
+        self._pitch = array('f')
+        nvalues = int(float(nframes) / float(framerate) / self._win_shift) + 1
+        for first in range(0, nvalues, sppasStreamPitch.BLOCK_SIZE):
+            last = min(first + sppasStreamPitch.BLOCK_SIZE, nvalues)
+            starts = [int(round(i * self._win_shift * rate)) - half
+                      for i in range(first, last)]
+
+            # the samples of the block, completed with zeros
+            begin = starts[0]
+            end = starts[-1] + length
+            frames = channel.extract_fragment(
+                max(0, begin) * factor,
+                min(end, nsamples) * factor).get_frames()
+            samples = backend.unpack(frames, sampwidth, unsigned=True)
+            samples = sppasStreamPitch.__decimate(samples, factor)
+            before = [0] * max(0, -begin)
+            after = [0] * max(0, end - max(begin, nsamples))
+            offsets = [s - begin for s in starts]
+
+            if IMPORT_NUMPY is True:
+                samples = np.concatenate((np.array(before, dtype=np.float64),
+                                          np.asarray(samples, dtype=np.float64),
+                                          np.array(after, dtype=np.float64)))
+                rows = self.__difference_numpy(samples, offsets, max_lag)
+            else:
+                samples = before + [float(s) for s in samples] + after
+                rows = (self.__difference_python(samples, o, max_lag)
+                        for o in offsets)
+
+            for row in rows:
+                self._pitch.append(self.__select(row, min_lag, rate))
+
+    # -----------------------------------------------------------------------
+
+    def estimate_audio(self, audio, index=0):
+        """Estimate the pitch values of a channel of an opened audio file.
+
+        The frames are read block by block from the audio file.
+
+        :param audio: (sppasAudioPCM) An audio with an opened file
+        :param index: (int) Index of the channel
+        :raises: ChannelIndexError
+
+        """
+        self.estimate_channel(audio.read_fragment(index))
+
+    # -----------------------------------------------------------------------
+
+    def estimate_file(self, filename, index=0):
+        """Estimate the pitch values of a channel of an audio file.
+
+        :param filename: (str) Name of the audio file
+        :param index: (int) Index of the channel
+
+        """
+        from .aio import open as audio_open
+
+        audio = audio_open(filename)
+        try:
+            self.estimate_audio(audio, index)
+        finally:
+            audio.close()
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __decimate(samples, factor):
+        """Return the means of each factor consecutive samples."""
+        if factor == 1:
+            return samples
+        n = len(samples) // factor
+        if IMPORT_NUMPY is True:
+            s = np.asarray(samples[:n * factor], dtype=np.float64)
+            return s.reshape(n, factor).mean(axis=1)
+        return [sum(map(float, samples[i:i + factor])) / factor
+                for i in range(0, n * factor, factor)]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __difference_python(samples, offset, max_lag):
+        """Return the difference function of a window.
+
+        d(tau) = sum_{j=0}^{W-1} (x_j - x_{j+tau})^2 with W = max_lag,
+        for tau in [0;max_lag].
+
+        """
+        window = samples[offset:offset + 2 * max_lag]
+        head = window[:max_lag]
+        energies = [0.]
+        for s in window:
+            energies.append(energies[-1] + s * s)
+        e0 = energies[max_lag]
+        return [e0 + energies[tau + max_lag] - energies[tau] -
+                2. * sum(map(operator.mul, head, window[tau:tau + max_lag]))
+                for tau in range(max_lag + 1)]
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __difference_numpy(samples, offsets, max_lag):
+        """Return the difference functions of all the windows of a block.
+
+        The correlations are estimated with FFTs.
+
+        """
+        length = 2 * max_lag
+        index = (np.array(offsets)[:, np.newaxis] +
+                 np.arange(length)[np.newaxis, :])
+        windows = samples[index]
+        size = 1
+        while size < length + max_lag:
+            size *= 2
+        spectrum = np.fft.rfft(windows, size)
+        head = np.fft.rfft(windows[:, :max_lag], size)
+        corr = np.fft.irfft(np.conj(head) * spectrum, size)[:, :max_lag + 1]
+
+        energies = np.zeros((len(offsets), length + 1))
+        np.cumsum(windows * windows, axis=1, out=energies[:, 1:])
+        e_lag = energies[:, max_lag:length + 1] - energies[:, :max_lag + 1]
+        return (e_lag[:, :1] + e_lag - 2. * corr).tolist()
+
+    # -----------------------------------------------------------------------
+
+    def __select(self, diff, min_lag, rate):
+        """Return the pitch of a difference function, or 0 if unvoiced."""
+        max_lag = len(diff) - 1
+
+        # cumulative mean normalized difference
+        cmnd = [1.]
+        total = 0.
+        for tau in range(1, max_lag + 1):
+            total += diff[tau]
+            cmnd.append(diff[tau] * tau / total if total > 0. else 1.)
+
+        # first dip under the threshold, then its local minimum
+        tau = min_lag
+        while tau < max_lag and cmnd[tau] >= self._threshold:
+            tau += 1
+        if tau >= max_lag:
+            return 0.
+        while tau + 1 < max_lag and cmnd[tau + 1] < cmnd[tau]:
+            tau += 1
+
+        # parabolic interpolation of the minimum
+        a, b, c = cmnd[tau - 1], cmnd[tau], cmnd[tau + 1]
+        den = a - 2. * b + c
+        period = float(tau)
+        if den > 0.:
+            period += 0.5 * (a - c) / den
+
+        pitch = rate / period
+        if pitch < self._lo or pitch > self._hi:
+            return 0.
+        return pitch
@@ -0,0 +1,289 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.streamvolume.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    The volume is the estimation of RMS values, sampled with a window of 10ms.
+    The frames are processed block by block: the RMS of an audio file can be
+    estimated without loading all its frames in memory.
+
+"""
+
+import math
+import logging
+from array import array
+
+from .audiodataexc import AudioError
+from .audiodataexc import ChannelIndexError
+from .audiodataexc import SampleWidthError
+from .audioframes import sppasAudioFrames
+from .basevolume import sppasBaseVolume
+from .backend import get_backend
+
+# ----------------------------------------------------------------------------
+
+
+class sppasStreamVolume(sppasBaseVolume):
+    """Estimate the volume of a channel, block by block.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    The RMS values are estimated on windows of win_len seconds, starting
+    every win_shift seconds: windows are overlapping if the shift is lesser
+    than the length. With the default shift, the values are the same as the
+    ones of the previous per-window estimation of sppasChannelVolume.
+
+    The volumes are stored into a compact array of integers.
+
+    >>> vol = sppasStreamVolume(win_len=0.02, win_shift=0.01)
+    >>> vol.estimate_file("oriana1.wav")
+    >>> vol.volume(), vol.len(), vol.mean()
+
+    """
+
+    # Number of frames read at a time
+    BLOCK_SIZE = 1048576
+
+    def __init__(self, win_len=0.01, win_shift=None):
+        """Create a sppasStreamVolume instance.
+
+        :param win_len: (float) Window length to estimate the volume.
+        :param win_shift: (float) Delay between the start of two windows.
+        Default is the window length.
+
+        """
+        super(sppasStreamVolume, self).__init__(win_len)
+        if win_shift is None:
+            win_shift = win_len
+        self._winshift = float(win_shift)
+        if self._winshift <= 0.:
+            raise ValueError("Expected a positive window shift. Got {:f}."
+                             "".format(self._winshift))
+
+        self._volumes = array('L')
+        self._framerate = 0
+        self._nframes = 0
+
+    # -----------------------------------------------------------------------
+
+    def get_winshift(self):
+        """Return the delay between two windows.
+
+        :returns: (float) Duration in seconds.
+
+        """
+        return self._winshift
+
+    # -----------------------------------------------------------------------
+
+    def get_nframes(self):
+        """Return the number of frames of the estimated channel."""
+        return self._nframes
+
+    # -----------------------------------------------------------------------
+
+    def get_framerate(self):
+        """Return the frame rate of the estimated channel."""
+        return self._framerate
+
+    # -----------------------------------------------------------------------
+
+    def set_volume_value(self, index, value):
+        """Set manually the rms at a given position."""
+        self._volumes[index] = value
+
+    # -----------------------------------------------------------------------
+    # Estimators
+    # -----------------------------------------------------------------------
+
+    def estimate_channel(self, channel):
+        """Estimate the volumes of a sppasChannel.
+
+        The position of the channel is not changed.
+
+        :param channel: (sppasChannel) The channel to work on.
+
+        """
+        frames = channel.get_frames()
+        sampwidth = channel.get_sampwidth()
+        nframes = len(frames) // sampwidth
+        step = sppasStreamVolume.BLOCK_SIZE * sampwidth
+        view = memoryview(frames)
+        blocks = (view[i:i+step] for i in range(0, len(frames), step))
+
+        self._estimate(blocks, channel.get_framerate(), sampwidth, nframes)
+        self._rms = get_backend().rms(frames, sampwidth)
+
+    # -----------------------------------------------------------------------
+
+    def estimate_audio(self, audio, index=0):
+        """Estimate the volumes of a channel of an opened audio file.
+
+        The frames are read block by block from the audio file pointer,
+        then the position of the audio is restored.
+
+        :param audio: (sppasAudioPCM) The audio to work on.
+        :param index: (int) Index of the channel in the audio file.
+
+        """
+        if audio.get_audiofp() is None:
+            raise AudioError
+        nc = audio.get_nchannels()
+        index = int(index)
+        if index < 0 or index >= nc:
+            raise ChannelIndexError(index)
+        sampwidth = audio.get_sampwidth()
+        if sampwidth not in (1, 2, 3, 4):
+            raise SampleWidthError(sampwidth)
+
+        pos = audio.tell()
+        audio.seek(0)
+        nframes = audio.get_nframes()
+        squares = [0, 0]   # sum of the squares and number of samples
+        backend = get_backend()
+
+        def read_blocks():
+            read = 0
+            while read < nframes:
+                data = audio.read_view(min(sppasStreamVolume.BLOCK_SIZE,
+                                           nframes - read))
+                if len(data) < nc * sampwidth:
+                    break
+                if nc > 1:
+                    data = sppasAudioFrames.deinterleave(
+                        data, sampwidth, nc, [index])[0]
+                squares[0] += backend.sum_squares(data, sampwidth)
+                squares[1] += len(data) // sampwidth
+                read += len(data) // sampwidth
+                yield data
+
+        try:
+            self._estimate(read_blocks(), audio.get_framerate(),
+                           sampwidth, nframes)
+        finally:
+            audio.seek(pos)
+
+        self._rms = 0
+        if squares[1] > 0:
+            self._rms = int(math.sqrt(float(squares[0]) / float(squares[1])))
+
+    # -----------------------------------------------------------------------
+
+    def estimate_file(self, filename, index=0):
+        """Estimate the volumes of a channel of an audio file.
+
+        :param filename: (str) Name of the audio file
+        :param index: (int) Index of the channel in the audio file.
+
+        """
+        # import here to avoid circular import
+        from .aio import open as audio_open
+        audio = audio_open(filename)
+        try:
+            self.estimate_audio(audio, index)
+        finally:
+            audio.close()
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def _estimate(self, blocks, framerate, sampwidth, nframes):
+        """Estimate the rms of all the windows of the given blocks of frames.
+
+        The last windows can be partial or empty. Negative values of
+        corrupted audio files are replaced by the previous one and the
+        last volume is removed if it is 0.
+
+        :param blocks: (iterator) Successive frames of a mono channel
+        :param framerate: (int)
+        :param sampwidth: (int)
+        :param nframes: (int) Total number of frames of the blocks
+
+        """
+        win = int(self._winlen * framerate) * sampwidth
+        shift = int(self._winshift * framerate) * sampwidth
+        duration = float(nframes) / float(framerate)
+        nb_vols = int(duration / self._winshift) + 1
+
+        self._framerate = framerate
+        self._nframes = nframes
+        self._volumes = array('L', [0]) * nb_vols
+
+        # Frames of the current windows, and position of the 1st one
+        backend = get_backend()
+        buf = bytearray()
+        offset = 0
+        i = 0
+        for block in blocks:
+            buf.extend(block)
+            start = i * shift - offset
+            # The rms of all the complete windows of the block at once
+            if i < nb_vols and start + win <= len(buf):
+                nb = min(nb_vols - i, (len(buf) - start - win) // shift + 1)
+                end = start + (nb - 1) * shift + win
+                for value in backend.rms_windows(buf[start:end], sampwidth,
+                                                 win // sampwidth,
+                                                 shift // sampwidth):
+                    self.__set_rms(i, value)
+                    i += 1
+                start = i * shift - offset
+            # Frames before the next window are not needed anymore
+            consumed = min(start, len(buf))
+            del buf[:consumed]
+            offset += consumed
+
+        # Partial or empty windows at the end
+        while i < nb_vols:
+            start = i * shift - offset
+            self.__set_rms(i, backend.rms(buf[start:start+win], sampwidth))
+            i += 1
+
+        if len(self._volumes) > 0 and self._volumes[-1] == 0:
+            self._volumes.pop()
+
+    # -----------------------------------------------------------------------
+
+    def __set_rms(self, index, rms):
+        """Set the rms at the given index, except if it is not positive."""
+        if rms > 0:
+            self._volumes[index] = rms
+        elif rms < 0:
+            # provide negative values of corrupted audio files
+            if index > 0:
+                self._volumes[index] = self._volumes[index-1]
+            logging.warning("Corrupted audio? "
+                            "The RMS is a negative value {:d}".format(rms))
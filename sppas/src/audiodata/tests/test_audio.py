@@ -40,6 +40,7 @@ from sppas.src.config import paths
 
 from ..aio import open as audio_open
 from ..audio import sppasAudioPCM
+from ..audioframes import sppasAudioFrames
 from ..audiodataexc import ChannelIndexError, AudioError
 
 sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
@@ -92,6 +93,101 @@ class TestAudioPCM(unittest.TestCase):
         a2.remove_channel(c1)
         self.assertEqual(1, a2.get_nchannels())
 
+    def test_extract_channels(self):
+        """Test extract_channel/extract_channels of a stereo file."""
+        a3 = audio_open(sample_3)
+        self.assertEqual(2, a3.get_nchannels())
+        sw = a3.get_sampwidth()
+        data = a3.read()
+        expected = list()
+        for index in range(2):
+            frames = b"".join(data[i:i+sw]
+                              for i in range(index*sw, len(data), 2*sw))
+            expected.append(frames)
+
+        a3.extract_channels()
+        self.assertEqual(2, len(a3.get_channels()))
+        self.assertEqual(expected[0], a3.get_channel(0).get_frames())
+        self.assertEqual(expected[1], a3.get_channel(1).get_frames())
+        cidx = a3.extract_channel(1)
+        self.assertEqual(expected[1], a3.get_channel(cidx).get_frames())
+
+        # the frames are read by blocks
+        block_size = sppasAudioPCM.BLOCK_SIZE
+        sppasAudioPCM.BLOCK_SIZE = 1000
+        try:
+            cidx = a3.extract_channel(0)
+        finally:
+            sppasAudioPCM.BLOCK_SIZE = block_size
+        self.assertEqual(expected[0], a3.get_channel(cidx).get_frames())
+        a3.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_read_fragment(self):
+        """Test read_fragment of a mono and a stereo file."""
+        for sample in (sample_1, sample_3):
+            audio = audio_open(sample)
+            nc = audio.get_nchannels()
+            audio.extract_channels()
+            audio.seek(12)
+            for index in range(nc):
+                channel = audio.get_channel(index)
+                view = audio.read_fragment(index, 1000, 5000)
+                self.assertFalse(view.is_loaded())
+                self.assertEqual(4000, view.get_nframes())
+                self.assertEqual(channel.get_framerate(), view.get_framerate())
+
+                # a fragment of a view is another view
+                sub = view.extract_fragment(100, 200)
+                self.assertFalse(view.is_loaded())
+                self.assertEqual(1100, sub.get_begin())
+                self.assertEqual(channel.extract_fragment(1100, 1200).get_frames(),
+                                 sub.get_frames())
+                self.assertTrue(sub.is_loaded())
+
+                self.assertEqual(channel.extract_fragment(1000, 5000).get_frames(),
+                                 view.get_frames())
+                self.assertTrue(view.is_loaded())
+                self.assertEqual(4000, view.get_nframes())
+
+                view = audio.read_fragment(index, 100)
+                self.assertEqual(channel.extract_fragment(100).get_frames(),
+                                 view.get_frames())
+                self.assertEqual(0, audio.read_fragment(index, 10**9).get_nframes())
+
+            # the position in the file is not changed
+            self.assertEqual(12, audio.tell())
+            with self.assertRaises(ChannelIndexError):
+                audio.read_fragment(nc)
+            audio.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_deinterleave(self):
+        """Test sppasAudioFrames.deinterleave with all sample widths."""
+        for sw in (1, 2, 3, 4):
+            nc = 3
+            frames = bytes(bytearray(i % 256 for i in range(10*sw*nc)))
+            channels = sppasAudioFrames.deinterleave(frames, sw, nc)
+            self.assertEqual(nc, len(channels))
+            for index in range(nc):
+                expected = b"".join(
+                    frames[i:i+sw]
+                    for i in range(index*sw, len(frames), nc*sw))
+                self.assertEqual(expected, bytes(channels[index]))
+
+            # a selection of channels, an incomplete frame is ignored
+            channels = sppasAudioFrames.deinterleave(frames + b"\x00",
+                                                     sw, nc, [2])
+            self.assertEqual(1, len(channels))
+            self.assertEqual(10*sw, len(channels[0]))
+
+        with self.assertRaises(ChannelIndexError):
+            sppasAudioFrames.deinterleave(b"\x00\x00\x00\x00", 2, 2, [2])
+
+    # -----------------------------------------------------------------------
+
     def test_getters(self):
         """Test get_nchannels/get_sampwidth/get_framerate/get_nframes/get_duration."""
         a1 = audio_open(sample_1)
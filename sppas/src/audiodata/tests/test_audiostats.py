@@ -0,0 +1,182 @@
+# -*- coding:utf-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_audiostats.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os.path
+import shutil
+import json
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..aio import open as audio_open
+from ..audioframes import sppasAudioFrames
+from ..channelvolume import sppasChannelVolume
+from ..audiostats import sppasAudioStats, sppasAudioStatsCache
+
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+sample_3 = os.path.join(paths.samples, "samples-eng", "oriana3.wave")
+
+# ---------------------------------------------------------------------------
+
+
+def get_duration(stats):
+    """A function executed by the workers."""
+    return stats.get_duration()
+
+# ---------------------------------------------------------------------------
+
+
+class TestAudioStats(unittest.TestCase):
+
+    def setUp(self):
+        self._temp = sppasFileUtils().set_random()
+        os.mkdir(self._temp)
+
+    def tearDown(self):
+        shutil.rmtree(self._temp)
+
+    # -----------------------------------------------------------------------
+
+    def test_estimate(self):
+        """The statistics are the ones of the channels."""
+        stats = sppasAudioStats()
+        stats.estimate_file(sample_3)
+        audio = audio_open(sample_3)
+        self.assertEqual(2, stats.get_nchannels())
+        self.assertEqual(audio.get_framerate(), stats.get_framerate())
+        self.assertEqual(audio.get_sampwidth(), stats.get_sampwidth())
+        self.assertEqual(audio.get_nframes(), stats.get_nframes())
+        self.assertEqual(audio.get_duration(), stats.get_duration())
+        self.assertEqual(os.path.getsize(sample_3), stats.get_size())
+
+        audio.extract_channels()
+        for index in range(2):
+            channel = audio.get_channel(index)
+            volume = sppasChannelVolume(channel, sppasAudioStats.WIN_LEN)
+            self.assertEqual(list(volume.volumes()),
+                             list(stats.get_volumes(index).volumes()))
+            self.assertEqual(volume.volume(), stats.get_rms(index))
+            self.assertEqual(volume.mean(), stats.get_volumes(index).mean())
+            frames = sppasAudioFrames(channel.get_frames(),
+                                      channel.get_sampwidth())
+            for factor in sppasAudioStats.CLIPPING_FACTORS:
+                self.assertAlmostEqual(frames.clipping_rate(factor),
+                                       stats.get_clipping_rate(factor, index))
+            threshold = sorted(volume.volumes())[len(volume) // 2]
+            nb = sum(1 for v in volume.volumes() if v < threshold)
+            self.assertEqual(float(nb) / len(volume),
+                             stats.get_silence_rate(threshold, index))
+        audio.close()
+
+        with self.assertRaises(ValueError):
+            stats.get_clipping_rate(0.5)
+        with self.assertRaises(IndexError):
+            stats.get_rms(2)
+
+        # the statistics can be saved in JSON
+        copy = sppasAudioStats(json.loads(json.dumps(stats.get_dict())))
+        self.assertEqual(stats.get_volumes(1).volumes(),
+                         copy.get_volumes(1).volumes())
+        self.assertEqual(stats.get_clipping_rate(0.4, 1),
+                         copy.get_clipping_rate(0.4, 1))
+        with self.assertRaises(ValueError):
+            sppasAudioStats(dict(version=0))
+
+    # -----------------------------------------------------------------------
+
+    def test_cache(self):
+        """The statistics are estimated again only if the file changed."""
+        filename = os.path.join(self._temp, "sample.wav")
+        shutil.copy(sample_1, filename)
+        cache = sppasAudioStatsCache()
+        self.assertEqual(filename + ".stats", cache.get_filename(filename))
+
+        stats = cache.get(filename)
+        self.assertTrue(os.path.exists(cache.get_filename(filename)))
+        self.assertEqual(17.792, round(stats.get_duration(), 3))
+        self.assertEqual(696, stats.get_rms())
+
+        # the saved statistics are used
+        saved = cache.get_filename(filename)
+        with open(saved) as fp:
+            content = json.load(fp)
+        content["channels"][0]["rms"] = 1
+        with open(saved, "w") as fp:
+            json.dump(content, fp)
+        self.assertEqual(1, cache.get(filename).get_rms())
+
+        # even if the file was touched
+        mtime = os.path.getmtime(filename)
+        os.utime(filename, (mtime + 10, mtime + 10))
+        self.assertEqual(1, cache.get(filename).get_rms())
+        with open(saved) as fp:
+            self.assertEqual(mtime + 10, json.load(fp)["mtime"])
+
+        # but not if it was modified
+        with open(filename, "r+b") as fp:
+            fp.seek(1000)
+            fp.write(b"\x00\x10")
+        self.assertEqual(696, cache.get(filename).get_rms())
+
+        # the statistics can be stored into a directory
+        directory = os.path.join(self._temp, "stats")
+        cache = sppasAudioStatsCache(directory)
+        self.assertEqual(directory, os.path.dirname(cache.get_filename(filename)))
+        self.assertEqual(696, cache.get(filename).get_rms())
+        self.assertEqual(1, len(os.listdir(directory)))
+
+    # -----------------------------------------------------------------------
+
+    def test_get_files(self):
+        """The statistics of several files, with several processes."""
+        files = [os.path.join(self._temp, "sample{:d}.wav".format(i))
+                 for i in range(3)]
+        for filename in files:
+            shutil.copy(sample_1, filename)
+        files.append(os.path.join(self._temp, "unknown.wav"))
+
+        cache = sppasAudioStatsCache(os.path.join(self._temp, "stats"))
+        for nb_workers in (1, 2):
+            results = list(cache.get_files(files, nb_workers, get_duration))
+            self.assertEqual(files, [r[0] for r in results])
+            for filename, duration, error in results[:3]:
+                self.assertEqual(17.792, round(duration, 3))
+                self.assertIsNone(error)
+            self.assertIsNone(results[3][1])
+            self.assertIsNotNone(results[3][2])
+
+        results = list(cache.get_files(files[:1]))
+        self.assertEqual(696, results[0][1].get_rms())
@@ -0,0 +1,207 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_backend.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import random
+from array import array
+
+from ..backend import get_backends, get_backend, set_backend
+from ..backend import sppasPythonBackend
+from ..backend import _backends
+from ..audiodataexc import SampleWidthError
+from ..audioframes import sppasAudioFrames
+
+# ---------------------------------------------------------------------------
+
+
+def random_frames(sampwidth, nframes, nchannels=1):
+    """Return random frames, including the extreme values of samples."""
+    values = [0, 1, -1, sppasPythonBackend.get_maxval(sampwidth),
+              sppasPythonBackend.get_minval(sampwidth)]
+    values.extend(random.randint(sppasPythonBackend.get_minval(sampwidth),
+                                 sppasPythonBackend.get_maxval(sampwidth))
+                  for _ in range(nframes * nchannels - len(values)))
+    return sppasPythonBackend().pack(values[:nframes * nchannels], sampwidth)
+
+# ---------------------------------------------------------------------------
+
+
+class TestBackends(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(12)
+        self.ref = sppasPythonBackend()
+
+    # -----------------------------------------------------------------------
+
+    def test_get_set(self):
+        self.assertIn("python", get_backends())
+        self.assertEqual(get_backends()[0], get_backend().get_name())
+        previous = set_backend("python")
+        try:
+            self.assertEqual("python", get_backend().get_name())
+            with self.assertRaises(ValueError):
+                set_backend("foo")
+        finally:
+            set_backend(previous.get_name())
+
+    # -----------------------------------------------------------------------
+
+    def test_python(self):
+        b = self.ref
+        frames = array('h', [0, 10, -20, 30, -32768, 32767]).tobytes()
+        self.assertEqual([[0, 10, -20, 30, -32768, 32767]],
+                         b.samples(frames, 2))
+        self.assertEqual([[0, -20, -32768], [10, 30, 32767]],
+                         b.samples(frames, 2, 2))
+        self.assertEqual(frames, b.frames(b.samples(frames, 2, 2), 2, 2))
+        self.assertEqual((-32768, 32767), b.minmax(frames, 2))
+        self.assertEqual(3, b.avg(frames, 2))
+        self.assertEqual(18918, b.rms(frames, 2))
+        self.assertEqual(4, b.cross(frames, 2))
+        self.assertEqual(-1, b.cross(b"", 2))
+        self.assertEqual(0, b.rms(b"", 2))
+        self.assertEqual([[0, 10, -20, 30, -32768, 32767]],
+                         b.samples(b.mul(frames, 2, 1.), 2))
+        self.assertEqual([[0, 5, -10, 15, -16384, 16383]],
+                         b.samples(b.mul(frames, 2, 0.5), 2))
+        self.assertEqual([[0, 20, -40, 60, -32768, 32767]],
+                         b.samples(b.mul(frames, 2, 2), 2))
+        self.assertEqual([[1, 11, -19, 31, -32767, -32768]],
+                         b.samples(b.bias(frames, 2, 1), 2))
+        self.assertEqual([[0, 0, -1, 0, -128, 127]],
+                         b.samples(b.lin2lin(frames, 2, 1), 1))
+        self.assertEqual(frames[:2] + frames[4:6] + frames[8:10],
+                         b.ratecv(frames, 2, 1, 16000, 8000))
+
+        # 8 bits frames of WAV files are unsigned
+        self.assertEqual([[-128, 0, 127]],
+                         b.samples(b"\x00\x80\xff", 1, unsigned=True))
+        self.assertEqual([[0, -128, -1]], b.samples(b"\x00\x80\xff", 1))
+
+        # 24 bits frames
+        frames = b"\x01\x00\x00\xff\xff\xff\x00\x00\x80\xff\xff\x7f"
+        self.assertEqual([[1, -1, -8388608, 8388607]], b.samples(frames, 3))
+        self.assertEqual(frames, b.frames(b.samples(frames, 3), 3))
+
+        with self.assertRaises(SampleWidthError):
+            b.rms(b"\x00" * 10, 5)
+
+    # -----------------------------------------------------------------------
+
+    def test_same_results(self):
+        """All the backends give the results of the python one."""
+        for name in get_backends():
+            b = _backends[name]()
+            for sw in (1, 2, 3, 4):
+                for n in (0, 1, 7, 480):
+                    frames = random_frames(sw, n)
+                    for op in ("rms", "minmax", "avg", "cross"):
+                        self.assertEqual(getattr(self.ref, op)(frames, sw),
+                                         getattr(b, op)(frames, sw),
+                                         (name, op, sw, n))
+                    for f in (0.5, 1.7, -2.3, 3):
+                        self.assertEqual(self.ref.mul(frames, sw, f),
+                                         b.mul(frames, sw, f))
+                    for v in (1, -5, 1000, -(1 << 20)):
+                        self.assertEqual(self.ref.bias(frames, sw, v),
+                                         b.bias(frames, sw, v))
+                    for new_sw in (1, 2, 3, 4):
+                        self.assertEqual(self.ref.lin2lin(frames, sw, new_sw),
+                                         b.lin2lin(frames, sw, new_sw))
+                    other = random_frames(sw, n)
+                    for unsigned in (False, True):
+                        self.assertEqual(
+                            self.ref.mix([frames, other], sw, [0.7, -1.2],
+                                         0.9, unsigned),
+                            b.mix([frames, other], sw, [0.7, -1.2],
+                                  0.9, unsigned))
+                    if n > 0:
+                        self.assertEqual(
+                            self.ref.clipping_rate(frames, sw, 0.5, True),
+                            b.clipping_rate(frames, sw, 0.5, True))
+
+                for nc in (1, 2):
+                    frames = random_frames(sw, 300, nc)
+                    self.assertEqual(self.ref.samples(frames, sw, nc, True),
+                                     b.samples(frames, sw, nc, True))
+                    samples = self.ref.samples(frames, sw, nc)
+                    self.assertEqual(frames, b.frames(samples, sw, nc))
+                    for rate, new_rate in ((16000, 8000), (8000, 16000),
+                                           (44100, 16000), (16000, 16000)):
+                        self.assertEqual(
+                            self.ref.ratecv(frames, sw, nc, rate, new_rate),
+                            b.ratecv(frames, sw, nc, rate, new_rate),
+                            (name, sw, nc, rate, new_rate))
+
+    # -----------------------------------------------------------------------
+
+    def test_rms_windows(self):
+        """The rms of the windows are the ones of each window."""
+        for name in get_backends():
+            b = _backends[name]()
+            for sw in (1, 2, 3, 4):
+                frames = random_frames(sw, 487)
+                for win, shift in ((20, 10), (10, 10), (7, 13), (487, 1),
+                                   (488, 5)):
+                    expected = [
+                        self.ref.rms(frames[i*sw:(i+win)*sw], sw)
+                        for i in range(0, 487 - win + 1, shift)]
+                    self.assertEqual(expected,
+                                     b.rms_windows(frames, sw, win, shift),
+                                     (name, sw, win, shift))
+                self.assertEqual([], b.rms_windows(b"", sw, 20, 10))
+
+    # -----------------------------------------------------------------------
+
+    def test_audioframes(self):
+        """sppasAudioFrames gives the same results with all the backends."""
+        frames = random_frames(2, 1000, 2)
+        results = list()
+        for name in get_backends():
+            previous = set_backend(name)
+            try:
+                a = sppasAudioFrames(frames, 2, 2)
+                results.append((a.rms(), a.minmax(), a.avg(), a.cross(),
+                                a.resample(16000, 8000), a.mul(0.3),
+                                a.clipping_rate(0.5)))
+            finally:
+                set_backend(previous.get_name())
+        for r in results[1:]:
+            self.assertEqual(results[0], r)
+
+        # 24 bits frames are supported
+        a = sppasAudioFrames(random_frames(3, 100), 3, 1)
+        self.assertEqual(100*2, len(a.change_sampwidth(2)))
@@ -34,10 +34,16 @@
 """
 import unittest
 import os.path
+import shutil
 
 from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
 from ..aio import open as audio_open
+from ..aio import save as audio_save
+from ..audio import sppasAudioPCM
+from ..audiocache import sppasAudioCache
 from ..channelformatter import sppasChannelFormatter
+from ..resampler import sppasResampler
 
 # ---------------------------------------------------------------------------
 
@@ -68,3 +74,127 @@ class TestChannelFormatter(unittest.TestCase):
 
         self.assertEqual(channel.get_framerate(), formatter.get_channel().get_framerate())
         self.assertEqual(channel.get_sampwidth(), formatter.get_channel().get_sampwidth())
+
+    def test_convert_file(self):
+        """Convert a view of a file, block by block, into a file."""
+        temp = sppasFileUtils().set_random()
+        os.mkdir(temp)
+        block_size = sppasChannelFormatter.BLOCK_SIZE
+        try:
+            fragment = self._sample_1.read_fragment(0, 0, 8000)
+            formatter = sppasChannelFormatter(fragment)
+            formatter.set_framerate(8000)
+            formatter.set_sampwidth(4)
+            formatter.convert()
+            expected = formatter.get_channel()
+            self.assertEqual(4000, expected.get_nframes())
+            self.assertEqual(4, expected.get_sampwidth())
+
+            sppasChannelFormatter.BLOCK_SIZE = 1000
+            filename = os.path.join(temp, "converted.wav")
+            formatter = sppasChannelFormatter(
+                self._sample_1.read_fragment(0, 0, 8000))
+            formatter.set_framerate(8000)
+            formatter.set_sampwidth(4)
+            formatter.convert_file(filename)
+            converted = audio_open(filename)
+            self.assertEqual(8000, converted.get_framerate())
+            self.assertEqual(4, converted.get_sampwidth())
+            self.assertEqual(expected.get_frames(), converted.read())
+            converted.close()
+        finally:
+            sppasChannelFormatter.BLOCK_SIZE = block_size
+            shutil.rmtree(temp)
+
+    def test_cache(self):
+        """Convert the audio files once."""
+        temp = sppasFileUtils().set_random()
+        os.mkdir(temp)
+        try:
+            source = os.path.join(temp, "source.wav")
+            audio = sppasAudioPCM()
+            channel = self._sample_1.read_fragment(0, 0, 4000)
+            formatter = sppasChannelFormatter(channel)
+            formatter.set_framerate(22050)
+            formatter.convert()
+            audio.append_channel(formatter.get_channel())
+            nframes = formatter.get_channel().get_nframes()
+            audio_save(source, audio)
+
+            cache = sppasAudioCache(os.path.join(temp, "cache"), 16000, 2)
+            filename = cache.get(source)
+            self.assertTrue(filename.startswith(cache.get_directory()))
+            converted = audio_open(filename)
+            self.assertEqual(16000, converted.get_framerate())
+            self.assertEqual(2, converted.get_sampwidth())
+            self.assertEqual(sppasResampler.get_nframes(nframes, 22050, 16000),
+                             converted.get_nframes())
+            converted.close()
+
+            # the copy is re-used, until the file is modified
+            mtime = os.path.getmtime(filename)
+            os.utime(filename, (mtime - 10, mtime - 10))
+            self.assertEqual(filename, cache.get(source))
+            self.assertEqual(mtime - 10, os.path.getmtime(filename))
+            os.utime(source, (mtime + 10, mtime + 10))
+            self.assertNotEqual(filename, cache.get(source))
+            # the copy of the previous version of the file was removed
+            self.assertFalse(os.path.exists(filename))
+            self.assertEqual(1, len(os.listdir(cache.get_directory())))
+
+            # no copy of a file in the expected format
+            self.assertEqual(sample_1, cache.get(sample_1))
+            cache.clear()
+            self.assertEqual(0, len(os.listdir(cache.get_directory())))
+        finally:
+            shutil.rmtree(temp)
+
+    def test_cache_eviction(self):
+        """Remove the old copies and the oldest ones beyond the size."""
+        temp = sppasFileUtils().set_random()
+        os.mkdir(temp)
+        try:
+            sources = list()
+            for i in range(3):
+                source = os.path.join(temp, "source{:d}.wav".format(i))
+                audio = sppasAudioPCM()
+                formatter = sppasChannelFormatter(
+                    self._sample_1.read_fragment(0, 0, 4000))
+                formatter.set_framerate(22050)
+                formatter.convert()
+                audio.append_channel(formatter.get_channel())
+                audio_save(source, audio)
+                sources.append(source)
+
+            cache = sppasAudioCache(os.path.join(temp, "cache"), 16000, 2)
+            first = cache.get(sources[0])
+            size = os.path.getsize(first)
+
+            # the copies older than the maximum age are removed
+            now = os.path.getmtime(first)
+            os.utime(first, (now - 100, now - 100))
+            cache = sppasAudioCache(cache.get_directory(), 16000, 2,
+                                    max_age=50)
+            second = cache.get(sources[1])
+            self.assertFalse(os.path.exists(first))
+            self.assertTrue(os.path.exists(second))
+
+            # the oldest copies are removed beyond the maximum size
+            first = cache.get(sources[0])
+            os.utime(second, (now - 20, now - 20))
+            os.utime(first, (now - 10, now - 10))
+            cache = sppasAudioCache(cache.get_directory(), 16000, 2,
+                                    max_size=2 * size)
+            third = cache.get(sources[2])
+            self.assertFalse(os.path.exists(second))
+            self.assertTrue(os.path.exists(first))
+            self.assertTrue(os.path.exists(third))
+
+            # the copy which was just created is never removed
+            cache = sppasAudioCache(cache.get_directory(), 16000, 2,
+                                    max_size=0)
+            cache.evict(keep=third)
+            self.assertEqual([os.path.basename(third)],
+                             os.listdir(cache.get_directory()))
+        finally:
+            shutil.rmtree(temp)
@@ -34,9 +34,11 @@
 """
 import unittest
 import os.path
+from array import array
 
 from sppas.src.config import paths
 from ..aio import open as audio_open
+from ..channel import sppasChannel
 from ..channelformatter import sppasChannelFormatter
 from ..channelsmixer import sppasChannelMixer
 
@@ -83,3 +85,28 @@ class TestChannelsMixer(unittest.TestCase):
 
         self.assertEqual(newchannel.get_nframes(), mixer.get_channel(0).get_nframes())
         self.assertEqual(newchannel.get_nframes(), mixer.get_channel(1).get_nframes())
+
+    def test_mix_values(self):
+        c1 = sppasChannel(16000, 2, array('h', [0, 1000, -1000, 30000, -30000]).tobytes())
+        c2 = sppasChannel(16000, 2, array('h', [0, 3, -3, 30000, -30000]).tobytes())
+        mixer = sppasChannelMixer()
+        mixer.append_channel(c1, 1)
+        mixer.append_channel(c2, 0.5)
+        expected = [0, 1001, -1001, 32767, -32768]
+        self.assertEqual(array('h', expected).tobytes(),
+                         mixer.mix().get_frames())
+        self.assertEqual((-32768, 32767), mixer.get_minmax())
+        self.assertEqual(array('h', [0, 500, -500, 22500, -22500]).tobytes(),
+                         mixer.mix(0.5).get_frames())
+
+        # the result does not depend on the size of the blocks
+        mixer.BLOCK_SIZE = 2
+        self.assertEqual(array('h', expected).tobytes(),
+                         mixer.mix().get_frames())
+
+        # 8 bits samples are unsigned
+        mixer = sppasChannelMixer()
+        mixer.append_channel(sppasChannel(16000, 1, b"\x80\x90\x70\xff"))
+        mixer.append_channel(sppasChannel(16000, 1, b"\x80\x90\x70\xff"))
+        self.assertEqual(b"\x80\xa0\x60\xff", mixer.mix().get_frames())
+        self.assertEqual((-32, 127), mixer.get_minmax())
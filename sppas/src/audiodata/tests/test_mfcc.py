@@ -0,0 +1,222 @@
+# -*- coding:utf-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_mfcc.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os.path
+import shutil
+import math
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+from sppas.src.models.acm.features import sppasAcFeatures
+
+from ..aio import open as audio_open
+from ..aio import save as audio_save
+from ..audio import sppasAudioPCM
+from ..channelmfcc import sppasChannelMFCC
+from ..mfcc import sppasMFCC, _RealFFT, HTK_BASE_KINDS, HTK_QUALIFIERS
+from .. import mfcc as mfcc_module
+
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+
+# ---------------------------------------------------------------------------
+
+
+class TestMFCC(unittest.TestCase):
+
+    def setUp(self):
+        self._temp = sppasFileUtils().set_random()
+        os.mkdir(self._temp)
+
+    def tearDown(self):
+        shutil.rmtree(self._temp)
+
+    # -----------------------------------------------------------------------
+
+    def test_config(self):
+        """Parse the configuration files of sppasAcFeatures."""
+        features = sppasAcFeatures()
+        features.write_all(self._temp)
+        mfcc = sppasMFCC(features.configfile)
+        self.assertEqual("MFCC_0_D_N_Z", mfcc.get_config("TARGETKIND"))
+        self.assertEqual(100000., mfcc.get_config("TARGETRATE"))
+        self.assertEqual(250000., mfcc.get_config("WINDOWSIZE"))
+        self.assertTrue(mfcc.get_config("USEHAMMING"))
+        self.assertFalse(mfcc.get_config("ENORMALISE"))
+        self.assertEqual(26, mfcc.get_config("NUMCHANS"))
+        self.assertEqual(0.97, mfcc.get_config("PREEMCOEF"))
+        self.assertEqual(HTK_BASE_KINDS["MFCC"] | HTK_QUALIFIERS["0"] |
+                         HTK_QUALIFIERS["D"] | HTK_QUALIFIERS["N"] |
+                         HTK_QUALIFIERS["Z"], mfcc.get_parm_kind())
+
+        mfcc = sppasMFCC(features.mfcconfigfile)
+        self.assertEqual("MFCC_0_D", mfcc.get_config("TARGETKIND"))
+
+        with self.assertRaises(ValueError):
+            mfcc.set_config("TARGETKIND", "LPC")
+        with self.assertRaises(ValueError):
+            mfcc.set_config("TARGETKIND", "MFCC_A")
+        # N removes the absolute energy: it requires E or 0
+        with self.assertRaises(ValueError):
+            mfcc.set_config("TARGETKIND", "MFCC_D_N")
+        with self.assertRaises(ValueError):
+            sppasMFCC.parse_kind("MFCC_D_A_N_Z")
+        self.assertEqual(("MFCC", "EDN"), sppasMFCC.parse_kind("MFCC_E_D_N"))
+
+    # -----------------------------------------------------------------------
+
+    def test_fft(self):
+        """The magnitudes of the FFT are the ones of the DFT."""
+        frame = [math.sin(i / 3.) * 100. + (i % 7) for i in range(25)]
+        n = 32
+        padded = frame + [0.] * (n - len(frame))
+        expected = list()
+        for k in range(n // 2):
+            re = sum(v * math.cos(2. * math.pi * k * i / n)
+                     for i, v in enumerate(padded))
+            im = sum(v * math.sin(2. * math.pi * k * i / n)
+                     for i, v in enumerate(padded))
+            expected.append(math.sqrt(re * re + im * im))
+        for a, b in zip(expected, _RealFFT(n).magnitudes(frame)):
+            self.assertAlmostEqual(a, b, places=8)
+
+    # -----------------------------------------------------------------------
+
+    def test_evaluate(self):
+        """Number and size of the feature vectors."""
+        audio = audio_open(sample_1)
+        audio.extract_channel(0)
+        channel = audio.get_channel(0).extract_fragment(0, 16000)
+        audio.close()
+
+        mfcc = sppasMFCC()
+        mfcc.set_config("WINDOWSIZE", "250000.0")
+        for kind, dim in (("MFCC_0_D", 26), ("MFCC_0_D_N_Z", 25),
+                          ("MFCC_E_D_A", 39), ("FBANK", 20),
+                          ("MELSPEC_E_D", 42)):
+            mfcc.set_config("TARGETKIND", kind)
+            vectors = sppasChannelMFCC(channel).evaluate(mfcc)
+            # (16000 - 400) // 160 + 1 frames
+            self.assertEqual(98, len(vectors))
+            self.assertEqual(dim, len(vectors[0]))
+
+        # the energy is normalized: its max is 1
+        mfcc.set_config("TARGETKIND", "MFCC_E")
+        vectors = mfcc.evaluate_channel(channel)
+        self.assertAlmostEqual(1., max(v[-1] for v in vectors))
+
+        # cepstral mean normalization
+        mfcc.set_config("TARGETKIND", "MFCC_Z")
+        vectors = mfcc.evaluate_channel(channel)
+        for c in range(12):
+            self.assertAlmostEqual(0., sum(v[c] for v in vectors) / 98.)
+
+        # the delta of a constant vector is 0
+        mfcc.set_config("TARGETKIND", "MFCC_D")
+        vectors = mfcc.evaluate(sppasMFCC.frames_samples(b"\x01\x00" * 1600,
+                                                         2), 16000)
+        self.assertEqual(8, len(vectors))
+        self.assertEqual([0.] * 12, list(vectors[4][12:]))
+        self.assertEqual(0, len(mfcc.evaluate([0] * 399, 16000)))
+
+    # -----------------------------------------------------------------------
+
+    def test_python_numpy(self):
+        """Both implementations give the same results."""
+        if mfcc_module.IMPORT_NUMPY is False:
+            return
+        audio = audio_open(sample_1)
+        audio.extract_channel(0)
+        channel = audio.get_channel(0).extract_fragment(0, 16000)
+        audio.close()
+
+        mfcc = sppasMFCC()
+        for kind in ("MFCC_0_D_N_Z", "MFCC_E_D_A", "FBANK_E", "MELSPEC"):
+            mfcc.set_config("TARGETKIND", kind)
+            vectors = mfcc.evaluate_channel(channel)
+            mfcc_module.IMPORT_NUMPY = False
+            try:
+                expected = mfcc.evaluate_channel(channel)
+            finally:
+                mfcc_module.IMPORT_NUMPY = True
+            for v, e in zip(vectors.tolist(), expected):
+                for a, b in zip(v, e):
+                    self.assertAlmostEqual(a, b, places=6)
+
+    # -----------------------------------------------------------------------
+
+    def test_write_read(self):
+        """Write HTK files, with a pool of processes or not."""
+        features = sppasAcFeatures()
+        features.write_all(self._temp)
+        wav = os.path.join(self._temp, "sample.wav")
+        audio = audio_open(sample_1)
+        audio.extract_channel(0)
+        channel = audio.get_channel(0).extract_fragment(0, 8000)
+        audio.close()
+        sppasChannelMFCC(channel).write(features.mfcconfigfile,
+                                        os.path.join(self._temp, "ref.mfc"))
+        out = sppasAudioPCM()
+        out.append_channel(channel)
+        audio_save(wav, out)
+
+        mfcc = sppasMFCC(features.mfcconfigfile)
+        kind, period, vectors = sppasMFCC.read_htk(
+            os.path.join(self._temp, "ref.mfc"))
+        self.assertEqual(mfcc.get_parm_kind(), kind)
+        self.assertEqual(100000, period)
+        self.assertEqual(48, len(vectors))
+        self.assertEqual(26, len(vectors[0]))
+        expected = mfcc.evaluate_channel(channel)
+        for a, b in zip(vectors[10], expected[10]):
+            self.assertAlmostEqual(a, b, places=3)
+
+        # scp of HCopy, processed by 2 workers
+        scp = os.path.join(self._temp, "files.scp")
+        with open(scp, "w") as fp:
+            for i in range(3):
+                fp.write("{:s} {:s}\n".format(
+                    wav, os.path.join(self._temp, "%d.mfc" % i)))
+            fp.write("{:s} {:s}\n".format(
+                os.path.join(self._temp, "none.wav"),
+                os.path.join(self._temp, "none.mfc")))
+        self.assertFalse(sppasChannelMFCC().hcopy(features.mfcconfigfile,
+                                                  scp, nb_workers=2))
+        with open(os.path.join(self._temp, "ref.mfc"), "rb") as fp:
+            ref = fp.read()
+        for i in range(3):
+            with open(os.path.join(self._temp, "%d.mfc" % i), "rb") as fp:
+                self.assertEqual(ref, fp.read())
+        self.assertFalse(os.path.exists(os.path.join(self._temp, "none.mfc")))
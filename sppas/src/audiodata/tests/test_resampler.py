@@ -0,0 +1,169 @@
+# -*- coding:utf-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_resampler.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import math
+import random
+
+from ..backend import sppasPythonBackend
+from ..audiodataexc import SampleWidthError
+from ..resampler import sppasResampler
+from .. import resampler
+
+# ---------------------------------------------------------------------------
+
+
+def sine_frames(framerate, sampwidth, frequency, nframes):
+    """Return the frames of a sine, at the half of the max amplitude."""
+    amplitude = sppasPythonBackend.get_maxval(sampwidth) // 2
+    values = [int(amplitude * math.sin(2. * math.pi * frequency * i / framerate))
+              for i in range(nframes)]
+    return sppasPythonBackend().pack(values, sampwidth)
+
+
+def samples(frames, sampwidth):
+    return list(sppasPythonBackend().unpack(frames, sampwidth, unsigned=True))
+
+
+def rms(values):
+    return math.sqrt(sum(float(v) * v for v in values) / len(values))
+
+# ---------------------------------------------------------------------------
+
+
+class TestResampler(unittest.TestCase):
+
+    def test_sine(self):
+        """Convert a sine, in one block or in several ones."""
+        random.seed(7)
+        for rate, sw, new_rate, new_sw in ((44100, 3, 16000, 2),
+                                           (8000, 2, 16000, 2),
+                                           (16000, 2, 22050, 4),
+                                           (16000, 4, 16000, 2)):
+            frames = sine_frames(rate, sw, 440, rate // 10)
+            r = sppasResampler(rate, sw, new_rate, new_sw)
+            converted = r.convert_all(frames)
+            nframes = sppasResampler.get_nframes(rate // 10, rate, new_rate)
+            self.assertEqual(nframes * new_sw, len(converted))
+
+            # the result does not depend on the blocks
+            blocks = list()
+            i = 0
+            while i < len(frames):
+                size = random.randint(1, 3000)
+                blocks.append(r.convert(frames[i:i+size]))
+                i += size
+            blocks.append(r.flush())
+            self.assertEqual(converted, b"".join(blocks))
+
+            # the sine is preserved, except at the borders
+            amplitude = sppasPythonBackend.get_maxval(new_sw) // 2
+            values = samples(converted, new_sw)
+            for i in range(100, nframes - 100):
+                expected = amplitude * math.sin(2. * math.pi * 440 * i / new_rate)
+                self.assertAlmostEqual(expected, values[i], delta=amplitude * 1e-3)
+
+        with self.assertRaises(SampleWidthError):
+            sppasResampler(16000, 5, 16000, 2)
+
+    # -----------------------------------------------------------------------
+
+    def test_aliasing(self):
+        """Frequencies higher than the new Nyquist frequency are removed."""
+        frames = sine_frames(44100, 2, 10000, 4410)
+        converted = sppasResampler(44100, 2, 16000, 2).convert_all(frames)
+        values = samples(converted, 2)
+        self.assertLess(rms(values[100:-100]), 2.)
+
+        frames = sine_frames(44100, 2, 5000, 4410)
+        converted = sppasResampler(44100, 2, 16000, 2).convert_all(frames)
+        values = samples(converted, 2)
+        self.assertAlmostEqual(rms(samples(frames, 2)), rms(values[100:-100]),
+                               delta=50.)
+
+    # -----------------------------------------------------------------------
+
+    def test_sampwidth(self):
+        """Convert only the sample width, with or without a dither."""
+        values = [0, 255, 256, 257, 383, 384, -1, -256, -32768 * 256, 32767 * 256]
+        frames = sppasPythonBackend().pack(values, 3)
+
+        r = sppasResampler(16000, 3, 16000, 2, dither=False)
+        self.assertEqual([0, 1, 1, 1, 1, 2, 0, -1, -32768, 32767],
+                         samples(r.convert_all(frames), 2))
+        r = sppasResampler(16000, 2, 16000, 3)
+        self.assertEqual(b"", r.convert_all(b""))
+        frames16 = sppasPythonBackend().pack([1, -1, 32767], 2)
+        self.assertEqual([256, -256, 32767 * 256],
+                         samples(r.convert_all(frames16), 3))
+
+        # 8 bits frames are unsigned
+        r = sppasResampler(16000, 2, 16000, 1, dither=False)
+        self.assertEqual(b"\x80\x81\x7f\xff",
+                         r.convert_all(sppasPythonBackend().pack(
+                             [0, 256, -256, 32767], 2)))
+
+        # the dither is a noise of at most one step
+        random.seed(2)
+        values = [random.randint(-1 << 20, 1 << 20) for _ in range(1000)]
+        frames = sppasPythonBackend().pack(values, 3)
+        r = sppasResampler(16000, 3, 16000, 2)
+        dithered = samples(r.convert_all(frames), 2)
+        self.assertNotEqual(dithered, [int(math.floor(v / 256. + 0.5))
+                                       for v in values])
+        for v, d in zip(values, dithered):
+            self.assertLessEqual(abs(v / 256. - d), 1.5)
+
+    # -----------------------------------------------------------------------
+
+    def test_python_numpy(self):
+        """Both implementations give the same frames."""
+        if resampler.IMPORT_NUMPY is False:
+            return
+        random.seed(5)
+        values = [random.randint(-20000, 20000) for _ in range(3000)]
+        frames = sppasPythonBackend().pack(values, 2)
+        for new_rate, new_sw, dither in ((16000, 2, False), (8000, 1, False),
+                                         (44100, 3, False), (8000, 1, True),
+                                         (22050, 1, True)):
+            expected = sppasResampler(22050, 2, new_rate, new_sw,
+                                      dither=dither).convert_all(frames)
+            resampler.IMPORT_NUMPY = False
+            try:
+                converted = sppasResampler(22050, 2, new_rate, new_sw,
+                                           dither=dither).convert_all(frames)
+            finally:
+                resampler.IMPORT_NUMPY = True
+            self.assertEqual(expected, converted)
@@ -0,0 +1,146 @@
+# -*- coding:utf-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_streampitch.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import math
+import shutil
+
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..aio import save as audio_save
+from ..audio import sppasAudioPCM
+from ..channel import sppasChannel
+from ..audiopitch import AudioPitch
+from ..backend import sppasPythonBackend
+from ..streampitch import sppasStreamPitch
+from .. import streampitch
+
+# ---------------------------------------------------------------------------
+
+
+def sine_channel(framerate, sampwidth, parts):
+    """Return a channel with sines of (frequency, duration) parts.
+
+    A frequency of 0 is a silence.
+
+    """
+    amplitude = sppasPythonBackend.get_maxval(sampwidth) // 4
+    values = list()
+    for frequency, duration in parts:
+        values.extend(
+            int(amplitude * math.sin(2. * math.pi * frequency * i / framerate))
+            for i in range(int(duration * framerate)))
+    frames = sppasPythonBackend().pack(values, sampwidth)
+    return sppasChannel(framerate, sampwidth, frames)
+
+# ---------------------------------------------------------------------------
+
+
+class TestStreamPitch(unittest.TestCase):
+
+    def test_sines(self):
+        """Estimate the pitch of sines and silences."""
+        for framerate, sampwidth in ((16000, 2), (44100, 2), (8000, 4)):
+            channel = sine_channel(framerate, sampwidth,
+                                   [(0, 0.3), (200, 0.4), (0, 0.2), (95, 0.3)])
+            pitch = sppasStreamPitch()
+            pitch.estimate_channel(channel)
+            values = pitch.values()
+            # a value every 10ms, the first one at time 0
+            self.assertEqual(121, len(values))
+            self.assertEqual([0.] * 25, values[:25])
+            for v in values[35:65]:
+                self.assertAlmostEqual(200., v, delta=1.)
+            self.assertEqual([0.] * 10, values[75:85])
+            for v in values[95:115]:
+                self.assertAlmostEqual(95., v, delta=0.5)
+
+            # the pitch range is respected
+            pitch = sppasStreamPitch(lo=250, hi=400)
+            pitch.estimate_channel(channel)
+            self.assertEqual(0, len([v for v in pitch.values() if v > 0.]))
+
+        with self.assertRaises(ValueError):
+            sppasStreamPitch(lo=200, hi=100)
+
+    # -----------------------------------------------------------------------
+
+    def test_blocks(self):
+        """The values do not depend on the blocks nor on numpy."""
+        channel = sine_channel(16000, 2, [(150, 0.2), (0, 0.1), (180, 0.15)])
+        pitch = sppasStreamPitch()
+        pitch.estimate_channel(channel)
+        expected = pitch.values()
+
+        block_size = sppasStreamPitch.BLOCK_SIZE
+        sppasStreamPitch.BLOCK_SIZE = 7
+        try:
+            pitch.estimate_channel(channel)
+        finally:
+            sppasStreamPitch.BLOCK_SIZE = block_size
+        self.assertEqual(expected, pitch.values())
+
+        if streampitch.IMPORT_NUMPY is True:
+            streampitch.IMPORT_NUMPY = False
+            try:
+                pitch.estimate_channel(channel)
+            finally:
+                streampitch.IMPORT_NUMPY = True
+            for a, b in zip(expected, pitch.values()):
+                self.assertAlmostEqual(a, b, places=3)
+
+    # -----------------------------------------------------------------------
+
+    def test_file(self):
+        """Estimate the pitch of an audio file, with AudioPitch."""
+        temp = sppasFileUtils().set_random()
+        os.mkdir(temp)
+        try:
+            filename = os.path.join(temp, "sine.wav")
+            audio = sppasAudioPCM()
+            audio.append_channel(sine_channel(16000, 2, [(0, 0.1), (120, 0.3)]))
+            audio_save(filename, audio)
+
+            pitch = AudioPitch()
+            values = pitch.eval_pitch(filename)
+            self.assertEqual(41, len(pitch))
+            self.assertEqual(values, pitch.get_pitch_list())
+            self.assertEqual(0., pitch.get_pitch(0.))
+            self.assertAlmostEqual(120., pitch.get_pitch(0.25), delta=0.5)
+            with self.assertRaises(ValueError):
+                pitch.get_pitch(1.)
+        finally:
+            shutil.rmtree(temp)
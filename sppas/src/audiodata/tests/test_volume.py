@@ -39,6 +39,7 @@ from sppas.src.config import paths
 from ..aio import open as audio_open
 from ..channelvolume import sppasChannelVolume
 from ..audiovolume import sppasAudioVolume
+from ..streamvolume import sppasStreamVolume
 
 # ---------------------------------------------------------------------------
 
@@ -65,3 +66,46 @@ class TestVolume(unittest.TestCase):
         self.assertEqual(int(chanvol.mean()), int(audiovol.mean()))
         self.assertEqual(int(chanvol.variance()), int(audiovol.variance()))
         self.assertEqual(int(chanvol.stdev()), int(audiovol.stdev()))
+
+    # -----------------------------------------------------------------------
+
+    def test_stream(self):
+        audio = audio_open(sample_1)
+        cidx = audio.extract_channel(0)
+        channel = audio.get_channel(cidx)
+        chanvol = sppasChannelVolume(channel)
+
+        # same values from the channel or from the file, whatever the blocks
+        block_size = sppasStreamVolume.BLOCK_SIZE
+        try:
+            for size in (block_size, 1000, 333):
+                sppasStreamVolume.BLOCK_SIZE = size
+                streamvol = sppasStreamVolume()
+                streamvol.estimate_channel(channel)
+                self.assertEqual(list(chanvol.volumes()),
+                                 list(streamvol.volumes()))
+                self.assertEqual(chanvol.volume(), streamvol.volume())
+
+                streamvol = sppasStreamVolume()
+                streamvol.estimate_file(sample_1)
+                self.assertEqual(list(chanvol.volumes()),
+                                 list(streamvol.volumes()))
+                self.assertEqual(channel.rms(), streamvol.volume())
+                self.assertEqual(channel.get_nframes(),
+                                 streamvol.get_nframes())
+        finally:
+            sppasStreamVolume.BLOCK_SIZE = block_size
+
+        # overlapping windows: 20ms every 10ms
+        streamvol = sppasStreamVolume(win_len=0.02, win_shift=0.01)
+        streamvol.estimate_channel(channel)
+        self.assertEqual(0.01, streamvol.get_winshift())
+        self.assertEqual(chanvol.len(), streamvol.len())
+        frames = channel.get_frames()
+        for i in (0, 10, 100, 1000):
+            expected = sppasChannelVolume(
+                channel.extract_fragment(i*160, i*160+320), 0.02)
+            self.assertEqual(expected.volume_at(0), streamvol.volume_at(i))
+        self.assertEqual(0, channel.tell())
+        self.assertEqual(len(frames), len(channel.get_frames()))
+        audio.close()
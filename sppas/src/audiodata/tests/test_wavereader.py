@@ -0,0 +1,173 @@
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+        ---------------------------------------------------------------------
+
+    src.audiodata.tests.test_wavereader.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os.path
+import shutil
+import struct
+import wave
+from array import array
+
+from sppas.src.config import paths
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..aio import open as audio_open
+from ..aio.waveio import WaveIO
+from ..aio.wavereader import sppasWaveReader
+
+# ---------------------------------------------------------------------------
+
+TEMP = sppasFileUtils().set_random()
+sample_1 = os.path.join(paths.samples, "samples-eng", "oriana1.wav")
+sample_2 = os.path.join(paths.samples, "samples-fra", "F_F_B003-P9.wav")
+sample_3 = os.path.join(paths.samples, "samples-eng", "oriana3.wave")
+
+# ---------------------------------------------------------------------------
+
+
+def write_wave(filename, frames, nchannels, sampwidth, framerate,
+               header="RIFF", extensible=False, data_size=None, ds64=False):
+    """Write a WAV file with the given header and format chunk."""
+    bits = 8 * sampwidth
+    block_align = nchannels * sampwidth
+    fmt = struct.pack("<HHIIHH", 0xFFFE if extensible else 1, nchannels,
+                      framerate, framerate * block_align, block_align, bits)
+    if extensible:
+        guid = b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71"
+        fmt += struct.pack("<HHIH", 22, bits, 0, 1) + guid
+    chunks = b""
+    if ds64:
+        chunks += b"ds64" + struct.pack("<IQQQI", 28, 0, len(frames), 0, 0)
+    chunks += b"fmt " + struct.pack("<I", len(fmt)) + fmt
+    chunks += b"LIST" + struct.pack("<I", 3) + b"abc\x00"
+    if data_size is None:
+        data_size = len(frames)
+    chunks += b"data" + struct.pack("<I", data_size) + frames
+    with open(filename, "wb") as fp:
+        fp.write(header.encode("ascii"))
+        fp.write(struct.pack("<I", 0xFFFFFFFF if ds64 else 4 + len(chunks)))
+        fp.write(b"WAVE" + chunks)
+
+# ---------------------------------------------------------------------------
+
+
+class TestWaveReader(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_samples(self):
+        """The reader gives the frames of the wave module."""
+        for sample in (sample_1, sample_2, sample_3):
+            w = wave.open(sample, "r")
+            r = sppasWaveReader(sample)
+            self.assertEqual(w.getparams()[:4], r.getparams()[:4])
+            self.assertEqual(w.readframes(100), r.readframes(100))
+            self.assertEqual(100, r.tell())
+            w.setpos(5000)
+            r.setpos(5000)
+            self.assertEqual(w.readframes(10**9), r.readview(10**9))
+            self.assertEqual(b"", r.readframes(10))
+            r.rewind()
+            w.rewind()
+            self.assertEqual(w.readframes(w.getnframes()), r.get_data())
+            w.close()
+            r.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_channel_view(self):
+        r = sppasWaveReader(sample_3)
+        self.assertEqual(2, r.getnchannels())
+        samples = array('h', r.readframes(r.getnframes()))
+        left = r.get_channel_view(0)
+        right = r.get_channel_view(1)
+        self.assertEqual(samples[0::2].tolist(), left.tolist())
+        self.assertEqual(samples[1::2].tolist(), right.tolist())
+        self.assertEqual(samples[201:401:2].tolist(),
+                         r.get_channel_view(1, 100, 200).tolist())
+        with self.assertRaises(ValueError):
+            r.get_channel_view(2)
+        # the views can still be used after the reader is closed
+        r.close()
+        self.assertEqual(samples[0], left[0])
+        with self.assertRaises(ValueError):
+            r.readframes(10)
+
+    # -----------------------------------------------------------------------
+
+    def test_formats(self):
+        """RF64, WAVE_FORMAT_EXTENSIBLE and unknown sizes of data."""
+        frames = bytes(bytearray(i % 256 for i in range(3 * 2 * 1000)))
+        filename = os.path.join(TEMP, "sample.wav")
+
+        for params in ({"extensible": True},
+                       {"header": "RF64", "ds64": True,
+                        "data_size": 0xFFFFFFFF},
+                       {"header": "RF64", "ds64": True, "extensible": True,
+                        "data_size": 0xFFFFFFFF},
+                       {"data_size": 0xFFFFFFFF},
+                       {"data_size": 10**8}):
+            write_wave(filename, frames, 2, 3, 16000, **params)
+            r = sppasWaveReader(filename)
+            self.assertEqual((2, 3, 16000, 1000), r.getparams()[:4])
+            self.assertEqual(frames, r.readframes(1000))
+            with self.assertRaises(ValueError):
+                r.get_channel_view(0)
+            r.close()
+
+        with open(filename, "wb") as fp:
+            fp.write(b"RIFF\x00\x00\x00\x00WAVE")
+        with self.assertRaises(IOError):
+            sppasWaveReader(filename)
+
+    # -----------------------------------------------------------------------
+
+    def test_open(self):
+        """aio.open() uses the reader for PCM wave files."""
+        audio = audio_open(sample_1)
+        self.assertIsInstance(audio, WaveIO)
+        self.assertIsInstance(audio.get_audiofp(), sppasWaveReader)
+        frames = audio.read_frames(1000)
+        self.assertIsInstance(frames, bytes)
+        audio.seek(0)
+        self.assertEqual(frames, audio.read_view(1000))
+        audio.close()
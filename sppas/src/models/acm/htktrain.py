@@ -61,7 +61,7 @@ import sppas.src.audiodata.aio as audiodataio
 
 from sppas.src.audiodata.audio import sppasAudioPCM
 from sppas.src.audiodata.channelformatter import sppasChannelFormatter
-from sppas.src.audiodata.channelmfcc import sppasChannelMFCC
+from sppas.src.audiodata.mfcc import sppasMFCC
 
 from sppas.src.resources.dictpron import sppasDictPron
 from sppas.src.resources.vocab import sppasVocabulary
@@ -460,7 +460,9 @@ class sppasTrainingCorpus(object):
     It converts the input data into the HTK-specific data format.
     It codes the audio data, also called "parameterizing the raw speech
     waveforms into sequences of feature vectors" (i.e. convert from wav
-    to MFCC format).
+    to MFCC format). The audio files are converted all together, by a
+    pool of nb_workers processes, when a corpus was added or when the
+    scp file is created.
 
     Accepted input:
 
@@ -468,15 +470,19 @@ class sppasTrainingCorpus(object):
         - audio files: one of audiodata.extensions
 
     """
-    def __init__(self, datatrainer=None, lang="und"):
+    def __init__(self, datatrainer=None, lang="und", nb_workers=1):
         """Create a sppasTrainingCorpus instance.
 
         :param datatrainer: (sppasDataTrainer)
         :param lang: (str) iso-8859-3 of the language
+        :param nb_workers: (int) Number of processes to convert the audio
+        files into MFCC, 0 for the number of CPUs
 
         """
         self.datatrainer = datatrainer
         self.lang = lang
+        self.nb_workers = nb_workers
+        self.mfcjobs = list()  # (wav, mfc) files not converted yet
         self.transfiles = {}  # Time-aligned at the ipus level, orthograph
         self.phonfiles = {}   # Time-aligned at the ipus level, phonetization
         self.alignfiles = {}  # Time-aligned at the phone level
@@ -508,6 +514,7 @@ class sppasTrainingCorpus(object):
         self.alignfiles = {}  # Time-aligned at the phone level
         self.audiofiles = {}  #
         self.mfcfiles = {}    #
+        self.mfcjobs = list()
 
         # The lexicon, the pronunciation dictionary and the phoneset
         self.vocabfile = None
@@ -614,6 +621,9 @@ class sppasTrainingCorpus(object):
             if len(files) > 0:
                 trs_files.extend(files)
 
+        # The files added before are converted apart
+        self.convert_features()
+
         count = 0
         # Find matching files (audio / transcription files).
         for trs_filename in trs_files:
@@ -636,6 +646,9 @@ class sppasTrainingCorpus(object):
                     if ret is True:
                         count += 1
 
+        # Convert the audio files into MFCC, all together
+        count -= self.convert_features()
+
         return count
 
     # -----------------------------------------------------------------------
@@ -703,6 +716,40 @@ class sppasTrainingCorpus(object):
 
     # -----------------------------------------------------------------------
 
+    def convert_features(self):
+        """Create the MFCC files of the audio files not converted yet.
+
+        The files are converted by a pool of nb_workers processes. The
+        data of a file which can't be converted are removed of the corpus.
+
+        :returns: (int) Number of files removed
+
+        """
+        jobs = self.mfcjobs
+        self.mfcjobs = list()
+        if len(jobs) == 0:
+            return 0
+
+        mfcc = sppasMFCC(self.datatrainer.features.mfcconfigfile)
+        failed = set()
+        for mfc_file, error in mfcc.convert_files(jobs, self.nb_workers):
+            if error is not None:
+                failed.add(mfc_file)
+
+        for trs_filename, mfc_file in list(self.mfcfiles.items()):
+            if mfc_file in failed:
+                logging.info('Files {:s} / {:s} rejected.'
+                             ''.format(trs_filename,
+                                       self.audiofiles[trs_filename]))
+                for files in (self.transfiles, self.phonfiles,
+                              self.alignfiles, self.audiofiles,
+                              self.mfcfiles):
+                    files.pop(trs_filename, None)
+
+        return len(failed)
+
+    # -----------------------------------------------------------------------
+
     def get_scp(self, aligned=True, phonetized=False, transcribed=False):
         """Fix the train.scp file content.
 
@@ -713,6 +760,7 @@ class sppasTrainingCorpus(object):
         :returns: filename or None if no data is available.
 
         """
+        self.convert_features()
         files = False
         scp_file = os.path.join(self.datatrainer.workdir, "train.scp")
 
@@ -918,17 +966,10 @@ class sppasTrainingCorpus(object):
         audio_out.append_channel(formatter.get_channel())
         audiodataio.save(os.path.join(self.datatrainer.get_storewav(), outfile + ".wav"), audio_out)
 
-        # Generate MFCC
-        wav = os.path.join(self.datatrainer.get_storewav(), outfile + ".wav")
-        mfc = os.path.join(self.datatrainer.get_storemfc(), outfile + ".mfc")
-        sf = sppasFileUtils()
-        tmpfile = sf.set_random(root="scp", add_today=False, add_pid=False)
-        with open(tmpfile, "w") as fp:
-            fp.write('%s %s\n' % (wav, mfc))
-
-        cmfc = sppasChannelMFCC(formatter.get_channel())
-        cmfc.hcopy(self.datatrainer.features.mfcconfigfile, tmpfile)
-        os.remove(tmpfile)
+        # The MFCC are generated later, with the ones of the other files
+        self.mfcjobs.append(
+            (os.path.join(self.datatrainer.get_storewav(), outfile + ".wav"),
+             os.path.join(self.datatrainer.get_storemfc(), outfile + ".mfc")))
 
         return True
 
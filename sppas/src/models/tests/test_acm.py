@@ -95,6 +95,11 @@ class TestTrainer(unittest.TestCase):
         self.assertEqual(0, len(corpus.phonfiles))
         self.assertEqual(0, len(corpus.alignfiles))
 
+        # the MFCC files were all created
+        self.assertEqual(0, len(corpus.mfcjobs))
+        for mfc_file in corpus.mfcfiles.values():
+            self.assertTrue(os.path.exists(mfc_file))
+
     # -----------------------------------------------------------------------
 
     def test_datatrainer(self):
@@ -149,6 +154,15 @@ class TestTrainer(unittest.TestCase):
                                         os.path.join(DATA, "F_F_B003-P8.wav")))
         self.assertFalse(corpus.add_file("toto", "toto"))
 
+        # the MFCC files are created with the scp file, by 2 processes
+        corpus.nb_workers = 2
+        mfc_file = corpus.mfcfiles[os.path.join(DATA, "F_F_B003-P8-palign.TextGrid")]
+        self.assertFalse(os.path.exists(mfc_file))
+        scp_file = corpus.get_scp(aligned=True)
+        self.assertTrue(os.path.exists(mfc_file))
+        with open(scp_file, "r") as fp:
+            self.assertEqual(mfc_file, fp.read().strip())
+
         corpus.datatrainer.delete()
 
     # -----------------------------------------------------------------------
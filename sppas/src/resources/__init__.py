@@ -56,6 +56,7 @@ from .patterns import sppasPatterns
 from .unigram import sppasUnigram
 from .vocab import sppasVocabulary
 from .dumpfile import sppasDumpFile
+from .compiledfile import sppasCompiledFile
 
 __all__ = (
     "sppasMapping",
@@ -65,5 +66,6 @@ __all__ = (
     "sppasPatterns",
     "sppasUnigram",
     "sppasVocabulary",
-    "sppasDumpFile"
+    "sppasDumpFile",
+    "sppasCompiledFile"
 )
@@ -0,0 +1,414 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.resources.compiledfile.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Compiled (memory-mapped) images of the linguistic resources.
+
+"""
+
+import os
+import mmap
+import zlib
+import struct
+import logging
+
+from .resourcesexc import DumpExtensionError
+
+# ---------------------------------------------------------------------------
+
+
+class sppasCompiledFile(object):
+    """Class to manage compiled files.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    A compiled file is a versioned binary image of the dictionary of an
+    ASCII resource file (a list of words, a pronunciation dictionary, a
+    replacement dictionary...). Unlike a dump file, it is not unpickled:
+    it is memory-mapped and its entries are decoded only when accessed,
+    so that opening it costs nearly nothing and the processes using the
+    same resource are sharing it read-only through the page cache.
+
+    The image is made of a header, the offsets of the keys and of the
+    values, an open-addressing hash table of the keys, then the sorted
+    keys and their values as utf-8 strings:
+
+        - header: magic, version, flags, number of entries,
+          number of buckets, offset of each section;
+        - keys offsets: (number of entries + 1) unsigned int;
+        - values offsets: idem, if the dictionary has values;
+        - hash table: number of buckets unsigned int, each one is 0 or
+          the index of a key + 1; the hash of a key is its crc32;
+        - keys: the utf-8 keys one after the other;
+        - values: the values one after the other, each one is either
+          a 0 byte for None, or a 1 byte followed by the utf-8 string.
+
+    """
+
+    COMPILED_FILENAME_EXT = ".rsc"
+    MAGIC = b"SPPASRSC"
+    VERSION = 2
+    HEADER = struct.Struct("<8sIIIIQQQQQ")
+    HAS_VALUES = 1
+
+    # -----------------------------------------------------------------------
+
+    def __init__(self, filename, compiled_extension=""):
+        """Create a sppasCompiledFile instance.
+
+        :param filename: (str) Name of the ASCII file.
+        :param compiled_extension: (str) Extension of the compiled file.
+
+        """
+        self._compiled_ext = sppasCompiledFile.COMPILED_FILENAME_EXT
+        self._filename = filename
+        self.set_compiled_extension(compiled_extension)
+
+    # -----------------------------------------------------------------------
+
+    def set_compiled_extension(self, extension=""):
+        """Fix the extension of the compiled file.
+
+        Set to the default extension if the given extension is an empty
+        string.
+
+        :param extension: (str) Extension of the compiled file \
+        (starting with or without the dot).
+        :raises: DumpExtensionError if extension of the compiled file is \
+        the same as the ASCII file.
+
+        """
+        if extension.startswith('.') is False:
+            extension = "." + extension
+
+        if len(extension) == 1:
+            extension = sppasCompiledFile.COMPILED_FILENAME_EXT
+
+        file_name, file_ext = os.path.splitext(self._filename)
+        if extension.lower() == file_ext.lower():
+            raise DumpExtensionError(extension)
+
+        self._compiled_ext = extension
+
+    # -----------------------------------------------------------------------
+
+    def get_compiled_filename(self):
+        """Return the file name of the compiled version of filename."""
+        file_name, file_ext = os.path.splitext(self._filename)
+        return file_name + self._compiled_ext
+
+    # -----------------------------------------------------------------------
+
+    def has_compiled(self):
+        """Test if a compiled file exists for filename and is up-to-date.
+
+        :returns: (bool)
+
+        """
+        compiled_filename = self.get_compiled_filename()
+        if os.path.isfile(compiled_filename):
+            tascii = os.path.getmtime(self._filename)
+            tcompiled = os.path.getmtime(compiled_filename)
+            if tascii < tcompiled:
+                return True
+
+        return False
+
+    # -----------------------------------------------------------------------
+
+    def load_from_compiled(self):
+        """Open the compiled file.
+
+        :returns: (sppasCompiledDict) or None
+
+        """
+        if self.has_compiled() is False:
+            return None
+
+        try:
+            return sppasCompiledDict(self.get_compiled_filename())
+        except Exception as e:
+            logging.info('Open a compiled data failed: {:s}'.format(str(e)))
+            return None
+
+    # -----------------------------------------------------------------------
+
+    def save_as_compiled(self, data):
+        """Save the data as a compiled file.
+
+        The file is written under a temporary name then renamed, so that
+        the processes which are reading the previous one are not disturbed.
+
+        :param data: (dict) Dictionary with str keys and str or None values
+        :returns: (bool)
+
+        """
+        compiled_filename = self.get_compiled_filename()
+        tmp_filename = compiled_filename + ".tmp" + str(os.getpid())
+
+        try:
+            with open(tmp_filename, 'wb') as f:
+                sppasCompiledFile.write(f, data)
+            if os.path.exists(compiled_filename):
+                os.remove(compiled_filename)
+            os.rename(tmp_filename, compiled_filename)
+        except Exception as e:
+            logging.info('Save a compiled data failed: {:s}'.format(str(e)))
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            return False
+
+        return True
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def write(fp, data):
+        """Write the image of a dictionary into a binary file object.
+
+        :param fp: (file) Opened in binary mode
+        :param data: (dict) Dictionary with str keys and str or None values
+
+        """
+        keys = sorted(data.keys())
+        count = len(keys)
+        has_values = any(data[k] is not None for k in keys)
+        nbuckets = 2 * count + 1
+
+        encoded_keys = [k.encode("utf-8") for k in keys]
+        koffsets = sppasCompiledFile.__offsets(encoded_keys)
+        encoded_values = list()
+        voffsets = list()
+        if has_values is True:
+            encoded_values = [sppasCompiledFile.__encode_value(data[k])
+                              for k in keys]
+            voffsets = sppasCompiledFile.__offsets(encoded_values)
+
+        # Hash table with linear probing
+        table = [0] * nbuckets
+        for i, k in enumerate(encoded_keys):
+            slot = (zlib.crc32(k) & 0xffffffff) % nbuckets
+            while table[slot] != 0:
+                slot = (slot + 1) % nbuckets
+            table[slot] = i + 1
+
+        off_koffsets = sppasCompiledFile.HEADER.size
+        off_voffsets = off_koffsets + 4 * len(koffsets)
+        off_table = off_voffsets + 4 * len(voffsets)
+        off_kblob = off_table + 4 * nbuckets
+        off_vblob = off_kblob + koffsets[-1]
+
+        flags = sppasCompiledFile.HAS_VALUES if has_values else 0
+        fp.write(sppasCompiledFile.HEADER.pack(
+            sppasCompiledFile.MAGIC, sppasCompiledFile.VERSION, flags,
+            count, nbuckets,
+            off_koffsets, off_voffsets, off_table, off_kblob, off_vblob))
+        fp.write(struct.pack("<%dI" % len(koffsets), *koffsets))
+        fp.write(struct.pack("<%dI" % len(voffsets), *voffsets))
+        fp.write(struct.pack("<%dI" % nbuckets, *table))
+        fp.write(b"".join(encoded_keys))
+        fp.write(b"".join(encoded_values))
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __encode_value(value):
+        """Return the bytes of a value: its utf-8 string or None."""
+        if value is None:
+            return b"\x00"
+        return b"\x01" + value.encode("utf-8")
+
+    # -----------------------------------------------------------------------
+
+    @staticmethod
+    def __offsets(encoded):
+        """Return the list of offsets of a list of bytes, plus the end."""
+        offsets = [0]
+        for e in encoded:
+            offsets.append(offsets[-1] + len(e))
+        return offsets
+
+# ---------------------------------------------------------------------------
+
+
+class sppasCompiledDict(object):
+    """Read-only dictionary of a memory-mapped compiled file.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    It implements the reading methods of a dict. Keys are iterated in
+    sorted order. Use to_dict() to get a modifiable copy.
+
+    """
+
+    def __init__(self, filename):
+        """Open a compiled file.
+
+        :param filename: (str) Name of the compiled file
+        :raises: IOError if the file is not a compiled file of this version
+
+        """
+        self.__filename = filename
+        with open(filename, 'rb') as fp:
+            size = os.fstat(fp.fileno()).st_size
+            if size < sppasCompiledFile.HEADER.size:
+                raise IOError("Invalid compiled file {:s}".format(filename))
+            self.__mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, flags, self.__count, self.__nbuckets,
+         self.__off_koffsets, self.__off_voffsets, self.__off_table,
+         self.__off_kblob, self.__off_vblob) = \
+            sppasCompiledFile.HEADER.unpack_from(self.__mm, 0)
+
+        if magic != sppasCompiledFile.MAGIC or \
+                version != sppasCompiledFile.VERSION:
+            self.__mm.close()
+            raise IOError("Invalid compiled file {:s}".format(filename))
+        self.__has_values = bool(flags & sppasCompiledFile.HAS_VALUES)
+
+    # -----------------------------------------------------------------------
+
+    def get_filename(self):
+        """Return the name of the compiled file."""
+        return self.__filename
+
+    # -----------------------------------------------------------------------
+
+    def get(self, key, default=None):
+        """Return the value of a key or default if the key is missing."""
+        i = self.__find(key)
+        if i == -1:
+            return default
+        return self.__value_at(i)
+
+    # -----------------------------------------------------------------------
+
+    def keys(self):
+        """Return the sorted list of keys."""
+        return [self.__key_at(i) for i in range(self.__count)]
+
+    # -----------------------------------------------------------------------
+
+    def values(self):
+        """Return the list of values, in the order of the keys."""
+        return [self.__value_at(i) for i in range(self.__count)]
+
+    # -----------------------------------------------------------------------
+
+    def items(self):
+        """Return the list of (key, value), in the order of the keys."""
+        return [(self.__key_at(i), self.__value_at(i))
+                for i in range(self.__count)]
+
+    # -----------------------------------------------------------------------
+
+    def to_dict(self):
+        """Return a modifiable copy, as a dict."""
+        return dict(self.items())
+
+    # -----------------------------------------------------------------------
+
+    def close(self):
+        """Release the memory-mapped file."""
+        self.__mm.close()
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __find(self, key):
+        """Return the index of a key or -1."""
+        try:
+            encoded = key.encode("utf-8")
+        except (AttributeError, UnicodeError):
+            return -1
+
+        mm = self.__mm
+        slot = (zlib.crc32(encoded) & 0xffffffff) % self.__nbuckets
+        while True:
+            idx = struct.unpack_from("<I", mm, self.__off_table + 4 * slot)[0]
+            if idx == 0:
+                return -1
+            start, end = struct.unpack_from(
+                "<II", mm, self.__off_koffsets + 4 * (idx - 1))
+            if mm[self.__off_kblob + start:self.__off_kblob + end] == encoded:
+                return idx - 1
+            slot = (slot + 1) % self.__nbuckets
+
+    # -----------------------------------------------------------------------
+
+    def __key_at(self, i):
+        start, end = struct.unpack_from("<II", self.__mm, self.__off_koffsets + 4 * i)
+        return self.__mm[self.__off_kblob + start:self.__off_kblob + end].decode("utf-8")
+
+    # -----------------------------------------------------------------------
+
+    def __value_at(self, i):
+        if self.__has_values is False:
+            return None
+        start, end = struct.unpack_from("<II", self.__mm, self.__off_voffsets + 4 * i)
+        if self.__mm[self.__off_vblob + start] == 0:
+            return None
+        return self.__mm[self.__off_vblob + start + 1:self.__off_vblob + end].decode("utf-8")
+
+    # -----------------------------------------------------------------------
+    # Overloads
+    # -----------------------------------------------------------------------
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __len__(self):
+        return self.__count
+
+    def __contains__(self, key):
+        return self.__find(key) != -1
+
+    def __getitem__(self, key):
+        i = self.__find(key)
+        if i == -1:
+            raise KeyError(key)
+        return self.__value_at(i)
+
+    def __iter__(self):
+        for i in range(self.__count):
+            yield self.__key_at(i)
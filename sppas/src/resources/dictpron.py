@@ -45,6 +45,8 @@ from sppas.src.config import separators
 from sppas.src.utils import sppasUnicode
 
 from .dumpfile import sppasDumpFile
+from .compiledfile import sppasCompiledFile
+from .compiledfile import sppasCompiledDict
 from .resourcesexc import FileIOError, FileUnicodeError, FileFormatError
 
 # ---------------------------------------------------------------------------
@@ -115,10 +117,12 @@ class sppasDictPron(object):
             dp = sppasDumpFile(dict_filename)
             data = None
 
-            # Try first to get the dict from a dump file
-            # (at least 2 times faster)
+            # Try first to open a compiled file (nearly no loading time),
+            # then to get the dict from a dump file (at least 2 times faster)
             if nodump is False:
-                data = dp.load_from_dump()
+                data = sppasCompiledFile(dict_filename).load_from_compiled()
+                if data is None:
+                    data = dp.load_from_dump()
 
             # Load from ascii if:
             # 1st load, or, dump load error, or dump older than ascii
@@ -242,6 +246,8 @@ class sppasDictPron(object):
         new_pron = cur_pron + new_pron
 
         # Add (or change) the entry in the dict
+        if isinstance(self._dict, sppasCompiledDict):
+            self._dict = self._dict.to_dict()
         self._dict[entry] = new_pron
 
     # -----------------------------------------------------------------------
@@ -268,6 +274,19 @@ class sppasDictPron(object):
     # File management
     # -----------------------------------------------------------------------
 
+    def save_as_compiled(self):
+        """Save the dictionary in a compiled file, next to the ASCII one.
+
+        :returns: (bool)
+
+        """
+        if len(self._filename) == 0:
+            return False
+        return sppasCompiledFile(self._filename).save_as_compiled(
+            dict(self._dict.items()))
+
+    # -----------------------------------------------------------------------
+
     def load(self, filename):
         """Load a pronunciation dictionary.
 
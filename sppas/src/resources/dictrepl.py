@@ -39,6 +39,8 @@ from sppas.src.config import sg
 from sppas.src.utils import sppasUnicode, u
 
 from .dumpfile import sppasDumpFile
+from .compiledfile import sppasCompiledFile
+from .compiledfile import sppasCompiledDict
 from .resourcesexc import FileUnicodeError
 
 # ----------------------------------------------------------------------------
@@ -91,10 +93,12 @@ class sppasDictRepl(object):
             data = None
             dp = sppasDumpFile(dict_filename)
 
-            # Try first to get the dict from a dump file
-            # (at least 2 times faster)
+            # Try first to open a compiled file (nearly no loading time),
+            # then to get the dict from a dump file (at least 2 times faster)
             if nodump is False:
-                data = dp.load_from_dump()
+                data = sppasCompiledFile(dict_filename).load_from_compiled()
+                if data is None:
+                    data = dp.load_from_dump()
 
             # Load from ascii if: 1st load,
             # or dump load error,
@@ -257,6 +261,7 @@ class sppasDictRepl(object):
                 value = "{0}|{1}".format(self._dict.get(key), value)
 
         # Append
+        self.__set_writable()
         self._dict[key] = value
 
     # -----------------------------------------------------------------------
@@ -269,6 +274,7 @@ class sppasDictRepl(object):
         """
         s = sppasDictRepl.format_token(entry)
         if s in self._dict:
+            self.__set_writable()
             self._dict.pop(s)
 
     # -----------------------------------------------------------------------
@@ -285,6 +291,8 @@ class sppasDictRepl(object):
             if k == s or self.is_value_of(k, entry):
                 to_pop.append(k)
 
+        if len(to_pop) > 0:
+            self.__set_writable()
         for k in to_pop:
             self._dict.pop(k)
 
@@ -292,6 +300,19 @@ class sppasDictRepl(object):
     # File
     # -----------------------------------------------------------------------
 
+    def save_as_compiled(self):
+        """Save the dictionary in a compiled file, next to the ASCII one.
+
+        :returns: (bool)
+
+        """
+        if len(self._filename) == 0:
+            return False
+        return sppasCompiledFile(self._filename).save_as_compiled(
+            dict(self._dict.items()))
+
+    # -----------------------------------------------------------------------
+
     def load_from_ascii(self, filename):
         """Load a replacement dictionary from an ascii file.
 
@@ -374,3 +395,12 @@ class sppasDictRepl(object):
     def __getitem__(self, item):
         s = sppasDictRepl.format_token(str(item))
         return self._dict[s]
+
+    # -----------------------------------------------------------------------
+    # Private
+    # -----------------------------------------------------------------------
+
+    def __set_writable(self):
+        """Turn the read-only dict of a compiled file into a dict."""
+        if isinstance(self._dict, sppasCompiledDict):
+            self._dict = self._dict.to_dict()
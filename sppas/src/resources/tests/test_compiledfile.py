@@ -0,0 +1,188 @@
+# -*- coding: utf8 -*-
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+        ---------------------------------------------------------------------
+
+    src.resources.tests.test_compiledfile.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+import os
+import shutil
+import time
+
+from sppas.src.files.fileutils import sppasFileUtils
+
+from ..compiledfile import sppasCompiledFile
+from ..compiledfile import sppasCompiledDict
+from ..resourcesexc import DumpExtensionError
+from ..dictpron import sppasDictPron
+from ..dictrepl import sppasDictRepl
+from ..vocab import sppasVocabulary
+
+# ---------------------------------------------------------------------------
+
+DATA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+TEMP = sppasFileUtils().set_random()
+
+# ---------------------------------------------------------------------------
+
+
+class TestCompiledFile(unittest.TestCase):
+
+    def setUp(self):
+        if os.path.exists(TEMP) is False:
+            os.mkdir(TEMP)
+
+    def tearDown(self):
+        shutil.rmtree(TEMP)
+
+    # -----------------------------------------------------------------------
+
+    def test_extension(self):
+        cf = sppasCompiledFile("E://data/toto.txt")
+        self.assertEqual(cf.get_compiled_filename(), "E://data/toto.rsc")
+        self.assertFalse(cf.has_compiled())
+        self.assertIsNone(cf.load_from_compiled())
+        cf.set_compiled_extension("IMG")
+        self.assertEqual(cf.get_compiled_filename(), "E://data/toto.IMG")
+        with self.assertRaises(DumpExtensionError):
+            cf.set_compiled_extension(".TXT")
+
+    # -----------------------------------------------------------------------
+
+    def test_save_load(self):
+        filename = os.path.join(TEMP, "words.txt")
+        with open(filename, "w") as fp:
+            fp.write("ascii file\n")
+        data = {u"a": u"b", u"été": u"summer", u"": u"empty", u"c": u""}
+
+        cf = sppasCompiledFile(filename)
+        self.assertTrue(cf.save_as_compiled(data))
+        self.assertTrue(cf.has_compiled())
+        d = cf.load_from_compiled()
+        self.assertIsInstance(d, sppasCompiledDict)
+        self.assertEqual(len(d), 4)
+        self.assertEqual(d.to_dict(), data)
+        self.assertEqual(d[u"été"], u"summer")
+        self.assertEqual(d.get(u"c"), u"")
+        self.assertEqual(d.get(u"x", u"unk"), u"unk")
+        self.assertTrue(u"" in d)
+        self.assertFalse(u"x" in d)
+        self.assertFalse(None in d)
+        self.assertEqual(list(d), sorted(data.keys()))
+        with self.assertRaises(KeyError):
+            d[u"x"]
+        d.close()
+
+        # A list of words: there's no value
+        self.assertTrue(cf.save_as_compiled({u"a": None, u"b": None}))
+        d = cf.load_from_compiled()
+        self.assertEqual(d.to_dict(), {u"a": None, u"b": None})
+        d.close()
+
+        # None values are kept, even among strings
+        data = {u"a": None, u"b": u"", u"c": u"x"}
+        self.assertTrue(cf.save_as_compiled(data))
+        d = cf.load_from_compiled()
+        self.assertEqual(d.to_dict(), data)
+        self.assertIsNone(d[u"a"])
+        self.assertEqual(d[u"b"], u"")
+        d.close()
+
+        # No entry at all
+        self.assertTrue(cf.save_as_compiled(dict()))
+        d = cf.load_from_compiled()
+        self.assertEqual(len(d), 0)
+        self.assertFalse(u"a" in d)
+        d.close()
+
+    # -----------------------------------------------------------------------
+
+    def test_outdated(self):
+        filename = os.path.join(TEMP, "words.txt")
+        with open(filename, "w") as fp:
+            fp.write("ascii file\n")
+        cf = sppasCompiledFile(filename)
+        cf.save_as_compiled({u"a": None})
+        self.assertTrue(cf.has_compiled())
+
+        # The ASCII file is modified after the compiled one was created
+        t = time.time() + 10
+        os.utime(filename, (t, t))
+        self.assertFalse(cf.has_compiled())
+        self.assertIsNone(cf.load_from_compiled())
+
+        # Not a compiled file
+        with open(cf.get_compiled_filename(), "w") as fp:
+            fp.write("this is not a compiled file")
+        os.utime(filename, (0, 0))
+        self.assertIsNone(cf.load_from_compiled())
+
+    # -----------------------------------------------------------------------
+
+    def test_resources(self):
+        # Pronunciation dictionary
+        filename = os.path.join(TEMP, "dict.txt")
+        shutil.copy(os.path.join(DATA, "dict.txt"), filename)
+        d = sppasDictPron(filename, nodump=True)
+        self.assertTrue(d.save_as_compiled())
+        dc = sppasDictPron(filename)
+        self.assertEqual(len(d), len(dc))
+        for entry in d:
+            self.assertEqual(d.get_pron(entry), dc.get_pron(entry))
+        # the dict is modifiable
+        dc.add_pron(u"newentry", u"n-u")
+        self.assertEqual(dc.get_pron(u"newentry"), u"n-u")
+        self.assertEqual(len(dc), len(d) + 1)
+
+        # Replacement dictionary
+        filename = os.path.join(TEMP, "repl.txt")
+        with open(filename, "w") as fp:
+            fp.write("km kilomètre\nkg kilogramme\n")
+        d = sppasDictRepl(filename, nodump=True)
+        self.assertTrue(d.save_as_compiled())
+        dc = sppasDictRepl(filename)
+        self.assertEqual(dc.get(u"km"), u"kilomètre")
+        self.assertTrue(dc.is_value(u"kilogramme"))
+        dc.remove(u"kilogramme")
+        self.assertEqual(len(dc), 1)
+        dc.add(u"cm", u"centimètre")
+        self.assertEqual(dc.get(u"cm"), u"centimètre")
+
+        # List of words
+        filename = os.path.join(TEMP, "vocab.txt")
+        shutil.copy(os.path.join(DATA, "vocab.txt"), filename)
+        d = sppasVocabulary(filename, nodump=True)
+        self.assertTrue(d.save_as_compiled())
+        dc = sppasVocabulary(filename)
+        self.assertEqual(d.get_list(), dc.get_list())
+        self.assertTrue(dc.add(u"newentry"))
+        self.assertTrue(dc.is_in(u"newentry"))
@@ -41,6 +41,8 @@ from sppas.src.utils import sppasUnicode
 
 from .resourcesexc import FileIOError, FileUnicodeError, FileFormatError
 from .dumpfile import sppasDumpFile
+from .compiledfile import sppasCompiledFile
+from .compiledfile import sppasCompiledDict
 
 # ---------------------------------------------------------------------------
 
@@ -76,9 +78,12 @@ class sppasVocabulary(object):
             self.__filename = filename
             dp = sppasDumpFile(filename)
 
-            # Try first to get the dict from a dump file
+            # Try first to open a compiled file (nearly no loading time),
+            # then to get the dict from a dump file
             # (at least 2 times faster than the ascii one)
-            data = dp.load_from_dump()
+            data = sppasCompiledFile(filename).load_from_compiled()
+            if data is None:
+                data = dp.load_from_dump()
 
             # Load from ascii if: 1st load,
             # or, dump load error,
@@ -114,6 +119,8 @@ class sppasVocabulary(object):
             entry = s.to_lower()
 
         if entry not in self.__entries:
+            if isinstance(self.__entries, sppasCompiledDict):
+                self.__entries = self.__entries.to_dict()
             self.__entries[entry] = None
             return True
 
@@ -121,6 +128,19 @@ class sppasVocabulary(object):
 
     # -----------------------------------------------------------------------
 
+    def save_as_compiled(self):
+        """Save the list of words in a compiled file, next to the ASCII one.
+
+        :returns: (bool)
+
+        """
+        if len(self.__filename) == 0:
+            return False
+        return sppasCompiledFile(self.__filename).save_as_compiled(
+            dict((entry, None) for entry in self.__entries))
+
+    # -----------------------------------------------------------------------
+
     def get_list(self):
         """Return the list of entries, sorted in alpha-numeric order."""
         return sorted(self.__entries.keys())
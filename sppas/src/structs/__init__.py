@@ -40,7 +40,7 @@ structs: access and manage data structures.
 *****************************************************************************
 
 This package includes classes to manage data like un-typed options, a
-language, a dag...
+language, a dag, a trie...
 
 Requires the following other packages:
 
@@ -56,6 +56,7 @@ from .baseoption import sppasBaseOption
 from .baseoption import sppasOption
 from .lang import sppasLangResource
 from .metainfo import sppasMetaInfo
+from .trie import sppasTrie
 
 __all__ = (
     "sppasBaseCompare",
@@ -65,4 +66,5 @@ __all__ = (
     "sppasOption",
     "sppasLangResource",
     "sppasMetaInfo",
+    "sppasTrie",
 )
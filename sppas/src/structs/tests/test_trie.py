@@ -0,0 +1,82 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+
+    src.structs.tests.test_trie.py
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+"""
+import unittest
+
+from ..trie import sppasTrie
+
+# ---------------------------------------------------------------------------
+
+
+class TestTrie(unittest.TestCase):
+
+    def test_add(self):
+        trie = sppasTrie()
+        self.assertEqual(0, len(trie))
+        self.assertTrue(trie.add("ab"))
+        self.assertFalse(trie.add("ab"))
+        self.assertFalse(trie.add(""))
+        self.assertTrue(trie.add("a"))
+        self.assertEqual(2, len(trie))
+        self.assertTrue("ab" in trie)
+        self.assertTrue("a" in trie)
+        self.assertFalse("b" in trie)
+        self.assertFalse("abc" in trie)
+
+    def test_matches(self):
+        trie = sppasTrie(["a", "ab", "abcd", "b_c"])
+        tokens = ["a", "b", "c", "d", "e"]
+        self.assertEqual([1, 2, 4], trie.matches(tokens))
+        self.assertEqual(4, trie.longest_match(tokens))
+        self.assertEqual(2, trie.longest_match(tokens, max_tokens=3))
+        self.assertEqual(0, trie.longest_match(tokens, start=1))
+        self.assertEqual(0, trie.longest_match(tokens, start=5))
+        self.assertEqual(2, trie.longest_match(tokens, start=1, separator="_"))
+        self.assertEqual(1, trie.longest_match(tokens, separator="_"))
+        # tokens of several characters
+        self.assertEqual(2, trie.longest_match(["ab", "cd"]))
+        self.assertEqual(0, trie.longest_match(["abc"]))
+
+    def test_reverse(self):
+        trie = sppasTrie(["c", "bc", "abc", "a_b"], reverse=True)
+        self.assertTrue(trie.is_reverse())
+        self.assertTrue("abc" in trie)
+        self.assertFalse("cba" in trie)
+        tokens = ["a", "b", "c"]
+        self.assertEqual([1, 2, 3], trie.matches(tokens, start=2))
+        self.assertEqual(2, trie.longest_match(tokens, start=2, max_tokens=2))
+        self.assertEqual(0, trie.longest_match(tokens, start=1))
+        self.assertEqual(2, trie.longest_match(tokens, start=1, separator="_"))
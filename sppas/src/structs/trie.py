@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+"""
+    ..
+        ---------------------------------------------------------------------
+         ___   __    __    __    ___
+        /     |  \  |  \  |  \  /              the automatic
+        \__   |__/  |__/  |___| \__             annotation and
+           \  |     |     |   |    \             analysis
+        ___/  |     |     |   | ___/              of speech
+
+        http://www.sppas.org/
+
+        Use of this software is governed by the GNU Public License, version 3.
+
+        SPPAS is free software: you can redistribute it and/or modify
+        it under the terms of the GNU General Public License as published by
+        the Free Software Foundation, either version 3 of the License, or
+        (at your option) any later version.
+
+        SPPAS is distributed in the hope that it will be useful,
+        but WITHOUT ANY WARRANTY; without even the implied warranty of
+        MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+        GNU General Public License for more details.
+
+        You should have received a copy of the GNU General Public License
+        along with SPPAS. If not, see <http://www.gnu.org/licenses/>.
+
+        This banner notice must not be removed.
+
+        ---------------------------------------------------------------------
+
+    structs.trie.py
+    ~~~~~~~~~~~~~~~
+
+"""
+
+# ----------------------------------------------------------------------------
+
+
+class sppasTrie(object):
+    """Prefix tree of strings, to find matches in a sequence of tokens.
+
+    :author:       Brigitte Bigi
+    :organization: Laboratoire Parole et Langage, Aix-en-Provence, France
+    :contact:      develop@sppas.org
+    :license:      GPL, v3
+    :copyright:    Copyright (C) 2011-2019  Brigitte Bigi
+
+    Each node of the tree is a dictionary with characters as keys. The
+    end of an entry is marked by an empty-string key. Searching for the
+    entries starting at a given position of a sequence of tokens is then
+    done in one forward walk, without allocating any new string.
+
+    >>> trie = sppasTrie(["a", "ab", "abcd"])
+    >>> trie.matches(["a", "b", "c", "d", "e"])
+    [1, 2, 4]
+    >>> trie.longest_match(["a", "b", "c", "d", "e"], start=1)
+    0
+
+    If reverse is True, entries are stored reversed and the tokens are
+    walked from right to left.
+
+    >>> trie = sppasTrie(["bc", "abc"], reverse=True)
+    >>> trie.longest_match(["a", "b", "c"], start=2)
+    3
+
+    """
+
+    END = ""
+
+    # ------------------------------------------------------------------------
+
+    def __init__(self, entries=(), reverse=False):
+        """Create a new sppasTrie instance.
+
+        :param entries: (iterable of str) Entries to add into the tree
+        :param reverse: (bool) Store entries to be matched from right to left
+
+        """
+        self.__root = dict()
+        self.__reverse = bool(reverse)
+        self.__len = 0
+        for entry in entries:
+            self.add(entry)
+
+    # ------------------------------------------------------------------------
+
+    def is_reverse(self):
+        """Return True if entries are matched from right to left."""
+        return self.__reverse
+
+    # ------------------------------------------------------------------------
+
+    def add(self, entry):
+        """Add an entry into the tree.
+
+        :param entry: (str) A non-empty string
+        :returns: (bool) False if the entry was already in the tree
+
+        """
+        if len(entry) == 0:
+            return False
+        if self.__reverse is True:
+            entry = entry[::-1]
+
+        node = self.__root
+        for char in entry:
+            child = node.get(char)
+            if child is None:
+                child = dict()
+                node[char] = child
+            node = child
+
+        if sppasTrie.END in node:
+            return False
+        node[sppasTrie.END] = True
+        self.__len += 1
+        return True
+
+    # ------------------------------------------------------------------------
+
+    def matches(self, tokens, start=0, max_tokens=None, separator=""):
+        """Return the number of tokens of all entries matching at start.
+
+        Tokens are joined by the separator. With a reversed tree, tokens
+        are read from start to the beginning of the sequence.
+
+        :param tokens: (list of str) Sequence of tokens
+        :param start: (int) Index of the first token to match
+        :param max_tokens: (int) Max number of tokens of a match
+        :param separator: (str) String to join the tokens
+        :returns: (list of int) in increasing order
+
+        """
+        found = list()
+        self.__walk(tokens, start, max_tokens, separator, found)
+        return found
+
+    # ------------------------------------------------------------------------
+
+    def longest_match(self, tokens, start=0, max_tokens=None, separator=""):
+        """Return the number of tokens of the longest entry matching at start.
+
+        :param tokens: (list of str) Sequence of tokens
+        :param start: (int) Index of the first token to match
+        :param max_tokens: (int) Max number of tokens of a match
+        :param separator: (str) String to join the tokens
+        :returns: (int) 0 if no entry is matching
+
+        """
+        return self.__walk(tokens, start, max_tokens, separator, None)
+
+    # ------------------------------------------------------------------------
+
+    def __walk(self, tokens, start, max_tokens, separator, found):
+        """Walk the tree along the tokens from start.
+
+        :returns: (int) Number of tokens of the longest match
+
+        """
+        if self.__reverse is True:
+            stop = -1 if max_tokens is None else max(-1, start - max_tokens)
+            step = -1
+            separator = separator[::-1]
+        else:
+            stop = len(tokens)
+            if max_tokens is not None:
+                stop = min(stop, start + max_tokens)
+            step = 1
+
+        longest = 0
+        node = self.__root
+        for n, i in enumerate(range(start, stop, step), 1):
+            token = tokens[i]
+            if self.__reverse is True:
+                token = token[::-1]
+            if n > 1:
+                for char in separator:
+                    node = node.get(char)
+                    if node is None:
+                        return longest
+            for char in token:
+                node = node.get(char)
+                if node is None:
+                    return longest
+            if sppasTrie.END in node:
+                longest = n
+                if found is not None:
+                    found.append(n)
+
+        return longest
+
+    # ------------------------------------------------------------------------
+    # Overloads
+    # ------------------------------------------------------------------------
+
+    def __len__(self):
+        return self.__len
+
+    # ------------------------------------------------------------------------
+
+    def __contains__(self, entry):
+        if self.__reverse is True:
+            entry = entry[::-1]
+        node = self.__root
+        for char in entry:
+            node = node.get(char)
+            if node is None:
+                return False
+        return sppasTrie.END in node
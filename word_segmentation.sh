@@ -5,16 +5,13 @@ working_dir=$("pwd")
 txt_dir=$working_dir/txt/
 
 echo $working_dir
+# The vocabulary is loaded only once: each txt file is sent as a job
+# "input<TAB>output" to the server mode of normalize.py.
 for entry in "$txt_dir"*.txt
 do
   filename=$(basename -- "$entry")
   extension="${filename##*.}"
   filename="${filename%.*}"
-#  filename="${filename%.*}"
-#  echo $extension
-#  echo $filename
-#  fname=`basename $entry`
-#  echo "$fname"
-  python $working_dir/sppas/bin/normalize.py -i "$entry" -o $working_dir/output/$filename.csv -r $working_dir/resources/vocab/yue.vocab
+  printf '%s\t%s\n' "$entry" "$working_dir/output/$filename.csv"
 
-done
\ No newline at end of file
+done | python $working_dir/sppas/bin/normalize.py --server -e .csv -r $working_dir/resources/vocab/yue.vocab